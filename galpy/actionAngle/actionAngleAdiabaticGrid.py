@@ -158,7 +158,7 @@ class actionAngleAdiabaticGrid(actionAngle):
         )
         self._Lzmax = self._Lzs[-1]
         # Calculate ER(vr=0,R=RL)
-        self._RL = numpy.array([potential.rl(self._pot, l) for l in self._Lzs])
+        self._RL = potential.rl(self._pot, self._Lzs)
         self._RLInterp = interpolate.InterpolatedUnivariateSpline(
             self._Lzs, self._RL, k=3
         )
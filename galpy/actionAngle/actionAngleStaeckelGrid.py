@@ -95,7 +95,7 @@ class actionAngleStaeckelGrid(actionAngle):
         self._Lzmax = self._Lzs[-1]
         self._nLz = nLz
         # Calculate E_c(R=RL), energy of circular orbit
-        self._RL = numpy.array([potential.rl(self._pot, l) for l in self._Lzs])
+        self._RL = potential.rl(self._pot, self._Lzs)
         self._RLInterp = interpolate.InterpolatedUnivariateSpline(
             self._Lzs, self._RL, k=3
         )
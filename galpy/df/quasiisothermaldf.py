@@ -138,9 +138,7 @@ class quasiisothermaldf(df):
             self._precomputergLzgrid = numpy.linspace(
                 self._precomputergLzmin, self._precomputergLzmax, self._precomputergnLz
             )
-            self._rls = numpy.array(
-                [potential.rl(self._pot, l) for l in self._precomputergLzgrid]
-            )
+            self._rls = potential.rl(self._pot, self._precomputergLzgrid)
             # Spline interpolate
             self._rgInterp = interpolate.InterpolatedUnivariateSpline(
                 self._precomputergLzgrid, self._rls, k=3
@@ -3054,9 +3052,7 @@ class quasiisothermaldf(df):
             indxc = True ^ indx
             out = numpy.empty(lz.shape)
             out[indxc] = self._rgInterp(lz[indxc])
-            out[indx] = numpy.array(
-                [potential.rl(self._pot, lz[indx][ii]) for ii in range(numpy.sum(indx))]
-            )
+            out[indx] = potential.rl(self._pot, lz[indx])
             return out
         else:
             if lz > self._precomputergLzmax or lz < self._precomputergLzmin:
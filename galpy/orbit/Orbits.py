@@ -38,6 +38,10 @@ from ..potential import (
     toPlanarPotential,
 )
 from ..potential.DissipativeForce import _isDissipative
+from ..potential.planarPotential import (
+    planarPotentialFromFullPotential,
+    planarPotentialFromRZPotential,
+)
 from ..potential.plotEscapecurve import _INF
 from ..potential.Potential import _check_c
 from ..util import conversion, coords, galpyWarning, galpyWarningVerbose, plot
@@ -58,10 +62,12 @@ from ..util.conversion import (
 )
 from ..util.coords import _K
 from .integrateFullOrbit import (
+    evaluateFullOrbitEnergy_c,
     integrateFullOrbit,
     integrateFullOrbit_c,
     integrateFullOrbit_sos,
     integrateFullOrbit_sos_c,
+    integrateSatellites_c,
 )
 from .integrateLinearOrbit import (
     _ext_loaded,
@@ -1328,6 +1334,8 @@ class Orbit:
             "leapfrog_c",
             "symplec4_c",
             "symplec6_c",
+            "symplec4fg_c",
+            "ttleapfrog_c",
             "rk4_c",
             "rk6_c",
             "dopr54_c",
@@ -1340,6 +1348,8 @@ class Orbit:
                 "leapfrog_c",
                 "symplec4_c",
                 "symplec6_c",
+                "symplec4fg_c",
+                "ttleapfrog_c",
                 "ias15_c",  # practically speaking, ias15 has the same limitations as symplectic integrators in galpy
             ]
             [valid_methods.remove(symplec_method) for symplec_method in symplec_methods]
@@ -1402,6 +1412,7 @@ class Orbit:
         dt=None,
         numcores=_NUMCORES,
         force_map=False,
+        diagnostics=False,
     ):
         """
         Integrate the orbit instance with multiprocessing.
@@ -1422,6 +1433,8 @@ class Orbit:
             Number of cores to use for Python-based multiprocessing (pure Python or using force_map=True). Default is OMP_NUM_THREADS.
         force_map : bool, optional
             If True, force use of Python-based multiprocessing (not recommended). Default is False.
+        diagnostics : bool, optional
+            If True, record per-orbit integration diagnostics (step and force-evaluation counts for the C integrators, relative energy error), which can be accessed with integration_diagnostics(). Default is False.
 
         Returns
         -------
@@ -1437,6 +1450,8 @@ class Orbit:
           - 'leapfrog_c' for a simple leapfrog implementation in C
           -  'symplec4_c' for a 4th order symplectic integrator in C
           -  'symplec6_c' for a 6th order symplectic integrator in C
+          -  'symplec4fg_c' for a 4th order force-gradient symplectic integrator in C
+          -  'ttleapfrog_c' for a time-transformed leapfrog integrator in C, whose stepsize is proportional to the distance from the center (dt is the stepsize at the initial position)
           -  'rk4_c' for a 4th-order Runge-Kutta integrator in C
           -  'rk6_c' for a 6-th order Runge-Kutta integrator in C
           -  'dopr54_c' for a 5-4 Dormand-Prince integrator in C
@@ -1446,6 +1461,7 @@ class Orbit:
 
         - 2018-10-13 - Written as parallel_map applied to regular Orbit integration - Mathew Bub (UofT)
         - 2018-12-26 - Written to use OpenMP C implementation - Bovy (UofT)
+        - 2026-10-19 - Added diagnostics= option - Agent (local)
         """
         self.check_integrator(method)
         pot = flatten_potential(pot)
@@ -1480,6 +1496,8 @@ class Orbit:
         # Delete attributes for interpolation and rperi etc. determination
         if hasattr(self, "_orbInterp"):
             delattr(self, "_orbInterp")
+        if hasattr(self, "_integrate_diagnostics"):
+            delattr(self, "_integrate_diagnostics")
         if self.dim() == 2:
             thispot = toPlanarPotential(pot)
         else:
@@ -1525,13 +1543,14 @@ class Orbit:
                 "Using C implementation to integrate orbits", galpyWarningVerbose
             )
             if self.dim() == 1:
-                out, msg = integrateLinearOrbit_c(
+                out, msg, *stats = integrateLinearOrbit_c(
                     self._pot,
                     numpy.copy(self.vxvv),
                     t,
                     method,
                     progressbar=progressbar,
                     dt=dt,
+                    return_stats=diagnostics,
                 )
             else:
                 if self.phasedim() == 3 or self.phasedim() == 5:
@@ -1542,18 +1561,34 @@ class Orbit:
                 else:
                     vxvvs = numpy.copy(self.vxvv)
                 if self.dim() == 2:
-                    out, msg = integratePlanarOrbit_c(
-                        self._pot, vxvvs, t, method, progressbar=progressbar, dt=dt
+                    out, msg, *stats = integratePlanarOrbit_c(
+                        self._pot,
+                        vxvvs,
+                        t,
+                        method,
+                        progressbar=progressbar,
+                        dt=dt,
+                        return_stats=diagnostics,
                     )
                 else:
-                    out, msg = integrateFullOrbit_c(
-                        self._pot, vxvvs, t, method, progressbar=progressbar, dt=dt
+                    out, msg, *stats = integrateFullOrbit_c(
+                        self._pot,
+                        vxvvs,
+                        t,
+                        method,
+                        progressbar=progressbar,
+                        dt=dt,
+                        return_stats=diagnostics,
                     )
 
                 if self.phasedim() == 3 or self.phasedim() == 5:
                     out = out[:, :, :-1]
         # Store orbit internally
         self.orbit = out
+        if diagnostics:
+            self._set_integrate_diagnostics(
+                stats[0] if "_c" in method and ext_loaded and not force_map else None
+            )
         # Check whether r ever < minr if dynamical friction is included
         # and warn if so
         # or if using interpSphericalPotential and r < rmin or r > rmax
@@ -1616,6 +1651,208 @@ class Orbit:
                 )
         return None
 
+    def _set_integrate_diagnostics(self, stats):
+        """Store the integration diagnostics; stats is the (nobj,4) array returned by the C integrators or None for the Python integrators"""
+        if stats is None:
+            warnings.warn(
+                "Step and force-evaluation counts are only available for the C integrators; only the energy error is recorded",
+                galpyWarning,
+            )
+            stats = numpy.full((self.size, 4), numpy.nan)
+        stats = numpy.atleast_2d(stats)
+        # Energy error is only meaningful for conservative potentials
+        if _isDissipative(self._pot):
+            dEE = numpy.full(self.size, numpy.nan)
+        else:
+            Es = numpy.reshape(
+                self.E(self.t[[0, -1]], use_physical=False), (self.size, 2)
+            )
+            dEE = (Es[:, 1] - Es[:, 0]) / numpy.fabs(Es[:, 0])
+        self._integrate_diagnostics = {
+            "naccept": stats[:, 0],
+            "nreject": stats[:, 1],
+            "nfev": stats[:, 2],
+            "hmin": stats[:, 3],
+            "dEE": dEE,
+        }
+        return None
+
+    def integration_diagnostics(self):
+        """
+        Return the integration diagnostics recorded when integrating with diagnostics=True.
+
+        Returns
+        -------
+        dict
+            Dictionary with per-orbit arrays of shape self.shape: 'naccept' (number of accepted steps), 'nreject' (number of rejected steps), 'nfev' (number of force evaluations, not including those used to estimate the stepsize of fixed-step integrators), 'hmin' (smallest stepsize taken, in internal units), and 'dEE' (relative energy error between the first and last time).
+
+        Notes
+        -----
+        - Step and force-evaluation counts are only available for the C integrators and are NaN otherwise.
+        - The relative energy error is only meaningful for time-independent, conservative potentials and is NaN when the orbit was integrated including a DissipativeForce.
+        - 2026-10-19 - Written - Agent (local)
+        """
+        if not hasattr(self, "_integrate_diagnostics"):
+            raise AttributeError(
+                "Integration diagnostics not available; integrate the orbit with diagnostics=True first"
+            )
+        return {
+            key: numpy.reshape(val, self.shape)
+            for key, val in self._integrate_diagnostics.items()
+        }
+
+    def integrate_satellites(
+        self,
+        t,
+        pot,
+        satellite_pots,
+        dynfric=None,
+        reflex=False,
+        dt=None,
+        rtol=None,
+        atol=None,
+    ):
+        """
+        Integrate the orbits in this instance as a system of satellites that are coupled through their mutual gravitational interactions.
+
+        Parameters
+        ----------
+        t : list, numpy.ndarray or Quantity
+            List of times at which to compute the orbits. The initial condition is t[0]; the time array can be non-equispaced.
+        pot : Potential or list of Potential instances
+            Gravitational potential of the host.
+        satellite_pots : list of Potential instances or list of lists of Potential instances
+            For each orbit, the (axisymmetric) potential of the satellite, centered on the satellite.
+        dynfric : list of DissipativeForce instances, optional
+            For each orbit, the dynamical friction (e.g., a ChandrasekharDynamicalFrictionForce) acting on the satellite; entries can be None to not include dynamical friction for that satellite. Default is None, which does not include dynamical friction for any satellite.
+        reflex : bool, optional
+            If True, include the reflex motion of the host, whose center is accelerated by the satellites. The satellites are then integrated in the non-inertial frame centered on the host. Default is False.
+        dt : float or Quantity, optional
+            If set, force the integrator to use this stepsize.
+        rtol : float, optional
+            Relative tolerance of the integrator.
+        atol : float, optional
+            Absolute tolerance of the integrator.
+
+        Returns
+        -------
+        None
+            Get the actual orbits using getOrbit() or access the individual attributes (e.g., R, vR, etc.); use satellite_potential() to obtain the time-dependent potential of the satellites for integrating test particles.
+
+        Notes
+        -----
+        - The coupled system of all satellites is integrated using the 8-5-3 Dormand-Prince integrator in C.
+        - The host is treated as a rigid potential; when reflex=True, its center moves in response to the satellites, but its shape does not change.
+        - 2026-10-19 - Written - Agent (local)
+        """
+        if self.dim() != 3 or self.phasedim() != 6:
+            raise NotImplementedError(
+                "Satellite integration is only supported for full 3D orbits with phase-space dimension 6"
+            )
+        if not ext_loaded:  # pragma: no cover
+            raise RuntimeError(
+                "Satellite integration requires the C extension to be loaded"
+            )
+        pot = flatten_potential(pot)
+        _check_potential_dim(self, pot)
+        _check_consistent_units(self, pot)
+        if len(satellite_pots) != self.size:
+            raise ValueError(
+                "satellite_pots should contain one potential for each orbit"
+            )
+        if dynfric is None:
+            dynfric = [None] * self.size
+        elif len(dynfric) != self.size:
+            raise ValueError("dynfric should contain one entry for each orbit")
+        satellite_pots = [flatten_potential(p) for p in satellite_pots]
+        for sp in satellite_pots:
+            if _isNonAxi(sp):
+                raise NotImplementedError(
+                    "Satellite integration for non-axisymmetric satellite potentials is not currently supported"
+                )
+            _check_consistent_units(self, sp)
+        host_pots = [
+            flatten_potential([pot]) + ([] if df is None else flatten_potential([df]))
+            for df in dynfric
+        ]
+        if not numpy.all([_check_c(p) for p in host_pots + satellite_pots]):
+            raise NotImplementedError(
+                "Satellite integration requires all host, satellite, and dynamical-friction forces to have C implementations"
+            )
+        # Parse t
+        if _APY_LOADED and isinstance(t, units.Quantity):
+            self._integrate_t_asQuantity = True
+            t = conversion.parse_time(t, ro=self._ro, vo=self._vo)
+        else:
+            self._integrate_t_asQuantity = False
+        if _APY_LOADED and not dt is None and isinstance(dt, units.Quantity):
+            dt = conversion.parse_time(dt, ro=self._ro, vo=self._vo)
+        # Delete attributes for interpolation and rperi etc. determination
+        if hasattr(self, "_orbInterp"):
+            delattr(self, "_orbInterp")
+        if hasattr(self, "_integrate_diagnostics"):
+            delattr(self, "_integrate_diagnostics")
+        self.t = numpy.array(t)
+        self._pot = pot
+        warnings.warn("Using C implementation to integrate orbits", galpyWarningVerbose)
+        out, hostacc, msg = integrateSatellites_c(
+            host_pots,
+            satellite_pots,
+            numpy.copy(self.vxvv),
+            self.t,
+            reflex=reflex,
+            rtol=rtol,
+            atol=atol,
+            dt=dt,
+        )
+        if msg == 1:
+            warnings.warn(
+                "Satellite integration reached the maximum step reduction; the orbits may be inaccurate (decrease rtol and atol or set dt to avoid this)",
+                galpyWarning,
+            )
+        elif msg != 0:
+            raise RuntimeError(f"Satellite integration failed with error code {msg}")
+        self.orbit = out
+        self._satellite_pots = satellite_pots
+        self._satellite_hostacc = hostacc
+        return None
+
+    def satellite_potential(self):
+        """
+        Return the time-dependent potential of the satellites integrated with integrate_satellites, for use in integrating test particles.
+
+        Returns
+        -------
+        list of Potential and Force instances
+            A MovingObjectPotential for each satellite and, if the satellites were integrated with reflex=True, a NonInertialFrameForce that represents the fictitious force from the acceleration of the host's center (the test particles are then integrated in the frame centered on the host). Add the host potential to this list to integrate test particles.
+
+        Notes
+        -----
+        - The potentials are only valid over the time range over which the satellites were integrated.
+        - 2026-10-19 - Written - Agent (local)
+        """
+        if not hasattr(self, "_satellite_pots"):
+            raise AttributeError(
+                "Satellite potential not available; integrate the orbits with integrate_satellites first"
+            )
+        from ..potential import MovingObjectPotential, NonInertialFrameForce
+
+        out = [
+            MovingObjectPotential(
+                self[ii], pot=self._satellite_pots[ii], ro=self._ro, vo=self._vo
+            )
+            for ii in range(self.size)
+        ]
+        if self._satellite_hostacc is not None:
+            a0 = [
+                interpolate.InterpolatedUnivariateSpline(
+                    self.t, self._satellite_hostacc[:, ii], k=3
+                )
+                for ii in range(3)
+            ]
+            out.append(NonInertialFrameForce(a0=a0, ro=self._ro, vo=self._vo))
+        return out
+
     def integrate_SOS(
         self,
         psi,
@@ -2125,20 +2362,27 @@ class Orbit:
                     + thiso[2] ** 2.0 / 2.0
                 ).T
             except (ValueError, TypeError, IndexError):
-                out = (
-                    numpy.array(
-                        [
+                # Evaluate all times and orbits in a single C call
+                # rather than looping over them when possible
+                out = _evaluate_energy_c(pot, thiso, t, ro=self._ro, vo=self._vo)
+                if out is None:
+                    out = (
+                        numpy.array(
                             [
-                                evaluateplanarPotentials(
-                                    pot, thiso[0][ii][jj], t=t[ii], use_physical=False
-                                )
-                                for ii in range(len(thiso[0]))
+                                [
+                                    evaluateplanarPotentials(
+                                        pot,
+                                        thiso[0][ii][jj],
+                                        t=t[ii],
+                                        use_physical=False,
+                                    )
+                                    for ii in range(len(thiso[0]))
+                                ]
+                                for jj in range(self.size)
                             ]
-                            for jj in range(self.size)
-                        ]
+                        )
+                        + (thiso[1] ** 2.0 / 2.0 + thiso[2] ** 2.0 / 2.0).T
                     )
-                    + (thiso[1] ** 2.0 / 2.0 + thiso[2] ** 2.0 / 2.0).T
-                )
         elif self.phasedim() == 4:
             try:
                 out = (
@@ -2153,24 +2397,28 @@ class Orbit:
                     + thiso[2] ** 2.0 / 2.0
                 ).T
             except (ValueError, TypeError, IndexError):
-                out = (
-                    numpy.array(
-                        [
+                # Evaluate all times and orbits in a single C call
+                # rather than looping over them when possible
+                out = _evaluate_energy_c(pot, thiso, t, ro=self._ro, vo=self._vo)
+                if out is None:
+                    out = (
+                        numpy.array(
                             [
-                                evaluateplanarPotentials(
-                                    pot,
-                                    thiso[0][ii][jj],
-                                    t=t[ii],
-                                    phi=thiso[-1][ii][jj],
-                                    use_physical=False,
-                                )
-                                for ii in range(len(thiso[0]))
+                                [
+                                    evaluateplanarPotentials(
+                                        pot,
+                                        thiso[0][ii][jj],
+                                        t=t[ii],
+                                        phi=thiso[-1][ii][jj],
+                                        use_physical=False,
+                                    )
+                                    for ii in range(len(thiso[0]))
+                                ]
+                                for jj in range(self.size)
                             ]
-                            for jj in range(self.size)
-                        ]
+                        )
+                        + (thiso[1] ** 2.0 / 2.0 + thiso[2] ** 2.0 / 2.0).T
                     )
-                    + (thiso[1] ** 2.0 / 2.0 + thiso[2] ** 2.0 / 2.0).T
-                )
         elif self.phasedim() == 5:
             z = kwargs.get("_z", 1.0) * thiso[3]  # For ER and Ez
             vz = kwargs.get("_vz", 1.0) * thiso[4]  # For ER and Ez
@@ -2188,24 +2436,38 @@ class Orbit:
                     + vz**2.0 / 2.0
                 ).T
             except (ValueError, TypeError, IndexError):
-                out = (
-                    numpy.array(
-                        [
+                # Evaluate all times and orbits in a single C call
+                # rather than looping over them when possible
+                out = _evaluate_energy_c(
+                    pot,
+                    numpy.stack((thiso[0], thiso[1], thiso[2], z, vz, *thiso[5:])),
+                    t,
+                    ro=self._ro,
+                    vo=self._vo,
+                )
+                if out is None:
+                    out = (
+                        numpy.array(
                             [
-                                evaluatePotentials(
-                                    pot,
-                                    thiso[0][ii][jj],
-                                    z[ii][jj],
-                                    t=t[ii],
-                                    use_physical=False,
-                                )
-                                for ii in range(len(thiso[0]))
+                                [
+                                    evaluatePotentials(
+                                        pot,
+                                        thiso[0][ii][jj],
+                                        z[ii][jj],
+                                        t=t[ii],
+                                        use_physical=False,
+                                    )
+                                    for ii in range(len(thiso[0]))
+                                ]
+                                for jj in range(self.size)
                             ]
-                            for jj in range(self.size)
-                        ]
+                        )
+                        + (
+                            thiso[1] ** 2.0 / 2.0
+                            + thiso[2] ** 2.0 / 2.0
+                            + vz**2.0 / 2.0
+                        ).T
                     )
-                    + (thiso[1] ** 2.0 / 2.0 + thiso[2] ** 2.0 / 2.0 + vz**2.0 / 2.0).T
-                )
         elif self.phasedim() == 6:
             z = kwargs.get("_z", 1.0) * thiso[3]  # For ER and Ez
             vz = kwargs.get("_vz", 1.0) * thiso[4]  # For ER and Ez
@@ -2224,25 +2486,39 @@ class Orbit:
                     + vz**2.0 / 2.0
                 ).T
             except (ValueError, TypeError, IndexError):
-                out = (
-                    numpy.array(
-                        [
+                # Evaluate all times and orbits in a single C call
+                # rather than looping over them when possible
+                out = _evaluate_energy_c(
+                    pot,
+                    numpy.stack((thiso[0], thiso[1], thiso[2], z, vz, *thiso[5:])),
+                    t,
+                    ro=self._ro,
+                    vo=self._vo,
+                )
+                if out is None:
+                    out = (
+                        numpy.array(
                             [
-                                evaluatePotentials(
-                                    pot,
-                                    thiso[0][ii][jj],
-                                    z[ii][jj],
-                                    t=t[ii],
-                                    phi=thiso[-1][ii][jj],
-                                    use_physical=False,
-                                )
-                                for ii in range(len(thiso[0]))
+                                [
+                                    evaluatePotentials(
+                                        pot,
+                                        thiso[0][ii][jj],
+                                        z[ii][jj],
+                                        t=t[ii],
+                                        phi=thiso[-1][ii][jj],
+                                        use_physical=False,
+                                    )
+                                    for ii in range(len(thiso[0]))
+                                ]
+                                for jj in range(self.size)
                             ]
-                            for jj in range(self.size)
-                        ]
+                        )
+                        + (
+                            thiso[1] ** 2.0 / 2.0
+                            + thiso[2] ** 2.0 / 2.0
+                            + vz**2.0 / 2.0
+                        ).T
                     )
-                    + (thiso[1] ** 2.0 / 2.0 + thiso[2] ** 2.0 / 2.0 + vz**2.0 / 2.0).T
-                )
         if onet:
             return out[:, 0]
         else:
@@ -3006,17 +3282,13 @@ class Orbit:
         if len(Lz) > 500:
             # Build interpolation grid, 500 ~ 1s
             precomputergLzgrid = numpy.linspace(numpy.nanmin(Lz), numpy.nanmax(Lz), 500)
-            rls = numpy.array(
-                [rl(pot, lz, use_physical=False) for lz in precomputergLzgrid]
-            )
+            rls = rl(pot, precomputergLzgrid, use_physical=False)
             # Spline interpolate
             return interpolate.InterpolatedUnivariateSpline(
                 precomputergLzgrid, rls, k=3
             )(Lz).reshape(Lz_shape)
         else:
-            return numpy.array([rl(pot, lz, use_physical=False) for lz in Lz]).reshape(
-                Lz_shape
-            )
+            return rl(pot, Lz, use_physical=False).reshape(Lz_shape)
 
     @physical_conversion("position")
     @shapeDecorator
@@ -3068,17 +3340,13 @@ class Orbit:
         if len(E) > 500:
             # Build interpolation grid
             precomputerEEgrid = numpy.linspace(numpy.nanmin(E), numpy.nanmax(E), 500)
-            rEs = numpy.array(
-                [rE(pot, tE, use_physical=False) for tE in precomputerEEgrid]
-            )
+            rEs = rE(pot, precomputerEEgrid, use_physical=False)
             # Spline interpolate
             return interpolate.InterpolatedUnivariateSpline(
                 precomputerEEgrid, rEs, k=3
             )(E).reshape(E_shape)
         else:
-            return numpy.array([rE(pot, tE, use_physical=False) for tE in E]).reshape(
-                E_shape
-            )
+            return rE(pot, E, use_physical=False).reshape(E_shape)
 
     @physical_conversion("action")
     @shapeDecorator
@@ -3130,17 +3398,13 @@ class Orbit:
         if len(E) > 500:
             # Build interpolation grid
             precomputeLcEEgrid = numpy.linspace(numpy.nanmin(E), numpy.nanmax(E), 500)
-            LcEs = numpy.array(
-                [LcE(pot, tE, use_physical=False) for tE in precomputeLcEEgrid]
-            )
+            LcEs = LcE(pot, precomputeLcEEgrid, use_physical=False)
             # Spline interpolate
             return interpolate.InterpolatedUnivariateSpline(
                 precomputeLcEEgrid, LcEs, k=3
             )(E).reshape(E_shape)
         else:
-            return numpy.array([LcE(pot, tE, use_physical=False) for tE in E]).reshape(
-                E_shape
-            )
+            return LcE(pot, E, use_physical=False).reshape(E_shape)
 
     @physical_conversion("position")
     @shapeDecorator
@@ -5298,6 +5562,8 @@ class Orbit:
           - 'leapfrog_c' for a simple leapfrog implementation in C
           -  'symplec4_c' for a 4th order symplectic integrator in C
           -  'symplec6_c' for a 6th order symplectic integrator in C
+          -  'symplec4fg_c' for a 4th order force-gradient symplectic integrator in C
+          -  'ttleapfrog_c' for a time-transformed leapfrog integrator in C, whose stepsize is proportional to the distance from the center (dt is the stepsize at the initial position)
           -  'rk4_c' for a 4th-order Runge-Kutta integrator in C
           -  'rk6_c' for a 6-th order Runge-Kutta integrator in C
           -  'dopr54_c' for a 5-4 Dormand-Prince integrator in C
@@ -6041,6 +6307,8 @@ class Orbit:
           - 'leapfrog_c' for a simple leapfrog implementation in C
           -  'symplec4_c' for a 4th order symplectic integrator in C
           -  'symplec6_c' for a 6th order symplectic integrator in C
+          -  'symplec4fg_c' for a 4th order force-gradient symplectic integrator in C
+          -  'ttleapfrog_c' for a time-transformed leapfrog integrator in C, whose stepsize is proportional to the distance from the center (dt is the stepsize at the initial position)
           -  'rk4_c' for a 4th-order Runge-Kutta integrator in C
           -  'rk6_c' for a 6-th order Runge-Kutta integrator in C
           -  'dopr54_c' for a 5-4 Dormand-Prince integrator in C
@@ -8268,3 +8536,45 @@ def _check_consistent_units(orb, pot):
     assert physical_compatible(orb, pot), (
         "Physical conversion for the Orbit object is not consistent with that of the Potential given to it"
     )
+
+
+def _evaluate_energy_c(pot, vxvv, t, ro=None, vo=None):
+    """Evaluate the energy for all times and orbits in vxvv=[phasedim,nt,nobj] in a single C call, returns [nobj,nt] or None if this is not possible"""
+    if not ext_loaded:
+        return None
+    # DissipativeForces do not contribute to the energy
+    pot = [p for p in (pot if isinstance(pot, list) else [pot]) if not p.isDissipative]
+    if len(vxvv) % 2 == 1 and _isNonAxi(pot):
+        # Need phi for non-axisymmetric potentials; the Python path raises
+        return None
+    if len(vxvv) < 5:
+        # Planar potentials that have a potential in C are all derived from 3D
+        # ones, evaluate those in the plane
+        if not numpy.all(
+            [
+                isinstance(
+                    p,
+                    (planarPotentialFromRZPotential, planarPotentialFromFullPotential),
+                )
+                for p in pot
+            ]
+        ):
+            return None
+        pot = [p._Pot for p in pot]
+        planar_vxvv = numpy.zeros((5 + (len(vxvv) == 4),) + vxvv.shape[1:])
+        planar_vxvv[:3] = vxvv[:3]
+        if len(vxvv) == 4:
+            planar_vxvv[5] = vxvv[3]
+        vxvv = planar_vxvv
+    if len(pot) == 0 or not _check_c(pot):
+        return None
+    if _APY_LOADED and isinstance(t, units.Quantity):
+        t = conversion.parse_time(t, ro=ro, vo=vo)
+    t = numpy.asarray(t, dtype="float")
+    if t.ndim > 1 or (t.ndim == 1 and len(t) != vxvv.shape[1]):
+        return None
+    t = numpy.broadcast_to(t.reshape(t.shape + (1,) * (2 - t.ndim)), vxvv.shape[1:])
+    out, err = evaluateFullOrbitEnergy_c(pot, vxvv, t)
+    if err:  # Not all potentials have their potential implemented in C
+        return None
+    return out.T
@@ -1,10 +1,9 @@
-from . import Orbits
+from . import Orbits, integrateJaxOrbit
 
 #
 # Functions
 #
-
-# none
+jax_integrator = integrateJaxOrbit.jax_integrator
 
 #
 # Classes
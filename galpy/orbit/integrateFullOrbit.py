@@ -7,18 +7,23 @@ from numpy.ctypeslib import ndpointer
 from scipy import integrate
 
 from .. import potential
-from ..potential.Potential import (
-    _evaluatephitorques,
-    _evaluateRforces,
-    _evaluatezforces,
-)
+from ..potential.CompositePotential import _expand_composite
+from ..potential.Potential import _evaluateforces
 from ..util import _load_extension_libs, galpyWarning, symplecticode
 from ..util._optional_deps import _TQDM_LOADED
 from ..util.leung_dop853 import dop853
 from ..util.multi import parallel_map
 from .integratePlanarOrbit import (
+    _parse_anyaxisymmetricrazorthindisk_pot,
+    _parse_cylindricalspline_pot,
+    _parse_disk_qtable,
+    _parse_ferrers_pot,
     _parse_integrator,
+    _parse_interpspherical_pot,
+    _parse_multipole_pot,
+    _parse_razorthinexponentialdisk_pot,
     _parse_scf_pot,
+    _parse_timedependentscf_pot,
     _parse_tol,
     _prep_tfuncs,
 )
@@ -32,8 +37,7 @@ _lib, _ext_loaded = _load_extension_libs.load_libgalpy()
 def _parse_pot(pot, potforactions=False, potfortorus=False):
     """Parse the potential so it can be fed to C"""
     # Figure out what's in pot
-    if not isinstance(pot, list):
-        pot = [pot]
+    pot = _expand_composite(pot)
     if (potforactions or potfortorus) and (
         (len(pot) == 1 and isinstance(pot[0], potential.NullPotential))
         or numpy.all([isinstance(p, potential.NullPotential) for p in pot])
@@ -92,6 +96,7 @@ def _parse_pot(pot, potforactions=False, potfortorus=False):
             pot_args.extend(p._de_j1_xs)
             pot_args.extend(p._de_j0_weights)
             pot_args.extend(p._de_j1_weights)
+            pot_args.extend(_parse_disk_qtable(p))
         elif isinstance(p, potential.FlattenedPowerPotential):
             pot_type.append(12)
             pot_args.extend([p._amp, p.alpha, p.q2, p.core2])
@@ -215,6 +220,32 @@ def _parse_pot(pot, potforactions=False, potfortorus=False):
                     for ii in range(p._glorder)
                 ]
             )
+            # Precomputed table of the potential, if turned on
+            if p._qtable is None:
+                pot_args.append(0)
+            else:
+                grids = p._qtable["grids"]
+                pot_args.extend([1, *[len(grid) for grid in grids]])
+                pot_args.extend([grids[0][0], grids[0][-1]])
+                pot_args.extend(p._qtable["table"].flatten())
+        elif isinstance(p, potential.CylindricalSplinePotential):
+            # Type 43, see stand-alone parser below
+            pt, pa, ptf = _parse_cylindricalspline_pot(p)
+            pot_type.append(pt)
+            pot_args.extend(pa)
+            pot_tfuncs.extend(ptf)
+        elif isinstance(p, potential.MultipolePotential):
+            # Type 42, see stand-alone parser below
+            pt, pa, ptf = _parse_multipole_pot(p)
+            pot_type.append(pt)
+            pot_args.extend(pa)
+            pot_tfuncs.extend(ptf)
+        elif isinstance(p, potential.TimeDependentSCFPotential):
+            # Type 41, see stand-alone parser below
+            pt, pa, ptf = _parse_timedependentscf_pot(p)
+            pot_type.append(pt)
+            pot_args.extend(pa)
+            pot_tfuncs.extend(ptf)
         elif isinstance(p, potential.SCFPotential):
             # Type 24, see stand-alone parser below
             pt, pa, ptf = _parse_scf_pot(p)
@@ -279,6 +310,7 @@ def _parse_pot(pot, potforactions=False, potfortorus=False):
                 ]
             )
             pot_args.extend(p._Cs)
+            pot_args.extend([numpy.nan, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0])  # for caching
         # 30: PerfectEllipsoidPotential, done with others above
         # 31: KGPotential
         # 32: IsothermalDiskPotential
@@ -291,14 +323,14 @@ def _parse_pot(pot, potforactions=False, potfortorus=False):
         elif isinstance(p, potential.HomogeneousSpherePotential):
             pot_type.append(35)
             pot_args.extend([p._amp, p._R2, p._R3])
-        elif isinstance(p, potential.interpSphericalPotential):
-            pot_type.append(36)
-            pot_args.append(len(p._rgrid))
-            pot_args.extend(p._rgrid)
-            pot_args.extend(p._rforce_grid)
-            pot_args.extend(
-                [p._amp, p._rmin, p._rmax, p._total_mass, p._Phi0, p._Phimax]
-            )
+        elif isinstance(
+            p, (potential.interpSphericalPotential, potential.AnySphericalPotential)
+        ):
+            # Type 36, see stand-alone parser below
+            pt, pa, ptf = _parse_interpspherical_pot(p)
+            pot_type.append(pt)
+            pot_args.extend(pa)
+            pot_tfuncs.extend(ptf)
         # 37: TriaxialGaussianPotential, done with others above
         # 38: PowerTriaxialPotential, done with others above
         elif isinstance(p, potential.NonInertialFrameForce):
@@ -352,6 +384,30 @@ def _parse_pot(pot, potforactions=False, potfortorus=False):
         elif isinstance(p, potential.NullPotential):
             pot_type.append(40)
             # No arguments, zero forces
+        elif isinstance(p, potential.RingPotential):
+            pot_type.append(44)
+            pot_args.extend([p._amp, p.a])
+        elif isinstance(p, potential.SphericalShellPotential):
+            pot_type.append(45)
+            pot_args.extend([p._amp, p.a])
+        elif isinstance(p, potential.RazorThinExponentialDiskPotential):
+            # Type 46, see stand-alone parser below
+            pt, pa, ptf = _parse_razorthinexponentialdisk_pot(p)
+            pot_type.append(pt)
+            pot_args.extend(pa)
+            pot_tfuncs.extend(ptf)
+        elif isinstance(p, potential.FerrersPotential):
+            # Type 47, see stand-alone parser below
+            pt, pa, ptf = _parse_ferrers_pot(p)
+            pot_type.append(pt)
+            pot_args.extend(pa)
+            pot_tfuncs.extend(ptf)
+        elif isinstance(p, potential.AnyAxisymmetricRazorThinDiskPotential):
+            # Type 48, see stand-alone parser below
+            pt, pa, ptf = _parse_anyaxisymmetricrazorthindisk_pot(p)
+            pot_type.append(pt)
+            pot_args.extend(pa)
+            pot_tfuncs.extend(ptf)
         ############################## WRAPPERS ###############################
         elif isinstance(p, potential.DehnenSmoothWrapperPotential):
             pot_type.append(-1)
@@ -411,6 +467,59 @@ def _parse_pot(pot, potforactions=False, potfortorus=False):
             pot_args.extend(p._orb.z(p._orb.t, use_physical=False))
             pot_args.extend([p._amp])
             pot_args.extend([p._orb.t[0], p._orb.t[-1]])  # t_0, t_f
+        elif isinstance(p, potential.ManyMovingObjectsPotential):
+            pot_type.append(-11)
+            # The wrapped potentials are the objects' potentials, one group
+            # for all objects or one group per object
+            wrap_npots, wrap_pot_args = [], []
+            for pp in p._pots:
+                wrap_npot, wrap_pot_type, wrap_pot_arg, wrap_pot_tfuncs = _parse_pot(
+                    pp, potforactions=potforactions, potfortorus=potfortorus
+                )
+                wrap_npots.append(wrap_npot)
+                pot_type.extend(wrap_pot_type)
+                wrap_pot_args.extend(wrap_pot_arg)
+                pot_tfuncs.extend(wrap_pot_tfuncs)
+            pot_args.append(sum(wrap_npots))
+            pot_args.extend(wrap_pot_args)
+            pot_args.extend(
+                [
+                    p._amp,
+                    p._nobj,
+                    len(p._ts),
+                    -1.0 if p._rcut is None else p._rcut**2.0,
+                    len(wrap_npots),
+                ]
+            )
+            pot_args.extend(wrap_npots)
+            pot_args.extend(p._ts)
+            pot_args.extend(p._xyz.flatten())
+            pot_args.extend(p._xyz2.flatten())
+            pot_args.extend(
+                [numpy.nan, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
+            )  # for caching
+        elif isinstance(p, potential.TimeInterpolatedPotential):
+            pot_type.append(-12)
+            # The wrapped potentials are the snapshots in order, which are
+            # loaded one by one if they are stored in files
+            wrap_npots, wrap_pot_args = [], []
+            for ii in range(p._nsnap):
+                wrap_npot, wrap_pot_type, wrap_pot_arg, wrap_pot_tfuncs = _parse_pot(
+                    p._snapshot(ii),
+                    potforactions=potforactions,
+                    potfortorus=potfortorus,
+                )
+                wrap_npots.append(wrap_npot)
+                pot_type.extend(wrap_pot_type)
+                wrap_pot_args.extend(wrap_pot_arg)
+                pot_tfuncs.extend(wrap_pot_tfuncs)
+            pot_args.append(sum(wrap_npots))
+            pot_args.extend(wrap_pot_args)
+            pot_args.extend([p._amp, p._nsnap])
+            pot_args.extend(wrap_npots)
+            pot_args.extend(numpy.cumsum([0] + wrap_npots[:-1]))
+            pot_args.extend(p._ts)
+            pot_args.append(0)  # for caching
         elif isinstance(p, potential.ChandrasekharDynamicalFrictionForce):
             pot_type.append(-7)
             wrap_npot, wrap_pot_type, wrap_pot_args, wrap_pot_tfuncs = _parse_pot(
@@ -484,7 +593,15 @@ def _parse_pot(pot, potforactions=False, potfortorus=False):
 
 
 def integrateFullOrbit_c(
-    pot, yo, t, int_method, rtol=None, atol=None, progressbar=True, dt=None
+    pot,
+    yo,
+    t,
+    int_method,
+    rtol=None,
+    atol=None,
+    progressbar=True,
+    dt=None,
+    return_stats=False,
 ):
     """
     Integrate an ode for a FullOrbit.
@@ -507,15 +624,19 @@ def integrateFullOrbit_c(
         If True, display a tqdm progress bar when integrating multiple orbits (requires tqdm to be installed!).
     dt : float, optional
         Force integrator to use this stepsize (default is to automatically determine one; only for C-based integrators).
+    return_stats : bool, optional
+        If True, also return per-orbit integration statistics (default: False).
 
     Returns
     -------
     tuple
-        (y, err)
+        (y, err) or (y, err, stats) if return_stats
         y : array, shape (N,len(t),6)  or (len(t),6) if N = 1
             Array containing the value of y for each desired time in t, with the initial value y0 in the first row.
         err : int or array of ints
             Error message, if not zero: 1 means maximum step reduction happened for adaptive integrators.
+        stats : array, shape (N,4) or (4) if N = 1
+            Only returned if return_stats=True: number of accepted steps, number of rejected steps, number of force evaluations (not including those used to estimate the stepsize of fixed-step integrators), and the smallest stepsize taken.
 
     Notes
     -----
@@ -539,6 +660,8 @@ def integrateFullOrbit_c(
     # Set up result array
     result = numpy.empty((nobj, len(t), 6))
     err = numpy.zeros(nobj, dtype=numpy.int32)
+    if return_stats:
+        stats = numpy.zeros((nobj, 4))
 
     # Set up progressbar
     progressbar *= _TQDM_LOADED
@@ -566,6 +689,7 @@ def integrateFullOrbit_c(
         ctypes.c_double,
         ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
         ndpointer(dtype=numpy.int32, flags=ndarrayFlags),
+        ctypes.c_void_p,
         ctypes.c_int,
         ctypes.c_void_p,
     ]
@@ -576,6 +700,8 @@ def integrateFullOrbit_c(
     t = numpy.require(t, dtype=numpy.float64, requirements=["C", "W"])
     result = numpy.require(result, dtype=numpy.float64, requirements=["C", "W"])
     err = numpy.require(err, dtype=numpy.int32, requirements=["C", "W"])
+    if return_stats:
+        stats = numpy.require(stats, dtype=numpy.float64, requirements=["C", "W"])
 
     # Run the C code
     integrationFunc(
@@ -592,6 +718,7 @@ def integrateFullOrbit_c(
         ctypes.c_double(atol),
         result,
         err,
+        stats.ctypes.data_as(ctypes.c_void_p) if return_stats else None,
         ctypes.c_int(int_method_c),
         pbar_c,
     )
@@ -609,9 +736,307 @@ def integrateFullOrbit_c(
         t = numpy.asfortranarray(t)
 
     if single_obj:
-        return (result[0], err[0])
+        out = (result[0], err[0])
+        if return_stats:
+            out += (stats[0],)
     else:
-        return (result, err)
+        out = (result, err)
+        if return_stats:
+            out += (stats,)
+    return out
+
+
+def evaluateFullOrbitEnergy_c(pot, vxvv, t):
+    """
+    Evaluate the energy along a set of FullOrbits in C.
+
+    Parameters
+    ----------
+    pot : Potential or list of such instances
+        The potential (or list thereof) to evaluate the energy in.
+    vxvv : numpy.ndarray
+        Phase-space positions [R,vR,vT,z,vz(,phi)], shape (5 or 6,...).
+    t : numpy.ndarray
+        Times of the phase-space positions, shape vxvv.shape[1:].
+
+    Returns
+    -------
+    tuple
+        (E,err)
+        E : numpy.ndarray, shape vxvv.shape[1:]
+            Energy at each phase-space position.
+        err : int
+            Error message, if not zero: -1 means that not all potentials have their potential implemented in C.
+
+    Notes
+    -----
+    - 2026-10-19 - Written - Agent (local)
+    """
+    phasedim = vxvv.shape[0]
+    out_shape = vxvv.shape[1:]
+    ndata = int(numpy.prod(out_shape))
+    npot, pot_type, pot_args, pot_tfuncs = _parse_pot(pot)
+    pot_tfuncs = _prep_tfuncs(pot_tfuncs)
+
+    # Set up result array
+    out = numpy.empty(ndata)
+    err = ctypes.c_int(0)
+
+    # Set up the C code
+    ndarrayFlags = ("C_CONTIGUOUS", "WRITEABLE")
+    evalFunc = _lib.evaluateFullOrbitEnergy
+    evalFunc.argtypes = [
+        ctypes.c_int,
+        ctypes.c_int,
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ctypes.c_int,
+        ndpointer(dtype=numpy.int32, flags=ndarrayFlags),
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ctypes.c_void_p,
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ctypes.POINTER(ctypes.c_int),
+    ]
+
+    # Array requirements
+    vxvv = numpy.require(
+        numpy.reshape(vxvv, (phasedim, ndata)),
+        dtype=numpy.float64,
+        requirements=["C", "W"],
+    )
+    t = numpy.require(
+        numpy.broadcast_to(t, out_shape).reshape(ndata),
+        dtype=numpy.float64,
+        requirements=["C", "W"],
+    )
+
+    # Run the C code
+    evalFunc(
+        ctypes.c_int(ndata),
+        ctypes.c_int(phasedim),
+        vxvv,
+        t,
+        ctypes.c_int(npot),
+        pot_type,
+        pot_args,
+        pot_tfuncs,
+        out,
+        ctypes.byref(err),
+    )
+    return (numpy.reshape(out, out_shape), err.value)
+
+
+_QUANTITIES = {
+    "potential": 0,
+    "Rforce": 1,
+    "zforce": 2,
+    "phitorque": 3,
+    "dens": 4,
+}
+
+
+def evaluatePotentialQuantity_c(pot, quantity, R, z, phi, t):
+    """
+    Evaluate the potential, forces, or density of a list of potentials in C.
+
+    Parameters
+    ----------
+    pot : Potential or list of such instances
+        The potential (or list thereof) to evaluate.
+    quantity : str
+        Quantity to evaluate: 'potential', 'Rforce', 'zforce', 'phitorque', or 'dens'.
+    R : numpy.ndarray
+        Cylindrical Galactocentric radius.
+    z : numpy.ndarray
+        Vertical height, same shape as R.
+    phi : numpy.ndarray
+        Azimuth, same shape as R.
+    t : numpy.ndarray
+        Time, same shape as R.
+
+    Returns
+    -------
+    tuple
+        (out,incl)
+        out : numpy.ndarray, shape R.shape
+            Sum of the quantity for all potentials that have it implemented in C.
+        incl : numpy.ndarray, shape (len(pot))
+            Boolean array indicating which potentials were included in out.
+
+    Notes
+    -----
+    - 2026-10-19 - Written - Agent (local)
+    """
+    out_shape = numpy.shape(R)
+    ndata = int(numpy.prod(out_shape))
+    npot, pot_type, pot_args, pot_tfuncs = _parse_pot(pot)
+    pot_tfuncs = _prep_tfuncs(pot_tfuncs)
+
+    # Set up result arrays
+    out = numpy.empty(ndata)
+    incl = numpy.zeros(npot, dtype=numpy.int32)
+
+    # Set up the C code
+    ndarrayFlags = ("C_CONTIGUOUS", "WRITEABLE")
+    evalFunc = _lib.evaluatePotentialQuantity
+    evalFunc.argtypes = [
+        ctypes.c_int,
+        ctypes.c_int,
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ctypes.c_int,
+        ndpointer(dtype=numpy.int32, flags=ndarrayFlags),
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ctypes.c_void_p,
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ndpointer(dtype=numpy.int32, flags=ndarrayFlags),
+    ]
+
+    # Array requirements
+    R, z, phi, t = (
+        numpy.require(
+            numpy.reshape(x, ndata), dtype=numpy.float64, requirements=["C", "W"]
+        )
+        for x in (R, z, phi, t)
+    )
+
+    # Run the C code
+    evalFunc(
+        ctypes.c_int(_QUANTITIES[quantity]),
+        ctypes.c_int(ndata),
+        R,
+        z,
+        phi,
+        t,
+        ctypes.c_int(npot),
+        pot_type,
+        pot_args,
+        pot_tfuncs,
+        out,
+        incl,
+    )
+    return (numpy.reshape(out, out_shape), incl.astype(bool))
+
+
+def integrateSatellites_c(
+    host_pots, sat_pots, yo, t, reflex=False, rtol=None, atol=None, dt=None
+):
+    """
+    Integrate a system of satellites coupled through their mutual interactions in C.
+
+    Parameters
+    ----------
+    host_pots : list of lists of Potential or DissipativeForce instances
+        For each satellite, the host forces acting on it (host potential and, e.g., the satellite's dynamical friction).
+    sat_pots : list of lists of Potential instances
+        For each satellite, the (axisymmetric) potential of the satellite centered on the satellite.
+    yo : numpy.ndarray
+        Initial conditions [R,vR,vT,z,vz,phi] of the satellites, shape (nsat,6).
+    t : numpy.ndarray
+        Set of times at which one wants the result.
+    reflex : bool, optional
+        If True, include the reflex motion of the host's center, which is accelerated by the satellites; the satellites are then integrated in the non-inertial frame of the host's center (default: False).
+    rtol : float, optional
+        Relative tolerance.
+    atol : float, optional
+        Absolute tolerance.
+    dt : float, optional
+        Force integrator to use this stepsize (default is to automatically determine one).
+
+    Returns
+    -------
+    tuple
+        (y, hostacc, err)
+        y : numpy.ndarray, shape (nsat,len(t),6)
+            Orbits of the satellites.
+        hostacc : numpy.ndarray, shape (len(t),3) or None
+            Rectangular acceleration of the host's center (None if not reflex).
+        err : int
+            Error message, if not zero: 1 means maximum step reduction happened.
+
+    Notes
+    -----
+    - Integration is performed using dop853 for the coupled system.
+    - 2026-10-19 - Written - Agent (local)
+    """
+    yo = numpy.atleast_2d(yo)
+    nsat = len(yo)
+    rtol, atol = _parse_tol(rtol, atol)
+    npot, pot_type, pot_args, pot_tfuncs = [], [], [], []
+    for pot in list(host_pots) + list(sat_pots):
+        tnpot, tpot_type, tpot_args, tpot_tfuncs = _parse_pot(pot)
+        npot.append(tnpot)
+        pot_type.append(tpot_type)
+        pot_args.append(tpot_args)
+        pot_tfuncs.extend(tpot_tfuncs)
+    npot = numpy.array(npot, dtype=numpy.int32)
+    pot_type = numpy.concatenate(pot_type).astype(numpy.int32)
+    pot_args = numpy.concatenate(pot_args).astype(numpy.float64)
+    pot_tfuncs = _prep_tfuncs(pot_tfuncs)
+    if dt is None:
+        dt = -9999.99
+
+    # Set up result arrays
+    result = numpy.empty((len(t), nsat, 6))
+    hostacc = numpy.zeros((len(t), 3))
+    err = ctypes.c_int(0)
+
+    # Set up the C code
+    ndarrayFlags = ("C_CONTIGUOUS", "WRITEABLE")
+    integrationFunc = _lib.integrateSatellites
+    integrationFunc.argtypes = [
+        ctypes.c_int,
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ctypes.c_int,
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ndpointer(dtype=numpy.int32, flags=ndarrayFlags),
+        ndpointer(dtype=numpy.int32, flags=ndarrayFlags),
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ctypes.c_void_p,
+        ctypes.c_int,
+        ctypes.c_double,
+        ctypes.c_double,
+        ctypes.c_double,
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ctypes.POINTER(ctypes.c_int),
+        ctypes.c_void_p,
+    ]
+
+    # Array requirements
+    yo = numpy.require(numpy.copy(yo), dtype=numpy.float64, requirements=["C", "W"])
+    t = numpy.require(t, dtype=numpy.float64, requirements=["C", "W"])
+
+    # Run the C code
+    integrationFunc(
+        ctypes.c_int(nsat),
+        yo,
+        ctypes.c_int(len(t)),
+        t,
+        npot,
+        pot_type,
+        pot_args,
+        pot_tfuncs,
+        ctypes.c_int(reflex),
+        ctypes.c_double(dt),
+        ctypes.c_double(rtol),
+        ctypes.c_double(atol),
+        result,
+        hostacc,
+        ctypes.byref(err),
+        None,  # no step statistics
+    )
+
+    if err.value == -10:  # pragma: no cover
+        raise KeyboardInterrupt("Orbit integration interrupted by CTRL-C (SIGINT)")
+
+    return (
+        numpy.swapaxes(result, 0, 1),
+        hostacc if reflex else None,
+        err.value,
+    )
 
 
 def integrateFullOrbit_dxdv_c(
@@ -1152,12 +1577,8 @@ def _RZEOM(y, t, pot, l2):
     -----
     - 2010-04-16 - Written - Bovy (NYU).
     """
-    return [
-        y[1],
-        l2 / y[0] ** 3.0 + _evaluateRforces(pot, y[0], y[2], t=t),
-        y[3],
-        _evaluatezforces(pot, y[0], y[2], t=t),
-    ]
+    Rforce, zforce, _ = _evaluateforces(pot, y[0], y[2], t=t)
+    return [y[1], l2 / y[0] ** 3.0 + Rforce, y[3], zforce]
 
 
 def _EOM(y, t, pot):
@@ -1183,21 +1604,16 @@ def _EOM(y, t, pot):
     - 2010-04-16 - Written - Bovy (NYU)
     """
     l2 = (y[0] ** 2.0 * y[3]) ** 2.0
+    Rforce, zforce, phitorque = _evaluateforces(
+        pot, y[0], y[4], phi=y[2], t=t, v=[y[1], y[0] * y[3], y[5]]
+    )
     return [
         y[1],
-        l2 / y[0] ** 3.0
-        + _evaluateRforces(pot, y[0], y[4], phi=y[2], t=t, v=[y[1], y[0] * y[3], y[5]]),
+        l2 / y[0] ** 3.0 + Rforce,
         y[3],
-        1.0
-        / y[0] ** 2.0
-        * (
-            _evaluatephitorques(
-                pot, y[0], y[4], phi=y[2], t=t, v=[y[1], y[0] * y[3], y[5]]
-            )
-            - 2.0 * y[0] * y[1] * y[3]
-        ),
+        1.0 / y[0] ** 2.0 * (phitorque - 2.0 * y[0] * y[1] * y[3]),
         y[5],
-        _evaluatezforces(pot, y[0], y[4], phi=y[2], t=t, v=[y[1], y[0] * y[3], y[5]]),
+        zforce,
     ]
 
 
@@ -1270,12 +1686,11 @@ def _rectForce(x, pot, t=0.0, vx=None):
         vT = -vx[0] * sinphi + vx[1] * cosphi
         vx = [vR, vT, vx[2]]
     # calculate forces
-    Rforce = _evaluateRforces(pot, R, x[2], phi=phi, t=t, v=vx)
-    phitorque = _evaluatephitorques(pot, R, x[2], phi=phi, t=t, v=vx)
+    Rforce, zforce, phitorque = _evaluateforces(pot, R, x[2], phi=phi, t=t, v=vx)
     return numpy.array(
         [
             cosphi * Rforce - 1.0 / R * sinphi * phitorque,
             sinphi * Rforce + 1.0 / R * cosphi * phitorque,
-            _evaluatezforces(pot, R, x[2], phi=phi, t=t, v=vx),
+            zforce,
         ]
     )
@@ -6,6 +6,8 @@ from numpy.ctypeslib import ndpointer
 from scipy import integrate
 
 from .. import potential
+from ..potential import flatten as flatten_potential
+from ..potential.CompositePotential import _expand_composite
 from ..potential.linearPotential import _evaluatelinearForces
 from ..potential.verticalPotential import verticalPotential
 from ..util import _load_extension_libs, symplecticode
@@ -28,6 +30,16 @@ def _parse_pot(pot):
     # Figure out what's in pot
     if not isinstance(pot, list):
         pot = [pot]
+    # Replace vertical CompositePotentials with their vertical components
+    pot = flatten_potential(
+        [
+            potential.toVerticalPotential(_expand_composite(p._Pot), p._R, phi=p._phi)
+            if isinstance(p, verticalPotential)
+            and isinstance(p._Pot, potential.CompositePotential)
+            else p
+            for p in pot
+        ]
+    )
     # Initialize everything
     pot_type = []
     pot_args = []
@@ -123,7 +135,15 @@ def _parse_pot(pot):
 
 
 def integrateLinearOrbit_c(
-    pot, yo, t, int_method, rtol=None, atol=None, progressbar=True, dt=None
+    pot,
+    yo,
+    t,
+    int_method,
+    rtol=None,
+    atol=None,
+    progressbar=True,
+    dt=None,
+    return_stats=False,
 ):
     """
     C integrate an ode for a LinearOrbit
@@ -145,13 +165,16 @@ def integrateLinearOrbit_c(
         if True, display a tqdm progress bar
     dt : float, optional
         force integrator to use this stepsize (default is to automatically determine one; only for C-based integrators)
+    return_stats : bool, optional
+        if True, also return per-orbit integration statistics (default: False)
 
     Returns
     -------
     tuple
-        (y,err)
+        (y,err) or (y,err,stats) if return_stats
         y : Array containing the value of y for each desired time in t, with the initial value y0 in the first row.
         err: error message, if not zero: 1 means maximum step reduction happened for adaptive integrators
+        stats: array, shape (N,4) or (4) if N = 1, number of accepted steps, number of rejected steps, number of force evaluations (not including those used to estimate the stepsize of fixed-step integrators), and the smallest stepsize taken
 
     Notes
     -----
@@ -175,6 +198,8 @@ def integrateLinearOrbit_c(
     # Set up result array
     result = numpy.empty((nobj, len(t), 2))
     err = numpy.zeros(nobj, dtype=numpy.int32)
+    if return_stats:
+        stats = numpy.zeros((nobj, 4))
 
     # Set up progressbar
     progressbar *= _TQDM_LOADED
@@ -202,6 +227,7 @@ def integrateLinearOrbit_c(
         ctypes.c_double,
         ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
         ndpointer(dtype=numpy.int32, flags=ndarrayFlags),
+        ctypes.c_void_p,
         ctypes.c_int,
         ctypes.c_void_p,
     ]
@@ -212,6 +238,8 @@ def integrateLinearOrbit_c(
     t = numpy.require(t, dtype=numpy.float64, requirements=["C", "W"])
     result = numpy.require(result, dtype=numpy.float64, requirements=["C", "W"])
     err = numpy.require(err, dtype=numpy.int32, requirements=["C", "W"])
+    if return_stats:
+        stats = numpy.require(stats, dtype=numpy.float64, requirements=["C", "W"])
 
     # Run the C code
     integrationFunc(
@@ -228,6 +256,7 @@ def integrateLinearOrbit_c(
         ctypes.c_double(atol),
         result,
         err,
+        stats.ctypes.data_as(ctypes.c_void_p) if return_stats else None,
         ctypes.c_int(int_method_c),
         pbar_c,
     )
@@ -245,9 +274,14 @@ def integrateLinearOrbit_c(
         t = numpy.asfortranarray(t)
 
     if single_obj:
-        return (result[0], err[0])
+        out = (result[0], err[0])
+        if return_stats:
+            out += (stats[0],)
     else:
-        return (result, err)
+        out = (result, err)
+        if return_stats:
+            out += (stats,)
+    return out
 
 
 # Python integration functions
@@ -276,13 +310,16 @@ def integrateLinearOrbit(
         if True, display a tqdm progress bar
     dt : float, optional
         force integrator to use this stepsize (default is to automatically determine one; only for C-based integrators)
+    return_stats : bool, optional
+        if True, also return per-orbit integration statistics (default: False)
 
     Returns
     -------
     tuple
-        (y,err)
+        (y,err) or (y,err,stats) if return_stats
         y : Array containing the value of y for each desired time in t, with the initial value y0 in the first row.
         err: error message, if not zero: 1 means maximum step reduction happened for adaptive integrators
+        stats: array, shape (N,4) or (4) if N = 1, number of accepted steps, number of rejected steps, number of force evaluations (not including those used to estimate the stepsize of fixed-step integrators), and the smallest stepsize taken
 
     Notes
     -----
@@ -6,11 +6,13 @@ from numpy.ctypeslib import ndpointer
 from scipy import integrate
 
 from .. import potential
+from ..potential import flatten as flatten_potential
+from ..potential.CompositePotential import _expand_composite
 from ..potential.planarDissipativeForce import (
     planarDissipativeForceFromFullDissipativeForce,
 )
 from ..potential.planarPotential import (
-    _evaluateplanarphitorques,
+    _evaluateplanarforces,
     _evaluateplanarPotentials,
     _evaluateplanarRforces,
     planarPotentialFromFullPotential,
@@ -35,6 +37,18 @@ def _parse_pot(pot):
     # Figure out what's in pot
     if not isinstance(pot, list):
         pot = [pot]
+    # Replace planar CompositePotentials with their planar components
+    pot = flatten_potential(
+        [
+            potential.toPlanarPotential(_expand_composite(p._Pot))
+            if isinstance(
+                p, (planarPotentialFromFullPotential, planarPotentialFromRZPotential)
+            )
+            and isinstance(p._Pot, potential.CompositePotential)
+            else p
+            for p in pot
+        ]
+    )
     # Remove NullPotentials from list of Potentials containing other potentials
     purged_pot = [p for p in pot if not isinstance(p, potential.NullPotential)]
     if len(purged_pot) > 0:
@@ -176,6 +190,7 @@ def _parse_pot(pot):
             pot_args.extend(p._Pot._de_j1_xs)
             pot_args.extend(p._Pot._de_j0_weights)
             pot_args.extend(p._Pot._de_j1_weights)
+            pot_args.extend(_parse_disk_qtable(p._Pot))
         elif isinstance(p, planarPotentialFromRZPotential) and isinstance(
             p._Pot, potential.FlattenedPowerPotential
         ):
@@ -283,6 +298,38 @@ def _parse_pot(pot):
                     for ii in range(p._Pot._glorder)
                 ]
             )
+            # Precomputed table of the potential, if turned on
+            if p._Pot._qtable is None:
+                pot_args.append(0)
+            else:
+                grids = p._Pot._qtable["grids"]
+                pot_args.extend([1, *[len(grid) for grid in grids]])
+                pot_args.extend([grids[0][0], grids[0][-1]])
+                pot_args.extend(p._Pot._qtable["table"].flatten())
+        elif (
+            isinstance(p, planarPotentialFromFullPotential)
+            or isinstance(p, planarPotentialFromRZPotential)
+        ) and isinstance(p._Pot, potential.CylindricalSplinePotential):
+            pt, pa, ptf = _parse_cylindricalspline_pot(p._Pot)
+            pot_type.append(pt)
+            pot_args.extend(pa)
+            pot_tfuncs.extend(ptf)
+        elif (
+            isinstance(p, planarPotentialFromFullPotential)
+            or isinstance(p, planarPotentialFromRZPotential)
+        ) and isinstance(p._Pot, potential.MultipolePotential):
+            pt, pa, ptf = _parse_multipole_pot(p._Pot)
+            pot_type.append(pt)
+            pot_args.extend(pa)
+            pot_tfuncs.extend(ptf)
+        elif (
+            isinstance(p, planarPotentialFromFullPotential)
+            or isinstance(p, planarPotentialFromRZPotential)
+        ) and isinstance(p._Pot, potential.TimeDependentSCFPotential):
+            pt, pa, ptf = _parse_timedependentscf_pot(p._Pot)
+            pot_type.append(pt)
+            pot_args.extend(pa)
+            pot_tfuncs.extend(ptf)
         elif (
             isinstance(p, planarPotentialFromFullPotential)
             or isinstance(p, planarPotentialFromRZPotential)
@@ -365,6 +412,7 @@ def _parse_pot(pot):
                 ]
             )
             pot_args.extend(p._Pot._Cs)
+            pot_args.extend([numpy.nan, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0])  # for caching
         elif isinstance(p, potential.CosmphiDiskPotential):
             pot_type.append(28)
             pot_args.extend(
@@ -392,24 +440,15 @@ def _parse_pot(pot):
         ):
             pot_type.append(35)
             pot_args.extend([p._Pot._amp, p._Pot._R2, p._Pot._R3])
-        # 36: interpSphericalPotential
+        # 36: interpSphericalPotential, also used for AnySphericalPotential
         elif isinstance(p, planarPotentialFromRZPotential) and isinstance(
-            p._Pot, potential.interpSphericalPotential
+            p._Pot,
+            (potential.interpSphericalPotential, potential.AnySphericalPotential),
         ):
-            pot_type.append(36)
-            pot_args.append(len(p._Pot._rgrid))
-            pot_args.extend(p._Pot._rgrid)
-            pot_args.extend(p._Pot._rforce_grid)
-            pot_args.extend(
-                [
-                    p._Pot._amp,
-                    p._Pot._rmin,
-                    p._Pot._rmax,
-                    p._Pot._total_mass,
-                    p._Pot._Phi0,
-                    p._Pot._Phimax,
-                ]
-            )
+            pt, pa, ptf = _parse_interpspherical_pot(p._Pot)
+            pot_type.append(pt)
+            pot_args.extend(pa)
+            pot_tfuncs.extend(ptf)
         # 37: TriaxialGaussianPotential, done with other EllipsoidalPotentials above
         # 38: PowerTriaxialPotential, done with other EllipsoidalPotentials above
         elif isinstance(
@@ -466,6 +505,38 @@ def _parse_pot(pot):
             p._Pot, potential.NullPotential
         ):
             pot_type.append(40)
+        elif isinstance(p, planarPotentialFromRZPotential) and isinstance(
+            p._Pot, potential.RingPotential
+        ):
+            pot_type.append(44)
+            pot_args.extend([p._Pot._amp, p._Pot.a])
+        elif isinstance(p, planarPotentialFromRZPotential) and isinstance(
+            p._Pot, potential.SphericalShellPotential
+        ):
+            pot_type.append(45)
+            pot_args.extend([p._Pot._amp, p._Pot.a])
+        elif isinstance(p, planarPotentialFromRZPotential) and isinstance(
+            p._Pot, potential.RazorThinExponentialDiskPotential
+        ):
+            pt, pa, ptf = _parse_razorthinexponentialdisk_pot(p._Pot)
+            pot_type.append(pt)
+            pot_args.extend(pa)
+            pot_tfuncs.extend(ptf)
+        elif (
+            isinstance(p, planarPotentialFromFullPotential)
+            or isinstance(p, planarPotentialFromRZPotential)
+        ) and isinstance(p._Pot, potential.FerrersPotential):
+            pt, pa, ptf = _parse_ferrers_pot(p._Pot)
+            pot_type.append(pt)
+            pot_args.extend(pa)
+            pot_tfuncs.extend(ptf)
+        elif isinstance(p, planarPotentialFromRZPotential) and isinstance(
+            p._Pot, potential.AnyAxisymmetricRazorThinDiskPotential
+        ):
+            pt, pa, ptf = _parse_anyaxisymmetricrazorthindisk_pot(p._Pot)
+            pot_type.append(pt)
+            pot_args.extend(pa)
+            pot_tfuncs.extend(ptf)
         ############################## WRAPPERS ###############################
         elif (
             (
@@ -554,6 +625,73 @@ def _parse_pot(pot):
             pot_args.extend(p._orb.y(p._orb.t, use_physical=False))
             pot_args.extend([p._amp])
             pot_args.extend([p._orb.t[0], p._orb.t[-1]])  # t_0, t_f
+        elif (
+            (
+                isinstance(p, planarPotentialFromFullPotential)
+                or isinstance(p, planarPotentialFromRZPotential)
+            )
+            and isinstance(p._Pot, potential.ManyMovingObjectsPotential)
+        ) or isinstance(p, potential.ManyMovingObjectsPotential):
+            if not isinstance(p, potential.ManyMovingObjectsPotential):
+                p = p._Pot
+            pot_type.append(-11)
+            # The wrapped potentials are the objects' potentials, one group
+            # for all objects or one group per object
+            wrap_npots, wrap_pot_args = [], []
+            for pp in p._pots:
+                wrap_npot, wrap_pot_type, wrap_pot_arg, wrap_pot_tfuncs = _parse_pot(
+                    potential.toPlanarPotential(pp)
+                )
+                wrap_npots.append(wrap_npot)
+                pot_type.extend(wrap_pot_type)
+                wrap_pot_args.extend(wrap_pot_arg)
+                pot_tfuncs.extend(wrap_pot_tfuncs)
+            pot_args.append(sum(wrap_npots))
+            pot_args.extend(wrap_pot_args)
+            pot_args.extend(
+                [
+                    p._amp,
+                    p._nobj,
+                    len(p._ts),
+                    -1.0 if p._rcut is None else p._rcut**2.0,
+                    len(wrap_npots),
+                ]
+            )
+            pot_args.extend(wrap_npots)
+            pot_args.extend(p._ts)
+            pot_args.extend(p._xyz.flatten())
+            pot_args.extend(p._xyz2.flatten())
+            pot_args.extend(
+                [numpy.nan, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
+            )  # for caching
+        elif (
+            (
+                isinstance(p, planarPotentialFromFullPotential)
+                or isinstance(p, planarPotentialFromRZPotential)
+            )
+            and isinstance(p._Pot, potential.TimeInterpolatedPotential)
+        ) or isinstance(p, potential.TimeInterpolatedPotential):
+            if not isinstance(p, potential.TimeInterpolatedPotential):
+                p = p._Pot
+            pot_type.append(-12)
+            # The wrapped potentials are the snapshots in order, which are
+            # loaded one by one if they are stored in files
+            wrap_npots, wrap_pot_args = [], []
+            for ii in range(p._nsnap):
+                wrap_npot, wrap_pot_type, wrap_pot_arg, wrap_pot_tfuncs = _parse_pot(
+                    potential.toPlanarPotential(p._snapshot(ii))
+                )
+                wrap_npots.append(wrap_npot)
+                pot_type.extend(wrap_pot_type)
+                wrap_pot_args.extend(wrap_pot_arg)
+                pot_tfuncs.extend(wrap_pot_tfuncs)
+            pot_args.append(sum(wrap_npots))
+            pot_args.extend(wrap_pot_args)
+            pot_args.extend([p._amp, p._nsnap])
+            pot_args.extend(wrap_npots)
+            pot_args.extend(numpy.cumsum([0] + wrap_npots[:-1]))
+            pot_args.extend(p._ts)
+            pot_args.append(0)  # for caching
         elif (
             (
                 isinstance(p, planarPotentialFromFullPotential)
@@ -620,6 +758,10 @@ def _parse_integrator(int_method):
         int_method_c = 6
     elif int_method.lower() == "ias15_c":
         int_method_c = 7
+    elif int_method.lower() == "symplec4fg_c":
+        int_method_c = 8
+    elif int_method.lower() == "ttleapfrog_c":
+        int_method_c = 9
     else:
         int_method_c = 0
     return int_method_c
@@ -651,6 +793,138 @@ def _parse_scf_pot(p, extra_amp=1.0):
     return (24, pot_args, [])  # latter is pot_tfuncs
 
 
+def _parse_timedependentscf_pot(p):
+    # Stand-alone parser for TimeDependentSCF, bc used for full and planar
+    # SCF arguments, followed by the piecewise-polynomial time interpolation
+    _, pot_args, _ = _parse_scf_pot(p)
+    ncoeff = (1 + p.isNonAxi) * p._Acos.size
+    pot_args.extend([len(p._ts), numpy.nan])  # nan: no coefficients cached
+    pot_args.extend(p._ts)
+    # Polynomial coefficients of all of the expansion coefficients in each
+    # interval, padded to cubic order
+    cc = numpy.zeros((4, len(p._ts) - 1, ncoeff))
+    interp_c = p._Acos_interp.c.reshape(p._Acos_interp.c.shape[:2] + (-1,))
+    if p.isNonAxi:
+        interp_c = numpy.concatenate(
+            (
+                interp_c,
+                p._Asin_interp.c.reshape(p._Asin_interp.c.shape[:2] + (-1,)),
+            ),
+            axis=2,
+        )
+    cc[4 - len(interp_c) :] = interp_c
+    pot_args.extend(p._amp * cc.flatten(order="C"))
+    return (41, pot_args, [])  # latter is pot_tfuncs
+
+
+def _parse_multipole_pot(p):
+    # Stand-alone parser for Multipole, bc used for full and planar
+    from ..potential.MultipolePotential import _legendre_norm
+
+    nharm = len(p._harmonics)
+    nr = len(p._rgrid)
+    pot_args = [p.isNonAxi, p._L, nharm, nr]
+    pot_args.extend(numpy.log(p._rgrid))
+    pot_args.extend(p._ls)
+    pot_args.extend(p._ms)
+    pot_args.extend(p._sins)
+    pot_args.extend(_legendre_norm(p._ls, p._ms))
+    pot_args.extend(p._amp * p._radial_interp.c.flatten(order="C"))
+    pot_args.extend(p._amp * p._Phi_grid[0])
+    pot_args.extend(p._amp * p._dPhi_grid[0])
+    pot_args.extend(p._amp * p._Phi_grid[-1])
+    pot_args.extend(p._inner_slope)
+    pot_args.extend([numpy.nan, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0])  # for caching
+    return (42, pot_args, [])  # latter is pot_tfuncs
+
+
+def _parse_cylindricalspline_pot(p):
+    # Stand-alone parser for CylindricalSpline, bc used for full and planar
+    pot_args = [p._M, p._zsym, p._omegab, len(p._Rgrid), len(p._zgrid)]
+    pot_args.extend(p._Rgrid)
+    pot_args.extend(p._zgrid)
+    pot_args.extend(p._amp * p._grid.flatten(order="C"))
+    return (43, pot_args, [])  # latter is pot_tfuncs
+
+
+def _parse_interpspherical_pot(p):
+    # Stand-alone parser for interpSpherical, bc used for full and planar;
+    # AnySpherical is parsed through an interpolated version of itself
+    ip = (
+        p._interpolated_for_c() if isinstance(p, potential.AnySphericalPotential) else p
+    )
+    pot_args = [len(ip._rgrid)]
+    pot_args.extend(ip._rgrid)
+    pot_args.extend(ip._rforce_grid)
+    pot_args.extend([p._amp, ip._rmin, ip._rmax, ip._total_mass, ip._Phi0, ip._Phimax])
+    return (36, pot_args, [])  # latter is pot_tfuncs
+
+
+def _parse_razorthinexponentialdisk_pot(p):
+    # Stand-alone parser for RazorThinExponentialDisk, bc used for full and planar
+    pot_args = [p._amp, p._alpha, p._glorder]
+    pot_args.extend(p._glx)
+    pot_args.extend(p._glw)
+    pot_args.extend([numpy.nan, 0.0, 0.0, 0.0])  # for caching
+    return (46, pot_args, [])  # latter is pot_tfuncs
+
+
+def _parse_ferrers_pot(p):
+    # Stand-alone parser for Ferrers, bc used for full and planar
+    pot_args = [
+        p._amp * numpy.pi * p._rhoc_M * p.a**3 * p._b * p._c,
+        p._a2,
+        p._b2 * p._a2,
+        p._c2 * p._a2,
+        p.n,
+        p._pa,
+        p._omegab,
+    ]
+    pot_args.extend([numpy.nan, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0])  # for caching
+    pot_args.append(p._glorder)
+    pot_args.extend(p._glx)
+    pot_args.extend(p._glw)
+    return (47, pot_args, [])  # latter is pot_tfuncs
+
+
+def _parse_anyaxisymmetricrazorthindisk_pot(p):
+    # Stand-alone parser for AnyAxisymmetricRazorThinDisk, bc used for full
+    # and planar; surface-density table followed by the quadrature nodes
+    tables = p._tables_for_c()
+    pot_args = [len(tables["lnagrid"])]
+    pot_args.extend(tables["lnagrid"])
+    pot_args.extend(tables["sgrid"])
+    pot_args.extend(
+        [
+            p._amp,
+            p._pot_zero,
+            numpy.exp(tables["lnagrid"][0]),
+            numpy.exp(tables["lnagrid"][-1]),
+            len(tables["nodes"][0]),
+        ]
+    )
+    for nodes in tables["nodes"]:
+        pot_args.extend(nodes)
+    pot_args.extend(_parse_disk_qtable(p))
+    return (48, pot_args, [])  # latter is pot_tfuncs
+
+
+def _parse_disk_qtable(p):
+    # Precomputed table of the potential of a disk, if turned on, see
+    # DiskQuadratureTableMixin
+    if p._qtable is None:
+        return [0]
+    grids = p._qtable["grids"]
+    multipoles = p._qtable["multipoles"]
+    if multipoles is None:
+        multipoles = []
+    pot_args = [1, len(grids[0]), len(grids[1]), *p._qtable["scales"]]
+    pot_args.extend([p._qtable["Rmax"], p._qtable["zmax"], len(multipoles)])
+    pot_args.extend(multipoles)
+    pot_args.extend(p._qtable["table"].flatten())
+    return pot_args
+
+
 def _prep_tfuncs(pot_tfuncs):
     if len(pot_tfuncs) == 0:
         pot_tfuncs = None  # NULL
@@ -671,7 +945,15 @@ def _prep_tfuncs(pot_tfuncs):
 
 
 def integratePlanarOrbit_c(
-    pot, yo, t, int_method, rtol=None, atol=None, progressbar=True, dt=None
+    pot,
+    yo,
+    t,
+    int_method,
+    rtol=None,
+    atol=None,
+    progressbar=True,
+    dt=None,
+    return_stats=False,
 ):
     """
     Integrate an ode for a planarOrbit.
@@ -693,15 +975,19 @@ def integratePlanarOrbit_c(
         If True, display a tqdm progress bar when integrating multiple orbits (requires tqdm to be installed!).
     dt : float, optional
         Force integrator to use this stepsize (default is to automatically determine one).
+    return_stats : bool, optional
+        If True, also return per-orbit integration statistics (default: False).
 
     Returns
     -------
     tuple
-        (y,err)
+        (y,err) or (y,err,stats) if return_stats
         y : array, shape (len(y0),len(t),4)
             Array containing the value of y for each desired time in t, with the initial value y0 in the first row.
         err : int
             Error message, if not zero: 1 means maximum step reduction happened for adaptive integrators.
+        stats : array, shape (N,4) or (4) if N = 1
+            Only returned if return_stats=True: number of accepted steps, number of rejected steps, number of force evaluations (not including those used to estimate the stepsize of fixed-step integrators), and the smallest stepsize taken.
 
     Notes
     -----
@@ -725,6 +1011,8 @@ def integratePlanarOrbit_c(
     # Set up result array
     result = numpy.empty((nobj, len(t), 4))
     err = numpy.zeros(nobj, dtype=numpy.int32)
+    if return_stats:
+        stats = numpy.zeros((nobj, 4))
 
     # Set up progressbar
     progressbar *= _TQDM_LOADED
@@ -752,6 +1040,7 @@ def integratePlanarOrbit_c(
         ctypes.c_double,
         ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
         ndpointer(dtype=numpy.int32, flags=ndarrayFlags),
+        ctypes.c_void_p,
         ctypes.c_int,
         ctypes.c_void_p,
     ]
@@ -762,6 +1051,8 @@ def integratePlanarOrbit_c(
     t = numpy.require(t, dtype=numpy.float64, requirements=["C", "W"])
     result = numpy.require(result, dtype=numpy.float64, requirements=["C", "W"])
     err = numpy.require(err, dtype=numpy.int32, requirements=["C", "W"])
+    if return_stats:
+        stats = numpy.require(stats, dtype=numpy.float64, requirements=["C", "W"])
 
     # Run the C code
     integrationFunc(
@@ -778,6 +1069,7 @@ def integratePlanarOrbit_c(
         ctypes.c_double(atol),
         result,
         err,
+        stats.ctypes.data_as(ctypes.c_void_p) if return_stats else None,
         ctypes.c_int(int_method_c),
         pbar_c,
     )
@@ -795,9 +1087,14 @@ def integratePlanarOrbit_c(
         t = numpy.asfortranarray(t)
 
     if single_obj:
-        return (result[0], err[0])
+        out = (result[0], err[0])
+        if return_stats:
+            out += (stats[0],)
     else:
-        return (result, err)
+        out = (result, err)
+        if return_stats:
+            out += (stats,)
+    return out
 
 
 def integratePlanarOrbit_dxdv_c(
@@ -1558,17 +1855,14 @@ def _planarEOM(y, t, pot):
 
     """
     l2 = (y[0] ** 2.0 * y[3]) ** 2.0
+    Rforce, phitorque = _evaluateplanarforces(
+        pot, y[0], phi=y[2], t=t, v=[y[1], y[0] * y[3]]
+    )
     return [
         y[1],
-        l2 / y[0] ** 3.0
-        + _evaluateplanarRforces(pot, y[0], phi=y[2], t=t, v=[y[1], y[0] * y[3]]),
+        l2 / y[0] ** 3.0 + Rforce,
         y[3],
-        1.0
-        / y[0] ** 2.0
-        * (
-            _evaluateplanarphitorques(pot, y[0], phi=y[2], t=t, v=[y[1], y[0] * y[3]])
-            - 2.0 * y[0] * y[1] * y[3]
-        ),
+        1.0 / y[0] ** 2.0 * (phitorque - 2.0 * y[0] * y[1] * y[3]),
     ]
 
 
@@ -1602,8 +1896,7 @@ def _planarEOM_dxdv(x, t, pot):
     if x[1] < 0.0:
         phi = 2.0 * numpy.pi - phi
     # calculate forces
-    Rforce = _evaluateplanarRforces(pot, R, phi=phi, t=t)
-    phitorque = _evaluateplanarphitorques(pot, R, phi=phi, t=t)
+    Rforce, phitorque = _evaluateplanarforces(pot, R, phi=phi, t=t)
     R2deriv = _evaluateplanarPotentials(pot, R, phi=phi, t=t, dR=2)
     phi2deriv = _evaluateplanarPotentials(pot, R, phi=phi, t=t, dphi=2)
     Rphideriv = _evaluateplanarPotentials(pot, R, phi=phi, t=t, dR=1, dphi=1)
@@ -1751,8 +2044,7 @@ def _planarRectForce(x, pot, t=0.0, vx=None):
         vT = -vx[0] * sinphi + vx[1] * cosphi
         vx = [vR, vT]
     # calculate forces
-    Rforce = _evaluateplanarRforces(pot, R, phi=phi, t=t, v=vx)
-    phitorque = _evaluateplanarphitorques(pot, R, phi=phi, t=t, v=vx)
+    Rforce, phitorque = _evaluateplanarforces(pot, R, phi=phi, t=t, v=vx)
     return numpy.array(
         [
             cosphi * Rforce - 1.0 / R * sinphi * phitorque,
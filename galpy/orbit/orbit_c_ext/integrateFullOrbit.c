@@ -24,6 +24,9 @@
 #ifndef ORBITS_CHUNKSIZE
 #define ORBITS_CHUNKSIZE 1
 #endif
+#ifndef ORBITS_COST_ORDER
+#define ORBITS_COST_ORDER 1
+#endif
 //Macros to export functions in DLL on different OS
 #if defined(_WIN32)
 #define EXPORT __declspec(dllexport)
@@ -66,6 +69,7 @@ void parse_leapFuncArgs_Full(int npot,
            tfuncs_type_arr * pot_tfuncs){
   int ii,jj,kk;
   int nR, nz, nr;
+  int ncoeff, nt, nharm;
   double * Rgrid, * zgrid, * potGrid_splinecoeffs;
   init_potentialArgs(npot,potentialArgs);
   for (ii=0; ii < npot; ii++){
@@ -164,6 +168,7 @@ void parse_leapFuncArgs_Full(int npot,
       potentialArgs->dens= &DoubleExponentialDiskPotentialDens;
       //Look at pot_args to figure out the number of arguments
       potentialArgs->nargs= (int) (5 + 4 * *(*pot_args+4) );
+      potentialArgs->nargs+= disk_table_nargs(*pot_args+potentialArgs->nargs);
       potentialArgs->ntfuncs= 0;
       potentialArgs->requiresVelocity= false;
       break;
@@ -308,8 +313,7 @@ void parse_leapFuncArgs_Full(int npot,
       potentialArgs->psi= &TriaxialHernquistPotentialpsi;
       potentialArgs->mdens= &TriaxialHernquistPotentialmdens;
       potentialArgs->mdensDeriv= &TriaxialHernquistPotentialmdensDeriv;
-      potentialArgs->nargs = (int) (21 + *(*pot_args+7) + 2 * *(*pot_args
-					    + (int) (*(*pot_args+7) + 20)));
+      potentialArgs->nargs= EllipsoidalPotentialnargs(*pot_args);
       potentialArgs->ntfuncs= 0;
       potentialArgs->requiresVelocity= false;
       break;
@@ -323,8 +327,7 @@ void parse_leapFuncArgs_Full(int npot,
       potentialArgs->psi= &TriaxialNFWPotentialpsi;
       potentialArgs->mdens= &TriaxialNFWPotentialmdens;
       potentialArgs->mdensDeriv= &TriaxialNFWPotentialmdensDeriv;
-      potentialArgs->nargs = (int) (21 + *(*pot_args+7) + 2 * *(*pot_args
-					    + (int) (*(*pot_args+7) + 20)));
+      potentialArgs->nargs= EllipsoidalPotentialnargs(*pot_args);
       potentialArgs->ntfuncs= 0;
       potentialArgs->requiresVelocity= false;
       break;
@@ -338,8 +341,7 @@ void parse_leapFuncArgs_Full(int npot,
       potentialArgs->psi= &TriaxialJaffePotentialpsi;
       potentialArgs->mdens= &TriaxialJaffePotentialmdens;
       potentialArgs->mdensDeriv= &TriaxialJaffePotentialmdensDeriv;
-      potentialArgs->nargs = (int) (21 + *(*pot_args+7) + 2 * *(*pot_args
-					    + (int) (*(*pot_args+7) + 20)));
+      potentialArgs->nargs= EllipsoidalPotentialnargs(*pot_args);
       potentialArgs->ntfuncs= 0;
       potentialArgs->requiresVelocity= false;
       break;
@@ -372,7 +374,7 @@ void parse_leapFuncArgs_Full(int npot,
       potentialArgs->ntfuncs= 0;
       potentialArgs->requiresVelocity= false;
       break;
-    case 27: // SpiralArmsPotential, 10 arguments + array of Cs
+    case 27: // SpiralArmsPotential, 10 arguments + array of Cs + 7 for caching
       potentialArgs->Rforce = &SpiralArmsPotentialRforce;
       potentialArgs->zforce = &SpiralArmsPotentialzforce;
       potentialArgs->phitorque = &SpiralArmsPotentialphitorque;
@@ -381,7 +383,7 @@ void parse_leapFuncArgs_Full(int npot,
       potentialArgs->phi2deriv = &SpiralArmsPotentialphi2deriv;
       //potentialArgs->Rzderiv = &SpiralArmsPotentialRzderiv;
       potentialArgs->Rphideriv = &SpiralArmsPotentialRphideriv;
-      potentialArgs->nargs = (int) 10 + **pot_args;
+      potentialArgs->nargs = (int) 17 + **pot_args;
       potentialArgs->ntfuncs= 0;
       potentialArgs->requiresVelocity= false;
       break;
@@ -400,8 +402,7 @@ void parse_leapFuncArgs_Full(int npot,
       potentialArgs->psi= &PerfectEllipsoidPotentialpsi;
       potentialArgs->mdens= &PerfectEllipsoidPotentialmdens;
       potentialArgs->mdensDeriv= &PerfectEllipsoidPotentialmdensDeriv;
-      potentialArgs->nargs = (int) (21 + *(*pot_args+7) + 2 * *(*pot_args
-					    + (int) (*(*pot_args+7) + 20)));
+      potentialArgs->nargs= EllipsoidalPotentialnargs(*pot_args);
       potentialArgs->ntfuncs= 0;
       potentialArgs->requiresVelocity= false;
       break;
@@ -487,8 +488,7 @@ void parse_leapFuncArgs_Full(int npot,
       potentialArgs->psi= &TriaxialGaussianPotentialpsi;
       potentialArgs->mdens= &TriaxialGaussianPotentialmdens;
       potentialArgs->mdensDeriv= &TriaxialGaussianPotentialmdensDeriv;
-      potentialArgs->nargs = (int) (21 + *(*pot_args+7) + 2 * *(*pot_args
-					    + (int) (*(*pot_args+7) + 20)));
+      potentialArgs->nargs= EllipsoidalPotentialnargs(*pot_args);
       potentialArgs->ntfuncs= 0;
       potentialArgs->requiresVelocity= false;
       break;
@@ -507,8 +507,7 @@ void parse_leapFuncArgs_Full(int npot,
       potentialArgs->psi= &PowerTriaxialPotentialpsi;
       potentialArgs->mdens= &PowerTriaxialPotentialmdens;
       potentialArgs->mdensDeriv= &PowerTriaxialPotentialmdensDeriv;
-      potentialArgs->nargs = (int) (21 + *(*pot_args+7) + 2 * *(*pot_args
-					    + (int) (*(*pot_args+7) + 20)));
+      potentialArgs->nargs= EllipsoidalPotentialnargs(*pot_args);
       potentialArgs->ntfuncs= 0;
       potentialArgs->requiresVelocity= false;
       break;
@@ -530,6 +529,109 @@ void parse_leapFuncArgs_Full(int npot,
       potentialArgs->ntfuncs= 0;
       potentialArgs->requiresVelocity= false;
       break;
+    case 41: //TimeDependentSCFPotential, many arguments
+      potentialArgs->potentialEval= &TimeDependentSCFPotentialEval;
+      potentialArgs->Rforce= &TimeDependentSCFPotentialRforce;
+      potentialArgs->zforce= &TimeDependentSCFPotentialzforce;
+      potentialArgs->phitorque= &TimeDependentSCFPotentialphitorque;
+      potentialArgs->dens= &TimeDependentSCFPotentialDens;
+      ncoeff= (int) ( (1 + *(*pot_args + 1)) * *(*pot_args+2) * *(*pot_args+3) * *(*pot_args+4) );
+      nt= (int) *(*pot_args + 5 + ncoeff + 7);
+      potentialArgs->nargs= 5 + ncoeff + 7 + 2 + nt + 4 * (nt - 1) * ncoeff;
+      potentialArgs->ntfuncs= 0;
+      potentialArgs->requiresVelocity= false;
+      break;
+    case 42: //MultipolePotential, many arguments
+      potentialArgs->potentialEval= &MultipolePotentialEval;
+      potentialArgs->Rforce= &MultipolePotentialRforce;
+      potentialArgs->zforce= &MultipolePotentialzforce;
+      potentialArgs->phitorque= &MultipolePotentialphitorque;
+      potentialArgs->dens= &MultipolePotentialDens;
+      nharm= (int) *(*pot_args + 2);
+      nr= (int) *(*pot_args + 3);
+      potentialArgs->nargs= 4 + nr + 4 * nharm + 6 * (nr - 1) * nharm + 4 * nharm + 7;
+      potentialArgs->ntfuncs= 0;
+      potentialArgs->requiresVelocity= false;
+      break;
+    case 43: //CylindricalSplinePotential, many arguments
+      potentialArgs->potentialEval= &CylindricalSplinePotentialEval;
+      potentialArgs->Rforce= &CylindricalSplinePotentialRforce;
+      potentialArgs->zforce= &CylindricalSplinePotentialzforce;
+      potentialArgs->phitorque= &CylindricalSplinePotentialphitorque;
+      potentialArgs->dens= &CylindricalSplinePotentialDens;
+      nharm= 2 * (int) **pot_args + 1;
+      nR= (int) *(*pot_args + 3);
+      nz= (int) *(*pot_args + 4);
+      potentialArgs->nargs= 5 + nR + nz + 4 * nR * nz * nharm;
+      potentialArgs->ntfuncs= 0;
+      potentialArgs->requiresVelocity= false;
+      break;
+    case 44: //RingPotential, 2 arguments
+      potentialArgs->potentialEval= &RingPotentialEval;
+      potentialArgs->Rforce= &RingPotentialRforce;
+      potentialArgs->zforce= &RingPotentialzforce;
+      potentialArgs->phitorque= &ZeroForce;
+      potentialArgs->nargs= 2;
+      potentialArgs->ntfuncs= 0;
+      potentialArgs->requiresVelocity= false;
+      break;
+    case 45: //SphericalShellPotential, 2 arguments
+      potentialArgs->potentialEval= &SphericalPotentialEval;
+      potentialArgs->Rforce = &SphericalPotentialRforce;
+      potentialArgs->zforce = &SphericalPotentialzforce;
+      potentialArgs->phitorque= &ZeroForce;
+      potentialArgs->dens= &SphericalPotentialDens;
+      // Also assign functions specific to SphericalPotential
+      potentialArgs->revaluate= &SphericalShellPotentialrevaluate;
+      potentialArgs->rforce= &SphericalShellPotentialrforce;
+      potentialArgs->r2deriv= &SphericalShellPotentialr2deriv;
+      potentialArgs->rdens= &SphericalShellPotentialrdens;
+      potentialArgs->nargs= 2;
+      potentialArgs->ntfuncs= 0;
+      potentialArgs->requiresVelocity= false;
+      break;
+    case 46: //RazorThinExponentialDiskPotential, 7 + 2 x glorder arguments (4 caching ones)
+      potentialArgs->potentialEval= &RazorThinExponentialDiskPotentialEval;
+      potentialArgs->Rforce= &RazorThinExponentialDiskPotentialRforce;
+      potentialArgs->zforce= &RazorThinExponentialDiskPotentialzforce;
+      potentialArgs->phitorque= &ZeroForce;
+      potentialArgs->nargs= 7 + 2 * (int) *(*pot_args + 2);
+      potentialArgs->ntfuncs= 0;
+      potentialArgs->requiresVelocity= false;
+      break;
+    case 47: //FerrersPotential, 15 + 2 x glorder arguments (7 caching ones)
+      potentialArgs->potentialEval= &FerrersPotentialEval;
+      potentialArgs->Rforce= &FerrersPotentialRforce;
+      potentialArgs->zforce= &FerrersPotentialzforce;
+      potentialArgs->phitorque= &FerrersPotentialphitorque;
+      potentialArgs->nargs= 15 + 2 * (int) *(*pot_args + 14);
+      potentialArgs->ntfuncs= 0;
+      potentialArgs->requiresVelocity= false;
+      break;
+    case 48: //AnyAxisymmetricRazorThinDiskPotential, many arguments
+      // Set up 1 spline in potentialArgs
+      potentialArgs->nspline1d= 1;
+      potentialArgs->spline1d= (gsl_spline **)			\
+	malloc ( potentialArgs->nspline1d*sizeof ( gsl_spline *) );
+      potentialArgs->acc1d= (gsl_interp_accel **)			\
+	malloc ( potentialArgs->nspline1d * sizeof ( gsl_interp_accel * ) );
+      // allocate accelerator
+      *potentialArgs->acc1d= gsl_interp_accel_alloc();
+      // Set up interpolater
+      nr= (int) **pot_args;
+      *potentialArgs->spline1d= gsl_spline_alloc(gsl_interp_cspline,nr);
+      gsl_spline_init(*potentialArgs->spline1d,*pot_args+1,*pot_args+1+nr,nr);
+      *pot_args+= 2*nr+1;
+      // Bind forces
+      potentialArgs->potentialEval= &AnyAxisymmetricRazorThinDiskPotentialEval;
+      potentialArgs->Rforce= &AnyAxisymmetricRazorThinDiskPotentialRforce;
+      potentialArgs->zforce= &AnyAxisymmetricRazorThinDiskPotentialzforce;
+      potentialArgs->phitorque= &ZeroForce;
+      potentialArgs->nargs= 5 + 4 * (int) *(*pot_args + 4);
+      potentialArgs->nargs+= disk_table_nargs(*pot_args+potentialArgs->nargs);
+      potentialArgs->ntfuncs= 0;
+      potentialArgs->requiresVelocity= false;
+      break;
 //////////////////////////////// WRAPPERS /////////////////////////////////////
     case -1: //DehnenSmoothWrapperPotential
       potentialArgs->potentialEval= &DehnenSmoothWrapperPotentialEval;
@@ -606,7 +708,25 @@ void parse_leapFuncArgs_Full(int npot,
       potentialArgs->nargs= 3;
       potentialArgs->ntfuncs= 0;
       potentialArgs->requiresVelocity= false;
+      break;
+    case -11: //ManyMovingObjectsPotential, nargs set below
+      potentialArgs->Rforce= &ManyMovingObjectsPotentialRforce;
+      potentialArgs->zforce= &ManyMovingObjectsPotentialzforce;
+      potentialArgs->phitorque= &ManyMovingObjectsPotentialphitorque;
+      potentialArgs->ntfuncs= 0;
+      potentialArgs->requiresVelocity= false;
+      break;
+    case -12: //TimeInterpolatedPotential, nargs set below
+      potentialArgs->potentialEval= &TimeInterpolatedPotentialEval;
+      potentialArgs->Rforce= &TimeInterpolatedPotentialRforce;
+      potentialArgs->zforce= &TimeInterpolatedPotentialzforce;
+      potentialArgs->phitorque= &TimeInterpolatedPotentialphitorque;
+      potentialArgs->ntfuncs= 0;
+      potentialArgs->requiresVelocity= false;
+      break;
     }
+    int setupManyMovingObjects = *(*pot_type-1) == -11 ? 1 : 0;
+    int setupTimeInterpolated = *(*pot_type-1) == -12 ? 1 : 0;
     int setupMovingObjectSplines = *(*pot_type-1) == -6 ? 1 : 0;
     int setupChandrasekharDynamicalFrictionSplines = *(*pot_type-1) == -7 ? 1 : 0;
     if ( *(*pot_type-1) < 0 ) { // Parse wrapped potential for wrappers
@@ -620,6 +740,11 @@ void parse_leapFuncArgs_Full(int npot,
     }
     if (setupMovingObjectSplines)
       initMovingObjectSplines(potentialArgs, pot_args);
+    if (setupManyMovingObjects) // 5+ngroups+nt+6*nt*nobj+8 arguments
+      potentialArgs->nargs= 13 + (int) *(*pot_args+4) + (int) *(*pot_args+2)
+	* ( 1 + 6 * (int) *(*pot_args+1) );
+    if (setupTimeInterpolated) // 3+3*nsnap arguments
+      potentialArgs->nargs= 3 + 3 * (int) *(*pot_args+1);
     if (setupChandrasekharDynamicalFrictionSplines)
       initChandrasekharDynamicalFrictionSplines(potentialArgs,pot_args);
     // Now load each potential's parameters
@@ -638,6 +763,52 @@ void parse_leapFuncArgs_Full(int npot,
   }
   potentialArgs-= npot;
 }
+struct orbitCost{
+  double cost;
+  int index;
+};
+static int compare_orbitCost(const void * a, const void * b){
+  // Sort in descending order of cost, ties keep the input order
+  const struct orbitCost * ca= (const struct orbitCost *) a;
+  const struct orbitCost * cb= (const struct orbitCost *) b;
+  if ( ca->cost > cb->cost ) return -1;
+  else if ( ca->cost < cb->cost ) return 1;
+  else return ( ca->index > cb->index ) - ( ca->index < cb->index );
+}
+/*
+  order_orbits_by_cost: fill order with the indices of the orbits in
+  descending order of their estimated integration cost, such that the
+  dynamically-scheduled orbit loops start with the most expensive orbits
+  and threads do not sit idle at the end waiting for a single long orbit
+  Input:
+     nobj - number of orbits
+     cost - estimated cost of each orbit (NaN is treated as most expensive)
+  Output:
+     order - permutation of 0,...,nobj-1
+*/
+void order_orbits_by_cost(int nobj,double * cost,int * order){
+  int ii;
+  struct orbitCost * costs= (struct orbitCost *) malloc ( nobj * sizeof (struct orbitCost) );
+  for (ii=0; ii < nobj; ii++) {
+    (costs+ii)->cost= isnan(*(cost+ii)) ? INFINITY : *(cost+ii);
+    (costs+ii)->index= ii;
+  }
+  qsort(costs,nobj,sizeof (struct orbitCost),compare_orbitCost);
+  for (ii=0; ii < nobj; ii++)
+    *(order+ii)= (costs+ii)->index;
+  free(costs);
+}
+/*
+  orbit_cost_order_active: whether to estimate the cost of and re-order the
+  orbits; only useful for the adaptive integrators (dopr54, dop853, ias15,
+  and the time-transformed leapfrog; for the fixed-step integrators, all
+  orbits take the same number of steps) when there are more orbits than
+  threads
+*/
+int orbit_cost_order_active(int nobj,int max_threads,int odeint_type){
+  return ORBITS_COST_ORDER && max_threads > 1 && nobj > max_threads \
+    && ( ( odeint_type >= 5 && odeint_type <= 7 ) || odeint_type == 9 );
+}
 EXPORT void integrateFullOrbit(int nobj,
 			       double *yo,
 			       int nt,
@@ -651,10 +822,11 @@ EXPORT void integrateFullOrbit(int nobj,
 			       double atol,
 			       double *result,
 			       int * err,
+			       double * stats,
 			       int odeint_type,
              orbint_callback_type cb){
   //Set up the forces, first count
-  int ii,jj;
+  int ii,jj,kk;
   int dim;
   int max_threads;
   int * thread_pot_type;
@@ -679,7 +851,7 @@ EXPORT void integrateFullOrbit(int nobj,
 		      int, double, double *,
 		      int, struct potentialArg *,
 		      double, double,
-		      double *,int *);
+		      double *,int *,struct odeintStats *);
   void (*odeint_deriv_func)(double, double *, double *,
 			    int,struct potentialArg *);
   switch ( odeint_type ) {
@@ -723,13 +895,50 @@ EXPORT void integrateFullOrbit(int nobj,
     odeint_deriv_func= &evalRectForce;
     dim= 3;
     break;
+  case 8: //symplec4fg
+    odeint_func= &symplec4fg;
+    odeint_deriv_func= &evalRectForce;
+    dim= 3;
+    break;
+  case 9: //ttleapfrog
+    odeint_func= &ttleapfrog;
+    odeint_deriv_func= &evalRectForce;
+    dim= 3;
+    break;
   }
+  // Estimate the cost of each orbit as the number of dynamical times
+  // sqrt(r/|F|) it is integrated for and start with the most expensive ones
+  int * order= (int *) malloc ( nobj * sizeof(int) );
+  if ( orbit_cost_order_active(nobj,max_threads,odeint_type) ) {
+    double * cost= (double *) malloc ( nobj * sizeof(double) );
+    double R,z,phi,Rforce,zforce;
+#pragma omp parallel for schedule(static) private(ii,R,z,phi,Rforce,zforce) num_threads(max_threads)
+    for (ii=0; ii < nobj; ii++) {
+      R= *(yo+6*ii);
+      z= *(yo+6*ii+3);
+      phi= *(yo+6*ii+5);
+      Rforce= calcRforce(R,z,phi,*t,npot,
+			 potentialArgs+omp_get_thread_num()*npot,
+			 *(yo+6*ii+1),*(yo+6*ii+2),*(yo+6*ii+4));
+      zforce= calczforce(R,z,phi,*t,npot,
+			 potentialArgs+omp_get_thread_num()*npot,
+			 *(yo+6*ii+1),*(yo+6*ii+2),*(yo+6*ii+4));
+      *(cost+ii)= fabs(*(t+nt-1)-*t)
+	* sqrt(sqrt(Rforce*Rforce+zforce*zforce)/sqrt(R*R+z*z));
+    }
+    order_orbits_by_cost(nobj,cost,order);
+    free(cost);
+  }
+  else
+    for (ii=0; ii < nobj; ii++) *(order+ii)= ii;
 #pragma omp parallel for schedule(dynamic,ORBITS_CHUNKSIZE) private(ii,jj) num_threads(max_threads)
-  for (ii=0; ii < nobj; ii++) {
+  for (kk=0; kk < nobj; kk++) {
+    ii= *(order+kk);
     cyl_to_rect_galpy(yo+6*ii);
     odeint_func(odeint_deriv_func,dim,yo+6*ii,nt,dt,t,
 		npot,potentialArgs+omp_get_thread_num()*npot,rtol,atol,
-		result+6*nt*ii,err+ii);
+		result+6*nt*ii,err+ii,
+		stats ? (struct odeintStats *) (stats+4*ii) : NULL);
     for (jj=0; jj < nt; jj++)
       rect_to_cyl_galpy(result+6*jj+6*nt*ii);
     if ( cb ) // Callback if not void
@@ -740,6 +949,7 @@ EXPORT void integrateFullOrbit(int nobj,
   for (ii=0; ii < max_threads; ii++)
     free_potentialArgs(npot,potentialArgs+ii*npot);
   free(potentialArgs);
+  free(order);
   //Done!
 }
 EXPORT void integrateFullOrbit_sos(
@@ -785,7 +995,7 @@ EXPORT void integrateFullOrbit_sos(
 		      int, double, double *,
 		      int, struct potentialArg *,
 		      double, double,
-		      double *,int *);
+		      double *,int *,struct odeintStats *);
   void (*odeint_deriv_func)(double, double *, double *,
 			    int,struct potentialArg *);
   dim= 7;
@@ -812,7 +1022,7 @@ EXPORT void integrateFullOrbit_sos(
     cyl_to_sos_galpy(yo+dim*ii);
     odeint_func(odeint_deriv_func,dim,yo+dim*ii,npsi,dpsi,psi+npsi*ii*indiv_psi,
 		npot,potentialArgs+omp_get_thread_num()*npot,rtol,atol,
-		result+dim*npsi*ii,err+ii);
+		result+dim*npsi*ii,err+ii,NULL);
     for (jj=0; jj < npsi; jj++)
       sos_to_cyl_galpy(result+dim*jj+dim*npsi*ii);
     if ( cb ) // Callback if not void
@@ -825,6 +1035,140 @@ EXPORT void integrateFullOrbit_sos(
   free(potentialArgs);
   //Done!
 }
+EXPORT void evaluateFullOrbitEnergy(int ndata,
+				    int phasedim,
+				    double *vxvv,
+				    double *t,
+				    int npot,
+				    int * pot_type,
+				    double * pot_args,
+				    tfuncs_type_arr pot_tfuncs,
+				    double *out,
+				    int * err){
+  // Evaluate the energy along (a set of) orbits, vxvv=[phasedim,ndata]
+  // contains R,vR,vT,z,vz[,phi]
+  int ii;
+  int max_threads;
+  int * thread_pot_type;
+  double * thread_pot_args;
+  tfuncs_type_arr thread_pot_tfuncs;
+  double * R= vxvv;
+  double * vR= vxvv+ndata;
+  double * vT= vxvv+2*ndata;
+  double * z= vxvv+3*ndata;
+  double * vz= vxvv+4*ndata;
+  double * phi= vxvv+5*ndata;
+  max_threads= ( ndata < omp_get_max_threads() ) ? ndata : omp_get_max_threads();
+  // Because potentialArgs may cache, safest to have one / thread
+  struct potentialArg * potentialArgs= (struct potentialArg *) malloc ( max_threads * npot * sizeof (struct potentialArg) );
+#pragma omp parallel for schedule(static,1) private(ii,thread_pot_type,thread_pot_args,thread_pot_tfuncs) num_threads(max_threads)
+  for (ii=0; ii < max_threads; ii++) {
+    thread_pot_type= pot_type; // need to make thread-private pointers, bc
+    thread_pot_args= pot_args; // these pointers are changed in parse_...
+    thread_pot_tfuncs= pot_tfuncs; // ...
+    parse_leapFuncArgs_Full(npot,potentialArgs+ii*npot,
+			    &thread_pot_type,&thread_pot_args,&thread_pot_tfuncs);
+  }
+  // Not all potentials have their potential implemented in C
+  *err= hasPotentialEval(npot,potentialArgs) ? 0 : -1;
+  if ( ! *err ) {
+#pragma omp parallel for schedule(static) private(ii) num_threads(max_threads)
+    for (ii=0; ii < ndata; ii++)
+      *(out+ii)= calcPotential(*(R+ii),*(z+ii),
+			       phasedim == 6 ? *(phi+ii) : 0.,*(t+ii),
+			       npot,potentialArgs+omp_get_thread_num()*npot)
+	+ 0.5 * ( *(vR+ii) * *(vR+ii) + *(vT+ii) * *(vT+ii)
+		  + *(vz+ii) * *(vz+ii) );
+  }
+  for (ii=0; ii < max_threads; ii++)
+    free_potentialArgs(npot,potentialArgs+ii*npot);
+  free(potentialArgs);
+}
+static bool hasQuantity(int quantity,struct potentialArg * potentialArgs){
+  // Check whether a (wrapped) potential has the quantity implemented in C:
+  // 0: potential, 1: Rforce, 2: zforce, 3: phitorque, 4: density
+  int ii;
+  bool has;
+  if ( potentialArgs->requiresVelocity )
+    return false;
+  switch ( quantity ) {
+  case 0:
+    has= potentialArgs->potentialEval != NULL;
+    break;
+  case 4:
+    has= potentialArgs->dens != NULL;
+    break;
+  default: // forces are always implemented
+    has= true;
+    break;
+  }
+  for (ii=0; has && potentialArgs->wrappedPotentialArg
+	 && ii < potentialArgs->nwrapped; ii++)
+    has= hasQuantity(quantity,potentialArgs->wrappedPotentialArg+ii);
+  return has;
+}
+static double calcQuantity(int quantity,double R,double Z,double phi,double t,
+			   struct potentialArg * potentialArgs){
+  switch ( quantity ) {
+  case 0:
+    return potentialArgs->potentialEval(R,Z,phi,t,potentialArgs);
+  case 1:
+    return potentialArgs->Rforce(R,Z,phi,t,potentialArgs);
+  case 2:
+    return potentialArgs->zforce(R,Z,phi,t,potentialArgs);
+  case 3:
+    return potentialArgs->phitorque(R,Z,phi,t,potentialArgs);
+  default:
+    return potentialArgs->dens(R,Z,phi,t,potentialArgs);
+  }
+}
+EXPORT void evaluatePotentialQuantity(int quantity,
+				      int ndata,
+				      double *R,
+				      double *z,
+				      double *phi,
+				      double *t,
+				      int npot,
+				      int * pot_type,
+				      double * pot_args,
+				      tfuncs_type_arr pot_tfuncs,
+				      double *out,
+				      int * incl){
+  // Evaluate the sum of a quantity (see hasQuantity) of those potentials
+  // that have it implemented in C at ndata points; incl[npot] returns
+  // which potentials were included
+  int ii, jj;
+  int max_threads;
+  int * thread_pot_type;
+  double * thread_pot_args;
+  tfuncs_type_arr thread_pot_tfuncs;
+  struct potentialArg * thisPotentialArgs;
+  max_threads= ( ndata < omp_get_max_threads() ) ? ndata : omp_get_max_threads();
+  // Because potentialArgs may cache, safest to have one / thread
+  struct potentialArg * potentialArgs= (struct potentialArg *) malloc ( max_threads * npot * sizeof (struct potentialArg) );
+#pragma omp parallel for schedule(static,1) private(ii,thread_pot_type,thread_pot_args,thread_pot_tfuncs) num_threads(max_threads)
+  for (ii=0; ii < max_threads; ii++) {
+    thread_pot_type= pot_type; // need to make thread-private pointers, bc
+    thread_pot_args= pot_args; // these pointers are changed in parse_...
+    thread_pot_tfuncs= pot_tfuncs; // ...
+    parse_leapFuncArgs_Full(npot,potentialArgs+ii*npot,
+			    &thread_pot_type,&thread_pot_args,&thread_pot_tfuncs);
+  }
+  for (jj=0; jj < npot; jj++)
+    *(incl+jj)= (int) hasQuantity(quantity,potentialArgs+jj);
+#pragma omp parallel for schedule(static) private(ii,jj,thisPotentialArgs) num_threads(max_threads)
+  for (ii=0; ii < ndata; ii++) {
+    thisPotentialArgs= potentialArgs+omp_get_thread_num()*npot;
+    *(out+ii)= 0.;
+    for (jj=0; jj < npot; jj++)
+      if ( *(incl+jj) )
+	*(out+ii)+= calcQuantity(quantity,*(R+ii),*(z+ii),*(phi+ii),*(t+ii),
+				 thisPotentialArgs+jj);
+  }
+  for (ii=0; ii < max_threads; ii++)
+    free_potentialArgs(npot,potentialArgs+ii*npot);
+  free(potentialArgs);
+}
 // LCOV_EXCL_START
 void integrateOrbit_dxdv(double *yo,
 			 int nt,
@@ -850,7 +1194,7 @@ void integrateOrbit_dxdv(double *yo,
 		      int, double, double *,
 		      int, struct potentialArg *,
 		      double, double,
-		      double *,int *);
+		      double *,int *,struct odeintStats *);
   void (*odeint_deriv_func)(double, double *, double *,
 			    int,struct potentialArg *);
   switch ( odeint_type ) {
@@ -896,7 +1240,7 @@ void integrateOrbit_dxdv(double *yo,
     break;
   }
   odeint_func(odeint_deriv_func,dim,yo,nt,-9999.99,t,npot,potentialArgs,
-	      rtol,atol,result,err);
+	      rtol,atol,result,err,NULL);
   //Free allocated memory
   free_potentialArgs(npot,potentialArgs);
   free(potentialArgs);
@@ -9,6 +9,9 @@ extern "C" {
 #include <galpy_potentials.h>
 typedef void (*orbint_callback_type)(); // Callback function
 void parse_leapFuncArgs_Full(int, struct potentialArg *,int **,double **,tfuncs_type_arr *);
+void evalRectDeriv(double, double *, double *,int, struct potentialArg *);
+void order_orbits_by_cost(int,double *,int *);
+int orbit_cost_order_active(int,int,int);
 #ifdef _WIN32
 // On Windows, *need* to define this function to allow the package to be imported
 #if PY_MAJOR_VERSION >= 3
@@ -126,11 +126,12 @@ EXPORT void integrateLinearOrbit(int nobj,
 				 double atol,
 				 double *result,
 				 int * err,
+				 double * stats,
 				 int odeint_type,
          orbint_callback_type cb){
   //Set up the forces, first count
   int dim;
-  int ii;
+  int ii,kk;
   int max_threads;
   int * thread_pot_type;
   double * thread_pot_args;
@@ -154,7 +155,7 @@ EXPORT void integrateLinearOrbit(int nobj,
 		      int, double, double *,
 		      int, struct potentialArg *,
 		      double, double,
-		      double *,int *);
+		      double *,int *,struct odeintStats *);
   void (*odeint_deriv_func)(double, double *, double *,
 			    int,struct potentialArg *);
   switch ( odeint_type ) {
@@ -198,12 +199,40 @@ EXPORT void integrateLinearOrbit(int nobj,
     odeint_deriv_func= &evalLinearForce;
     dim= 1;
     break;
+  case 8: //symplec4fg
+    odeint_func= &symplec4fg;
+    odeint_deriv_func= &evalLinearForce;
+    dim= 1;
+    break;
+  case 9: //ttleapfrog
+    odeint_func= &ttleapfrog;
+    odeint_deriv_func= &evalLinearForce;
+    dim= 1;
+    break;
+  }
+  // Estimate the cost of each orbit as the number of dynamical times
+  // sqrt(|x|/|F|) it is integrated for and start with the most expensive ones
+  int * order= (int *) malloc ( nobj * sizeof(int) );
+  if ( orbit_cost_order_active(nobj,max_threads,odeint_type) ) {
+    double * cost= (double *) malloc ( nobj * sizeof(double) );
+#pragma omp parallel for schedule(static) private(ii) num_threads(max_threads)
+    for (ii=0; ii < nobj; ii++)
+      *(cost+ii)= fabs(*(t+nt-1)-*t)
+	* sqrt(fabs(calcLinearForce(*(yo+2*ii),*t,npot,
+				    potentialArgs+omp_get_thread_num()*npot)
+		    / *(yo+2*ii)));
+    order_orbits_by_cost(nobj,cost,order);
+    free(cost);
   }
+  else
+    for (ii=0; ii < nobj; ii++) *(order+ii)= ii;
 #pragma omp parallel for schedule(dynamic,ORBITS_CHUNKSIZE) private(ii) num_threads(max_threads)
-  for (ii=0; ii < nobj; ii++) {
+  for (kk=0; kk < nobj; kk++) {
+    ii= *(order+kk);
     odeint_func(odeint_deriv_func,dim,yo+2*ii,nt,dt,t,
 		npot,potentialArgs+omp_get_thread_num()*npot,rtol,atol,
-		result+2*nt*ii,err+ii);
+		result+2*nt*ii,err+ii,
+		stats ? (struct odeintStats *) (stats+4*ii) : NULL);
     if ( cb ) // Callback if not void
       cb();
   }
@@ -212,6 +241,7 @@ EXPORT void integrateLinearOrbit(int nobj,
   for (ii=0; ii < max_threads; ii++)
     free_potentialArgs(npot,potentialArgs+ii*npot);
   free(potentialArgs);
+  free(order);
   //Done!
 }
 
@@ -51,6 +51,7 @@ void parse_leapFuncArgs(int npot,struct potentialArg * potentialArgs,
       tfuncs_type_arr * pot_tfuncs){
   int ii,jj;
   int nr;
+  int ncoeff, nt, nharm, nR, nz;
   init_potentialArgs(npot,potentialArgs);
   for (ii=0; ii < npot; ii++){
     switch ( *(*pot_type)++ ) {
@@ -173,6 +174,7 @@ void parse_leapFuncArgs(int npot,struct potentialArg * potentialArgs,
       potentialArgs->planarRphideriv= &ZeroPlanarForce;
       //Look at pot_args to figure out the number of arguments
       potentialArgs->nargs= (int) (5 + 4 * *(*pot_args+4) );
+      potentialArgs->nargs+= disk_table_nargs(*pot_args+potentialArgs->nargs);
       potentialArgs->ntfuncs= 0;
       potentialArgs->requiresVelocity= false;
       break;
@@ -274,8 +276,7 @@ void parse_leapFuncArgs(int npot,struct potentialArg * potentialArgs,
       potentialArgs->psi= &TriaxialHernquistPotentialpsi;
       potentialArgs->mdens= &TriaxialHernquistPotentialmdens;
       potentialArgs->mdensDeriv= &TriaxialHernquistPotentialmdensDeriv;
-      potentialArgs->nargs = (int) (21 + *(*pot_args+7) + 2 * *(*pot_args
-					    + (int) (*(*pot_args+7) + 20)));
+      potentialArgs->nargs= EllipsoidalPotentialnargs(*pot_args);
       potentialArgs->ntfuncs= 0;
       potentialArgs->requiresVelocity= false;
       break;
@@ -289,8 +290,7 @@ void parse_leapFuncArgs(int npot,struct potentialArg * potentialArgs,
       potentialArgs->psi= &TriaxialNFWPotentialpsi;
       potentialArgs->mdens= &TriaxialNFWPotentialmdens;
       potentialArgs->mdensDeriv= &TriaxialNFWPotentialmdensDeriv;
-      potentialArgs->nargs = (int) (21 + *(*pot_args+7) + 2 * *(*pot_args
-					    + (int) (*(*pot_args+7) + 20)));
+      potentialArgs->nargs= EllipsoidalPotentialnargs(*pot_args);
       potentialArgs->ntfuncs= 0;
       potentialArgs->requiresVelocity= false;
       break;
@@ -304,8 +304,7 @@ void parse_leapFuncArgs(int npot,struct potentialArg * potentialArgs,
       potentialArgs->psi= &TriaxialJaffePotentialpsi;
       potentialArgs->mdens= &TriaxialJaffePotentialmdens;
       potentialArgs->mdensDeriv= &TriaxialJaffePotentialmdensDeriv;
-      potentialArgs->nargs = (int) (21 + *(*pot_args+7) + 2 * *(*pot_args
-					    + (int) (*(*pot_args+7) + 20)));
+      potentialArgs->nargs= EllipsoidalPotentialnargs(*pot_args);
       potentialArgs->ntfuncs= 0;
       potentialArgs->requiresVelocity= false;
       break;
@@ -336,13 +335,13 @@ void parse_leapFuncArgs(int npot,struct potentialArg * potentialArgs,
       potentialArgs->ntfuncs= 0;
       potentialArgs->requiresVelocity= false;
       break;
-    case 27: // SpiralArmsPotential, 10 arguments + array of Cs
+    case 27: // SpiralArmsPotential, 10 arguments + array of Cs + 7 for caching
       potentialArgs->planarRforce = &SpiralArmsPotentialPlanarRforce;
       potentialArgs->planarphitorque = &SpiralArmsPotentialPlanarphitorque;
       potentialArgs->planarR2deriv = &SpiralArmsPotentialPlanarR2deriv;
       potentialArgs->planarphi2deriv = &SpiralArmsPotentialPlanarphi2deriv;
       potentialArgs->planarRphideriv = &SpiralArmsPotentialPlanarRphideriv;
-      potentialArgs->nargs = (int) 10 + **pot_args;
+      potentialArgs->nargs = (int) 17 + **pot_args;
       potentialArgs->ntfuncs= 0;
       potentialArgs->requiresVelocity= false;
       break;
@@ -376,8 +375,7 @@ void parse_leapFuncArgs(int npot,struct potentialArg * potentialArgs,
       potentialArgs->psi= &PerfectEllipsoidPotentialpsi;
       potentialArgs->mdens= &PerfectEllipsoidPotentialmdens;
       potentialArgs->mdensDeriv= &PerfectEllipsoidPotentialmdensDeriv;
-      potentialArgs->nargs = (int) (21 + *(*pot_args+7) + 2 * *(*pot_args
-					    + (int) (*(*pot_args+7) + 20)));
+      potentialArgs->nargs= EllipsoidalPotentialnargs(*pot_args);
       potentialArgs->ntfuncs= 0;
       potentialArgs->requiresVelocity= false;
       break;
@@ -455,8 +453,7 @@ void parse_leapFuncArgs(int npot,struct potentialArg * potentialArgs,
       potentialArgs->psi= &TriaxialGaussianPotentialpsi;
       potentialArgs->mdens= &TriaxialGaussianPotentialmdens;
       potentialArgs->mdensDeriv= &TriaxialGaussianPotentialmdensDeriv;
-      potentialArgs->nargs = (int) (21 + *(*pot_args+7) + 2 * *(*pot_args
-					    + (int) (*(*pot_args+7) + 20)));
+      potentialArgs->nargs= EllipsoidalPotentialnargs(*pot_args);
       potentialArgs->ntfuncs= 0;
       potentialArgs->requiresVelocity= false;
       break;
@@ -470,8 +467,7 @@ void parse_leapFuncArgs(int npot,struct potentialArg * potentialArgs,
       potentialArgs->psi= &PowerTriaxialPotentialpsi;
       potentialArgs->mdens= &PowerTriaxialPotentialmdens;
       potentialArgs->mdensDeriv= &PowerTriaxialPotentialmdensDeriv;
-      potentialArgs->nargs = (int) (21 + *(*pot_args+7) + 2 * *(*pot_args
-					    + (int) (*(*pot_args+7) + 20)));
+      potentialArgs->nargs= EllipsoidalPotentialnargs(*pot_args);
       potentialArgs->ntfuncs= 0;
       potentialArgs->requiresVelocity= false;
       break;
@@ -494,6 +490,117 @@ void parse_leapFuncArgs(int npot,struct potentialArg * potentialArgs,
       potentialArgs->ntfuncs= 0;
       potentialArgs->requiresVelocity= false;
       break;
+    case 41: //TimeDependentSCFPotential, many arguments
+      potentialArgs->potentialEval= &TimeDependentSCFPotentialEval;
+      potentialArgs->planarRforce= &TimeDependentSCFPotentialPlanarRforce;
+      potentialArgs->planarphitorque= &TimeDependentSCFPotentialPlanarphitorque;
+      potentialArgs->planarR2deriv= &TimeDependentSCFPotentialPlanarR2deriv;
+      potentialArgs->planarphi2deriv= &TimeDependentSCFPotentialPlanarphi2deriv;
+      potentialArgs->planarRphideriv= &TimeDependentSCFPotentialPlanarRphideriv;
+      ncoeff= (int) ( (1 + *(*pot_args + 1)) * *(*pot_args+2) * *(*pot_args+3) * *(*pot_args+4) );
+      nt= (int) *(*pot_args + 5 + ncoeff + 7);
+      potentialArgs->nargs= 5 + ncoeff + 7 + 2 + nt + 4 * (nt - 1) * ncoeff;
+      potentialArgs->ntfuncs= 0;
+      potentialArgs->requiresVelocity= false;
+      break;
+    case 42: //MultipolePotential, many arguments
+      potentialArgs->potentialEval= &MultipolePotentialEval;
+      potentialArgs->planarRforce= &MultipolePotentialPlanarRforce;
+      potentialArgs->planarphitorque= &MultipolePotentialPlanarphitorque;
+      potentialArgs->planarR2deriv= &MultipolePotentialPlanarR2deriv;
+      potentialArgs->planarphi2deriv= &MultipolePotentialPlanarphi2deriv;
+      potentialArgs->planarRphideriv= &MultipolePotentialPlanarRphideriv;
+      nharm= (int) *(*pot_args + 2);
+      nr= (int) *(*pot_args + 3);
+      potentialArgs->nargs= 4 + nr + 4 * nharm + 6 * (nr - 1) * nharm + 4 * nharm + 7;
+      potentialArgs->ntfuncs= 0;
+      potentialArgs->requiresVelocity= false;
+      break;
+    case 43: //CylindricalSplinePotential, many arguments
+      potentialArgs->potentialEval= &CylindricalSplinePotentialEval;
+      potentialArgs->planarRforce= &CylindricalSplinePotentialPlanarRforce;
+      potentialArgs->planarphitorque= &CylindricalSplinePotentialPlanarphitorque;
+      potentialArgs->planarR2deriv= &CylindricalSplinePotentialPlanarR2deriv;
+      potentialArgs->planarphi2deriv= &CylindricalSplinePotentialPlanarphi2deriv;
+      potentialArgs->planarRphideriv= &CylindricalSplinePotentialPlanarRphideriv;
+      nharm= 2 * (int) **pot_args + 1;
+      nR= (int) *(*pot_args + 3);
+      nz= (int) *(*pot_args + 4);
+      potentialArgs->nargs= 5 + nR + nz + 4 * nR * nz * nharm;
+      potentialArgs->ntfuncs= 0;
+      potentialArgs->requiresVelocity= false;
+      break;
+    case 44: //RingPotential, 2 arguments
+      potentialArgs->potentialEval= &RingPotentialEval;
+      potentialArgs->planarRforce= &RingPotentialPlanarRforce;
+      potentialArgs->planarphitorque= &ZeroPlanarForce;
+      potentialArgs->planarR2deriv= &RingPotentialPlanarR2deriv;
+      potentialArgs->planarphi2deriv= &ZeroPlanarForce;
+      potentialArgs->planarRphideriv= &ZeroPlanarForce;
+      potentialArgs->nargs= 2;
+      potentialArgs->ntfuncs= 0;
+      potentialArgs->requiresVelocity= false;
+      break;
+    case 45: //SphericalShellPotential, 2 arguments
+      potentialArgs->potentialEval= &SphericalPotentialEval;
+      potentialArgs->planarRforce = &SphericalPotentialPlanarRforce;
+      potentialArgs->planarphitorque= &ZeroPlanarForce;
+      potentialArgs->planarR2deriv= &SphericalPotentialPlanarR2deriv;
+      potentialArgs->planarphi2deriv= &ZeroPlanarForce;
+      potentialArgs->planarRphideriv= &ZeroPlanarForce;
+      // Also assign functions specific to SphericalPotential
+      potentialArgs->revaluate= &SphericalShellPotentialrevaluate;
+      potentialArgs->rforce= &SphericalShellPotentialrforce;
+      potentialArgs->r2deriv= &SphericalShellPotentialr2deriv;
+      potentialArgs->nargs= 2;
+      potentialArgs->ntfuncs= 0;
+      potentialArgs->requiresVelocity= false;
+      break;
+    case 46: //RazorThinExponentialDiskPotential, 7 + 2 x glorder arguments (4 caching ones)
+      potentialArgs->potentialEval= &RazorThinExponentialDiskPotentialEval;
+      potentialArgs->planarRforce= &RazorThinExponentialDiskPotentialPlanarRforce;
+      potentialArgs->planarphitorque= &ZeroPlanarForce;
+      potentialArgs->planarR2deriv= &RazorThinExponentialDiskPotentialPlanarR2deriv;
+      potentialArgs->planarphi2deriv= &ZeroPlanarForce;
+      potentialArgs->planarRphideriv= &ZeroPlanarForce;
+      potentialArgs->nargs= 7 + 2 * (int) *(*pot_args + 2);
+      potentialArgs->ntfuncs= 0;
+      potentialArgs->requiresVelocity= false;
+      break;
+    case 47: //FerrersPotential, 15 + 2 x glorder arguments (7 caching ones)
+      potentialArgs->potentialEval= &FerrersPotentialEval;
+      potentialArgs->planarRforce= &FerrersPotentialPlanarRforce;
+      potentialArgs->planarphitorque= &FerrersPotentialPlanarphitorque;
+      potentialArgs->planarR2deriv= &FerrersPotentialPlanarR2deriv;
+      potentialArgs->planarphi2deriv= &FerrersPotentialPlanarphi2deriv;
+      potentialArgs->planarRphideriv= &FerrersPotentialPlanarRphideriv;
+      potentialArgs->nargs= 15 + 2 * (int) *(*pot_args + 14);
+      potentialArgs->ntfuncs= 0;
+      potentialArgs->requiresVelocity= false;
+      break;
+    case 48: //AnyAxisymmetricRazorThinDiskPotential, many arguments
+      // Set up 1 spline in potentialArgs
+      potentialArgs->nspline1d= 1;
+      potentialArgs->spline1d= (gsl_spline **)			\
+	malloc ( potentialArgs->nspline1d*sizeof ( gsl_spline *) );
+      potentialArgs->acc1d= (gsl_interp_accel **)			\
+	malloc ( potentialArgs->nspline1d * sizeof ( gsl_interp_accel * ) );
+      // allocate accelerator
+      *potentialArgs->acc1d= gsl_interp_accel_alloc();
+      // Set up interpolater
+      nr= (int) **pot_args;
+      *potentialArgs->spline1d= gsl_spline_alloc(gsl_interp_cspline,nr);
+      gsl_spline_init(*potentialArgs->spline1d,*pot_args+1,*pot_args+1+nr,nr);
+      *pot_args+= 2*nr+1;
+      // Bind forces; no second derivatives
+      potentialArgs->potentialEval= &AnyAxisymmetricRazorThinDiskPotentialEval;
+      potentialArgs->planarRforce= &AnyAxisymmetricRazorThinDiskPotentialPlanarRforce;
+      potentialArgs->planarphitorque= &ZeroPlanarForce;
+      potentialArgs->nargs= 5 + 4 * (int) *(*pot_args + 4);
+      potentialArgs->nargs+= disk_table_nargs(*pot_args+potentialArgs->nargs);
+      potentialArgs->ntfuncs= 0;
+      potentialArgs->requiresVelocity= false;
+      break;
 //////////////////////////////// WRAPPERS /////////////////////////////////////
     case -1: //DehnenSmoothWrapperPotential
       potentialArgs->potentialEval= &DehnenSmoothWrapperPotentialEval;
@@ -567,8 +674,26 @@ void parse_leapFuncArgs(int npot,struct potentialArg * potentialArgs,
       potentialArgs->ntfuncs= 0;
       potentialArgs->requiresVelocity= false;
       break;
+    case -11: //ManyMovingObjectsPotential, nargs set below
+      potentialArgs->planarRforce= &ManyMovingObjectsPotentialPlanarRforce;
+      potentialArgs->planarphitorque= &ManyMovingObjectsPotentialPlanarphitorque;
+      potentialArgs->ntfuncs= 0;
+      potentialArgs->requiresVelocity= false;
+      break;
+    case -12: //TimeInterpolatedPotential, nargs set below
+      potentialArgs->potentialEval= &TimeInterpolatedPotentialEval;
+      potentialArgs->planarRforce= &TimeInterpolatedPotentialPlanarRforce;
+      potentialArgs->planarphitorque= &TimeInterpolatedPotentialPlanarphitorque;
+      potentialArgs->planarR2deriv= &TimeInterpolatedPotentialPlanarR2deriv;
+      potentialArgs->planarphi2deriv= &TimeInterpolatedPotentialPlanarphi2deriv;
+      potentialArgs->planarRphideriv= &TimeInterpolatedPotentialPlanarRphideriv;
+      potentialArgs->ntfuncs= 0;
+      potentialArgs->requiresVelocity= false;
+      break;
     }
     int setupSplines = *(*pot_type-1) == -6 ? 1 : 0;
+    int setupManyMovingObjects = *(*pot_type-1) == -11 ? 1 : 0;
+    int setupTimeInterpolated = *(*pot_type-1) == -12 ? 1 : 0;
     if ( *(*pot_type-1) < 0) { // Parse wrapped potential for wrappers
       potentialArgs->nwrapped= (int) *(*pot_args)++;
       potentialArgs->wrappedPotentialArg= \
@@ -579,6 +704,11 @@ void parse_leapFuncArgs(int npot,struct potentialArg * potentialArgs,
 			 pot_type,pot_args,pot_tfuncs);
     }
     if (setupSplines) initPlanarMovingObjectSplines(potentialArgs, pot_args);
+    if (setupManyMovingObjects) // 5+ngroups+nt+6*nt*nobj+8 arguments
+      potentialArgs->nargs= 13 + (int) *(*pot_args+4) + (int) *(*pot_args+2)
+	* ( 1 + 6 * (int) *(*pot_args+1) );
+    if (setupTimeInterpolated) // 3+3*nsnap arguments
+      potentialArgs->nargs= 3 + 3 * (int) *(*pot_args+1);
     // Now load each potential's parameters
     potentialArgs->args= (double *) malloc( potentialArgs->nargs * sizeof(double));
     for (jj=0; jj < potentialArgs->nargs; jj++){
@@ -608,10 +738,11 @@ EXPORT void integratePlanarOrbit(int nobj,
 				 double atol,
 				 double *result,
 				 int * err,
+				 double * stats,
 				 int odeint_type,
          orbint_callback_type cb){
   //Set up the forces, first count
-  int ii,jj;
+  int ii,jj,kk;
   int dim;
   int max_threads;
   int * thread_pot_type;
@@ -636,7 +767,7 @@ EXPORT void integratePlanarOrbit(int nobj,
 		      int, double, double *,
 		      int, struct potentialArg *,
 		      double, double,
-		      double *,int *);
+		      double *,int *,struct odeintStats *);
   void (*odeint_deriv_func)(double, double *, double *,
 			    int,struct potentialArg *);
   switch ( odeint_type ) {
@@ -680,13 +811,49 @@ EXPORT void integratePlanarOrbit(int nobj,
     odeint_deriv_func= &evalPlanarRectForce;
     dim= 2;
     break;
+  case 8: //symplec4fg
+    odeint_func= &symplec4fg;
+    odeint_deriv_func= &evalPlanarRectForce;
+    dim= 2;
+    break;
+  case 9: //ttleapfrog
+    odeint_func= &ttleapfrog;
+    odeint_deriv_func= &evalPlanarRectForce;
+    dim= 2;
+    break;
+  }
+  // Estimate the cost of each orbit as the number of dynamical times
+  // sqrt(R/|F|) it is integrated for and start with the most expensive ones
+  int * order= (int *) malloc ( nobj * sizeof(int) );
+  if ( orbit_cost_order_active(nobj,max_threads,odeint_type) ) {
+    double * cost= (double *) malloc ( nobj * sizeof(double) );
+    double R,phi,Rforce,phitorque;
+#pragma omp parallel for schedule(static) private(ii,R,phi,Rforce,phitorque) num_threads(max_threads)
+    for (ii=0; ii < nobj; ii++) {
+      R= *(yo+4*ii);
+      phi= *(yo+4*ii+3);
+      Rforce= calcPlanarRforce(R,phi,*t,npot,
+			       potentialArgs+omp_get_thread_num()*npot,
+			       *(yo+4*ii+1),*(yo+4*ii+2));
+      phitorque= calcPlanarphitorque(R,phi,*t,npot,
+				     potentialArgs+omp_get_thread_num()*npot,
+				     *(yo+4*ii+1),*(yo+4*ii+2));
+      *(cost+ii)= fabs(*(t+nt-1)-*t)
+	* sqrt(sqrt(Rforce*Rforce+phitorque*phitorque/R/R)/R);
+    }
+    order_orbits_by_cost(nobj,cost,order);
+    free(cost);
   }
+  else
+    for (ii=0; ii < nobj; ii++) *(order+ii)= ii;
 #pragma omp parallel for schedule(dynamic,ORBITS_CHUNKSIZE) private(ii,jj) num_threads(max_threads)
-  for (ii=0; ii < nobj; ii++) {
+  for (kk=0; kk < nobj; kk++) {
+    ii= *(order+kk);
     polar_to_rect_galpy(yo+4*ii);
     odeint_func(odeint_deriv_func,dim,yo+4*ii,nt,dt,t,
 		npot,potentialArgs+omp_get_thread_num()*npot,rtol,atol,
-		result+4*nt*ii,err+ii);
+		result+4*nt*ii,err+ii,
+		stats ? (struct odeintStats *) (stats+4*ii) : NULL);
     for (jj= 0; jj < nt; jj++)
       rect_to_polar_galpy(result+4*jj+4*nt*ii);
     if ( cb ) // Callback if not void
@@ -697,6 +864,7 @@ EXPORT void integratePlanarOrbit(int nobj,
   for (ii=0; ii < max_threads; ii++)
     free_potentialArgs(npot,potentialArgs+ii*npot);
   free(potentialArgs);
+  free(order);
   //Done!
 }
 EXPORT void integratePlanarOrbit_sos(
@@ -743,7 +911,7 @@ EXPORT void integratePlanarOrbit_sos(
 		      int, double, double *,
 		      int, struct potentialArg *,
 		      double, double,
-		      double *,int *);
+		      double *,int *,struct odeintStats *);
   void (*odeint_deriv_func)(double, double *, double *,
 			    int,struct potentialArg *);
   dim= 5;
@@ -778,7 +946,7 @@ EXPORT void integratePlanarOrbit_sos(
     polar_to_sos_galpy(yo+dim*ii,surface);
     odeint_func(odeint_deriv_func,dim,yo+dim*ii,npsi,dpsi,psi+npsi*ii*indiv_psi,
 		npot,potentialArgs+omp_get_thread_num()*npot,rtol,atol,
-		result+dim*npsi*ii,err+ii);
+		result+dim*npsi*ii,err+ii,NULL);
     for (jj=0; jj < npsi; jj++)
       sos_to_polar_galpy(result+dim*jj+dim*npsi*ii,surface);
     if ( cb ) // Callback if not void
@@ -817,7 +985,7 @@ EXPORT void integratePlanarOrbit_dxdv(double *yo,
 		      int, double, double *,
 		      int, struct potentialArg *,
 		      double, double,
-		      double *,int *);
+		      double *,int *,struct odeintStats *);
   void (*odeint_deriv_func)(double, double *, double *,
 			    int,struct potentialArg *);
   switch ( odeint_type ) {
@@ -843,7 +1011,7 @@ EXPORT void integratePlanarOrbit_dxdv(double *yo,
     break;
   }
   odeint_func(odeint_deriv_func,dim,yo,nt,dt,t,npot,potentialArgs,rtol,atol,
-	      result,err);
+	      result,err,NULL);
   //Free allocated memory
   free_potentialArgs(npot,potentialArgs);
   free(potentialArgs);
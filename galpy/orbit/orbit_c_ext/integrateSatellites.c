@@ -0,0 +1,154 @@
+/*
+  C code for integrating a small system of satellites coupled through their
+  mutual gravitational interactions in a host potential
+*/
+#ifdef _WIN32
+#include <Python.h>
+#endif
+#include <stdio.h>
+#include <stdlib.h>
+#include <stdbool.h>
+#include <math.h>
+#include <bovy_coords.h>
+#include <bovy_symplecticode.h>
+#include <leung_dop853.h>
+#include <integrateFullOrbit.h>
+//Potentials
+#include <galpy_potentials.h>
+//Macros to export functions in DLL on different OS
+#if defined(_WIN32)
+#define EXPORT __declspec(dllexport)
+#elif defined(__GNUC__)
+#define EXPORT __attribute__((visibility("default")))
+#else
+// Just do nothing?
+#define EXPORT
+#endif
+/*
+  Function Declarations
+*/
+void evalSatellitesDeriv(double, double *, double *,
+			 int, struct potentialArg *);
+/*
+  Satellite potentials are axisymmetric and centered on the satellite, so
+  the force only depends on the separation d = x - x_satellite
+*/
+static void satelliteForce(double t, double dx, double dy, double dz,
+			   int npot, struct potentialArg * potentialArgs,
+			   double * F){
+  double R= sqrt(dx*dx+dy*dy);
+  double phi= atan2(dy,dx);
+  double Rforce= calcRforce(R,dz,phi,t,npot,potentialArgs);
+  *(F+2)+= calczforce(R,dz,phi,t,npot,potentialArgs);
+  if ( R > 0. ) {
+    *F+= Rforce * dx / R;
+    *(F+1)+= Rforce * dy / R;
+  }
+}
+/*
+  Acceleration of the host's center due to all satellites, the host is
+  treated as a test particle at the origin of the (host-centered) frame
+*/
+static void hostAcceleration(double t, double *q, int nsat,
+			     struct potentialArg * potentialArgs,
+			     double * acc){
+  int jj;
+  *acc= 0.;
+  *(acc+1)= 0.;
+  *(acc+2)= 0.;
+  for (jj=0; jj < nsat; jj++)
+    satelliteForce(t,-*(q+6*jj),-*(q+6*jj+1),-*(q+6*jj+2),
+		   (potentialArgs+nsat+jj)->nwrapped,
+		   (potentialArgs+nsat+jj)->wrappedPotentialArg,acc);
+}
+/*
+  MAIN FUNCTIONS
+*/
+EXPORT void integrateSatellites(int nsat,
+				double *yo,
+				int nt,
+				double *t,
+				int * npot,
+				int * pot_type,
+				double * pot_args,
+				tfuncs_type_arr pot_tfuncs,
+				int reflex,
+				double dt,
+				double rtol,
+				double atol,
+				double *result,
+				double *hostacc,
+				int * err,
+				double * stats){
+  // npot= [nhost_0,...,nhost_nsat-1,nsat_0,...,nsat_nsat-1]: the number
+  // of host forces (host potential + dynamical friction) acting on each
+  // satellite and the number of potentials making up each satellite
+  int ii,jj;
+  int dim= 6 * nsat;
+  // Each satellite's forces are stored as the wrapped potentials of one
+  // potentialArg, the first nsat for the host, the last nsat for the
+  // satellites themselves; the first of these stores reflex
+  struct potentialArg * potentialArgs= (struct potentialArg *) malloc ( 2 * nsat * sizeof (struct potentialArg) );
+  init_potentialArgs(2*nsat,potentialArgs);
+  for (ii=0; ii < 2*nsat; ii++) {
+    (potentialArgs+ii)->nwrapped= *(npot+ii);
+    (potentialArgs+ii)->wrappedPotentialArg= \
+      (struct potentialArg *) malloc ( *(npot+ii)		\
+				       * sizeof (struct potentialArg) );
+    parse_leapFuncArgs_Full(*(npot+ii),
+			    (potentialArgs+ii)->wrappedPotentialArg,
+			    &pot_type,&pot_args,&pot_tfuncs);
+    (potentialArgs+ii)->nargs= 1;
+    (potentialArgs+ii)->args= (double *) malloc ( sizeof (double) );
+    *((potentialArgs+ii)->args)= (double) reflex;
+    (potentialArgs+ii)->ntfuncs= 0;
+    (potentialArgs+ii)->nspline1d= 0;
+  }
+  // Integrate the coupled system in rectangular coordinates
+  for (ii=0; ii < nsat; ii++)
+    cyl_to_rect_galpy(yo+6*ii);
+  dop853(&evalSatellitesDeriv,dim,yo,nt,dt,t,2*nsat,potentialArgs,
+	 rtol,atol,result,err,
+	 stats ? (struct odeintStats *) stats : NULL);
+  for (jj=0; jj < nt; jj++) {
+    if ( reflex )
+      hostAcceleration(*(t+jj),result+dim*jj,nsat,potentialArgs,
+		       hostacc+3*jj);
+    for (ii=0; ii < nsat; ii++)
+      rect_to_cyl_galpy(result+dim*jj+6*ii);
+  }
+  //Free allocated memory
+  free_potentialArgs(2*nsat,potentialArgs);
+  free(potentialArgs);
+  //Done!
+}
+void evalSatellitesDeriv(double t, double *q, double *a,
+			 int nargs, struct potentialArg * potentialArgs){
+  int ii,jj;
+  int nsat= nargs / 2;
+  bool reflex= (bool) *(potentialArgs->args);
+  double acc[3];
+  if ( reflex )
+    hostAcceleration(t,q,nsat,potentialArgs,acc);
+  for (ii=0; ii < nsat; ii++) {
+    // Host forces (including dynamical friction) on satellite ii
+    evalRectDeriv(t,q+6*ii,a+6*ii,
+		  (potentialArgs+ii)->nwrapped,
+		  (potentialArgs+ii)->wrappedPotentialArg);
+    // Forces from all other satellites
+    for (jj=0; jj < nsat; jj++) {
+      if ( jj == ii ) continue;
+      satelliteForce(t,*(q+6*ii)-*(q+6*jj),*(q+6*ii+1)-*(q+6*jj+1),
+		     *(q+6*ii+2)-*(q+6*jj+2),
+		     (potentialArgs+nsat+jj)->nwrapped,
+		     (potentialArgs+nsat+jj)->wrappedPotentialArg,
+		     a+6*ii+3);
+    }
+    // Fictitious force from the acceleration of the host's center
+    if ( reflex ) {
+      *(a+6*ii+3)-= *acc;
+      *(a+6*ii+4)-= *(acc+1);
+      *(a+6*ii+5)-= *(acc+2);
+    }
+  }
+}
@@ -4,14 +4,16 @@
 #                                            to the growth of a baryonic
 #                                            component
 ###############################################################################
+import warnings
+from collections import OrderedDict
+
 import numpy
-from scipy import integrate
-from scipy.interpolate import interp1d
-from scipy.optimize import fixed_point
 
-from ..util import conversion
+from ..util import conversion, galpyWarning
+from ..util._disk_cache import disk_cache
 from .Force import Force
 from .interpSphericalPotential import interpSphericalPotential
+from .Potential import _cache_params_key, evaluaterforces, flatten
 
 
 # Note: not actually implemented as a WrapperPotential!
@@ -36,6 +38,7 @@ class AdiabaticContractionWrapperPotential(interpSphericalPotential):
         f_bar=0.157,
         rmin=None,
         rmax=50.0,
+        warm_start=None,
         ro=None,
         vo=None,
     ):
@@ -64,6 +67,8 @@ class AdiabaticContractionWrapperPotential(interpSphericalPotential):
             Minimum radius to consider (default: rmax/2500; don't set this to zero).
         rmax : float or Quantity, optional
             Maximum radius to consider (default: 50.).
+        warm_start : AdiabaticContractionWrapperPotential, optional
+            Contracted halo of a similar model using the same method (e.g., a neighboring model in a parameter scan), whose solution is used as the starting point of the iterative solution of the contraction, which then requires fewer iterations (default: None).
         ro : float or Quantity, optional
             Distance scale for translation into internal units (default from configuration file).
         vo : float or Quantity, optional
@@ -72,6 +77,8 @@ class AdiabaticContractionWrapperPotential(interpSphericalPotential):
         Notes
         -----
         - 2021-03-21 - Started based on Marius Cautun's code - Bovy (UofT)
+        - 2026-10-19 - Contraction cached on disk when a cache directory is set in the configuration file - Agent (local)
+        - 2026-10-19 - Vectorized solution with cached enclosed-mass tables, convergence diagnostics (in the contraction_info attribute), and warm starting - Agent (local)
 
         References
         ----------
@@ -87,39 +94,28 @@ class AdiabaticContractionWrapperPotential(interpSphericalPotential):
             if not rmin is None
             else rmax / 2500.0
         )
-        # Compute baryon and DM enclosed masses on radial grid
-        from ..potential import mass
-
-        rgrid = numpy.geomspace(rmin, rmax, 301)
-        baryon_mass = numpy.array(
-            [mass(baryonpot, r, use_physical=False) for r in rgrid]
-        )
-        dm_mass = numpy.array([mass(pot, r, use_physical=False) for r in rgrid])
-        # Adiabatic contraction
-        if f_bar is None:
-            f_bar = baryon_mass[-1] / (baryon_mass[-1] + dm_mass[-1])
-        if method.lower() == "cautun":
-            new_rforce = _contraction_Cautun2020(rgrid, dm_mass, baryon_mass, f_bar)
-        elif method.lower() == "gnedin":
-            new_rforce = _contraction_Gnedin2004(
-                rgrid,
-                dm_mass,
-                baryon_mass,
-                pot.rvir(overdens=180.0, wrtcrit=False),
-                f_bar,
+        if warm_start is None:
+            ratio0 = None
+        elif warm_start._method != method.lower():
+            raise ValueError(
+                "warm_start should be an AdiabaticContractionWrapperPotential that uses the same method"
             )
-        elif method.lower() == "blumenthal":
-            new_rforce = _contraction_Blumenthal1986(rgrid, dm_mass, baryon_mass, f_bar)
-        else:  # pragma: no cover
-            raise ValueError(f"Adiabatic contraction method '{method}' not recognized")
-        # Add central point
-        rgrid = numpy.concatenate(([0.0], rgrid))
-        new_rforce = numpy.concatenate(([0.0], new_rforce))
+        else:  # Solution of the other model, interpolated in log r
+            ratio0 = numpy.interp(
+                numpy.log(numpy.geomspace(rmin, rmax, 301)),
+                numpy.log(warm_start._rgrid[1:]),
+                warm_start._contraction_ratio,
+            )
+        rgrid, new_rforce, self._contraction_ratio, self.contraction_info = _contract(
+            pot, baryonpot, method, f_bar, rmin, rmax, ratio0=ratio0
+        )
+        self._method = method.lower()
         new_rforce_func = lambda r: -numpy.interp(r, rgrid, new_rforce)
         # Potential at zero = int_0^inf dr rforce, and enc. mass constant
-        # outside of last rgrid point
+        # outside of last rgrid point; the integral of the linearly
+        # interpolated rforce is exactly the trapezoidal rule
         Phi0 = (
-            integrate.quad(new_rforce_func, rgrid[0], rgrid[-1])[0]
+            -numpy.sum(0.5 * (new_rforce[1:] + new_rforce[:-1]) * numpy.diff(rgrid))
             - new_rforce[-1] * rgrid[-1]
         )
         interpSphericalPotential.__init__(
@@ -127,48 +123,174 @@ class AdiabaticContractionWrapperPotential(interpSphericalPotential):
         )
 
 
-def _contraction_Cautun2020(r, M_DMO, Mbar, fbar):
+# Enclosed-mass tables of the most recently used potentials, keyed on the
+# potentials' parameters and the radial grid
+_MASS_TABLES = OrderedDict()
+_MASS_TABLES_MAXSIZE = 16
+
+
+@disk_cache()
+def _contract(pot, baryonpot, method, f_bar, rmin, rmax, ratio0=None):
+    """Compute the radial force of the contracted halo on a radial grid, starting the iterative solution from ratio0 (the contracted over the original enclosed mass for 'cautun' and the contracted over the original radius otherwise) if given; also returns the solution's ratio and the solver's diagnostics"""
+    rgrid = numpy.geomspace(rmin, rmax, 301)
+    baryon_mass = _enclosed_mass(baryonpot, rgrid)
+    dm_mass = _enclosed_mass(pot, rgrid)
+    # Adiabatic contraction
+    if f_bar is None:
+        f_bar = baryon_mass[-1] / (baryon_mass[-1] + dm_mass[-1])
+    if method.lower() == "cautun":
+        new_rforce, ratio, info = _contraction_Cautun2020(
+            rgrid, dm_mass, baryon_mass, f_bar, ratio0=ratio0
+        )
+    elif method.lower() == "gnedin":
+        new_rforce, ratio, info = _contraction_Gnedin2004(
+            rgrid,
+            dm_mass,
+            baryon_mass,
+            pot.rvir(overdens=180.0, wrtcrit=False),
+            f_bar,
+            ratio0=ratio0,
+        )
+    elif method.lower() == "blumenthal":
+        new_rforce, ratio, info = _contraction_Blumenthal1986(
+            rgrid, dm_mass, baryon_mass, f_bar, ratio0=ratio0
+        )
+    else:  # pragma: no cover
+        raise ValueError(f"Adiabatic contraction method '{method}' not recognized")
+    # Add central point
+    rgrid = numpy.concatenate(([0.0], rgrid))
+    new_rforce = numpy.concatenate(([0.0], new_rforce))
+    return rgrid, new_rforce, ratio, info
+
+
+def _enclosed_mass(pot, rgrid, nmax=1024, rtol=1e-10):
+    """Mass of pot within spheres of radius rgrid, computed for all radii at once; tables are cached for the most recently used potentials"""
+    pot = flatten(pot if isinstance(pot, list) else [pot])
+    key = (
+        tuple((type(p), _cache_params_key(p)) for p in pot),
+        rgrid.tobytes(),
+    )
+    if key in _MASS_TABLES:
+        _MASS_TABLES.move_to_end(key)
+        return _MASS_TABLES[key].copy()
+    out = numpy.zeros_like(rgrid)
+    for p in pot:
+        if not p.isDissipative:
+            out += _component_mass(p, rgrid, nmax=nmax, rtol=rtol)
+    _MASS_TABLES[key] = out
+    if len(_MASS_TABLES) > _MASS_TABLES_MAXSIZE:
+        _MASS_TABLES.popitem(last=False)
+    return out.copy()
+
+
+def _component_mass(pot, rgrid, nmax=1024, rtol=1e-10):
+    """Mass of a single potential within spheres of radius rgrid: from its explicit mass expression if it has one, otherwise using Gauss' theorem with Gauss-Legendre quadrature in cos(theta) above and below the plane, doubling the number of nodes until converged to rtol"""
+    if hasattr(pot, "_mass"):
+        try:
+            out = pot.mass(rgrid, use_physical=False)
+            if numpy.shape(out) == rgrid.shape:
+                return out
+        except (TypeError, ValueError):  # for masses that do not accept arrays
+            pass
+        return numpy.array([pot.mass(rr, use_physical=False) for rr in rgrid])
+    r = rgrid[:, None]
+    n = 16
+    try:
+        out = _gauss_mass(pot, r, n)
+    except (TypeError, ValueError):  # for potentials that do not accept array input
+        return numpy.array([pot.mass(rr, use_physical=False) for rr in rgrid])
+    while n < nmax:
+        n *= 2
+        newout = _gauss_mass(pot, r, n)
+        unconverged = numpy.fabs(newout - out) > rtol * numpy.fabs(newout)
+        out = newout
+        if not numpy.any(unconverged):
+            break
+        elif n == nmax:
+            # Use adaptive integration for the radii that did not converge
+            out[unconverged] = [
+                pot.mass(rr, use_physical=False) for rr in rgrid[unconverged]
+            ]
+    return out
+
+
+def _gauss_mass(pot, r, n):
+    """Enclosed mass within r[:,None] from Gauss' theorem using n-point Gauss-Legendre quadrature in cos(theta) for each hemisphere"""
+    nodes, weights = numpy.polynomial.legendre.leggauss(n)
+    costheta = numpy.concatenate((0.5 * (nodes - 1.0), 0.5 * (nodes + 1.0)))
+    weights = numpy.concatenate((weights, weights)) / 2.0
+    rforce = evaluaterforces(
+        pot, r * numpy.sqrt(1.0 - costheta**2.0), r * costheta, use_physical=False
+    )
+    return -(r[:, 0] ** 2.0) * numpy.sum(weights * rforce, axis=1) / 2.0
+
+
+def _fixed_point(func, x0, xtol=1e-8, maxiter=500):
+    """Find the fixed point of func for all elements of x0 at once using Steffensen's method (as scipy.optimize.fixed_point); returns the solution and a dictionary with the number of iterations, the maximum relative change in the last iteration, and whether the solution converged"""
+    p0 = x0
+    for ii in range(maxiter):
+        p1 = func(p0)
+        p2 = func(p1)
+        d = p2 - 2.0 * p1 + p0
+        p = numpy.where(
+            d != 0.0, p0 - (p1 - p0) ** 2.0 / numpy.where(d != 0.0, d, 1.0), p2
+        )
+        relerr = numpy.amax(
+            numpy.fabs(
+                numpy.where(p0 != 0.0, (p - p0) / numpy.where(p0 != 0.0, p0, 1.0), p)
+            )
+        )
+        if relerr < xtol:
+            return p, {"niter": ii + 1, "relerr": relerr, "converged": True}
+        p0 = p
+    warnings.warn(
+        f"Adiabatic contraction did not converge after {maxiter} iterations (maximum relative change in the last iteration: {relerr:g})",
+        galpyWarning,
+    )
+    return p, {"niter": maxiter, "relerr": relerr, "converged": False}
+
+
+def _contraction_Cautun2020(r, M_DMO, Mbar, fbar, ratio0=None):
     # solve for the contracted enclosed DM mass
     func_M_DM_contract = (
         lambda M: M_DMO * 1.023 * (M_DMO / (1.0 - fbar) / (M + Mbar)) ** -0.54
     )
-    M_DM = fixed_point(func_M_DM_contract, M_DMO)
-    return M_DM / M_DMO * M_DMO / r**2.0
+    M_DM, info = _fixed_point(
+        func_M_DM_contract, M_DMO if ratio0 is None else ratio0 * M_DMO
+    )
+    return M_DM / r**2.0, M_DM / M_DMO, info
 
 
-def _contraction_Blumenthal1986(r, M_DMO, Mbar, fbar):
+def _contraction_Blumenthal1986(r, M_DMO, Mbar, fbar, ratio0=None):
     # solve for the contracted radius 'rf' containing the same DM mass
     # as enclosed for r
-    func_M_bar = interp1d(r, Mbar, bounds_error=False, fill_value=(Mbar[0], Mbar[-1]))
-    func_r_contract = lambda rf: r * (M_DMO / (1.0 - fbar)) / (M_DMO + func_M_bar(rf))
-    rf = fixed_point(func_r_contract, r)
-    # now find how much the enclosed mass increased at r
-    func_M_DM = interp1d(
-        rf, M_DMO, bounds_error=False, fill_value=(M_DMO[0], M_DMO[-1])
+    func_r_contract = lambda rf: (
+        r * (M_DMO / (1.0 - fbar)) / (M_DMO + _interp_mass(rf, r, Mbar))
     )
-    return func_M_DM(r) / r**2.0
+    rf, info = _fixed_point(func_r_contract, r if ratio0 is None else ratio0 * r)
+    # now find how much the enclosed mass increased at r
+    return _interp_mass(r, rf, M_DMO) / r**2.0, rf / r, info
 
 
-def _contraction_Gnedin2004(r, M_DMO, M_bar, Rvir, fbar):
+def _contraction_Gnedin2004(r, M_DMO, M_bar, Rvir, fbar, ratio0=None):
     # solve for the contracted radius 'rf' containing the same DM mass
     # as enclosed for r
-    func_M_bar = interp1d(
-        r, M_bar, bounds_error=False, fill_value=(M_bar[0], M_bar[-1])
-    )
-    func_M_DMO = interp1d(
-        r, M_DMO, bounds_error=False, fill_value=(M_DMO[0], M_DMO[-1])
-    )
     A, w = 0.85, 0.8
     func_r_mean = lambda ri: A * Rvir * (ri / Rvir) ** w
-    M_DMO_rmean = func_M_DMO(func_r_mean(r))
-    func_r_contract = (
-        lambda rf: r
+    M_DMO_rmean = _interp_mass(func_r_mean(r), r, M_DMO)
+    func_r_contract = lambda rf: (
+        r
         * (M_DMO_rmean / (1.0 - fbar))
-        / (M_DMO_rmean + func_M_bar(func_r_mean(rf)))
+        / (M_DMO_rmean + _interp_mass(func_r_mean(rf), r, M_bar))
     )
-    rf = fixed_point(func_r_contract, r)
+    rf, info = _fixed_point(func_r_contract, r if ratio0 is None else ratio0 * r)
     # now find how much the enclosed mass increased at r
-    func_M_DM = interp1d(
-        rf, M_DMO, bounds_error=False, fill_value=(M_DMO[0], M_DMO[-1])
-    )
-    return func_M_DM(r) / r**2.0
+    return _interp_mass(r, rf, M_DMO) / r**2.0, rf / r, info
+
+
+def _interp_mass(x, r, M):
+    """Linearly interpolate the enclosed mass M(r) at x, constant outside of the range of r (which need not be sorted)"""
+    if numpy.any(numpy.diff(r) < 0.0):
+        sindx = numpy.argsort(r)
+        r, M = r[sindx], M[sindx]
+    return numpy.interp(x, r, M)
@@ -8,13 +8,14 @@ from scipy import integrate, special
 
 from ..util import conversion
 from ..util._optional_deps import _APY_LOADED
+from .DiskQuadratureTableMixin import DiskQuadratureTableMixin
 from .Potential import Potential, check_potential_inputs_not_arrays
 
 if _APY_LOADED:
     from astropy import units
 
 
-class AnyAxisymmetricRazorThinDiskPotential(Potential):
+class AnyAxisymmetricRazorThinDiskPotential(Potential, DiskQuadratureTableMixin):
     """Class that implements the potential of an arbitrary axisymmetric, razor-thin disk with surface density :math:`\\Sigma(R)`"""
 
     def __init__(
@@ -89,9 +90,42 @@ class AnyAxisymmetricRazorThinDiskPotential(Potential):
             isinstance(normalize, (int, float)) and not isinstance(normalize, bool)
         ):  # pragma: no cover
             self.normalize(normalize)
+        # The C implementation uses a table of the surface density, set up
+        # when first needed; no C second derivatives, because their
+        # integrands are not integrable across a = R
+        self.hasC = True
+        self.hasC_dxdv = False
+        self._c_tables = None
+        # Optional table of the potential, see turn_quadrature_table_on
+        self._qtable = None
+
+    def _tables_for_c(self):
+        """Tabulate the surface density in ln(a) and set up the
+        double-exponential quadrature nodes used by the C implementation"""
+        if self._c_tables is None:
+            lnagrid = numpy.linspace(numpy.log(1e-4), numpy.log(1e4), 2001)
+            sgrid = numpy.array([self._sdens(a) for a in numpy.exp(lnagrid)])
+            # tanh-sinh nodes on [0,1] and exp-sinh nodes on [0,infinity)
+            h = 1.0 / 16.0
+            t = numpy.arange(-int(3.3 / h), int(3.3 / h) + 1) * h
+            sinht = 0.5 * numpy.pi * numpy.sinh(t)
+            xde = 0.5 * (1.0 + numpy.tanh(sinht))
+            wde = 0.25 * numpy.pi * h * numpy.cosh(t) / numpy.cosh(sinht) ** 2.0
+            xdeinf = numpy.exp(sinht)
+            wdeinf = 0.5 * numpy.pi * h * numpy.cosh(t) * xdeinf
+            self._c_tables = {
+                "lnagrid": lnagrid,
+                "sgrid": sgrid,
+                "nodes": (xde, wde, xdeinf, wdeinf),
+            }
+        return self._c_tables
 
     @check_potential_inputs_not_arrays
     def _evaluate(self, R, z, phi=0.0, t=0.0):
+        if self._qtable is not None:
+            out = self._qtable_eval(R, z)
+            if out is not None:
+                return out[0]
         if R == 0 and z == 0:
             return self._pot_zero
         elif numpy.isinf(R**2 + z**2):
@@ -109,6 +143,10 @@ class AnyAxisymmetricRazorThinDiskPotential(Potential):
 
     @check_potential_inputs_not_arrays
     def _Rforce(self, R, z, phi=0.0, t=0.0):
+        if self._qtable is not None:
+            out = self._qtable_eval(R, z)
+            if out is not None:
+                return out[1]
         R2 = R**2
         z2 = z**2
 
@@ -135,6 +173,10 @@ class AnyAxisymmetricRazorThinDiskPotential(Potential):
 
     @check_potential_inputs_not_arrays
     def _zforce(self, R, z, phi=0.0, t=0.0):
+        if self._qtable is not None:
+            out = self._qtable_eval(R, z)
+            if out is not None:
+                return out[2]
         if z == 0:
             return 0.0
         z2 = z**2
@@ -263,3 +305,32 @@ class AnyAxisymmetricRazorThinDiskPotential(Potential):
 
     def _surfdens(self, R, z, phi=0.0, t=0.0):
         return self._sdens(R)
+
+    def _qtable_scales(self):
+        # Disk scale: half of the mass-weighted mean radius, the scale length
+        # of an exponential disk; the table is logarithmic down to a much
+        # smaller scale, to resolve the logarithmic terms in the potential
+        # of a razor-thin disk near the center
+        Rd = (
+            0.5
+            * integrate.quad(lambda a: a**2.0 * self._sdens(a), 0, numpy.inf)[0]
+            / integrate.quad(lambda a: a * self._sdens(a), 0, numpy.inf)[0]
+        )
+        return (0.01 * Rd, 0.01 * Rd, Rd)
+
+    def _qtable_moment(self, a, b):
+        if b > 0:
+            return 0.0
+        out = integrate.quad(
+            lambda R: R ** (2.0 * a + 1.0) * self._sdens(R), 0, numpy.inf, full_output=1
+        )
+        # A fourth output is a message that the integral did not converge
+        return 2.0 * numpy.pi * out[0] if len(out) == 3 else numpy.nan
+
+    def _qtable_quadrature(self, R, z):
+        out = DiskQuadratureTableMixin._qtable_quadrature(self, R, z)
+        # Vertical force just above the disk, used to clamp the table at z = 0
+        out[2, z == 0.0] = (
+            -2.0 * numpy.pi * numpy.array([self._sdens(a) for a in R[z == 0.0]])
+        )
+        return out
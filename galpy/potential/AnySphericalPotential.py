@@ -6,6 +6,7 @@ from scipy import integrate
 
 from ..util import conversion
 from ..util._optional_deps import _APY_LOADED
+from .interpSphericalPotential import interpSphericalPotential
 from .SphericalPotential import SphericalPotential
 
 if _APY_LOADED:
@@ -106,6 +107,11 @@ class AnySphericalPotential(SphericalPotential):
             )[-1]
         )
         self._pot_inf = 0.0 if not _infmass else numpy.inf
+        # The C implementation interpolates the force, which requires a finite
+        # potential everywhere; the interpolation is set up when first needed
+        self.hasC = numpy.isfinite(self._pot_zero) and self._pot_inf == 0.0
+        self.hasC_dxdv = self.hasC
+        self._interp_for_c = None
         # Normalize?
         if normalize or (
             isinstance(normalize, (int, float)) and not isinstance(normalize, bool)
@@ -113,6 +119,19 @@ class AnySphericalPotential(SphericalPotential):
             self.normalize(normalize)
         return None
 
+    def _interpolated_for_c(self):
+        """interpSphericalPotential of the unit-amplitude potential on a fine
+        radial grid, used by the C implementation"""
+        if self._interp_for_c is None:
+            rgrid = numpy.concatenate(([0.0], numpy.geomspace(1e-6, 1e4, 1001)))
+            # Force at r=0 from its limit
+            self._interp_for_c = interpSphericalPotential(
+                rforce=lambda r: self._rforce(r if r > 0.0 else 1e-3 * rgrid[1]),
+                rgrid=rgrid,
+                Phi0=self._pot_zero,
+            )
+        return self._interp_for_c
+
     def _revaluate(self, r, t=0.0):
         """Potential as a function of r and time"""
         if r == 0:
@@ -3,18 +3,22 @@
 #                                        Chandrasekhar dynamical friction
 ###############################################################################
 import copy
-import hashlib
+from collections import OrderedDict
 
 import numpy
-from scipy import interpolate, special
+from scipy import integrate, interpolate, special
 
 from ..util import conversion
 from .DissipativeForce import DissipativeForce
-from .Potential import _check_c, evaluateDensities
+from .Potential import _cache_params_key, _check_c, evaluateDensities, evaluaterforces
 from .Potential import flatten as flatten_pot
 
 _INVSQRTTWO = 1.0 / numpy.sqrt(2.0)
 _INVSQRTPI = 1.0 / numpy.sqrt(numpy.pi)
+# sigma_r tables of the most recently used densities, keyed on the density's
+# parameters and the radii, shared by all instances
+_SIGMAR_TABLES = OrderedDict()
+_SIGMAR_TABLES_MAXSIZE = 16
 
 
 class ChandrasekharDynamicalFrictionForce(DissipativeForce):
@@ -85,6 +89,7 @@ class ChandrasekharDynamicalFrictionForce(DissipativeForce):
         - 2011-12-26 - Started - Bovy (NYU)
         - 2018-03-18 - Re-started: updated to r dependent Lambda form and integrated into galpy framework - Bovy (UofT)
         - 2018-07-23 - Calculate sigmar from the Jeans equation and interpolate it; allow GMs and rhm to be set on the fly - Bovy (UofT)
+        - 2026-10-19 - Compute the Jeans sigmar for all radii at once and share it between instances with the same density - Agent (local)
 
         References
         ----------
@@ -123,9 +128,22 @@ class ChandrasekharDynamicalFrictionForce(DissipativeForce):
                 self._dens_pot, x, beta=0.0, use_physical=False
             )
         self._sigmar_rs_4interp = numpy.linspace(self._minr, self._maxr, nr)
-        self._sigmars_4interp = numpy.array(
-            [sigmar(x) for x in self._sigmar_rs_4interp]
-        )
+        self._sigmars_4interp = None
+        if (
+            self._sigmar_kwarg is None
+            and self._dens_kwarg is not None
+            and self._minr > 0.0
+        ):
+            try:
+                self._sigmars_4interp = _jeans_sigmar_table(
+                    self._dens_pot, self._sigmar_rs_4interp
+                )
+            except (TypeError, ValueError):  # for densities without array support
+                pass
+        if self._sigmars_4interp is None:
+            self._sigmars_4interp = numpy.array(
+                [sigmar(x) for x in self._sigmar_rs_4interp]
+            )
         if numpy.any(numpy.isnan(self._sigmars_4interp)):
             # Check for case where density is zero, in that case, just
             # paint in the nearest neighbor for the interpolation
@@ -155,7 +173,6 @@ class ChandrasekharDynamicalFrictionForce(DissipativeForce):
         else:
             self._lnLambda = False
         self._amp *= 4.0 * numpy.pi
-        self._force_hash = None
         self.hasC = _check_c(self._dens_pot, dens=True)
         return None
 
@@ -163,16 +180,12 @@ class ChandrasekharDynamicalFrictionForce(DissipativeForce):
         gms = conversion.parse_mass(gms, ro=self._ro, vo=self._vo)
         self._amp *= gms / self._ms
         self._ms = gms
-        # Reset the hash
-        self._force_hash = None
         return None
 
     GMs = property(None, GMs)
 
     def rhm(self, new_rhm):
         self._rhm = conversion.parse_length(new_rhm, ro=self._ro)
-        # Reset the hash
-        self._force_hash = None
         return None
 
     rhm = property(None, rhm)
@@ -210,45 +223,32 @@ class ChandrasekharDynamicalFrictionForce(DissipativeForce):
         return lnLambda
 
     def _calc_force(self, R, phi, z, v, t):
+        """Compute the magnitude of the force divided by the velocity"""
         r = numpy.sqrt(R**2.0 + z**2.0)
         if r < self._minr:
-            self._cached_force = 0.0
+            return 0.0
+        vs = numpy.sqrt(v[0] ** 2.0 + v[1] ** 2.0 + v[2] ** 2.0)
+        if r > self._maxr:
+            sr = self.sigmar_orig(r)
         else:
-            vs = numpy.sqrt(v[0] ** 2.0 + v[1] ** 2.0 + v[2] ** 2.0)
-            if r > self._maxr:
-                sr = self.sigmar_orig(r)
-            else:
-                sr = self.sigmar(r)
-            X = vs * _INVSQRTTWO / sr
-            Xfactor = special.erf(X) - 2.0 * X * _INVSQRTPI * numpy.exp(-(X**2.0))
-            lnLambda = self.lnLambda(r, vs)
-            self._cached_force = (
-                -self._dens(R, z, phi=phi, t=t) / vs**3.0 * Xfactor * lnLambda
-            )
+            sr = self.sigmar(r)
+        X = vs * _INVSQRTTWO / sr
+        Xfactor = special.erf(X) - 2.0 * X * _INVSQRTPI * numpy.exp(-(X**2.0))
+        lnLambda = self.lnLambda(r, vs)
+        return -self._dens(R, z, phi=phi, t=t) / vs**3.0 * Xfactor * lnLambda
+
+    def _forces(self, R, z, phi=0.0, t=0.0, v=None):
+        force = self._calc_force(R, phi, z, v, t)
+        return force * v[0], force * v[2], force * v[1] * R
 
     def _Rforce(self, R, z, phi=0.0, t=0.0, v=None):
-        new_hash = hashlib.md5(
-            numpy.array([R, phi, z, v[0], v[1], v[2], t])
-        ).hexdigest()
-        if new_hash != self._force_hash:
-            self._calc_force(R, phi, z, v, t)
-        return self._cached_force * v[0]
+        return self._forces(R, z, phi=phi, t=t, v=v)[0]
 
     def _phitorque(self, R, z, phi=0.0, t=0.0, v=None):
-        new_hash = hashlib.md5(
-            numpy.array([R, phi, z, v[0], v[1], v[2], t])
-        ).hexdigest()
-        if new_hash != self._force_hash:
-            self._calc_force(R, phi, z, v, t)
-        return self._cached_force * v[1] * R
+        return self._forces(R, z, phi=phi, t=t, v=v)[2]
 
     def _zforce(self, R, z, phi=0.0, t=0.0, v=None):
-        new_hash = hashlib.md5(
-            numpy.array([R, phi, z, v[0], v[1], v[2], t])
-        ).hexdigest()
-        if new_hash != self._force_hash:
-            self._calc_force(R, phi, z, v, t)
-        return self._cached_force * v[2]
+        return self._forces(R, z, phi=phi, t=t, v=v)[1]
 
     # Pickling functions
     def __getstate__(self):
@@ -278,3 +278,90 @@ class ChandrasekharDynamicalFrictionForce(DissipativeForce):
                 self._dens_pot, x, beta=0.0, use_physical=False
             )
         return None
+
+
+def _jeans_sigmar_table(dens_pot, rs, rtol=1e-8, nmax=256):
+    """Isotropic spherical-Jeans sigma_r (as in galpy.df.jeans.sigmar) at the increasing radii rs, computed for all radii at once by integrating rho x -F_r between consecutive radii with Gauss-Legendre quadrature in ln r (doubling the number of nodes of the intervals that have not converged to rtol) and summing these from the outside in; tables are cached for the most recently used densities"""
+    key = (
+        tuple(
+            (type(p), _cache_params_key(p))
+            for p in (dens_pot if isinstance(dens_pot, list) else [dens_pot])
+        ),
+        rs.tobytes(),
+    )
+    if key in _SIGMAR_TABLES:
+        _SIGMAR_TABLES.move_to_end(key)
+        return _SIGMAR_TABLES[key].copy()
+
+    def integrand(r):
+        return -evaluateDensities(
+            dens_pot,
+            r * _INVSQRTTWO,
+            r * _INVSQRTTWO,
+            phi=numpy.pi / 4.0,
+            use_physical=False,
+        ) * evaluaterforces(
+            dens_pot,
+            r * _INVSQRTTWO,
+            r * _INVSQRTTWO,
+            phi=numpy.pi / 4.0,
+            use_physical=False,
+        )
+
+    lnrs = numpy.log(rs)
+
+    def interval_integrals(n, indx):
+        nodes, weights = numpy.polynomial.legendre.leggauss(n)
+        lnr0 = lnrs[:-1][indx, None]
+        dlnr = numpy.diff(lnrs)[indx, None]
+        x = numpy.exp(lnr0 + 0.5 * (nodes + 1.0) * dlnr)
+        return numpy.sum(0.5 * dlnr * weights * x * integrand(x), axis=1)
+
+    # Integral beyond the last radius (with a purely relative tolerance,
+    # because the integrand is tiny there)
+    tail = integrate.quad(
+        integrand, rs[-1], numpy.inf, epsabs=0.0, epsrel=rtol, limit=200
+    )[0]
+
+    def cumulative(intervals):
+        """Integral from each radius outwards"""
+        return tail + numpy.concatenate((numpy.cumsum(intervals[::-1])[::-1], [0.0]))
+
+    # Only refine the intervals that have not converged yet
+    unconverged = numpy.ones(len(rs) - 1, dtype="bool")
+    n = 8
+    intervals = interval_integrals(n, unconverged)
+    while n < nmax:
+        n *= 2
+        new_intervals = intervals.copy()
+        new_intervals[unconverged] = interval_integrals(n, unconverged)
+        # Converged when the change is small compared to the integral from
+        # the start of the interval outwards
+        unconverged = numpy.fabs(new_intervals - intervals) > rtol * numpy.fabs(
+            cumulative(new_intervals)[:-1]
+        )
+        intervals = new_intervals
+        if not numpy.any(unconverged):
+            break
+    else:
+        # Use adaptive integration for the intervals that did not converge
+        for ii in numpy.arange(len(intervals))[unconverged]:
+            intervals[ii] = integrate.quad(
+                integrand, rs[ii], rs[ii + 1], epsabs=0.0, epsrel=rtol, limit=200
+            )[0]
+    cumul = cumulative(intervals)
+    with numpy.errstate(invalid="ignore", divide="ignore"):
+        out = numpy.sqrt(
+            cumul
+            / evaluateDensities(
+                dens_pot,
+                rs * _INVSQRTTWO,
+                rs * _INVSQRTTWO,
+                phi=numpy.pi / 4.0,
+                use_physical=False,
+            )
+        )
+    _SIGMAR_TABLES[key] = out
+    if len(_SIGMAR_TABLES) > _SIGMAR_TABLES_MAXSIZE:
+        _SIGMAR_TABLES.popitem(last=False)
+    return out.copy()
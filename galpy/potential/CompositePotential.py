@@ -0,0 +1,120 @@
+###############################################################################
+#   CompositePotential.py: class that fuses a list of potentials into a
+#                          single potential
+###############################################################################
+from .DissipativeForce import _isDissipative
+from .Potential import (
+    Potential,
+    _check_c,
+    _evaluateforces,
+    _isNonAxi,
+    _raw_method,
+    flatten,
+)
+
+
+class CompositePotential(Potential):
+    """Class that fuses a list of potentials into a single Potential instance, such that evaluating the potential, its forces, density, or second derivatives is a single call rather than a loop over a list of potentials with the list handling and input parsing that this involves"""
+
+    def __init__(self, pots, ro=None, vo=None):
+        """
+        Initialize a CompositePotential.
+
+        Parameters
+        ----------
+        pots : Potential instance or list of Potential instances
+            (Possibly nested) list of potentials to combine.
+        ro : float or Quantity, optional
+            Distance scale for translation into internal units (default from configuration file).
+        vo : float or Quantity, optional
+            Velocity scale for translation into internal units (default from configuration file).
+
+        Notes
+        -----
+        - 2026-10-19 - Written - Agent (local)
+        """
+        Potential.__init__(self, amp=1.0, ro=ro, vo=vo)
+        pots = flatten(pots)
+        if not isinstance(pots, list):
+            pots = [pots]
+        if _isDissipative(pots):
+            raise NotImplementedError(
+                "CompositePotential for dissipative forces is not currently supported"
+            )
+        self._pots = pots
+        self.isNonAxi = _isNonAxi(pots)
+        self.hasC = _check_c(pots)
+        self.hasC_dxdv = _check_c(pots, dxdv=True)
+        self.hasC_dens = _check_c(pots, dens=True)
+        return None
+
+    def _evaluate(self, R, z, phi=0.0, t=0.0):
+        out = 0.0
+        for pot in self._pots:
+            out += pot._call_nodecorator(R, z, phi=phi, t=t)
+        return out
+
+    def _Rforce(self, R, z, phi=0.0, t=0.0):
+        out = 0.0
+        for pot in self._pots:
+            out += pot._Rforce_nodecorator(R, z, phi=phi, t=t)
+        return out
+
+    def _zforce(self, R, z, phi=0.0, t=0.0):
+        out = 0.0
+        for pot in self._pots:
+            out += pot._zforce_nodecorator(R, z, phi=phi, t=t)
+        return out
+
+    def _phitorque(self, R, z, phi=0.0, t=0.0):
+        out = 0.0
+        for pot in self._pots:
+            out += pot._phitorque_nodecorator(R, z, phi=phi, t=t)
+        return out
+
+    def _forces(self, R, z, phi=0.0, t=0.0):
+        return _evaluateforces(self._pots, R, z, phi=phi, t=t)
+
+    def _sum_raw(self, name, R, z, phi, t):
+        out = 0.0
+        for pot in self._pots:
+            out += _raw_method(pot, name)(pot, R, z, phi=phi, t=t)
+        return out
+
+    def _dens(self, R, z, phi=0.0, t=0.0):
+        return self._sum_raw("dens", R, z, phi, t)
+
+    def _R2deriv(self, R, z, phi=0.0, t=0.0):
+        return self._sum_raw("R2deriv", R, z, phi, t)
+
+    def _z2deriv(self, R, z, phi=0.0, t=0.0):
+        return self._sum_raw("z2deriv", R, z, phi, t)
+
+    def _Rzderiv(self, R, z, phi=0.0, t=0.0):
+        return self._sum_raw("Rzderiv", R, z, phi, t)
+
+    def _phi2deriv(self, R, z, phi=0.0, t=0.0):
+        return self._sum_raw("phi2deriv", R, z, phi, t)
+
+    def _Rphideriv(self, R, z, phi=0.0, t=0.0):
+        return self._sum_raw("Rphideriv", R, z, phi, t)
+
+    def _phizderiv(self, R, z, phi=0.0, t=0.0):
+        return self._sum_raw("phizderiv", R, z, phi, t)
+
+
+def _expand_composite(pot):
+    """Replace CompositePotential instances in a list of potentials with their (scaled) components, for parsing potentials for C"""
+    if not isinstance(pot, list):
+        pot = [pot]
+    out = []
+    for p in pot:
+        if isinstance(p, CompositePotential):
+            out.extend(
+                _expand_composite(
+                    p._pots if p._amp == 1.0 else [q * p._amp for q in p._pots]
+                )
+            )
+        else:
+            out.append(p)
+    return out
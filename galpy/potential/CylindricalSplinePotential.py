@@ -0,0 +1,419 @@
+###############################################################################
+#   CylindricalSplinePotential.py: potential interpolated on an (R,z) grid
+#                                  with a Fourier expansion in phi
+###############################################################################
+import numpy
+
+from ..util import conversion
+from ..util.conversion import get_physical, physical_compatible
+from .DehnenBarPotential import DehnenBarPotential
+from .PlummerPotential import PlummerPotential
+from .Potential import (
+    Potential,
+    PotentialError,
+    evaluatePotentials,
+    evaluateRforces,
+    evaluatezforces,
+)
+
+
+class CylindricalSplinePotential(Potential):
+    """Class that implements a potential that is interpolated on a grid in cylindrical :math:`(R,z)` with a Fourier expansion in azimuth
+
+    .. math::
+
+        \\Phi(R,z,\\phi,t) = \\sum_{m=0}^{M} \\left[\\Phi_m^c(R,z)\\,\\cos(m\\phi')+\\Phi_m^s(R,z)\\,\\sin(m\\phi')\\right]\\,,\\quad \\phi' = \\phi-\\Omega_b\\,t\\,,
+
+    where each azimuthal harmonic :math:`\\Phi_m^{c,s}(R,z)` is interpolated with bicubic Hermite splines that match the values and the first derivatives of the harmonic computed from the potential to be interpolated at the grid points, such that the forces are the exact derivatives of the interpolated potential. The potential can rotate with a pattern speed :math:`\\Omega_b`. Inside the smallest grid radius, the potential is held constant in :math:`R`; outside of the grid, each harmonic is extrapolated along rays from the origin as a sum of :math:`r^{-m-1}` and :math:`r^{-m-2}` terms that matches its value and radial derivative at the edge of the grid, such that the forces are continuous across the edge."""
+
+    def __init__(
+        self,
+        amp=1.0,
+        pot=None,
+        pos=None,
+        mass=1.0,
+        L=6,
+        Rgrid=numpy.linspace(0.0, 3.0, 61),
+        zgrid=numpy.linspace(0.0, 1.0, 41),
+        zsym=True,
+        M=4,
+        nphi=None,
+        omegab=0.0,
+        normalize=False,
+        ro=None,
+        vo=None,
+    ):
+        """
+        Initialize a CylindricalSplinePotential from a potential or from a set of particles
+
+        Parameters
+        ----------
+        amp : float, optional
+            Amplitude to be applied to the potential (default: 1).
+        pot : Potential instance or list thereof, optional
+            Potential to interpolate, evaluated at t=0; default: a PlummerPotential with a DehnenBarPotential bar if pos is also None.
+        pos : numpy.ndarray, optional
+            Positions of particles in rectangular coordinates with shape [3,n] in internal units; used instead of pot, in which case the potential of the particles is first computed as a MultipolePotential up to degree L.
+        mass : float or numpy.ndarray, optional
+            Mass of the particles (scalar or array with size n) in internal units (default: 1).
+        L : int, optional
+            Maximum degree of the MultipolePotential of the particles (default: 6).
+        Rgrid : numpy.ndarray, optional
+            Increasing, non-negative grid in R in internal units (default: numpy.linspace(0.,3.,61)).
+        zgrid : numpy.ndarray, optional
+            Increasing grid in z in internal units that contains z=0; starts at z=0 when zsym=True (default: numpy.linspace(0.,1.,41)).
+        zsym : bool, optional
+            If True, the potential is assumed to be symmetric in z (default: True).
+        M : int, optional
+            Maximum azimuthal order m of the Fourier expansion (default: 4; 0 for an axisymmetric potential).
+        nphi : int, optional
+            Number of azimuths at which to evaluate the potential for the Fourier expansion (default: 4(M+1)).
+        omegab : float or Quantity, optional
+            Pattern speed with which the potential rotates (default: 0).
+        normalize : bool or float, optional
+            If True, normalize such that vc(1.,0.)=1., or, if given as a number, such that the force is this fraction of the force necessary to make vc(1.,0.)=1.
+        ro : float or Quantity, optional
+            Distance scale for translation into internal units (default from configuration file).
+        vo : float or Quantity, optional
+            Velocity scale for translation into internal units (default from configuration file).
+
+        Notes
+        -----
+        - 2026-10-19 - Written - Agent (local)
+        """
+        Potential.__init__(self, amp=amp, ro=ro, vo=vo)
+        if pot is None and pos is None:
+            pot = [
+                PlummerPotential(amp=1.0, b=0.8),
+                DehnenBarPotential(),
+            ]
+        if pos is not None:
+            from .MultipolePotential import MultipolePotential
+
+            pot = MultipolePotential(
+                pos=pos,
+                mass=mass,
+                L=L,
+                rgrid=numpy.geomspace(
+                    1e-3 * numpy.amax(Rgrid), 1e3 * numpy.amax(Rgrid), 121
+                ),
+            )
+        if not physical_compatible(self, pot):
+            raise RuntimeError(
+                "Unit conversion factors ro and vo incompatible between Potential to be interpolated and the factors given to CylindricalSplinePotential"
+            )
+        # If set for the potential, set for the interpolation
+        phys = get_physical(pot, include_set=True)
+        if phys["roSet"]:
+            self.turn_physical_on(ro=phys["ro"])
+        if phys["voSet"]:
+            self.turn_physical_on(vo=phys["vo"])
+        Rgrid = numpy.array(Rgrid, dtype=float)
+        zgrid = numpy.array(zgrid, dtype=float)
+        if (
+            Rgrid[0] < 0.0
+            or numpy.any(numpy.diff(Rgrid) <= 0.0)
+            or numpy.any(numpy.diff(zgrid) <= 0.0)
+        ):
+            raise ValueError(
+                "Rgrid must be non-negative and Rgrid and zgrid must be strictly increasing"
+            )
+        if (zsym and zgrid[0] != 0.0) or (
+            not zsym and (zgrid[0] >= 0.0 or zgrid[-1] <= 0.0)
+        ):
+            raise ValueError(
+                "zgrid must start at zero when zsym=True and contain zero otherwise"
+            )
+        self._Rgrid = Rgrid
+        self._zgrid = zgrid
+        self._zsym = zsym
+        self._M = M
+        self._ms = numpy.concatenate((numpy.arange(M + 1), numpy.arange(1, M + 1)))
+        self._sins = numpy.arange(2 * M + 1) > M
+        self._omegab = conversion.parse_frequency(omegab, ro=self._ro, vo=self._vo)
+        self.isNonAxi = M > 0
+        self._grid = _grid_harmonics(
+            pot, Rgrid, zgrid, M, 4 * (M + 1) if nphi is None else nphi
+        )
+        self.hasC = True
+        self.hasC_dxdv = True
+        self.hasC_dens = True
+        if normalize or (
+            isinstance(normalize, (int, float)) and not isinstance(normalize, bool)
+        ):
+            self.normalize(normalize)
+        return None
+
+    def OmegaP(self):
+        """
+        Return the pattern speed.
+
+        Returns
+        -------
+        float
+            The pattern speed of the potential.
+
+        Notes
+        -----
+        - 2026-10-19 - Written - Agent (local)
+        """
+        return self._omegab
+
+    def _harmonics(self, R, z):
+        """Evaluate the azimuthal harmonics and their derivatives wrt R and z, [n,nharm] arrays"""
+        Rg, zg = self._Rgrid, self._zgrid
+        zsign = numpy.where(z < 0.0, -1.0, 1.0) if self._zsym else numpy.ones_like(z)
+        z = numpy.fabs(z) if self._zsym else z
+        inner = R < Rg[0]
+        R = numpy.where(inner, Rg[0], R)
+        # Scale factor to the edge of the grid along the ray from the origin
+        with numpy.errstate(divide="ignore"):
+            sR = numpy.where(R > Rg[-1], Rg[-1] / R, numpy.inf)
+            sz = numpy.where(
+                z > zg[-1],
+                zg[-1] / z,
+                numpy.where(
+                    z < zg[0], zg[0] / numpy.where(z < 0.0, z, -1.0), numpy.inf
+                ),
+            )
+        outside = numpy.isfinite(sR) + numpy.isfinite(sz)
+        Rbound = sR <= sz
+        s = numpy.where(outside, numpy.minimum(sR, sz), 1.0)
+        # Point at the edge of the grid along the ray, exactly on the edge
+        with numpy.errstate(invalid="ignore"):
+            Re = numpy.where(outside * Rbound, Rg[-1], s * R)
+            ze = numpy.where(
+                outside * ~Rbound, numpy.where(z > 0.0, zg[-1], zg[0]), s * z
+            )
+        F, FR, Fz, FRR, FRz, Fzz, FRRR, FRRz, FRzz, Fzzz = _bicubic_hermite(
+            self._grid,
+            Rg,
+            zg,
+            numpy.clip(Re, Rg[0], Rg[-1]),
+            numpy.clip(ze, zg[0], zg[-1]),
+        )
+        if numpy.any(outside):
+            # Along the ray, G = P s^a + Q s^(a+1) with P and Q set by the value
+            # and the radial derivative at the edge; in coordinates (u,v) with
+            # the edge at u=b and w=s v along the edge
+            o = outside
+            Rb = Rbound[o, None]
+            so = s[o, None]
+            b = numpy.where(Rb, Re[o, None], ze[o, None])
+            w = numpy.where(Rb, ze[o, None], Re[o, None])
+            a = self._ms[None, :] + 1.0
+            Fn = numpy.where(Rb, FR[o], Fz[o])
+            Fv = numpy.where(Rb, Fz[o], FR[o])
+            Fvv = numpy.where(Rb, Fzz[o], FRR[o])
+            Fnvv = numpy.where(Rb, FRzz[o], FRRz[o])
+            Fvvv = numpy.where(Rb, Fzzz[o], FRRR[o])
+            D = b * Fn + w * Fv
+            D1 = b * FRz[o] + Fv + w * Fvv
+            D2 = b * Fnvv + 2.0 * Fvv + w * Fvvv
+            P, P1, P2 = (a + 1.0) * F[o] + D, (a + 1.0) * Fv + D1, (a + 1.0) * Fvv + D2
+            Q, Q1, Q2 = -D - a * F[o], -D1 - a * Fv, -D2 - a * Fvv
+            H1, H1p = w * P1 + a * P, w * P2 + (a + 1.0) * P1
+            H2, H2p = w * Q1 + (a + 1.0) * Q, w * Q2 + (a + 2.0) * Q1
+            G = P * so**a + Q * so ** (a + 1.0)
+            Gv = P1 * so ** (a + 1.0) + Q1 * so ** (a + 2.0)
+            Gvv = P2 * so ** (a + 2.0) + Q2 * so ** (a + 3.0)
+            Gu = -(H1 * so ** (a + 1.0) + H2 * so ** (a + 2.0)) / b
+            Guv = -(H1p * so ** (a + 2.0) + H2p * so ** (a + 3.0)) / b
+            Guu = (
+                (w * H1p + (a + 1.0) * H1) * so ** (a + 2.0)
+                + (w * H2p + (a + 2.0) * H2) * so ** (a + 3.0)
+            ) / b**2.0
+            F[o] = G
+            FR[o] = numpy.where(Rb, Gu, Gv)
+            Fz[o] = numpy.where(Rb, Gv, Gu)
+            FRR[o] = numpy.where(Rb, Guu, Gvv)
+            Fzz[o] = numpy.where(Rb, Gvv, Guu)
+            FRz[o] = Guv
+        # Constant in R inside of the smallest grid radius
+        FR[inner] = 0.0
+        FRR[inner] = 0.0
+        FRz[inner] = 0.0
+        zsign = zsign[:, None]
+        return F, FR, zsign * Fz, FRR, zsign * FRz, Fzz
+
+    def _compute(self, R, z, phi, t, second=False):
+        """Compute the potential and its derivatives wrt R, z, and phi"""
+        R, z, phi, t = numpy.broadcast_arrays(
+            numpy.atleast_1d(R).astype(float),
+            numpy.atleast_1d(z).astype(float),
+            numpy.atleast_1d(0.0 if phi is None else phi).astype(float),
+            numpy.atleast_1d(t).astype(float),
+        )
+        shape = R.shape
+        R, z = R.flatten(), z.flatten()
+        mphi = self._ms[None, :] * (phi.flatten() - self._omegab * t.flatten())[:, None]
+        trig = numpy.where(self._sins, numpy.sin(mphi), numpy.cos(mphi))
+        dtrig = self._ms * numpy.where(self._sins, numpy.cos(mphi), -numpy.sin(mphi))
+        F, FR, Fz, FRR, FRz, Fzz = self._harmonics(R, z)
+        out = {
+            "shape": shape,
+            "R": R,
+            "Phi": numpy.sum(F * trig, axis=1),
+            "Phi_R": numpy.sum(FR * trig, axis=1),
+            "Phi_z": numpy.sum(Fz * trig, axis=1),
+            "Phi_p": numpy.sum(F * dtrig, axis=1),
+        }
+        if second:
+            out["Phi_RR"] = numpy.sum(FRR * trig, axis=1)
+            out["Phi_zz"] = numpy.sum(Fzz * trig, axis=1)
+            out["Phi_Rz"] = numpy.sum(FRz * trig, axis=1)
+            out["Phi_pp"] = -numpy.sum(self._ms**2.0 * F * trig, axis=1)
+            out["Phi_Rp"] = numpy.sum(FR * dtrig, axis=1)
+            out["Phi_zp"] = numpy.sum(Fz * dtrig, axis=1)
+        return out
+
+    def _evaluate(self, R, z, phi=0.0, t=0.0):
+        out = self._compute(R, z, phi, t)
+        return _reshape(out["Phi"], out["shape"])
+
+    def _Rforce(self, R, z, phi=0.0, t=0.0):
+        out = self._compute(R, z, phi, t)
+        return _reshape(-out["Phi_R"], out["shape"])
+
+    def _zforce(self, R, z, phi=0.0, t=0.0):
+        out = self._compute(R, z, phi, t)
+        return _reshape(-out["Phi_z"], out["shape"])
+
+    def _phitorque(self, R, z, phi=0.0, t=0.0):
+        out = self._compute(R, z, phi, t)
+        return _reshape(-out["Phi_p"], out["shape"])
+
+    def _dens(self, R, z, phi=0.0, t=0.0):
+        out = self._compute(R, z, phi, t, second=True)
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            lapl = (
+                out["Phi_RR"]
+                + out["Phi_zz"]
+                + numpy.where(
+                    out["R"] > 0.0,
+                    out["Phi_R"] / out["R"] + out["Phi_pp"] / out["R"] ** 2.0,
+                    out["Phi_RR"],
+                )
+            )
+        return _reshape(lapl / 4.0 / numpy.pi, out["shape"])
+
+    def _R2deriv(self, R, z, phi=0.0, t=0.0):
+        out = self._compute(R, z, phi, t, second=True)
+        return _reshape(out["Phi_RR"], out["shape"])
+
+    def _z2deriv(self, R, z, phi=0.0, t=0.0):
+        out = self._compute(R, z, phi, t, second=True)
+        return _reshape(out["Phi_zz"], out["shape"])
+
+    def _Rzderiv(self, R, z, phi=0.0, t=0.0):
+        out = self._compute(R, z, phi, t, second=True)
+        return _reshape(out["Phi_Rz"], out["shape"])
+
+    def _phi2deriv(self, R, z, phi=0.0, t=0.0):
+        out = self._compute(R, z, phi, t, second=True)
+        return _reshape(out["Phi_pp"], out["shape"])
+
+    def _Rphideriv(self, R, z, phi=0.0, t=0.0):
+        out = self._compute(R, z, phi, t, second=True)
+        return _reshape(out["Phi_Rp"], out["shape"])
+
+    def _phizderiv(self, R, z, phi=0.0, t=0.0):
+        out = self._compute(R, z, phi, t, second=True)
+        return _reshape(out["Phi_zp"], out["shape"])
+
+
+def _reshape(x, shape):
+    return x[0] if shape == (1,) else x.reshape(shape)
+
+
+def _grid_harmonics(pot, Rgrid, zgrid, M, nphi):
+    """Compute the azimuthal harmonics of the potential and of its R and z derivatives and their cross derivative on the grid, [4,nR,nz,nharm] array"""
+    phis = 2.0 * numpy.pi * numpy.arange(nphi) / nphi
+    # Avoid the coordinate singularity on the z axis
+    Rgrid = numpy.where(Rgrid == 0.0, 1e-8 * Rgrid[1], Rgrid)
+    R, z, phi = numpy.meshgrid(Rgrid, zgrid, phis, indexing="ij")
+    R, z, phi = R.flatten(), z.flatten(), phi.flatten()
+    out = []
+    for func, sign in [
+        (evaluatePotentials, 1.0),
+        (evaluateRforces, -1.0),
+        (evaluatezforces, -1.0),
+    ]:
+        try:
+            vals = func(pot, R, z, phi=phi, use_physical=False)
+        except (PotentialError, TypeError, ValueError):  # not vectorized
+            vals = numpy.vectorize(
+                lambda RR, zz, pp: func(pot, RR, zz, phi=pp, use_physical=False)
+            )(R, z, phi)
+        vals = sign * numpy.reshape(vals, (len(Rgrid), len(zgrid), nphi))
+        # Fourier coefficients of cos(m phi) and sin(m phi)
+        fft = numpy.fft.rfft(vals, axis=2)[:, :, : M + 1] / nphi
+        out.append(
+            numpy.concatenate(
+                (
+                    fft.real * numpy.where(numpy.arange(M + 1) > 0, 2.0, 1.0),
+                    -2.0 * fft.imag[:, :, 1:],
+                ),
+                axis=2,
+            )
+        )
+    F, FR, Fz = out
+    # Cross derivative from the gradients of the first derivatives
+    FRz = 0.5 * (
+        numpy.gradient(Fz, Rgrid, axis=0, edge_order=2)
+        + numpy.gradient(FR, zgrid, axis=1, edge_order=2)
+    )
+    return numpy.array([F, FR, Fz, FRz])
+
+
+def _bicubic_hermite(grid, Rgrid, zgrid, R, z):
+    """Evaluate the bicubic Hermite interpolation of the harmonics and its first, second, and third derivatives at (R,z) inside of the grid"""
+    i = numpy.clip(numpy.searchsorted(Rgrid, R, side="right") - 1, 0, len(Rgrid) - 2)
+    j = numpy.clip(numpy.searchsorted(zgrid, z, side="right") - 1, 0, len(zgrid) - 2)
+    hR = (Rgrid[i + 1] - Rgrid[i])[:, None]
+    hz = (zgrid[j + 1] - zgrid[j])[:, None]
+    u = (R - Rgrid[i])[:, None] / hR
+    v = (z - zgrid[j])[:, None] / hz
+    # Hermite basis functions [value,deriv] for the nodes at 0 and 1
+    bu, dbu, d2bu, d3bu = _hermite_basis(u, hR)
+    bv, dbv, d2bv, d3bv = _hermite_basis(v, hz)
+    out = [numpy.zeros((len(R), grid.shape[-1])) for ii in range(10)]
+    for a in range(2):
+        for b in range(2):
+            # Node values: f, f_R, f_z, f_Rz
+            nodes = grid[:, i + a, j + b]
+            for k, (ku, kv) in enumerate([(0, 0), (1, 0), (0, 1), (1, 1)]):
+                c = nodes[k]
+                out[0] += c * bu[a][ku] * bv[b][kv]
+                out[1] += c * dbu[a][ku] * bv[b][kv]
+                out[2] += c * bu[a][ku] * dbv[b][kv]
+                out[3] += c * d2bu[a][ku] * bv[b][kv]
+                out[4] += c * dbu[a][ku] * dbv[b][kv]
+                out[5] += c * bu[a][ku] * d2bv[b][kv]
+                out[6] += c * d3bu[a][ku] * bv[b][kv]
+                out[7] += c * d2bu[a][ku] * dbv[b][kv]
+                out[8] += c * dbu[a][ku] * d2bv[b][kv]
+                out[9] += c * bu[a][ku] * d3bv[b][kv]
+    return out
+
+
+def _hermite_basis(u, h):
+    """Cubic Hermite basis functions and their first, second, and third derivatives wrt x = x0 + u h, as [node][value/derivative] lists"""
+    b = [
+        [2.0 * u**3.0 - 3.0 * u**2.0 + 1.0, h * (u**3.0 - 2.0 * u**2.0 + u)],
+        [-2.0 * u**3.0 + 3.0 * u**2.0, h * (u**3.0 - u**2.0)],
+    ]
+    db = [
+        [(6.0 * u**2.0 - 6.0 * u) / h, 3.0 * u**2.0 - 4.0 * u + 1.0],
+        [(-6.0 * u**2.0 + 6.0 * u) / h, 3.0 * u**2.0 - 2.0 * u],
+    ]
+    d2b = [
+        [(12.0 * u - 6.0) / h**2.0, (6.0 * u - 4.0) / h],
+        [(-12.0 * u + 6.0) / h**2.0, (6.0 * u - 2.0) / h],
+    ]
+    one = numpy.ones_like(u)
+    d3b = [
+        [12.0 / h**3.0 * one, 6.0 / h**2.0 * one],
+        [-12.0 / h**3.0 * one, 6.0 / h**2.0 * one],
+    ]
+    return b, db, d2b, d3b
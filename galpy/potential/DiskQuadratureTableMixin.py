@@ -0,0 +1,332 @@
+###############################################################################
+#   DiskQuadratureTableMixin: helper class to replace the quadrature of
+#                             axisymmetric disk potentials by a table
+###############################################################################
+import warnings
+
+import numpy
+from numpy.polynomial import legendre
+
+from ..util import conversion, galpyWarning
+from ..util._disk_cache import disk_cache
+from .EllipsoidalPotential import _bspline_basis, _clamped_spline_coeffs
+
+
+class DiskQuadratureTableMixin:
+    """Mixin to add an optional precomputed table of the potential to an axisymmetric disk potential whose potential and forces are computed with quadrature (e.g., Hankel transforms). The table is a bicubic spline of the potential in the scaled coordinates :math:`u = \\mathrm{arcsinh}(R/R_s)` and :math:`v = \\mathrm{arcsinh}(|z|/z_s)`, beyond which a multipole expansion of the density is used. Classes using this Mixin set ``self._qtable= None`` at initialization, return the table in their ``_evaluate``, ``_Rforce``, and ``_zforce`` when it is turned on, and implement
+
+        * ``_qtable_scales(self)``: the scales (R_s,z_s) and the radial scale of the disk, which sets the default extent of the table;
+
+        * ``_qtable_moment(self,a,b)``: the moment of the density :math:`\\int \\mathrm{d}^3x\\,\\rho\\,R^{2a}\\,z^{2b}` (without the amplitude), NaN if it does not exist;
+
+    and may override ``_qtable_quadrature`` to change how the potential and forces at the nodes of the table are computed."""
+
+    def turn_quadrature_table_on(
+        self, Rmax=None, zmax=None, rtol=1e-5, maxiter=3, lmax=6
+    ):
+        """
+        Turn on a precomputed table of the potential, which replaces the quadrature for the potential and the forces by interpolation for R <= Rmax and abs(z) <= zmax and by a multipole expansion of the density beyond, both in Python and in C (second derivatives are still computed with quadrature).
+
+        Parameters
+        ----------
+        Rmax : float or Quantity, optional
+            Maximum cylindrical radius of the table (default: 40 times the radial scale of the disk).
+        zmax : float or Quantity, optional
+            Maximum height of the table (default: Rmax).
+        rtol : float, optional
+            Relative tolerance of the potential and forces; the table is refined until the interpolation error between the nodes is below this tolerance (default: 1e-5).
+        maxiter : int, optional
+            Maximum number of refinements of the table (default: 3).
+        lmax : int, optional
+            Maximum order of the multipole expansion beyond the table (default: 6); the multipole expansion is only used when its error at the edge of the table is below rtol, otherwise the quadrature is used beyond the table.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        - The table is regular in (arcsinh(R/R_s),arcsinh(|z|/z_s)), with scales R_s and z_s set by the disk, and the forces are the continuous derivatives of the interpolated potential.
+        - 2026-10-19 - Written - Agent (local)
+
+        """
+        if Rmax is None:
+            Rmax = 40.0 * self._qtable_scales()[2]
+        else:
+            Rmax = conversion.parse_length(Rmax, ro=self._ro)
+        if zmax is None:
+            zmax = Rmax
+        else:
+            zmax = conversion.parse_length(zmax, ro=self._ro)
+        self._qtable = None
+        self._qtable, err, err_mult = _disk_quadrature_table(
+            self, Rmax, zmax, rtol, maxiter, lmax
+        )
+        self._qtable_cache = (None, None)
+        if err >= rtol:
+            warnings.warn(
+                f"Quadrature table only reached a relative error of {err:.1e} > rtol = {rtol:.1e}; increase maxiter for a more accurate table, unless the error is limited by that of the quadrature itself",
+                galpyWarning,
+            )
+        if self._qtable["multipoles"] is None:
+            warnings.warn(
+                f"Multipole expansion has a relative error of {err_mult:.1e} > rtol = {rtol:.1e} at the edge of the quadrature table, using quadrature beyond the table; increase Rmax and zmax to use the multipole expansion",
+                galpyWarning,
+            )
+        return None
+
+    def turn_quadrature_table_off(self):
+        """
+        Turn off the precomputed table of the potential and go back to computing the potential and forces with quadrature.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        - 2026-10-19 - Written - Agent (local)
+
+        """
+        self._qtable = None
+        return None
+
+    def _qtable_quadrature(self, R, z):
+        """Potential and forces (without the amplitude) from the quadrature for arrays of (R,z>=0), [3,n] array"""
+        from ..orbit.integrateFullOrbit import _ext_loaded
+        from .Potential import evaluatePotentials, evaluateRforces, evaluatezforces
+
+        if _ext_loaded and self.hasC:
+            return (
+                numpy.array(
+                    [
+                        func(self, R, z, use_physical=False, backend="c")
+                        for func in (
+                            evaluatePotentials,
+                            evaluateRforces,
+                            evaluatezforces,
+                        )
+                    ]
+                )
+                / self._amp
+            )
+        return numpy.array(
+            [
+                numpy.vectorize(func, otypes=[float])(R, z)
+                for func in (self._evaluate, self._Rforce, self._zforce)
+            ]
+        )
+
+    def _qtable_multipoles(self, lmax):
+        """Multipole moments int rho r^l P_l(cos theta) of the density for l = 0, 2, ..., lmax, None if they do not all exist"""
+        out = []
+        for l in range(0, lmax + 1, 2):
+            # r^l P_l(z/r) as a polynomial in R^2 and z^2
+            Ml = 0.0
+            for j, pj in enumerate(legendre.leg2poly(numpy.eye(l + 1)[l])):
+                if j % 2 == 1 or pj == 0.0:
+                    continue
+                # z^j (R^2+z^2)^((l-j)/2)
+                n = (l - j) // 2
+                for k in range(n + 1):
+                    binom = numpy.prod(numpy.arange(n - k + 1, n + 1)) / numpy.prod(
+                        numpy.arange(1, k + 1)
+                    )
+                    Ml += pj * binom * self._qtable_moment(k, n - k + j // 2)
+            out.append(Ml)
+        out = numpy.array(out)
+        return out if numpy.all(numpy.isfinite(out)) else None
+
+    def _qtable_eval(self, R, z):
+        """Potential and forces (without the amplitude) from the quadrature table and the multipole expansion beyond it, None when not all points are covered"""
+        scalar = numpy.ndim(R) == 0 and numpy.ndim(z) == 0
+        if scalar and self._qtable_cache[0] == (R, z):
+            return self._qtable_cache[1]
+        R, z = numpy.broadcast_arrays(
+            numpy.asarray(R, dtype=float), numpy.asarray(z, dtype=float)
+        )
+        az = numpy.fabs(z)
+        intable = (R <= self._qtable["Rmax"]) * (az <= self._qtable["zmax"])
+        if self._qtable["multipoles"] is None and not numpy.all(intable):
+            return None
+        Phi, dPhidR, dPhidz = _qtable_derivs(self._qtable, R, az, intable)
+        out = (Phi, -dPhidR, -numpy.sign(z) * dPhidz)
+        if scalar:
+            out = tuple(float(o) for o in out)
+            self._qtable_cache = ((float(R), float(z)), out)
+        return out
+
+
+@disk_cache()
+def _disk_quadrature_table(pot, Rmax, zmax, rtol, maxiter, lmax):
+    """Build the quadrature table of a disk potential for R <= Rmax and |z| <= zmax, refining each axis until its interpolation error is below rtol, and set up the multipole expansion beyond it; returns the table, its error, and the error of the multipole expansion"""
+    Rs, zs, _ = pot._qtable_scales()
+    umax = numpy.arcsinh(Rmax / Rs)
+    vmax = numpy.arcsinh(zmax / zs)
+    # Start with nodes every 0.1 in (u,v), ~10% apart at large R and |z|
+    shape = [int(numpy.ceil(10.0 * umax)) + 1, int(numpy.ceil(10.0 * vmax)) + 1]
+    best = None
+    for ii in range(maxiter + 1):
+        grids = [
+            numpy.linspace(0.0, umax, shape[0]),
+            numpy.linspace(0.0, vmax, shape[1]),
+        ]
+        qtable = {
+            "scales": (Rs, zs),
+            "grids": grids,
+            "table": _qtable_build(pot, grids),
+            "Rmax": Rmax,
+            "zmax": zmax,
+            "multipoles": None,
+        }
+        errs = [_qtable_error(pot, qtable, axis) for axis in range(2)]
+        # Stop once the error no longer decreases, when it is dominated by
+        # the error of the quadrature itself, and keep the best table
+        if best is not None and max(errs) >= max(best[1]):
+            qtable, errs = best
+            break
+        best = (qtable, errs)
+        if max(errs) < rtol or ii == maxiter:
+            break
+        shape = [2 * n - 1 if err >= rtol else n for n, err in zip(shape, errs)]
+    grids, shape = qtable["grids"], [len(grid) for grid in qtable["grids"]]
+    # Multipole expansion, used beyond the table if accurate enough at its edge
+    multipoles = pot._qtable_multipoles(lmax)
+    if multipoles is None:
+        return qtable, max(errs), numpy.inf
+    R = numpy.concatenate((Rs * numpy.sinh(grids[0]), numpy.full(shape[1], Rmax)))
+    z = numpy.concatenate((numpy.full(shape[0], zmax), zs * numpy.sinh(grids[1])))
+    Phi, FR, Fz = pot._qtable_quadrature(R, z)
+    mPhi, mdPhidR, mdPhidz = _multipole_derivs(multipoles, R, z)
+    Fnorm = _force_norm(pot, R, z, Phi, FR, Fz)
+    err_mult = max(
+        numpy.amax(numpy.fabs(mPhi - Phi) / numpy.fabs(Phi)),
+        numpy.amax(numpy.fabs(mdPhidR + FR) / Fnorm),
+        numpy.amax(numpy.fabs(mdPhidz + Fz) / Fnorm),
+    )
+    if err_mult < rtol:
+        qtable["multipoles"] = multipoles
+    return qtable, max(errs), err_mult
+
+
+def _qtable_build(pot, grids):
+    """Compute the coefficients of the bicubic B-spline of the potential in (u,v), [nu+2,nv+2] array"""
+    Rs, zs, _ = pot._qtable_scales()
+    u, v = numpy.meshgrid(*grids, indexing="ij")
+    R = Rs * numpy.sinh(u)
+    z = zs * numpy.sinh(v)
+    Phi, FR, Fz = (
+        q.reshape(u.shape) for q in pot._qtable_quadrature(R.flatten(), z.flatten())
+    )
+    # Derivatives wrt (u,v); the potential is even in R, so Phiu = 0 at u = 0
+    Phiu = -FR * numpy.sqrt(Rs**2.0 + R**2.0)
+    Phiu[0] = 0.0
+    Phiv = -Fz * numpy.sqrt(zs**2.0 + z**2.0)
+    # Spline along v, clamped at the derivatives wrt v
+    coeffs = _clamped_spline_coeffs(Phi, Phiv[:, :1], Phiv[:, -1:], grids[1], 1)
+    # Spline along u of the coefficients, clamped at the coefficients of the
+    # derivative wrt u at the ends, themselves clamped at the mixed
+    # derivatives at the corners, from one-sided finite differences (zero at
+    # u = 0)
+    hu = grids[0][1] - grids[0][0]
+    Phiuv = (3.0 * Phiv[-1] - 4.0 * Phiv[-2] + Phiv[-3]) / 2.0 / hu
+    dcoeffsl = _clamped_spline_coeffs(
+        Phiu[:1], numpy.zeros((1, 1)), numpy.zeros((1, 1)), grids[1], 1
+    )
+    dcoeffsr = _clamped_spline_coeffs(
+        Phiu[-1:], Phiuv[None, :1], Phiuv[None, -1:], grids[1], 1
+    )
+    return _clamped_spline_coeffs(coeffs, dcoeffsl, dcoeffsr, grids[0], 0)
+
+
+def _force_norm(pot, R, z, Phi, FR, Fz):
+    """Force used to compute relative errors of the forces: the magnitude of the force plus the typical force |Phi|/(r+R_d), such that the errors are not relative to the vanishing force at the center"""
+    return numpy.sqrt(FR**2.0 + Fz**2.0) + numpy.fabs(Phi) / (
+        numpy.sqrt(R**2.0 + z**2.0) + pot._qtable_scales()[2]
+    )
+
+
+def _qtable_error(pot, qtable, axis):
+    """Maximum relative error of the table and of its force along one axis between the nodes along that axis, at the midpoints and the quarter points, where the errors of the potential and of its derivative peak"""
+    Rs, zs = qtable["scales"]
+    grids = qtable["grids"]
+    pts = list(grids)
+    pts[axis] = numpy.concatenate(
+        [(1.0 - f) * grids[axis][:-1] + f * grids[axis][1:] for f in [0.25, 0.5]]
+    )
+    u, v = (q.flatten() for q in numpy.meshgrid(*pts, indexing="ij"))
+    R = Rs * numpy.sinh(u)
+    z = zs * numpy.sinh(v)
+    Phi, FR, Fz = pot._qtable_quadrature(R, z)
+    approx = _qtable_derivs(qtable, R, z, numpy.ones(len(R), dtype=bool))
+    return max(
+        numpy.amax(numpy.fabs(approx[0] - Phi) / numpy.fabs(Phi)),
+        numpy.amax(
+            numpy.fabs(approx[axis + 1] + (FR, Fz)[axis])
+            / _force_norm(pot, R, z, Phi, FR, Fz)
+        ),
+    )
+
+
+def _qtable_derivs(qtable, R, z, intable):
+    """Potential and its derivatives wrt (R,z>=0) from the table where intable and from the multipole expansion elsewhere"""
+    Rs, zs = qtable["scales"]
+    grids, table = qtable["grids"], qtable["table"]
+    if numpy.ndim(R) == 0:
+        R, z = float(R), float(z)
+        if not intable:
+            return _multipole_derivs(qtable["multipoles"], R, z)
+        # Single point: contract the 4x4 block of coefficients directly
+        block, bases = [], []
+        for grid, c in zip(grids, [numpy.arcsinh(R / Rs), numpy.arcsinh(z / zs)]):
+            h = grid[1] - grid[0]
+            i = min(max(int(c // h), 0), len(grid) - 2)
+            block.append(slice(i, i + 4))
+            bases.append(numpy.array(_bspline_basis(c / h - i, h)))
+        out = numpy.einsum("ab,ia,jb->ij", table[tuple(block)], *bases)
+        return (
+            out[0, 0],
+            out[1, 0] / numpy.sqrt(Rs**2.0 + R**2.0),
+            out[0, 1] / numpy.sqrt(zs**2.0 + z**2.0),
+        )
+    Phi, dPhidR, dPhidz = (numpy.empty(R.shape) for ii in range(3))
+    if not numpy.all(intable):
+        Phi[~intable], dPhidR[~intable], dPhidz[~intable] = _multipole_derivs(
+            qtable["multipoles"], R[~intable], z[~intable]
+        )
+    Rin, zin = R[intable], z[intable]
+    idx, basis, dbasis = [], [], []
+    for grid, c in zip(grids, [numpy.arcsinh(Rin / Rs), numpy.arcsinh(zin / zs)]):
+        h = grid[1] - grid[0]
+        i = numpy.clip((c // h).astype(int), 0, len(grid) - 2)
+        b, db = _bspline_basis(c / h - i, h)
+        idx.append(i[:, None] + numpy.arange(4)[None, :])
+        basis.append(b)
+        dbasis.append(db)
+    coeffs = table[idx[0][:, :, None], idx[1][:, None, :]]
+    Phi[intable] = numpy.einsum("nab,an,bn->n", coeffs, basis[0], basis[1])
+    dPhidR[intable] = numpy.einsum(
+        "nab,an,bn->n", coeffs, dbasis[0], basis[1]
+    ) / numpy.sqrt(Rs**2.0 + Rin**2.0)
+    dPhidz[intable] = numpy.einsum(
+        "nab,an,bn->n", coeffs, basis[0], dbasis[1]
+    ) / numpy.sqrt(zs**2.0 + zin**2.0)
+    return Phi, dPhidR, dPhidz
+
+
+def _multipole_derivs(multipoles, R, z):
+    """Potential -sum_l M_l P_l(cos theta) / r^(l+1) of the even multipoles M_l and its derivatives wrt (R,z)"""
+    r2 = R**2.0 + z**2.0
+    r = numpy.sqrt(r2)
+    c = z / r
+    Phi, dPhidR, dPhidz = 0.0, 0.0, 0.0
+    for ii, Ml in enumerate(multipoles):
+        l = 2 * ii
+        coef = numpy.eye(l + 1)[l]
+        Pl = legendre.legval(c, coef)
+        dPl = legendre.legval(c, legendre.legder(coef))
+        rl1 = r ** (l + 1.0)
+        Phi = Phi - Ml * Pl / rl1
+        dPhidR = dPhidR - Ml * (-dPl * z * R / r2 / r - (l + 1.0) * Pl * R / r2) / rl1
+        dPhidz = dPhidz - Ml * (dPl * R**2.0 / r2 / r - (l + 1.0) * Pl * z / r2) / rl1
+    return Phi, dPhidR, dPhidz
@@ -170,6 +170,28 @@ class DissipativeForce(Force):
                 )
             return 0.0
 
+    def _forces(self, R, z, phi=0.0, t=0.0, v=None):
+        """Evaluate the radial force, the vertical force, and the azimuthal torque (without the amplitude) at once; forces that compute these together implement this to do so in a single pass"""
+        return (
+            self._Rforce(R, z, phi=phi, t=t, v=v),
+            self._zforce(R, z, phi=phi, t=t, v=v),
+            (
+                self._phitorque(R, z, phi=phi, t=t, v=v)
+                if self.isNonAxi or hasattr(self, "_phitorque")
+                else 0.0
+            ),
+        )
+
+    def _forces_nodecorator(self, R, z, phi=0.0, t=0.0, v=None):
+        # Separate, so it can be used during orbit integration
+        try:
+            Rforce, zforce, phitorque = self._forces(R, z, phi=phi, t=t, v=v)
+        except AttributeError:  # pragma: no cover
+            from .Potential import PotentialError
+
+            raise PotentialError("Forces not implemented for this DissipativeForce")
+        return self._amp * Rforce, self._amp * zforce, self._amp * phitorque
+
 
 def _isDissipative(obj):
     """
@@ -8,6 +8,7 @@ import numpy
 from scipy import special
 
 from ..util import conversion
+from .DiskQuadratureTableMixin import DiskQuadratureTableMixin
 from .Potential import Potential, check_potential_inputs_not_arrays
 
 
@@ -21,7 +22,7 @@ def _de_psiprime(t):
     )
 
 
-class DoubleExponentialDiskPotential(Potential):
+class DoubleExponentialDiskPotential(Potential, DiskQuadratureTableMixin):
     """Class that implements the double exponential disk potential
 
     .. math::
@@ -117,6 +118,8 @@ class DoubleExponentialDiskPotential(Potential):
             + numpy.log(1.0 + _gamma / numpy.sqrt(1.0 + _gamma2))
         ) / (2.0 * (1.0 + _gamma2) ** 1.5)
         self._pot_zero *= -4.0 * numpy.pi / self._alpha**2.0
+        # Optional table of the potential, see turn_quadrature_table_on
+        self._qtable = None
         # Normalize?
         if normalize or (
             isinstance(normalize, (int, float)) and not isinstance(normalize, bool)
@@ -149,6 +152,10 @@ class DoubleExponentialDiskPotential(Potential):
         - 2012-12-26 - New method using Gaussian quadrature between zeros - Bovy (IAS)
         - 2020-12-24 - New method using Ogata's Bessel integral formula - Bovy (UofT)
         """
+        if self._qtable is not None:
+            out = self._qtable_eval(R, z)
+            if out is not None:
+                return out[0]
         if isinstance(R, (float, int)):
             floatIn = True
             R = numpy.atleast_1d(R)
@@ -211,6 +218,10 @@ class DoubleExponentialDiskPotential(Potential):
         - 2012-12-26 - New method using Gaussian quadrature between zeros - Bovy (IAS)
         - 2020-12-24 - New method using Ogata's Bessel integral formula - Bovy (UofT)
         """
+        if self._qtable is not None:
+            out = self._qtable_eval(R, z)
+            if out is not None:
+                return out[1]
         fun = (
             lambda x: x
             * (self._alpha**2.0 + (x / R) ** 2.0) ** -1.5
@@ -255,6 +266,10 @@ class DoubleExponentialDiskPotential(Potential):
         - 2012-12-26 - New method using Gaussian quadrature between zeros - Bovy (IAS)
         - 2020-12-24 - New method using Ogata's Bessel integral formula - Bovy (UofT)
         """
+        if self._qtable is not None:
+            out = self._qtable_eval(R, z)
+            if out is not None:
+                return out[2]
         fun = (
             lambda x: (self._alpha**2.0 + (x / R) ** 2.0) ** -1.5
             * x
@@ -427,3 +442,63 @@ class DoubleExponentialDiskPotential(Potential):
             / self._beta
             * (1.0 - numpy.exp(-self._beta * numpy.fabs(z)))
         )
+
+    def _qtable_scales(self):
+        # Near the center, the potential varies on the scale height in R as
+        # well
+        return (self._hz, self._hz, self._hr)
+
+    def _qtable_moment(self, a, b):
+        return (
+            4.0
+            * numpy.pi
+            * special.gamma(2.0 * a + 2.0)
+            * self._hr ** (2.0 * a + 2.0)
+            * special.gamma(2.0 * b + 1.0)
+            * self._hz ** (2.0 * b + 1.0)
+        )
+
+    def _qtable_quadrature(self, R, z):
+        """Potential and forces for arrays of (R,z>=0), [3,n] array; uses Gauss-Legendre quadrature of the Hankel integrals where the double-exponential formula loses accuracy, at small R and at R << z"""
+        out = numpy.empty((3, len(R)))
+        ogata = (R >= 0.3 * self._hr) * (z <= 10.0 * R)
+        out[:, ogata] = DiskQuadratureTableMixin._qtable_quadrature(
+            self, R[ogata], z[ogata]
+        )
+        out[:, ~ogata] = self._hankel_gl(R[~ogata], z[~ogata])
+        return out
+
+    def _hankel_gl(self, R, z, chunk=200):
+        """Potential and forces for arrays of (R < 0.3 h_R or R << z, z>=0) from the Hankel integrals over k with panels of Gauss-Legendre quadrature, geometric up to the wavenumber where J_0(kR) oscillates and then uniform and shorter than half of its period; [3,n] array"""
+        kmax = numpy.pi / 0.3 / self._hr
+        breaks = numpy.unique(
+            numpy.concatenate(
+                (
+                    [0.0, self._beta],
+                    numpy.geomspace(
+                        1e-3 * self._alpha,
+                        kmax,
+                        int(numpy.log(kmax / self._alpha / 1e-3) / numpy.log(1.25)),
+                    ),
+                    numpy.arange(2.0 * kmax, 1e4 * self._alpha, kmax),
+                )
+            )
+        )
+        glx, glw = numpy.polynomial.legendre.leggauss(10)
+        dk = 0.5 * (breaks[1:] - breaks[:-1])[:, None]
+        k = (dk * (glx + 1.0) + breaks[:-1, None]).flatten()
+        w = (dk * glw).flatten()
+        kpot = (self._alpha**2.0 + k**2.0) ** -1.5 / (self._beta**2.0 - k**2.0)
+        out = numpy.empty((3, len(R)))
+        for ii in range(0, len(R), chunk):
+            zz = z[ii : ii + chunk, None]
+            ebetaz = numpy.exp(-self._beta * zz)
+            ekz = numpy.exp(-k * zz)
+            fpot = kpot * (self._beta * ekz - k * ebetaz)
+            j0 = special.j0(k * R[ii : ii + chunk, None])
+            out[0, ii : ii + chunk] = (j0 * fpot) @ w
+            out[1, ii : ii + chunk] = (
+                special.j1(k * R[ii : ii + chunk, None]) * k * fpot
+            ) @ w
+            out[2, ii : ii + chunk] = self._beta * (j0 * kpot * k * (ekz - ebetaz)) @ w
+        return -4.0 * numpy.pi * self._alpha * out
@@ -8,12 +8,13 @@
 #                            with m^2 = x^2+y^2/b^2+z^2/c^2
 #
 ###############################################################################
-import hashlib
+import warnings
 
 import numpy
 from scipy import integrate
 
-from ..util import _rotate_to_arbitrary_vector, conversion, coords
+from ..util import _rotate_to_arbitrary_vector, conversion, coords, galpyWarning
+from ..util._disk_cache import disk_cache
 from .Potential import Potential, check_potential_inputs_not_arrays
 
 
@@ -82,7 +83,7 @@ class EllipsoidalPotential(Potential):
         self._c = c
         self._b2 = self._b**2.0
         self._c2 = self._c**2.0
-        self._force_hash = None
+        self._qtable = None
         # Setup rotation
         self._setup_zvec_pa(zvec, pa)
         # Setup integration
@@ -147,6 +148,8 @@ class EllipsoidalPotential(Potential):
     def _evaluate_xyz(self, x, y, z):
         """Evaluation of the potential as a function of (x,y,z) in the
         aligned coordinate frame"""
+        if self._in_qtable(x, y, z):
+            return self._qtable_eval(x, y, z)[0]
         return (
             2.0
             * numpy.pi
@@ -158,107 +161,45 @@ class EllipsoidalPotential(Potential):
         )
 
     @check_potential_inputs_not_arrays
-    def _Rforce(self, R, z, phi=0.0, t=0.0):
+    def _forces(self, R, z, phi=0.0, t=0.0):
         if not self.isNonAxi:
             phi = 0.0
         x, y, z = coords.cyl_to_rect(R, phi, z)
         # Compute all rectangular forces
-        new_hash = hashlib.md5(numpy.array([x, y, z])).hexdigest()
-        if new_hash == self._force_hash:
-            Fx = self._cached_Fx
-            Fy = self._cached_Fy
-            Fz = self._cached_Fz
+        if self._aligned:
+            Fx, Fy, Fz = self._forces_xyz(x, y, z)
         else:
-            if self._aligned:
-                xp, yp, zp = x, y, z
-            else:
-                xyzp = numpy.dot(self._rot, numpy.array([x, y, z]))
-                xp, yp, zp = xyzp[0], xyzp[1], xyzp[2]
-            Fx = self._force_xyz(xp, yp, zp, 0)
-            Fy = self._force_xyz(xp, yp, zp, 1)
-            Fz = self._force_xyz(xp, yp, zp, 2)
-            self._force_hash = new_hash
-            self._cached_Fx = Fx
-            self._cached_Fy = Fy
-            self._cached_Fz = Fz
-        if not self._aligned:
-            Fxyz = numpy.dot(self._rot.T, numpy.array([Fx, Fy, Fz]))
-            Fx, Fy = Fxyz[0], Fxyz[1]
-        return numpy.cos(phi) * Fx + numpy.sin(phi) * Fy
+            xyzp = numpy.dot(self._rot, numpy.array([x, y, z]))
+            Fxyz = numpy.dot(self._rot.T, self._forces_xyz(xyzp[0], xyzp[1], xyzp[2]))
+            Fx, Fy, Fz = Fxyz[0], Fxyz[1], Fxyz[2]
+        cp, sp = numpy.cos(phi), numpy.sin(phi)
+        return cp * Fx + sp * Fy, Fz, R * (-sp * Fx + cp * Fy)
+
+    def _Rforce(self, R, z, phi=0.0, t=0.0):
+        return self._forces(R, z, phi=phi, t=t)[0]
 
-    @check_potential_inputs_not_arrays
     def _phitorque(self, R, z, phi=0.0, t=0.0):
-        if not self.isNonAxi:
-            phi = 0.0
-        x, y, z = coords.cyl_to_rect(R, phi, z)
-        # Compute all rectangular forces
-        new_hash = hashlib.md5(numpy.array([x, y, z])).hexdigest()
-        if new_hash == self._force_hash:
-            Fx = self._cached_Fx
-            Fy = self._cached_Fy
-            Fz = self._cached_Fz
-        else:
-            if self._aligned:
-                xp, yp, zp = x, y, z
-            else:
-                xyzp = numpy.dot(self._rot, numpy.array([x, y, z]))
-                xp, yp, zp = xyzp[0], xyzp[1], xyzp[2]
-            Fx = self._force_xyz(xp, yp, zp, 0)
-            Fy = self._force_xyz(xp, yp, zp, 1)
-            Fz = self._force_xyz(xp, yp, zp, 2)
-            self._force_hash = new_hash
-            self._cached_Fx = Fx
-            self._cached_Fy = Fy
-            self._cached_Fz = Fz
-        if not self._aligned:
-            Fxyz = numpy.dot(self._rot.T, numpy.array([Fx, Fy, Fz]))
-            Fx, Fy = Fxyz[0], Fxyz[1]
-        return R * (-numpy.sin(phi) * Fx + numpy.cos(phi) * Fy)
+        return self._forces(R, z, phi=phi, t=t)[2]
 
-    @check_potential_inputs_not_arrays
     def _zforce(self, R, z, phi=0.0, t=0.0):
-        if not self.isNonAxi:
-            phi = 0.0
-        x, y, z = coords.cyl_to_rect(R, phi, z)
-        # Compute all rectangular forces
-        new_hash = hashlib.md5(numpy.array([x, y, z])).hexdigest()
-        if new_hash == self._force_hash:
-            Fx = self._cached_Fx
-            Fy = self._cached_Fy
-            Fz = self._cached_Fz
-        else:
-            if self._aligned:
-                xp, yp, zp = x, y, z
-            else:
-                xyzp = numpy.dot(self._rot, numpy.array([x, y, z]))
-                xp, yp, zp = xyzp[0], xyzp[1], xyzp[2]
-            Fx = self._force_xyz(xp, yp, zp, 0)
-            Fy = self._force_xyz(xp, yp, zp, 1)
-            Fz = self._force_xyz(xp, yp, zp, 2)
-            self._force_hash = new_hash
-            self._cached_Fx = Fx
-            self._cached_Fy = Fy
-            self._cached_Fz = Fz
-        if not self._aligned:
-            Fxyz = numpy.dot(self._rot.T, numpy.array([Fx, Fy, Fz]))
-            Fz = Fxyz[2]
-        return Fz
+        return self._forces(R, z, phi=phi, t=t)[1]
 
-    def _force_xyz(self, x, y, z, i):
-        """Evaluation of the i-th force component as a function of (x,y,z)"""
+    def _forces_xyz(self, x, y, z):
+        """Evaluation of the x, y, and z forces as a function of (x,y,z)"""
+        if self._in_qtable(x, y, z):
+            return numpy.array(self._qtable_eval(x, y, z)[1:])
         return (
             -4.0
             * numpy.pi
             * self._b
             * self._c
-            * _forceInt(
+            * _forcesInt(
                 x,
                 y,
                 z,
                 lambda m: self._mdens(m),
                 self._b2,
                 self._c2,
-                i,
                 glx=self._glx,
                 glw=self._glw,
             )
@@ -315,8 +256,7 @@ class EllipsoidalPotential(Potential):
             raise NotImplementedError(
                 "2nd potential derivatives of TwoPowerTriaxialPotential not implemented for rotated coordinated frames (non-trivial zvec and pa; use RotateAndTiltWrapperPotential for this functionality instead)"
             )
-        Fx = self._force_xyz(x, y, z, 0)
-        Fy = self._force_xyz(x, y, z, 1)
+        Fx, Fy, _ = self._forces_xyz(x, y, z)
         phixx = self._2ndderiv_xyz(x, y, z, 0, 0)
         phixy = self._2ndderiv_xyz(x, y, z, 0, 1)
         phiyy = self._2ndderiv_xyz(x, y, z, 1, 1)
@@ -335,8 +275,7 @@ class EllipsoidalPotential(Potential):
             raise NotImplementedError(
                 "2nd potential derivatives of TwoPowerTriaxialPotential not implemented for rotated coordinated frames (non-trivial zvec and pa; use RotateAndTiltWrapperPotential for this functionality instead)"
             )
-        Fx = self._force_xyz(x, y, z, 0)
-        Fy = self._force_xyz(x, y, z, 1)
+        Fx, Fy, _ = self._forces_xyz(x, y, z)
         phixx = self._2ndderiv_xyz(x, y, z, 0, 0)
         phixy = self._2ndderiv_xyz(x, y, z, 0, 1)
         phiyy = self._2ndderiv_xyz(x, y, z, 1, 1)
@@ -408,6 +347,286 @@ class EllipsoidalPotential(Potential):
     def OmegaP(self):
         return 0.0
 
+    def turn_quadrature_table_on(self, rmin=1e-3, rmax=1e3, rtol=1e-5, maxiter=3):
+        """
+        Turn on a precomputed table of the potential in the frame aligned with the ellipsoid, which replaces the quadrature for the potential and the forces by interpolation for radii between rmin and rmax, both in Python and in C (second derivatives are still computed with quadrature).
+
+        Parameters
+        ----------
+        rmin : float or Quantity, optional
+            Minimum radius of the table (default: 1e-3).
+        rmax : float or Quantity, optional
+            Maximum radius of the table (default: 1e3).
+        rtol : float, optional
+            Relative tolerance of the potential, the table is refined until the interpolation error between the nodes is below this tolerance (default: 1e-5); this tolerance applies to the potential only: the errors of the forces relative to the magnitude of the force are typically of the same order, but are not guaranteed to be below rtol, and individual force components can have much larger relative errors where they are small.
+        maxiter : int, optional
+            Maximum number of refinements of the table (default: 3).
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        - The table is regular in log radius and in the two angles of a single octant, using the symmetry of the density; the potential is interpolated with a tricubic spline, such that the forces are the continuous derivatives of the interpolated potential.
+        - 2026-10-19 - Written - Agent (local)
+
+        """
+        umin = numpy.log(conversion.parse_length(rmin, ro=self._ro))
+        umax = numpy.log(conversion.parse_length(rmax, ro=self._ro))
+        self._qtable = None
+        self._qtable, err = _quadrature_table(self, umin, umax, rtol, maxiter)
+        self._qtable_cache = (None, None)
+        if err >= rtol:
+            warnings.warn(
+                f"Quadrature table only reached a relative error of {err:.1e} > rtol = {rtol:.1e}; increase maxiter for a more accurate table",
+                galpyWarning,
+            )
+        return None
+
+    def turn_quadrature_table_off(self):
+        """
+        Turn off the precomputed table of the potential and go back to computing the potential and forces with quadrature.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        - 2026-10-19 - Written - Agent (local)
+
+        """
+        self._qtable = None
+        return None
+
+    def _in_qtable(self, x, y, z):
+        """Whether (x,y,z) in the aligned frame is covered by the quadrature table"""
+        if self._qtable is None:
+            return False
+        grid = self._qtable["grids"][0]
+        return (
+            numpy.exp(2.0 * grid[0])
+            <= x**2.0 + y**2.0 + z**2.0
+            <= numpy.exp(2.0 * grid[-1])
+        )
+
+    def _quadrature_xyz(self, x, y, z):
+        """Potential and forces in the aligned frame from quadrature for arrays of (x,y,z), [4,n] array"""
+        if self._glx is None:
+            glx, glw = numpy.polynomial.legendre.leggauss(50)
+            glx, glw = 0.5 * glx + 0.5, 0.5 * glw
+        else:
+            glx, glw = self._glx, self._glw
+        t = 1.0 / glx**2.0 - 1.0
+        w = (
+            glw
+            * self._b
+            * self._c
+            / numpy.sqrt(
+                (1.0 + (self._b2 - 1.0) * glx**2.0)
+                * (1.0 + (self._c2 - 1.0) * glx**2.0)
+            )
+        )
+        out = numpy.empty((4, len(x)))
+        chunk = 2000
+        for ii in range(0, len(x), chunk):
+            xx = x[ii : ii + chunk, None] / (1.0 + t)
+            yy = y[ii : ii + chunk, None] / (self._b2 + t)
+            zz = z[ii : ii + chunk, None] / (self._c2 + t)
+            m = numpy.sqrt(
+                xx * x[ii : ii + chunk, None]
+                + yy * y[ii : ii + chunk, None]
+                + zz * z[ii : ii + chunk, None]
+            )
+            dens = self._mdens(m)
+            out[0, ii : ii + chunk] = (
+                2.0 * numpy.pi * numpy.sum(w * self._psi(m), axis=1)
+            )
+            out[1, ii : ii + chunk] = -4.0 * numpy.pi * numpy.sum(w * dens * xx, axis=1)
+            out[2, ii : ii + chunk] = -4.0 * numpy.pi * numpy.sum(w * dens * yy, axis=1)
+            out[3, ii : ii + chunk] = -4.0 * numpy.pi * numpy.sum(w * dens * zz, axis=1)
+        return out
+
+    def _qtable_build(self, grids):
+        """Compute the coefficients of the tricubic B-spline of the potential in (ln r,theta,phi), [nu+2,ntheta+2,nphi+2] array"""
+        u, theta, phi = numpy.meshgrid(*grids, indexing="ij")
+        r = numpy.exp(u)
+        x = r * numpy.sin(theta) * numpy.cos(phi)
+        y = r * numpy.sin(theta) * numpy.sin(phi)
+        z = r * numpy.cos(theta)
+        Phi, Fx, Fy, Fz = (
+            q.reshape(u.shape)
+            for q in self._quadrature_xyz(x.flatten(), y.flatten(), z.flatten())
+        )
+        # Clamped at the radial derivative at the ends in ln r; the potential
+        # is even about the edges of the octant, so the derivatives wrt the
+        # angles vanish there
+        Phiu = -(x * Fx + y * Fy + z * Fz)
+        coeffs = _clamped_spline_coeffs(Phi, Phiu[:1], Phiu[-1:], grids[0], 0)
+        for axis in [1, 2]:
+            shape = list(coeffs.shape)
+            shape[axis] = 1
+            coeffs = _clamped_spline_coeffs(
+                coeffs, numpy.zeros(shape), numpy.zeros(shape), grids[axis], axis
+            )
+        return coeffs
+
+    def _qtable_error(self, qtable, axis):
+        """Maximum relative error of the table and of its derivative along one axis between the nodes along that axis, at the midpoints and the quarter points, where the errors of the potential and of its derivative peak"""
+        grids = qtable["grids"]
+        pts = list(grids)
+        pts[axis] = numpy.concatenate(
+            [(1.0 - f) * grids[axis][:-1] + f * grids[axis][1:] for f in [0.25, 0.5]]
+        )
+        u, theta, phi = (q.flatten() for q in numpy.meshgrid(*pts, indexing="ij"))
+        r = numpy.exp(u)
+        x = r * numpy.sin(theta) * numpy.cos(phi)
+        y = r * numpy.sin(theta) * numpy.sin(phi)
+        z = r * numpy.cos(theta)
+        Phi, Fx, Fy, Fz = self._quadrature_xyz(x, y, z)
+        if axis == 0:
+            dPhi = -(x * Fx + y * Fy + z * Fz)
+        elif axis == 1:
+            dPhi = -r * (
+                numpy.cos(theta) * (numpy.cos(phi) * Fx + numpy.sin(phi) * Fy)
+                - numpy.sin(theta) * Fz
+            )
+        else:
+            dPhi = y * Fx - x * Fy
+        approx = _qtable_derivs(qtable, x, y, z)
+        return max(
+            numpy.amax(numpy.fabs(approx[0] - Phi) / numpy.fabs(Phi)),
+            numpy.amax(
+                numpy.fabs(approx[axis + 1] - dPhi)
+                / r
+                / numpy.sqrt(Fx**2.0 + Fy**2.0 + Fz**2.0)
+            ),
+        )
+
+    def _qtable_eval(self, x, y, z):
+        """Potential and forces in the aligned frame from the quadrature table"""
+        scalar = numpy.ndim(x) == 0
+        if scalar and self._qtable_cache[0] == (x, y, z):
+            return self._qtable_cache[1]
+        Phi, Phiu, Phit, Phip = _qtable_derivs(self._qtable, x, y, z)
+        ax, ay, az = numpy.fabs(x), numpy.fabs(y), numpy.fabs(z)
+        Rc = numpy.sqrt(ax**2.0 + ay**2.0)
+        r2 = Rc**2.0 + az**2.0
+        # Gradient in rectangular coordinates, zero on the z axis by symmetry
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            gR = numpy.where(Rc > 0.0, (Phiu * Rc + Phit * az) / r2 / Rc, 0.0)
+            gp = numpy.where(Rc > 0.0, Phip / Rc**2.0, 0.0)
+        gx = gR * ax - gp * ay
+        gy = gR * ay + gp * ax
+        gz = (Phiu * az - Phit * Rc) / r2
+        out = (
+            Phi,
+            -numpy.sign(x) * gx,
+            -numpy.sign(y) * gy,
+            -numpy.sign(z) * gz,
+        )
+        if scalar:
+            out = tuple(float(o) for o in out)
+            self._qtable_cache = ((x, y, z), out)
+        return out
+
+
+@disk_cache()
+def _quadrature_table(pot, umin, umax, rtol, maxiter):
+    """Build the quadrature table of an EllipsoidalPotential between ln r = umin and umax, refining each axis until its interpolation error is below rtol; returns the table and its error"""
+    # Start with 8 nodes per dex and a 9x9 grid in the angles
+    shape = [int(numpy.ceil(8.0 * (umax - umin) / numpy.log(10.0))) + 1, 9, 9]
+    bounds = [(umin, umax), (0.0, numpy.pi / 2.0), (0.0, numpy.pi / 2.0)]
+    for ii in range(maxiter + 1):
+        grids = [numpy.linspace(lo, hi, n) for (lo, hi), n in zip(bounds, shape)]
+        qtable = {"grids": grids, "table": pot._qtable_build(grids)}
+        errs = [pot._qtable_error(qtable, axis) for axis in range(3)]
+        if max(errs) < rtol or ii == maxiter:
+            break
+        shape = [2 * n - 1 if err >= rtol else n for n, err in zip(shape, errs)]
+    return qtable, max(errs)
+
+
+def _qtable_derivs(qtable, x, y, z):
+    """Potential and its derivatives wrt (ln r,theta,phi) in the octant from the quadrature table"""
+    ax, ay, az = numpy.fabs(x), numpy.fabs(y), numpy.fabs(z)
+    Rc = numpy.sqrt(ax**2.0 + ay**2.0)
+    crds = [
+        0.5 * numpy.log(Rc**2.0 + az**2.0),
+        numpy.arctan2(Rc, az),
+        numpy.arctan2(ay, ax),
+    ]
+    grids, table = qtable["grids"], qtable["table"]
+    if numpy.ndim(x) == 0:
+        # Single point: contract the 4x4x4 block of coefficients directly
+        block, bases = [], []
+        for grid, c in zip(grids, crds):
+            h = grid[1] - grid[0]
+            i = min(max(int((c - grid[0]) // h), 0), len(grid) - 2)
+            block.append(slice(i, i + 4))
+            bases.append(numpy.array(_bspline_basis((c - grid[i]) / h, h)))
+        out = numpy.einsum("abc,ia,jb,kc->ijk", table[tuple(block)], *bases)
+        return out[0, 0, 0], out[1, 0, 0], out[0, 1, 0], out[0, 0, 1]
+    crds = [numpy.atleast_1d(c).astype(float) for c in crds]
+    idx, basis, dbasis = [], [], []
+    for grid, c in zip(grids, crds):
+        h = grid[1] - grid[0]
+        i = numpy.clip(((c - grid[0]) // h).astype(int), 0, len(grid) - 2)
+        b, db = _bspline_basis((c - grid[i]) / h, h)
+        idx.append(i[:, None] + numpy.arange(4)[None, :])
+        basis.append(b)
+        dbasis.append(db)
+    coeffs = table[
+        idx[0][:, :, None, None],
+        idx[1][:, None, :, None],
+        idx[2][:, None, None, :],
+    ]
+    return tuple(
+        numpy.einsum("nabc,an,bn,cn->n", coeffs, bu, bt, bp)
+        for bu, bt, bp in [
+            (basis[0], basis[1], basis[2]),
+            (dbasis[0], basis[1], basis[2]),
+            (basis[0], dbasis[1], basis[2]),
+            (basis[0], basis[1], dbasis[2]),
+        ]
+    )
+
+
+def _clamped_spline_coeffs(f, dfl, dfr, grid, axis):
+    """Coefficients of the uniform cubic B-spline along axis that interpolates f with derivatives dfl and dfr at the ends, n+2 coefficients along axis"""
+    n = len(grid)
+    h = grid[1] - grid[0]
+    A = numpy.zeros((n + 2, n + 2))
+    A[0, [0, 2]] = -0.5 / h, 0.5 / h
+    A[-1, [-3, -1]] = -0.5 / h, 0.5 / h
+    for ii in range(n):
+        A[ii + 1, ii : ii + 3] = 1.0 / 6.0, 2.0 / 3.0, 1.0 / 6.0
+    rhs = numpy.moveaxis(numpy.concatenate((dfl, f, dfr), axis=axis), axis, 0)
+    out = numpy.linalg.solve(A, rhs.reshape((n + 2, -1))).reshape(rhs.shape)
+    return numpy.moveaxis(out, 0, axis)
+
+
+def _bspline_basis(t, h):
+    """Uniform cubic B-spline basis functions and their derivatives for x = x_i + t h, [4,n] arrays for the coefficients i-1,...,i+2"""
+    b = numpy.array(
+        [
+            (1.0 - t) ** 3.0,
+            3.0 * t**3.0 - 6.0 * t**2.0 + 4.0,
+            -3.0 * t**3.0 + 3.0 * t**2.0 + 3.0 * t + 1.0,
+            t**3.0,
+        ]
+    )
+    db = numpy.array(
+        [
+            -3.0 * (1.0 - t) ** 2.0,
+            9.0 * t**2.0 - 12.0 * t,
+            -9.0 * t**2.0 + 6.0 * t + 3.0,
+            3.0 * t**2.0,
+        ]
+    )
+    return b / 6.0, db / 6.0 / h
+
 
 def _potInt(x, y, z, psi, b2, c2, glx=None, glw=None):
     r"""int_0^\infty [psi(m)-psi(\infy)]/sqrt([1+tau]x[b^2+tau]x[c^2+tau])dtau"""
@@ -424,10 +643,10 @@ def _potInt(x, y, z, psi, b2, c2, glx=None, glw=None):
         return numpy.sum(glw * integrand(glx))
 
 
-def _forceInt(x, y, z, dens, b2, c2, i, glx=None, glw=None):
-    """Integral that gives the force in x,y,z"""
+def _forcesInt(x, y, z, dens, b2, c2, glx=None, glw=None):
+    """Integrals that give the forces in x, y, and z"""
 
-    def integrand(s):
+    def integrand(s, i):
         t = 1 / s**2.0 - 1.0
         return (
             dens(numpy.sqrt(x**2.0 / (1.0 + t) + y**2.0 / (b2 + t) + z**2.0 / (c2 + t)))
@@ -440,9 +659,23 @@ def _forceInt(x, y, z, dens, b2, c2, i, glx=None, glw=None):
         )
 
     if glx is None:
-        return integrate.quad(integrand, 0.0, 1.0)[0]
-    else:
-        return numpy.sum(glw * integrand(glx))
+        return numpy.array(
+            [integrate.quad(integrand, 0.0, 1.0, args=(i,))[0] for i in range(3)]
+        )
+    # Evaluate the density once for all three components
+    t = 1 / glx**2.0 - 1.0
+    w = (
+        glw
+        * dens(numpy.sqrt(x**2.0 / (1.0 + t) + y**2.0 / (b2 + t) + z**2.0 / (c2 + t)))
+        / numpy.sqrt((1.0 + (b2 - 1.0) * glx**2.0) * (1.0 + (c2 - 1.0) * glx**2.0))
+    )
+    return numpy.array(
+        [
+            numpy.sum(w * x / (1.0 + t)),
+            numpy.sum(w * y / (b2 + t)),
+            numpy.sum(w * z / (c2 + t)),
+        ]
+    )
 
 
 def _2ndDerivInt(x, y, z, dens, densDeriv, b2, c2, i, j, glx=None, glw=None):
@@ -7,7 +7,6 @@
 #
 #       m^2 = x^2 + y^2/b^2 + z^2/c^2
 ########################################################################
-import hashlib
 
 import numpy
 from scipy import integrate
@@ -32,8 +31,6 @@ class FerrersPotential(Potential):
 
     and :math:`(x',y',z')` is a rotated frame wrt :math:`(x,y,z)`
     so that the major axis is aligned with :math:`x'`.
-
-    Note that this potential has not yet been optimized for speed and has no C implementation, so orbit integration is currently slow.
     """
 
     def __init__(
@@ -94,7 +91,6 @@ class FerrersPotential(Potential):
         self._a2 = self.a**2
         self._b2 = self._b**2.0
         self._c2 = self._c**2.0
-        self._force_hash = None
         self._pa = pa
         self._rhoc_M = gamma(n + 2.5) / gamma(n + 1) / numpy.pi**1.5 / a**3 / b / c
         if normalize or (
@@ -103,6 +99,11 @@ class FerrersPotential(Potential):
             self.normalize(normalize)
         if numpy.fabs(self._b - 1.0) > 10.0**-10.0:
             self.isNonAxi = True
+        # Gauss-Legendre nodes for the integrals in the C implementation
+        self._glorder = 50
+        self._glx, self._glw = numpy.polynomial.legendre.leggauss(self._glorder)
+        self.hasC = True
+        self.hasC_dxdv = True
         return None
 
     def _evaluate(self, R, z, phi=0.0, t=0.0):
@@ -128,47 +129,34 @@ class FerrersPotential(Potential):
             )
         )
 
-    def _Rforce(self, R, z, phi=0.0, t=0.0):
+    def _forces(self, R, z, phi=0.0, t=0.0):
         if not self.isNonAxi:
             phi = 0.0
-        self._compute_xyzforces(R, z, phi, t)
-        return numpy.cos(phi) * self._cached_Fx + numpy.sin(phi) * self._cached_Fy
+        Fx, Fy, Fz = self._compute_xyzforces(R, z, phi, t)
+        cp, sp = numpy.cos(phi), numpy.sin(phi)
+        return cp * Fx + sp * Fy, Fz, R * (-sp * Fx + cp * Fy)
+
+    def _Rforce(self, R, z, phi=0.0, t=0.0):
+        return self._forces(R, z, phi=phi, t=t)[0]
 
     def _phitorque(self, R, z, phi=0.0, t=0.0):
-        if not self.isNonAxi:
-            phi = 0.0
-        self._compute_xyzforces(R, z, phi, t)
-        return R * (
-            -numpy.sin(phi) * self._cached_Fx + numpy.cos(phi) * self._cached_Fy
-        )
+        return self._forces(R, z, phi=phi, t=t)[2]
 
     def _zforce(self, R, z, phi=0.0, t=0.0):
-        if not self.isNonAxi:
-            phi = 0.0
-        self._compute_xyzforces(R, z, phi, t)
-        return self._cached_Fz
+        return self._forces(R, z, phi=phi, t=t)[1]
 
     def _compute_xyz(self, R, phi, z, t):
         return coords.cyl_to_rect(R, phi - self._pa - self._omegab * t, z)
 
     def _compute_xyzforces(self, R, z, phi, t):
-        # Compute all rectangular forces
-        new_hash = hashlib.md5(numpy.array([R, phi, z, t])).hexdigest()
-        if new_hash == self._force_hash:
-            Fx = self._cached_Fx
-            Fy = self._cached_Fy
-            Fz = self._cached_Fz
-        else:
-            x, y, z = self._compute_xyz(R, phi, z, t)
-            Fx = self._xforce_xyz(x, y, z)
-            Fy = self._yforce_xyz(x, y, z)
-            Fz = self._zforce_xyz(x, y, z)
-            self._force_hash = new_hash
-            tp = self._pa + self._omegab * t
-            cp, sp = numpy.cos(tp), numpy.sin(tp)
-            self._cached_Fx = cp * Fx - sp * Fy
-            self._cached_Fy = sp * Fx + cp * Fy
-            self._cached_Fz = Fz
+        # Compute all rectangular forces, rotated back to the inertial frame
+        x, y, z = self._compute_xyz(R, phi, z, t)
+        Fx = self._xforce_xyz(x, y, z)
+        Fy = self._yforce_xyz(x, y, z)
+        Fz = self._zforce_xyz(x, y, z)
+        tp = self._pa + self._omegab * t
+        cp, sp = numpy.cos(tp), numpy.sin(tp)
+        return cp * Fx - sp * Fy, sp * Fx + cp * Fy, Fz
 
     def _xforce_xyz(self, x, y, z):
         """Evaluation of the x force as a function of (x,y,z) in the aligned
@@ -9,8 +9,12 @@
 import numpy
 
 from ..util import conversion
+from ..util._optional_deps import _JAX_LOADED
 from .Potential import Potential
 
+if _JAX_LOADED:
+    import jax.numpy as jnp
+
 _CORE = 10**-8
 
 
@@ -87,6 +91,24 @@ class FlattenedPowerPotential(Potential):
             m2 = self.core2 + R**2.0 + z**2.0 / self.q2
             return -(m2 ** (-self.alpha / 2.0)) / self.alpha
 
+    def _jax_params(self):
+        return {
+            "amp": self._amp,
+            "alpha": self.alpha,
+            "q": self.q2**0.5,
+            "core": self.core2**0.5,
+        }
+
+    def _evaluate_jax(self, params, R, z, phi=0.0, t=0.0):
+        if not _JAX_LOADED:  # pragma: no cover
+            raise ImportError(
+                "Making use of _evaluate_jax function requires the google/jax library"
+            )
+        m2 = params["core"] ** 2.0 + R**2.0 + z**2.0 / params["q"] ** 2.0
+        if self.alpha == 0.0:  # the instance's alpha sets the functional form
+            return params["amp"] / 2.0 * jnp.log(m2)
+        return -params["amp"] * m2 ** (-params["alpha"] / 2.0) / params["alpha"]
+
     def _Rforce(self, R, z, phi=0.0, t=0.0):
         if self.alpha == 0.0:
             return -R / (R**2.0 + z**2.0 / self.q2 + self.core2)
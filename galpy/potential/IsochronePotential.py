@@ -60,6 +60,15 @@ class IsochronePotential(Potential):
         rb = numpy.sqrt(r2 + self.b2)
         return -1.0 / (self.b + rb)
 
+    def _jax_params(self):
+        return {"amp": self._amp, "b": self.b}
+
+    def _evaluate_jax(self, params, R, z, phi=0.0, t=0.0):
+        # No need for actual JAX!
+        return -params["amp"] / (
+            params["b"] + (R**2.0 + z**2.0 + params["b"] ** 2.0) ** 0.5
+        )
+
     def _Rforce(self, R, z, phi=0.0, t=0.0):
         r2 = R**2.0 + z**2.0
         rb = numpy.sqrt(r2 + self.b2)
@@ -8,8 +8,12 @@
 import numpy
 
 from ..util import conversion
+from ..util._optional_deps import _JAX_LOADED
 from .Potential import Potential
 
+if _JAX_LOADED:
+    import jax.numpy as jnp
+
 
 class KuzminDiskPotential(Potential):
     """Class that implements the Kuzmin Disk potential
@@ -57,6 +61,16 @@ class KuzminDiskPotential(Potential):
     def _evaluate(self, R, z, phi=0.0, t=0.0):
         return -(self._denom(R, z) ** -0.5)
 
+    def _jax_params(self):
+        return {"amp": self._amp, "a": self._a}
+
+    def _evaluate_jax(self, params, R, z, phi=0.0, t=0.0):
+        if not _JAX_LOADED:  # pragma: no cover
+            raise ImportError(
+                "Making use of _evaluate_jax function requires the google/jax library"
+            )
+        return -params["amp"] * (R**2.0 + (params["a"] + jnp.abs(z)) ** 2.0) ** -0.5
+
     def _Rforce(self, R, z, phi=0.0, t=0.0):
         return -(self._denom(R, z) ** -1.5) * R
 
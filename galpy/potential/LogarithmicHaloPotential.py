@@ -7,8 +7,12 @@ import warnings
 import numpy
 
 from ..util import conversion, galpyWarning
+from ..util._optional_deps import _JAX_LOADED
 from .Potential import Potential, kms_to_kpcGyrDecorator
 
+if _JAX_LOADED:
+    import jax.numpy as jnp
+
 _CORE = 10**-8
 
 
@@ -88,6 +92,26 @@ class LogarithmicHaloPotential(Potential):
         else:
             return 1.0 / 2.0 * numpy.log(R**2.0 + (z / self._q) ** 2.0 + self._core2)
 
+    def _jax_params(self):
+        out = {"amp": self._amp, "q": self._q, "core": self._core2**0.5}
+        if self.isNonAxi:
+            out["b"] = self._b
+        return out
+
+    def _evaluate_jax(self, params, R, z, phi=0.0, t=0.0):
+        if not _JAX_LOADED:  # pragma: no cover
+            raise ImportError(
+                "Making use of _evaluate_jax function requires the google/jax library"
+            )
+        R2 = R**2.0
+        if self.isNonAxi:
+            R2 = R2 * (1.0 - (1.0 - 1.0 / params["b"] ** 2.0) * jnp.sin(phi) ** 2.0)
+        return (
+            params["amp"]
+            / 2.0
+            * jnp.log(R2 + (z / params["q"]) ** 2.0 + params["core"] ** 2.0)
+        )
+
     def _Rforce(self, R, z, phi=0.0, t=0.0):
         if self.isNonAxi:
             Rt2 = R**2.0 * (1.0 - self._1m1overb2 * numpy.sin(phi) ** 2.0)
@@ -0,0 +1,208 @@
+###############################################################################
+#   ManyMovingObjectsPotential.py: class that implements the potential coming
+#                                  from a population of moving objects
+###############################################################################
+import numpy
+from scipy import interpolate
+
+from ..util import conversion
+from .PlummerPotential import PlummerPotential
+from .Potential import (
+    Potential,
+    _check_c,
+    _evaluateforces,
+    _evaluatePotentials,
+    _isNonAxi,
+    evaluateDensities,
+    flatten,
+)
+
+
+class ManyMovingObjectsPotential(Potential):
+    """
+    Class that implements the potential coming from a population of moving objects (e.g., a population of dark-matter subhalos), each represented by a galpy potential moving along an integrated galpy orbit. All trajectories are stored in packed arrays on a shared time grid, such that the summed force of thousands of objects can be efficiently evaluated, in particular in C. Objects that are farther than ``rcut`` from the evaluation point are ignored.
+    """
+
+    def __init__(self, orbits, pot=None, amp=1.0, rcut=None, ro=None, vo=None):
+        """
+        Initialize a ManyMovingObjectsPotential.
+
+        Parameters
+        ----------
+        orbits : galpy.orbit.Orbit
+            Orbit instance containing the integrated orbits of all objects (integrated on a shared time grid).
+        pot : Potential object, list of Potential objects, or list of such, optional
+            Either a single potential (or list of potentials) that represents the potential of each object or a list with a potential (or list of potentials) for each object; should be spherical, but this is not checked. Default is `PlummerPotential(amp=0.06,b=0.01)` for each object.
+        amp : float, optional
+            Another amplitude to apply to the potential. Default is 1.0.
+        rcut : float or Quantity, optional
+            Only include objects within this distance from the evaluation point (default: None, include all objects); this makes the force discontinuous at rcut, so it is best combined with fixed-step orbit integrators.
+        ro : float, optional
+            Distance scale for translation into internal units (default from configuration file).
+        vo : float, optional
+            Velocity scale for translation into internal units (default from configuration file).
+
+        Notes
+        -----
+        - 2026-10-19 - Written - Agent (local)
+        """
+        Potential.__init__(self, amp=amp, ro=ro, vo=vo)
+        if not hasattr(orbits, "t"):
+            raise AttributeError(
+                "ManyMovingObjectsPotential requires the objects' orbits to be integrated first"
+            )
+        self._nobj = orbits.size
+        # Parse the potential(s) of the objects into a list of groups
+        if pot is None:
+            pot = PlummerPotential(amp=0.06, b=0.01)
+        if isinstance(pot, list) and len(pot) == self._nobj and self._nobj > 1:
+            self._pots = [flatten(p) for p in pot]
+            self._shared_pot = False
+        elif isinstance(pot, list) and len(pot) > 1 and self._nobj > 1:
+            raise ValueError(
+                "pot= should be a single potential shared by all objects or a list with one potential for each object"
+            )
+        else:
+            self._pots = [flatten(pot)]
+            self._shared_pot = True
+        for p in self._pots:
+            if _isNonAxi(p):
+                raise NotImplementedError(
+                    "ManyMovingObjectsPotential for non-axisymmetric potentials is not currently supported"
+                )
+        self._rcut = conversion.parse_length(rcut, ro=self._ro)
+        # Pack the trajectories: positions (nt,nobj,3) and the second
+        # derivatives of their natural cubic splines in time
+        self._ts = numpy.array(orbits.t, dtype="float")
+        self._xyz = numpy.empty((len(self._ts), self._nobj, 3))
+        self._xyz[..., 0] = (
+            orbits.x(self._ts, use_physical=False).reshape(self._nobj, -1).T
+        )
+        self._xyz[..., 1] = (
+            orbits.y(self._ts, use_physical=False).reshape(self._nobj, -1).T
+        )
+        if orbits.dim() == 3:
+            self._xyz[..., 2] = (
+                orbits.z(self._ts, use_physical=False).reshape(self._nobj, -1).T
+            )
+        else:
+            self._xyz[..., 2] = 0.0
+        self._xyz2 = numpy.zeros_like(self._xyz)
+        self._xyz2[:-1] = (
+            2.0
+            * interpolate.CubicSpline(self._ts, self._xyz, axis=0, bc_type="natural").c[
+                1
+            ]
+        )
+        self.isNonAxi = True
+        self.hasC = all([_check_c(p) for p in self._pots])
+        return None
+
+    def _positions(self, t):
+        """Positions of all objects at time(s) t from the cubic spline, shape t.shape+(nobj,3)"""
+        t = numpy.clip(t, self._ts[0], self._ts[-1])
+        k = numpy.clip(
+            numpy.searchsorted(self._ts, t, side="right") - 1, 0, len(self._ts) - 2
+        )
+        h = self._ts[k + 1] - self._ts[k]
+        a = ((self._ts[k + 1] - t) / h)[..., None, None]
+        b = ((t - self._ts[k]) / h)[..., None, None]
+        h = h[..., None, None]
+        return (
+            a * self._xyz[k]
+            + b * self._xyz[k + 1]
+            + ((a**3.0 - a) * self._xyz2[k] + (b**3.0 - b) * self._xyz2[k + 1])
+            * h**2.0
+            / 6.0
+        )
+
+    def _diff(self, R, z, phi, t):
+        """Difference vectors between the objects and the evaluation point, shape R.shape+(nobj,)"""
+        R = numpy.asarray(R, dtype="float")[..., None]
+        z = numpy.asarray(z, dtype="float")[..., None]
+        phi = numpy.asarray(phi, dtype="float")[..., None]
+        xyz = self._positions(numpy.asarray(t, dtype="float"))
+        xd = xyz[..., 0] - R * numpy.cos(phi)
+        yd = xyz[..., 1] - R * numpy.sin(phi)
+        zd = xyz[..., 2] - z
+        if self._rcut is None:
+            incut = True
+        else:
+            incut = xd**2.0 + yd**2.0 + zd**2.0 < self._rcut**2.0
+        return (xd, yd, zd, numpy.sqrt(xd**2.0 + yd**2.0), incut)
+
+    def _object_sum(self, func, Rdist, zd, t, incut):
+        """Sum func(pot,Rdist,zd,t) over all objects, using the objects' potential(s)"""
+        if self._shared_pot:
+            return numpy.sum(
+                numpy.where(incut, func(self._pots[0], Rdist, zd, _tobj(t)), 0.0),
+                axis=-1,
+            )
+        out = 0.0
+        for ii, p in enumerate(self._pots):
+            out += numpy.where(
+                incut if self._rcut is None else incut[..., ii],
+                func(p, Rdist[..., ii], zd[..., ii], t),
+                0.0,
+            )
+        return out
+
+    def _evaluate(self, R, z, phi=0.0, t=0.0):
+        xd, yd, zd, Rdist, incut = self._diff(R, z, phi, t)
+        return self._object_sum(
+            lambda p, Rd, zd, t: _evaluatePotentials(p, Rd, zd, phi=0.0, t=t),
+            Rdist,
+            zd,
+            t,
+            incut,
+        )
+
+    def _forces(self, R, z, phi=0.0, t=0.0):
+        xd, yd, zd, Rdist, incut = self._diff(R, z, phi, t)
+        # Cylindrical radial and vertical forces of each object, with the
+        # radial force divided by the cylindrical distance to the object
+        if self._shared_pot:
+            RF, zF, _ = _evaluateforces(self._pots[0], Rdist, zd, phi=0.0, t=_tobj(t))
+        else:
+            RF = numpy.empty_like(Rdist)
+            zF = numpy.empty_like(Rdist)
+            for ii, p in enumerate(self._pots):
+                RF[..., ii], zF[..., ii], _ = _evaluateforces(
+                    p, Rdist[..., ii], zd[..., ii], phi=0.0, t=t
+                )
+        RF = numpy.where(incut, RF, 0.0) / Rdist
+        zF = numpy.where(incut, zF, 0.0)
+        # Project onto the cylindrical frame of the evaluation point
+        cosphi = numpy.cos(phi)[..., None]
+        sinphi = numpy.sin(phi)[..., None]
+        return (
+            -numpy.sum(RF * (cosphi * xd + sinphi * yd), axis=-1),
+            -numpy.sum(zF, axis=-1),
+            -R * numpy.sum(RF * (cosphi * yd - sinphi * xd), axis=-1),
+        )
+
+    def _Rforce(self, R, z, phi=0.0, t=0.0):
+        return self._forces(R, z, phi=phi, t=t)[0]
+
+    def _zforce(self, R, z, phi=0.0, t=0.0):
+        return self._forces(R, z, phi=phi, t=t)[1]
+
+    def _phitorque(self, R, z, phi=0.0, t=0.0):
+        return self._forces(R, z, phi=phi, t=t)[2]
+
+    def _dens(self, R, z, phi=0.0, t=0.0):
+        xd, yd, zd, Rdist, incut = self._diff(R, z, phi, t)
+        return self._object_sum(
+            lambda p, Rd, zd, t: evaluateDensities(
+                p, Rd, zd, phi=0.0, t=t, use_physical=False
+            ),
+            Rdist,
+            zd,
+            t,
+            incut,
+        )
+
+
+def _tobj(t):
+    # Broadcast array times against the object axis
+    return numpy.asarray(t)[..., None] if numpy.ndim(t) > 0 else t
@@ -69,6 +69,17 @@ class MiyamotoNagaiPotential(Potential):
             R**2.0 + (self._a + numpy.sqrt(z**2.0 + self._b2)) ** 2.0
         )
 
+    def _jax_params(self):
+        return {"amp": self._amp, "a": self._a, "b": self._b}
+
+    def _evaluate_jax(self, params, R, z, phi=0.0, t=0.0):
+        # No need for actual JAX!
+        return (
+            -params["amp"]
+            * (R**2.0 + (params["a"] + (z**2.0 + params["b"] ** 2.0) ** 0.5) ** 2.0)
+            ** -0.5
+        )
+
     def _Rforce(self, R, z, phi=0.0, t=0.0):
         return -R / (R**2.0 + (self._a + numpy.sqrt(z**2.0 + self._b2)) ** 2.0) ** (
             3.0 / 2.0
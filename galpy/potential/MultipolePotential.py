@@ -0,0 +1,526 @@
+###############################################################################
+#   MultipolePotential.py: potential from a multipole expansion, with radial
+#                          splines and spherical harmonics in angle
+###############################################################################
+import numpy
+from numpy.polynomial.legendre import leggauss
+from scipy import interpolate
+from scipy.special import gammaln
+
+from ..util import coords
+from ..util.conversion import get_physical, physical_compatible
+from .Potential import Potential, evaluateDensities
+from .TwoPowerSphericalPotential import HernquistPotential
+
+
+class MultipolePotential(Potential):
+    """Class that implements a potential from a multipole expansion
+
+    .. math::
+
+        \\Phi(r,\\theta,\\phi) = \\sum_{l=0}^{L}\\sum_{m=0}^{l} \\bar{P}_{lm}(\\cos\\theta)\\,\\left[\\Phi_{lm}^c(r)\\,\\cos(m\\phi)+\\Phi_{lm}^s(r)\\,\\sin(m\\phi)\\right]
+
+    where :math:`\\bar{P}_{lm}` are the associated Legendre functions normalized such that :math:`\\bar{P}_{lm}(\\cos\\theta)\\,\\{\\cos,\\sin\\}(m\\phi)` are orthonormal real spherical harmonics. The radial functions :math:`\\Phi_{lm}(r)` are computed from a density or a set of particles on a radial grid by solving Poisson's equation for each harmonic and they are interpolated with quintic splines in :math:`\\ln r` that match their values and first two derivatives at the grid points. Inside the innermost grid point, the radial functions are extrapolated as power laws with the logarithmic slope at the innermost grid point (for :math:`l=0`, this is a power-law density); beyond the outermost grid point, the potential is extrapolated as that of the mass inside of the grid (:math:`\\Phi_{lm}(r) \\propto r^{-l-1}`). Because the radial dependence is not restricted to a fixed set of basis functions, this expansion typically requires many fewer terms than :ref:`SCFPotential <scf_potential>` for cuspy or truncated profiles.
+    """
+
+    def __init__(
+        self,
+        amp=1.0,
+        dens=None,
+        pos=None,
+        mass=1.0,
+        L=6,
+        rgrid=numpy.geomspace(1e-3, 1e3, 121),
+        symmetry=None,
+        costheta_order=None,
+        phi_order=None,
+        radial_order=8,
+        normalize=False,
+        ro=None,
+        vo=None,
+    ):
+        """
+        Initialize a multipole-expansion potential from a density or a set of particles
+
+        Parameters
+        ----------
+        amp : float, optional
+            Amplitude to be applied to the potential (default: 1).
+        dens : function or galpy Potential instance or list thereof, optional
+            Density function that takes parameters R, z and phi (in internal units, preferably vectorized) or a galpy Potential instance or list thereof; default: HernquistPotential(a=1.) with symmetry='spherical' if pos is also None.
+        pos : numpy.ndarray, optional
+            Positions of particles in rectangular coordinates with shape [3,n] in internal units; used instead of dens.
+        mass : float or numpy.ndarray, optional
+            Mass of the particles (scalar or array with size n) in internal units (default: 1).
+        L : int, optional
+            Maximum degree l of the spherical harmonics (default: 6).
+        rgrid : numpy.ndarray, optional
+            Increasing radial grid in internal units on which to compute the radial functions (default: numpy.geomspace(1e-3,1e3,121)).
+        symmetry : {'spherical','axisymmetry',None}, optional
+            Symmetry of the profile to assume. None is the general, non-axisymmetric case.
+        costheta_order : int, optional
+            Number of sample points of the costheta integral for a density (default: max(20,2L+2)).
+        phi_order : int, optional
+            Number of sample points of the phi integral for a non-axisymmetric density (default: max(20,2L+2)).
+        radial_order : int, optional
+            Number of sample points of the radial integral between grid points for a density (default: 8).
+        normalize : bool or float, optional
+            If True, normalize such that vc(1.,0.)=1., or, if given as a number, such that the force is this fraction of the force necessary to make vc(1.,0.)=1.
+        ro : float or Quantity, optional
+            Distance scale for translation into internal units (default from configuration file).
+        vo : float or Quantity, optional
+            Velocity scale for translation into internal units (default from configuration file).
+
+        Notes
+        -----
+        - 2026-10-19 - Written - Agent (local)
+        """
+        Potential.__init__(self, amp=amp, ro=ro, vo=vo)
+        if dens is None and pos is None:
+            dens = HernquistPotential(a=1.0)
+            symmetry = "spherical"
+        if isinstance(dens, (list, Potential)):
+            if not physical_compatible(self, dens):
+                raise RuntimeError(
+                    "Unit conversion factors ro and vo incompatible between Potential to be expanded and the factors given to MultipolePotential"
+                )
+            # If set for the density, set for the expansion
+            phys = get_physical(dens, include_set=True)
+            if phys["roSet"]:
+                self.turn_physical_on(ro=phys["ro"])
+            if phys["voSet"]:
+                self.turn_physical_on(vo=phys["vo"])
+            _pot = dens
+            dens = lambda R, z, phi: evaluateDensities(
+                _pot, R, z, phi=phi, use_physical=False
+            )
+        rgrid = numpy.array(rgrid, dtype=float)
+        if numpy.any(rgrid <= 0.0) or numpy.any(numpy.diff(rgrid) <= 0.0):
+            raise ValueError("rgrid must be positive and strictly increasing")
+        if not symmetry is None and symmetry.startswith("spher"):
+            L = 0
+            self._harmonics = [(0, 0, 0)]
+            self.isNonAxi = False
+        elif not symmetry is None and symmetry.startswith("axi"):
+            self._harmonics = [(l, 0, 0) for l in range(L + 1)]
+            self.isNonAxi = False
+        else:
+            # (l,m,0) for cos(m phi), (l,m,1) for sin(m phi)
+            self._harmonics = [(l, m, 0) for l in range(L + 1) for m in range(l + 1)]
+            self._harmonics.extend(
+                [(l, m, 1) for l in range(1, L + 1) for m in range(1, l + 1)]
+            )
+            self.isNonAxi = True
+        self._L = L
+        self._ls = numpy.array([h[0] for h in self._harmonics])
+        self._ms = numpy.array([h[1] for h in self._harmonics])
+        self._sins = numpy.array([h[2] for h in self._harmonics], dtype=bool)
+        self._rgrid = rgrid
+        if pos is None:
+            Phi, dPhi, d2Phi = _multipole_from_density(
+                dens,
+                self._harmonics,
+                L,
+                rgrid,
+                self.isNonAxi,
+                costheta_order=max(20, 2 * L + 2)
+                if costheta_order is None
+                else costheta_order,
+                phi_order=max(20, 2 * L + 2) if phi_order is None else phi_order,
+                radial_order=radial_order,
+            )
+        else:
+            Phi, dPhi, d2Phi = _multipole_from_particles(
+                pos, mass, self._harmonics, L, rgrid
+            )
+        self._setup_splines(Phi, dPhi, d2Phi)
+        self.hasC = True
+        self.hasC_dxdv = True
+        self.hasC_dens = True
+        if normalize or (
+            isinstance(normalize, (int, float)) and not isinstance(normalize, bool)
+        ):
+            self.normalize(normalize)
+        return None
+
+    def _setup_splines(self, Phi, dPhi, d2Phi):
+        """Set up quintic Hermite splines in x = ln r for the radial functions, given their values and first two derivatives wrt r (shape [nr,nharmonics])"""
+        r = self._rgrid[:, numpy.newaxis]
+        x = numpy.log(self._rgrid)
+        # Derivatives wrt x
+        p, v, a = Phi, r * dPhi, r**2.0 * d2Phi + r * dPhi
+        h = numpy.diff(x)[:, numpy.newaxis]
+        d = p[1:] - p[:-1] - v[:-1] * h - a[:-1] * h**2.0 / 2.0
+        e = v[1:] - v[:-1] - a[:-1] * h
+        f = a[1:] - a[:-1]
+        c = numpy.empty((6,) + d.shape)
+        c[0] = (6.0 * d - 3.0 * e * h + f * h**2.0 / 2.0) / h**5.0
+        c[1] = (-15.0 * d + 7.0 * e * h - f * h**2.0) / h**4.0
+        c[2] = (10.0 * d - 4.0 * e * h + f * h**2.0 / 2.0) / h**3.0
+        c[3] = a[:-1] / 2.0
+        c[4] = v[:-1]
+        c[5] = p[:-1]
+        self._radial_interp = interpolate.PPoly(c, x, extrapolate=False)
+        self._Phi_grid = Phi
+        self._dPhi_grid = dPhi
+        # Power-law slopes for extrapolating inside of the grid: for l=0 of
+        # dPhi/dr (s > -1 for a finite mass), for l > 0 of Phi (s > 0)
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            s0 = self._rgrid[0] * d2Phi[0] / dPhi[0]
+            sl = self._rgrid[0] * dPhi[0] / Phi[0]
+        self._inner_slope = numpy.where(
+            self._ls == 0,
+            numpy.where(numpy.isfinite(s0) * (s0 > -1.0), s0, 1.0),
+            numpy.where(numpy.isfinite(sl) * (sl > 0.0), sl, self._ls),
+        )
+        return None
+
+    def _radial(self, r):
+        """Radial functions and their first two derivatives wrt r at r (shape [n,nharmonics] each)"""
+        rmin, rmax = self._rgrid[0], self._rgrid[-1]
+        x = numpy.log(r)
+        f = numpy.empty((len(r), len(self._harmonics)))
+        df = numpy.empty_like(f)
+        d2f = numpy.empty_like(f)
+        inside = (r >= rmin) * (r <= rmax)
+        if numpy.any(inside):
+            rin = r[inside, numpy.newaxis]
+            xin = numpy.clip(x[inside], *self._radial_interp.x[[0, -1]])
+            p = self._radial_interp(xin)
+            px = self._radial_interp(xin, nu=1)
+            pxx = self._radial_interp(xin, nu=2)
+            f[inside] = p
+            df[inside] = px / rin
+            d2f[inside] = (pxx - px) / rin**2.0
+        ls = self._ls[numpy.newaxis, :]
+        inner = r < rmin
+        if numpy.any(inner):
+            rin = r[inner, numpy.newaxis] / rmin
+            f0 = self._Phi_grid[0][numpy.newaxis, :]
+            df0 = self._dPhi_grid[0][numpy.newaxis, :]
+            s = self._inner_slope[numpy.newaxis, :]
+            # l=0: power-law density, dPhi/dr propto r^s; l > 0: Phi propto r^s
+            f[inner] = numpy.where(
+                ls == 0,
+                f0 + df0 * rmin / (s + 1.0) * (rin ** (s + 1.0) - 1.0),
+                f0 * rin**s,
+            )
+            df[inner] = numpy.where(
+                ls == 0, df0 * rin**s, s * f0 * rin ** (s - 1.0) / rmin
+            )
+            d2f[inner] = numpy.where(
+                ls == 0,
+                s * df0 * rin ** (s - 1.0) / rmin,
+                s * (s - 1.0) * f0 * rin ** (s - 2.0) / rmin**2.0,
+            )
+        outer = r > rmax
+        if numpy.any(outer):
+            rout = r[outer, numpy.newaxis]
+            fN = self._Phi_grid[-1][numpy.newaxis, :] * (rmax / rout) ** (ls + 1.0)
+            f[outer] = fN
+            df[outer] = -(ls + 1.0) * fN / rout
+            d2f[outer] = (ls + 1.0) * (ls + 2.0) * fN / rout**2.0
+        return f, df, d2f
+
+    def _compute(self, R, z, phi, second=False):
+        """Compute the potential and its derivatives wrt spherical r, theta, and phi"""
+        R, z, phi = numpy.broadcast_arrays(
+            numpy.atleast_1d(R).astype(float),
+            numpy.atleast_1d(z).astype(float),
+            numpy.atleast_1d(0.0 if phi is None else phi).astype(float),
+        )
+        shape = R.shape
+        R, z, phi = R.flatten(), z.flatten(), phi.flatten()
+        r, theta, phi = coords.cyl_to_spher(R, z, phi)
+        # Avoid dividing by zero at the center
+        r = numpy.where(r == 0.0, 1e-10 * self._rgrid[0], r)
+        f, df, d2f = self._radial(r)
+        P, dP, d2P = _legendre_normalized(self._L, numpy.cos(theta), numpy.sin(theta))
+        ls, ms = self._ls, self._ms
+        Y = P[ls, ms].T
+        dY = dP[ls, ms].T
+        mphi = ms[numpy.newaxis, :] * phi[:, numpy.newaxis]
+        trig = numpy.where(self._sins, numpy.sin(mphi), numpy.cos(mphi))
+        dtrig = ms * numpy.where(self._sins, numpy.cos(mphi), -numpy.sin(mphi))
+        out = {
+            "r": r,
+            "theta": theta,
+            "shape": shape,
+            "Phi": numpy.sum(f * Y * trig, axis=1),
+            "Phi_r": numpy.sum(df * Y * trig, axis=1),
+            "Phi_t": numpy.sum(f * dY * trig, axis=1),
+            "Phi_p": numpy.sum(f * Y * dtrig, axis=1),
+        }
+        if second:
+            d2Y = d2P[ls, ms].T
+            d2trig = -(ms**2.0) * trig
+            out["Phi_rr"] = numpy.sum(d2f * Y * trig, axis=1)
+            out["Phi_rt"] = numpy.sum(df * dY * trig, axis=1)
+            out["Phi_tt"] = numpy.sum(f * d2Y * trig, axis=1)
+            out["Phi_rp"] = numpy.sum(df * Y * dtrig, axis=1)
+            out["Phi_tp"] = numpy.sum(f * dY * dtrig, axis=1)
+            out["Phi_pp"] = numpy.sum(f * Y * d2trig, axis=1)
+            out["lapl"] = numpy.sum(
+                (d2f + 2.0 * df / r[:, None] - ls * (ls + 1.0) * f / r[:, None] ** 2.0)
+                * Y
+                * trig,
+                axis=1,
+            )
+        return out
+
+    def _evaluate(self, R, z, phi=0.0, t=0.0):
+        out = self._compute(R, z, phi)
+        return _reshape(out["Phi"], out["shape"])
+
+    def _Rforce(self, R, z, phi=0.0, t=0.0):
+        out = self._compute(R, z, phi)
+        st, ct = numpy.sin(out["theta"]), numpy.cos(out["theta"])
+        return _reshape(-out["Phi_r"] * st - out["Phi_t"] * ct / out["r"], out["shape"])
+
+    def _zforce(self, R, z, phi=0.0, t=0.0):
+        out = self._compute(R, z, phi)
+        st, ct = numpy.sin(out["theta"]), numpy.cos(out["theta"])
+        return _reshape(-out["Phi_r"] * ct + out["Phi_t"] * st / out["r"], out["shape"])
+
+    def _phitorque(self, R, z, phi=0.0, t=0.0):
+        out = self._compute(R, z, phi)
+        return _reshape(-out["Phi_p"], out["shape"])
+
+    def _dens(self, R, z, phi=0.0, t=0.0):
+        out = self._compute(R, z, phi, second=True)
+        return _reshape(out["lapl"] / 4.0 / numpy.pi, out["shape"])
+
+    def _second(self, R, z, phi):
+        out = self._compute(R, z, phi, second=True)
+        st, ct = numpy.sin(out["theta"]), numpy.cos(out["theta"])
+        return out, st, ct, out["r"]
+
+    def _R2deriv(self, R, z, phi=0.0, t=0.0):
+        out, st, ct, r = self._second(R, z, phi)
+        return _reshape(
+            st**2.0 * out["Phi_rr"]
+            + 2.0 * st * ct / r * out["Phi_rt"]
+            + ct**2.0 / r**2.0 * out["Phi_tt"]
+            + ct**2.0 / r * out["Phi_r"]
+            - 2.0 * st * ct / r**2.0 * out["Phi_t"],
+            out["shape"],
+        )
+
+    def _z2deriv(self, R, z, phi=0.0, t=0.0):
+        out, st, ct, r = self._second(R, z, phi)
+        return _reshape(
+            ct**2.0 * out["Phi_rr"]
+            - 2.0 * st * ct / r * out["Phi_rt"]
+            + st**2.0 / r**2.0 * out["Phi_tt"]
+            + st**2.0 / r * out["Phi_r"]
+            + 2.0 * st * ct / r**2.0 * out["Phi_t"],
+            out["shape"],
+        )
+
+    def _Rzderiv(self, R, z, phi=0.0, t=0.0):
+        out, st, ct, r = self._second(R, z, phi)
+        return _reshape(
+            st * ct * out["Phi_rr"]
+            + (ct**2.0 - st**2.0) / r * out["Phi_rt"]
+            - st * ct / r**2.0 * out["Phi_tt"]
+            - st * ct / r * out["Phi_r"]
+            + (st**2.0 - ct**2.0) / r**2.0 * out["Phi_t"],
+            out["shape"],
+        )
+
+    def _phi2deriv(self, R, z, phi=0.0, t=0.0):
+        out = self._compute(R, z, phi, second=True)
+        return _reshape(out["Phi_pp"], out["shape"])
+
+    def _Rphideriv(self, R, z, phi=0.0, t=0.0):
+        out, st, ct, r = self._second(R, z, phi)
+        return _reshape(st * out["Phi_rp"] + ct / r * out["Phi_tp"], out["shape"])
+
+    def _phizderiv(self, R, z, phi=0.0, t=0.0):
+        out, st, ct, r = self._second(R, z, phi)
+        return _reshape(ct * out["Phi_rp"] - st / r * out["Phi_tp"], out["shape"])
+
+    def _mass(self, R, z=None, t=0.0):
+        if not z is None:
+            raise AttributeError  # Hack to fall back to general
+        # Only the monopole contributes to the mass within a sphere
+        r = numpy.atleast_1d(numpy.array(R, dtype=float))
+        df = self._radial(r.flatten())[1][:, 0]
+        return _reshape(r.flatten() ** 2.0 * df / numpy.sqrt(4.0 * numpy.pi), r.shape)
+
+
+def _reshape(x, shape):
+    return x[0] if shape == (1,) else x.reshape(shape)
+
+
+def _legendre_norm(l, m):
+    """Normalization of the associated Legendre functions P_lm such that P_lm(cos theta) x {cos,sin}(m phi) are orthonormal on the sphere"""
+    lnN = 0.5 * (
+        numpy.log((2.0 * l + 1.0) / 4.0 / numpy.pi)
+        + gammaln(numpy.fabs(l - m) + 1.0)
+        - gammaln(l + m + 1.0)
+    )
+    return numpy.exp(lnN) * numpy.where(m > 0, numpy.sqrt(2.0), 1.0)
+
+
+def _legendre_normalized(L, costheta, sintheta):
+    """Associated Legendre functions P_lm(cos theta) for 0 <= m <= l <= L and their first and second derivatives wrt theta, normalized such that P_lm(cos theta) x {cos,sin}(m phi) are orthonormal on the sphere; arrays have shape [L+1,L+2,n]"""
+    P = numpy.zeros((L + 1, L + 3) + costheta.shape)
+    P[0, 0] = 1.0
+    for m in range(L + 1):
+        if m > 0:
+            P[m, m] = -(2.0 * m - 1.0) * sintheta * P[m - 1, m - 1]
+        if m + 1 <= L:
+            P[m + 1, m] = (2.0 * m + 1.0) * costheta * P[m, m]
+        for l in range(m + 2, L + 1):
+            P[l, m] = (
+                (2.0 * l - 1.0) * costheta * P[l - 1, m] - (l + m - 1.0) * P[l - 2, m]
+            ) / (l - m)
+    # dP_l^m/dtheta = [P_l^(m+1) - (l+m)(l-m+1) P_l^(m-1)]/2, using
+    # P_l^(-1) = -P_l^1/[l(l+1)]
+    l = numpy.arange(L + 1)[:, numpy.newaxis]
+    m = numpy.arange(L + 2)[numpy.newaxis, :]
+    fac = ((l + m) * (l - m + 1.0)).reshape((L + 1, L + 2) + (1,) * costheta.ndim)
+    dP = numpy.zeros((L + 1, L + 3) + costheta.shape)
+    dP[:, 1 : L + 2] = 0.5 * (P[:, 2:] - fac[:, 1:] * P[:, : L + 1])
+    dP[:, 0] = P[:, 1]
+    d2P = numpy.zeros((L + 1, L + 2) + costheta.shape)
+    d2P[:, 1:] = 0.5 * (dP[:, 2:] - fac[:, 1:] * dP[:, : L + 1])
+    d2P[:, 0] = dP[:, 1]
+    # Normalize, zeroing m > l
+    N = _legendre_norm(l, m) * (m <= l)
+    N = N.reshape((L + 1, L + 2) + (1,) * costheta.ndim)
+    return P[:, : L + 2] * N, dP[:, : L + 2] * N, d2P * N
+
+
+def _radial_functions(harmonics, rgrid, Iin, Iout):
+    """Radial functions Phi_lm and their derivatives from the inner and outer integrals Iin = int_0^r rho_lm r^(l+2) dr and Iout = int_r^infty rho_lm r^(1-l) dr"""
+    ls = numpy.array([h[0] for h in harmonics])[numpy.newaxis, :]
+    r = rgrid[:, numpy.newaxis]
+    pref = -4.0 * numpy.pi / (2.0 * ls + 1.0)
+    Phi = pref * (r ** (-ls - 1.0) * Iin + r**ls * Iout)
+    dPhi = -pref * ((ls + 1.0) * r ** (-ls - 2.0) * Iin - ls * r ** (ls - 1.0) * Iout)
+    return Phi, dPhi
+
+
+def _multipole_from_density(
+    dens, harmonics, L, rgrid, isNonAxi, costheta_order, phi_order, radial_order
+):
+    """Compute the radial functions of the multipole expansion for a density by direct integration"""
+    nharm = len(harmonics)
+    ls = numpy.array([h[0] for h in harmonics])
+    ms = numpy.array([h[1] for h in harmonics])
+    sins = numpy.array([h[2] for h in harmonics], dtype=bool)
+    # Angular quadrature: Gauss-Legendre in cos(theta), uniform in phi
+    costheta, wcostheta = leggauss(costheta_order)
+    if isNonAxi:
+        phis = numpy.arange(phi_order) * 2.0 * numpy.pi / phi_order
+        wphi = 2.0 * numpy.pi / phi_order * numpy.ones(phi_order)
+    else:
+        phis = numpy.zeros(1)
+        wphi = 2.0 * numpy.pi * numpy.ones(1)
+    sintheta = numpy.sqrt(1.0 - costheta**2.0)
+    P = _legendre_normalized(L, costheta, sintheta)[0]
+    mphi = ms[:, numpy.newaxis] * phis[numpy.newaxis, :]
+    trig = numpy.where(sins[:, numpy.newaxis], numpy.sin(mphi), numpy.cos(mphi))
+    # [nharm,ntheta,nphi] weights of the projection onto the harmonics
+    Yw = (P[ls, ms] * wcostheta)[:, :, numpy.newaxis] * (trig * wphi)[
+        :, numpy.newaxis, :
+    ]
+
+    def rho_lm(r):
+        R = r[:, None, None] * sintheta[None, :, None] * numpy.ones((1, 1, len(phis)))
+        z = r[:, None, None] * costheta[None, :, None] * numpy.ones((1, 1, len(phis)))
+        phi = numpy.ones_like(R) * phis[None, None, :]
+        try:
+            d = dens(R.flatten(), z.flatten(), phi.flatten())
+        except Exception:
+            d = numpy.vectorize(dens)(R.flatten(), z.flatten(), phi.flatten())
+        d = numpy.reshape(d, R.shape)
+        return numpy.einsum("ktp,jtp->kj", d, Yw)
+
+    # Gauss-Legendre in ln r between grid points
+    x = numpy.log(rgrid)
+    xg, wg = leggauss(radial_order)
+    xs = (
+        0.5 * (x[1:] + x[:-1])[:, numpy.newaxis]
+        + 0.5 * numpy.diff(x)[:, numpy.newaxis] * xg[numpy.newaxis, :]
+    )
+    ws = 0.5 * numpy.diff(x)[:, numpy.newaxis] * wg[numpy.newaxis, :]
+    rs = numpy.exp(xs).flatten()
+    rhos = rho_lm(rs).reshape(xs.shape + (nharm,))
+    rho_grid = rho_lm(rgrid)
+    lsx = ls[numpy.newaxis, numpy.newaxis, :]
+    # Integrals over each interval, dr = r dx
+    dIin = numpy.sum(
+        (
+            ws[:, :, numpy.newaxis]
+            * rhos
+            * numpy.exp(xs)[:, :, numpy.newaxis] ** (lsx + 3.0)
+        ),
+        axis=1,
+    )
+    dIout = numpy.sum(
+        (
+            ws[:, :, numpy.newaxis]
+            * rhos
+            * numpy.exp(xs)[:, :, numpy.newaxis] ** (2.0 - lsx)
+        ),
+        axis=1,
+    )
+    # Power-law extrapolation of the density inside rgrid[0] and outside rgrid[-1]
+    Iin0 = _powerlaw_integral(
+        rho_grid[0], rho_grid[1], rgrid[0], rgrid[1], ls + 2.0, inner=True
+    )
+    IoutN = _powerlaw_integral(
+        rho_grid[-1], rho_grid[-2], rgrid[-1], rgrid[-2], 1.0 - ls, inner=False
+    )
+    Iin = numpy.vstack((Iin0, Iin0 + numpy.cumsum(dIin, axis=0)))
+    Iout = numpy.vstack(
+        (IoutN + numpy.cumsum(dIout[::-1], axis=0)[::-1], IoutN[numpy.newaxis])
+    )
+    Phi, dPhi = _radial_functions(harmonics, rgrid, Iin, Iout)
+    r = rgrid[:, numpy.newaxis]
+    d2Phi = 4.0 * numpy.pi * rho_grid - 2.0 * dPhi / r + ls * (ls + 1.0) * Phi / r**2.0
+    return Phi, dPhi, d2Phi
+
+
+def _powerlaw_integral(rho0, rho1, r0, r1, power, inner=True):
+    """Integral of rho(r) r^power from 0 to r0 (inner) or from r0 to infinity (outer) for the power law through (r0,rho0) and (r1,rho1); zero when the power law is ill-defined or the integral diverges"""
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        gamma = numpy.log(rho1 / rho0) / numpy.log(r1 / r0)
+        expo = gamma + power + 1.0
+        out = rho0 * r0 ** (power + 1.0) / expo * (1.0 if inner else -1.0)
+    good = (rho0 * rho1 > 0.0) * numpy.isfinite(gamma)
+    good *= expo > 0.0 if inner else expo < 0.0
+    return numpy.where(good, out, 0.0)
+
+
+def _multipole_from_particles(pos, mass, harmonics, L, rgrid):
+    """Compute the radial functions of the multipole expansion for a set of particles"""
+    pos = numpy.asarray(pos, dtype=float)
+    r = numpy.sqrt(pos[0] ** 2.0 + pos[1] ** 2.0 + pos[2] ** 2.0)
+    indx = numpy.argsort(r)
+    r = r[indx]
+    x, y, z = pos[0][indx], pos[1][indx], pos[2][indx]
+    mass = mass * numpy.ones_like(r) if numpy.ndim(mass) == 0 else mass[indx]
+    costheta = numpy.where(r > 0.0, z / numpy.where(r > 0.0, r, 1.0), 1.0)
+    sintheta = numpy.sqrt(1.0 - costheta**2.0)
+    phi = numpy.arctan2(y, x)
+    # Particles strictly inside each grid radius
+    nin = numpy.searchsorted(r, rgrid)
+    Iin = numpy.empty((len(rgrid), len(harmonics)))
+    Iout = numpy.empty_like(Iin)
+    P = _legendre_normalized(L, costheta, sintheta)[0]
+    for jj, (l, m, sin) in enumerate(harmonics):
+        mY = mass * P[l, m] * (numpy.sin(m * phi) if sin else numpy.cos(m * phi))
+        cumin = numpy.concatenate(([0.0], numpy.cumsum(mY * r**l)))
+        with numpy.errstate(divide="ignore"):
+            qout = numpy.where(r > 0.0, mY * r ** (-l - 1.0), 0.0)
+        cumout = numpy.concatenate(([0.0], numpy.cumsum(qout)))
+        Iin[:, jj] = cumin[nin]
+        Iout[:, jj] = cumout[-1] - cumout[nin]
+    Phi, dPhi = _radial_functions(harmonics, rgrid, Iin, Iout)
+    # The density is noisy, so get the second derivative from the first
+    d2Phi = numpy.gradient(dPhi, rgrid, axis=0)
+    return Phi, dPhi, d2Phi
@@ -3,8 +3,6 @@
 #                          present when integrating orbits in a non-intertial
 #                          frame
 ###############################################################################
-import hashlib
-
 import numpy
 import numpy.linalg
 
@@ -168,18 +166,12 @@ class NonInertialFrameForce(DissipativeForce):
                         [-self._Omegadot[1], self._Omegadot[0], 0.0],
                     ]
                 )
-        self._force_hash = None
         self.hasC = True
         return None
 
     def _force(self, R, z, phi, t, v):
         """Internal function that computes the fictitious forces in rectangular
         coordinates"""
-        new_hash = hashlib.md5(
-            numpy.array([R, phi, z, v[0], v[1], v[2], t])
-        ).hexdigest()
-        if new_hash == self._force_hash:
-            return self._cached_force
         x, y, z = coords.cyl_to_rect(R, phi, z)
         vx, vy, vz = coords.cyl_to_rect_vec(v[0], v[1], v[2], phi)
         force = numpy.zeros(3)
@@ -264,17 +256,22 @@ class NonInertialFrameForce(DissipativeForce):
                         force -= numpy.dot(self._Omegadot_for_cross, self._x0_py(t))
         if self._lin_acc:
             force -= self._a0_py(t)
-        self._force_hash = new_hash
-        self._cached_force = force
         return force
 
-    def _Rforce(self, R, z, phi=0.0, t=0.0, v=None):
+    def _forces(self, R, z, phi=0.0, t=0.0, v=None):
         force = self._force(R, z, phi, t, v)
-        return numpy.cos(phi) * force[0] + numpy.sin(phi) * force[1]
+        cp, sp = numpy.cos(phi), numpy.sin(phi)
+        return (
+            cp * force[0] + sp * force[1],
+            force[2],
+            R * (-sp * force[0] + cp * force[1]),
+        )
+
+    def _Rforce(self, R, z, phi=0.0, t=0.0, v=None):
+        return self._forces(R, z, phi=phi, t=t, v=v)[0]
 
     def _phitorque(self, R, z, phi=0.0, t=0.0, v=None):
-        force = self._force(R, z, phi, t, v)
-        return R * (-numpy.sin(phi) * force[0] + numpy.cos(phi) * force[1])
+        return self._forces(R, z, phi=phi, t=t, v=v)[2]
 
     def _zforce(self, R, z, phi=0.0, t=0.0, v=None):
-        return self._force(R, z, phi, t, v)[2]
+        return self._forces(R, z, phi=phi, t=t, v=v)[1]
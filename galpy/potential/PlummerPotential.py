@@ -57,6 +57,13 @@ class PlummerPotential(Potential):
     def _evaluate(self, R, z, phi=0.0, t=0.0):
         return -1.0 / numpy.sqrt(R**2.0 + z**2.0 + self._b2)
 
+    def _jax_params(self):
+        return {"amp": self._amp, "b": self._b}
+
+    def _evaluate_jax(self, params, R, z, phi=0.0, t=0.0):
+        # No need for actual JAX!
+        return -params["amp"] * (R**2.0 + z**2.0 + params["b"] ** 2.0) ** -0.5
+
     def _Rforce(self, R, z, phi=0.0, t=0.0):
         dPhidrr = -((R**2.0 + z**2.0 + self._b2) ** -1.5)
         return dPhidrr * R
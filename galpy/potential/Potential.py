@@ -13,13 +13,15 @@
 #    for epicycle frequency
 #      function _R2deriv(self,R,z,phi) return d2 Phi dR2
 ###############################################################################
+import inspect
 import os
 import os.path
 import pickle
+import warnings
 from functools import wraps
 
 import numpy
-from scipy import integrate, optimize
+from scipy import integrate, interpolate, optimize
 
 from ..util import conversion, coords, galpyWarning, plot
 from ..util._optional_deps import _APY_LOADED
@@ -113,6 +115,23 @@ class Potential(Force):
         self.hasC_dens = False
         return None
 
+    @property
+    def raw(self):
+        """
+        Low-level interface to the potential that skips unit parsing, conversion to physical units, and input checking.
+
+        Returns
+        -------
+        RawPotential
+            Object with methods __call__, Rforce, zforce, phitorque, dens, R2deriv, z2deriv, Rzderiv, phi2deriv, Rphideriv, phizderiv, rforce, and r2deriv that have the signature (R,z,phi=0.,t=0.) and take and return quantities in internal units only.
+
+        Notes
+        -----
+        - Useful for evaluating the potential for scalar inputs many times, e.g., inside root finders or quadratures, where the overhead of the decorators of the regular methods dominates.
+        - 2026-10-19 - Written - Agent (local)
+        """
+        return RawPotential(self)
+
     @potential_physical_input
     @physical_conversion("energy", pop=True)
     def __call__(self, R, z, phi=0.0, t=0.0, dR=0, dphi=0):
@@ -357,8 +376,17 @@ class Potential(Force):
         -----
         - 2018-08-19 - Written - Bovy (UofT)
         - 2021-04-19 - Adjusted for non-z-symmetric densities - Bovy (UofT)
+        - 2026-10-19 - Use tabulated surface densities when the mass cache is turned on - Agent (local)
 
         """
+        if (
+            not forcepoisson
+            and getattr(self, "_mass_cache", None) is not None
+            and type(self)._surfdens is Potential._surfdens
+        ):
+            out = self._mass_cache.surfdens(self, R, z, phi, t)
+            if out is not None:
+                return out
         try:
             if forcepoisson:
                 raise AttributeError  # Hack!
@@ -441,6 +469,7 @@ class Potential(Force):
         - 2019-08-15 - Added spherical warning - Bovy (UofT)
         - 2021-03-15 - Changed to integrate to spherical shell for z is None slab otherwise - Bovy (UofT)
         - 2021-03-18 - Switched to using Gauss' theorem - Bovy (UofT)
+        - 2026-10-19 - Use tabulated masses when the mass cache is turned on - Agent (local)
 
         """
         from .EllipsoidalPotential import EllipsoidalPotential
@@ -455,6 +484,14 @@ class Potential(Force):
             )
         if not z is None:  # Make sure z is positive, bc we integrate from -z to z
             z = numpy.fabs(z)
+        elif (
+            not forceint
+            and getattr(self, "_mass_cache", None) is not None
+            and not hasattr(self, "_mass")
+        ):
+            out = self._mass_cache.mass(self, R, t)
+            if out is not None:
+                return out
         try:
             if forceint:
                 raise AttributeError  # Hack!
@@ -483,6 +520,52 @@ class Potential(Force):
                     )[0]
                 )
 
+    def turn_mass_cache_on(self, rmin=1e-4, rmax=1e3, rtol=1e-6):
+        """
+        Turn on caching of the enclosed mass M(<r) (for z=None), its inverse, and the surface density Sigma(R;z) in monotone spline tables that are built on first use; these are used instead of numerical integration by mass, surfdens, tdyn, and mvir (and thus by the distribution-function samplers) and to invert the mass profile in rhalf, for radii within the tabulated range.
+
+        Parameters
+        ----------
+        rmin : float or Quantity, optional
+            Minimum radius of the tables (default: 1e-4).
+        rmax : float or Quantity, optional
+            Maximum radius of the tables (default: 1e3).
+        rtol : float, optional
+            Relative tolerance of the tables, which are refined until the interpolation error at the midpoints between the nodes is below this tolerance (default: 1e-6).
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        - Tables are rebuilt when the parameters of the potential change (array parameters, e.g., expansion coefficients, need to be replaced rather than modified in place for this to be detected).
+        - 2026-10-19 - Written - Agent (local)
+
+        """
+        self._mass_cache = _MassCache(
+            conversion.parse_length(rmin, ro=self._ro),
+            conversion.parse_length(rmax, ro=self._ro),
+            rtol,
+        )
+        return None
+
+    def turn_mass_cache_off(self):
+        """
+        Turn off caching of the enclosed mass and surface density.
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        - 2026-10-19 - Written - Agent (local)
+
+        """
+        self._mass_cache = None
+        return None
+
     @physical_conversion("position", pop=True)
     def rhalf(self, t=0.0, INF=numpy.inf):
         """
@@ -758,6 +841,26 @@ class Potential(Force):
                 )
             return 0.0
 
+    def _forces(self, R, z, phi=0.0, t=0.0):
+        """Evaluate the radial force, the vertical force, and the azimuthal torque (without the amplitude) at once; potentials that compute these together (e.g., from their rectangular or spherical forces) implement this to do so in a single pass and use it for their individual forces"""
+        return (
+            self._Rforce(R, z, phi=phi, t=t),
+            self._zforce(R, z, phi=phi, t=t),
+            (
+                self._phitorque(R, z, phi=phi, t=t)
+                if self.isNonAxi or hasattr(self, "_phitorque")
+                else 0.0
+            ),
+        )
+
+    def _forces_nodecorator(self, R, z, phi=0.0, t=0.0):
+        # Separate, so it can be used during orbit integration
+        try:
+            Rforce, zforce, phitorque = self._forces(R, z, phi=phi, t=t)
+        except AttributeError:  # pragma: no cover
+            raise PotentialError("Forces not implemented for this potential")
+        return self._amp * Rforce, self._amp * zforce, self._amp * phitorque
+
     @potential_physical_input
     @physical_conversion("energy", pop=True)
     def phi2deriv(self, R, z, phi=0.0, t=0.0):
@@ -1746,8 +1849,9 @@ class Potential(Force):
                 "Tidal tensor calculation is currently only implemented for axisymmetric potentials"
             )
         # Evaluate forces, angles and derivatives
-        Rderiv = -self.Rforce(R, z, phi=phi, t=t, use_physical=False)
-        phideriv = -self.phitorque(R, z, phi=phi, t=t, use_physical=False)
+        Rforce, _, phitorque = self._forces_nodecorator(R, z, phi=phi, t=t)
+        Rderiv = -Rforce
+        phideriv = -phitorque
         R2deriv = self.R2deriv(R, z, phi=phi, t=t, use_physical=False)
         z2deriv = self.z2deriv(R, z, phi=phi, t=t, use_physical=False)
         phi2deriv = self.phi2deriv(R, z, phi=phi, t=t, use_physical=False)
@@ -1853,6 +1957,258 @@ class Potential(Force):
         return zvc_range(self, E, Lz, phi=phi, t=t, use_physical=False)
 
 
+_RAW_METHODS = {}
+
+
+def _raw_method(Pot, name):
+    """Return the method name of Pot's class without its unit-handling decorators (cached per class)"""
+    try:
+        return _RAW_METHODS[(type(Pot), name)]
+    except KeyError:
+        func = inspect.unwrap(getattr(type(Pot), name))
+        _RAW_METHODS[(type(Pot), name)] = func
+        return func
+
+
+class RawPotential:
+    """Low-level interface to a Potential's methods that takes and returns quantities in internal units, without unit parsing, conversion to physical units, or input checking"""
+
+    __slots__ = ("_pot",)
+
+    def __init__(self, pot):
+        """
+        Initialize a RawPotential.
+
+        Parameters
+        ----------
+        pot : Potential instance
+            The potential to provide the low-level interface for.
+
+        Notes
+        -----
+        - 2026-10-19 - Written - Agent (local)
+        """
+        self._pot = pot
+
+    def __call__(self, R, z, phi=0.0, t=0.0):
+        return self._pot._call_nodecorator(R, z, phi=phi, t=t)
+
+    def Rforce(self, R, z, phi=0.0, t=0.0):
+        return self._pot._Rforce_nodecorator(R, z, phi=phi, t=t)
+
+    def zforce(self, R, z, phi=0.0, t=0.0):
+        return self._pot._zforce_nodecorator(R, z, phi=phi, t=t)
+
+    def phitorque(self, R, z, phi=0.0, t=0.0):
+        return self._pot._phitorque_nodecorator(R, z, phi=phi, t=t)
+
+    def dens(self, R, z, phi=0.0, t=0.0):
+        return _raw_method(self._pot, "dens")(self._pot, R, z, phi=phi, t=t)
+
+    def R2deriv(self, R, z, phi=0.0, t=0.0):
+        return _raw_method(self._pot, "R2deriv")(self._pot, R, z, phi=phi, t=t)
+
+    def z2deriv(self, R, z, phi=0.0, t=0.0):
+        return _raw_method(self._pot, "z2deriv")(self._pot, R, z, phi=phi, t=t)
+
+    def Rzderiv(self, R, z, phi=0.0, t=0.0):
+        return _raw_method(self._pot, "Rzderiv")(self._pot, R, z, phi=phi, t=t)
+
+    def phi2deriv(self, R, z, phi=0.0, t=0.0):
+        return _raw_method(self._pot, "phi2deriv")(self._pot, R, z, phi=phi, t=t)
+
+    def Rphideriv(self, R, z, phi=0.0, t=0.0):
+        return _raw_method(self._pot, "Rphideriv")(self._pot, R, z, phi=phi, t=t)
+
+    def phizderiv(self, R, z, phi=0.0, t=0.0):
+        return _raw_method(self._pot, "phizderiv")(self._pot, R, z, phi=phi, t=t)
+
+    def rforce(self, R, z, phi=0.0, t=0.0):
+        r = numpy.sqrt(R**2.0 + z**2.0)
+        return (
+            self.Rforce(R, z, phi=phi, t=t) * R + self.zforce(R, z, phi=phi, t=t) * z
+        ) / r
+
+    def r2deriv(self, R, z, phi=0.0, t=0.0):
+        r2 = R**2.0 + z**2.0
+        return (
+            self.R2deriv(R, z, phi=phi, t=t) * R**2.0
+            + 2.0 * self.Rzderiv(R, z, phi=phi, t=t) * R * z
+            + self.z2deriv(R, z, phi=phi, t=t) * z**2.0
+        ) / r2
+
+
+class _Identity:
+    """Wrapper that compares equal only to a wrapper of the same object"""
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __eq__(self, other):
+        return isinstance(other, _Identity) and self.obj is other.obj
+
+    def __hash__(self):
+        return id(self.obj)
+
+
+def _cache_params_key(pot, arrays_by_identity=False):
+    """Key that identifies the current parameters of a potential, used to invalidate cached tables; with arrays_by_identity=True, array parameters are compared by identity rather than by content, which is cheap, but does not detect arrays that are modified in place"""
+    out = []
+    for key, val in sorted(vars(pot).items()):
+        if key in ("_mass_cache", "_ro", "_vo", "_roSet", "_voSet"):
+            continue
+        if isinstance(val, (bool, int, float, complex, str, type(None))):
+            out.append((key, val))
+        elif isinstance(val, numpy.ndarray):
+            if arrays_by_identity:
+                out.append((key, _Identity(val)))
+            else:
+                out.append((key, val.shape, val.tobytes()))
+        elif isinstance(val, Force):
+            out.append((key, _cache_params_key(val, arrays_by_identity)))
+        elif isinstance(val, (list, tuple)) and all(isinstance(v, Force) for v in val):
+            out.append(
+                (key, tuple(_cache_params_key(v, arrays_by_identity) for v in val))
+            )
+    return tuple(out)
+
+
+def _monotone_spline(lnr, vals):
+    """Monotonicity-preserving spline of vals(ln r), interpolated in log space when vals > 0"""
+    if numpy.all(vals > 0.0):
+        spl = interpolate.PchipInterpolator(lnr, numpy.log(vals))
+        return lambda r: numpy.exp(spl(numpy.log(r)))
+    spl = interpolate.PchipInterpolator(lnr, vals)
+    return lambda r: spl(numpy.log(r))
+
+
+class _MassCache:
+    """Monotone spline tables of the enclosed mass M(<r), its inverse, and the surface density Sigma(R;z) of a potential, built on first use and rebuilt when the potential's parameters change"""
+
+    def __init__(self, rmin, rmax, rtol, nmax=4097):
+        self._rmin = rmin
+        self._rmax = rmax
+        self._rtol = rtol
+        self._nmax = nmax
+        self._key = None
+        self._tables = {}
+        self._building = False
+
+    def __getstate__(self):
+        # Tables contain splines that cannot be pickled, so rebuild them
+        state = self.__dict__.copy()
+        state["_key"] = None
+        state["_tables"] = {}
+        return state
+
+    def _table(self, pot, kind, func, args):
+        """Return the table of func(r) for this kind and args, building it if necessary"""
+        # Compare array parameters by identity, to avoid copying large
+        # coefficient or grid arrays on every call
+        key = _cache_params_key(pot, arrays_by_identity=True)
+        if key != self._key:
+            self._tables = {}
+            self._key = key
+        if (kind,) + args in self._tables:
+            return self._tables[(kind,) + args]
+        self._building = True
+        try:
+            lnr = numpy.linspace(numpy.log(self._rmin), numpy.log(self._rmax), 33)
+            vals = numpy.array([func(r) for r in numpy.exp(lnr)])
+            refine = numpy.ones(len(lnr) - 1, dtype="bool")
+            dlnrmin = 2.0 * (lnr[-1] - lnr[0]) / self._nmax
+            while True:
+                # Add the midpoints of the intervals that need refinement and
+                # check the spline through the current nodes there
+                spl = _monotone_spline(lnr, vals)
+                lnrmid = 0.5 * (lnr[1:] + lnr[:-1])[refine]
+                valsmid = numpy.array([func(r) for r in numpy.exp(lnrmid)])
+                bad = numpy.fabs(spl(numpy.exp(lnrmid)) - valsmid) > self._rtol * (
+                    numpy.maximum(
+                        numpy.fabs(valsmid), 1e-12 * numpy.amax(numpy.fabs(vals))
+                    )
+                )
+                sindx = numpy.argsort(numpy.concatenate((lnr, lnrmid)))
+                lnr = numpy.concatenate((lnr, lnrmid))[sindx]
+                vals = numpy.concatenate((vals, valsmid))[sindx]
+                bad = numpy.concatenate((numpy.zeros(len(sindx) - len(bad)), bad))[
+                    sindx
+                ].astype("bool")
+                # Don't refine below the resolution of a table with nmax nodes
+                refine = (bad[1:] + bad[:-1]) * (numpy.diff(lnr) > dlnrmin)
+                if not numpy.any(refine) or len(lnr) > self._nmax:
+                    break
+            if numpy.any(bad):
+                warnings.warn(
+                    f"Cached {kind} table did not reach the requested relative tolerance of {self._rtol} everywhere",
+                    galpyWarning,
+                )
+        finally:
+            self._building = False
+        table = {"lnr": lnr, "vals": vals, "spline": _monotone_spline(lnr, vals)}
+        self._tables[(kind,) + args] = table
+        return table
+
+    def _in_range(self, R):
+        return numpy.all(R >= self._rmin) and numpy.all(R <= self._rmax)
+
+    def mass(self, pot, R, t):
+        """M(<R) from the table or None when R is outside of the tabulated range (or the table is being built); for arrays, only the elements outside of the range are computed directly"""
+        if self._building or numpy.ndim(t) > 0:
+            return None
+        elif not self._in_range(R):
+            if numpy.ndim(R) == 0:
+                return None
+            indx = (R >= self._rmin) * (R <= self._rmax)
+            out = numpy.empty(numpy.shape(R))
+            out[~indx] = [pot.mass(r, t=t, use_physical=False) for r in R[~indx]]
+            if numpy.any(indx):
+                out[indx] = self.mass(pot, R[indx], t)
+            return out
+        return self._table(
+            pot, "mass", lambda r: pot.mass(r, t=t, use_physical=False), (t,)
+        )["spline"](R)
+
+    def rmass(self, pot, M, t):
+        """Inverse of M(<r) from the table or None when M is outside of the tabulated range or M(<r) is not strictly increasing"""
+        if self._building:
+            return None
+        table = self._table(
+            pot, "mass", lambda r: pot.mass(r, t=t, use_physical=False), (t,)
+        )
+        if "inverse" not in table:
+            if numpy.all(numpy.diff(table["vals"]) > 0.0) and table["vals"][0] > 0.0:
+                spl = interpolate.PchipInterpolator(
+                    numpy.log(table["vals"]), table["lnr"]
+                )
+                table["inverse"] = lambda m: numpy.exp(spl(numpy.log(m)))
+            else:
+                table["inverse"] = None
+        if (
+            table["inverse"] is None
+            or numpy.any(M < table["vals"][0])
+            or numpy.any(M > table["vals"][-1])
+        ):
+            return None
+        return table["inverse"](M)
+
+    def surfdens(self, pot, R, z, phi, t):
+        """Sigma(R;z) from the table or None when R is outside of the tabulated range (or the table is being built)"""
+        if self._building or not self._in_range(R) or numpy.ndim(z) > 0:
+            return None
+        if numpy.ndim(phi) > 0 or numpy.ndim(t) > 0:
+            return None
+        z = numpy.fabs(z)
+        return self._table(
+            pot,
+            "surfdens",
+            lambda r: pot.surfdens(r, z, phi=phi, t=t, use_physical=False),
+            (z, phi, t),
+        )["spline"](R)
+
+
 class PotentialError(Exception):  # pragma: no cover
     def __init__(self, value):
         self.value = value
@@ -1861,10 +2217,74 @@ class PotentialError(Exception):  # pragma: no cover
         return repr(self.value)
 
 
+def _evaluate_nondissipative(Pot, method, R, z, phi=None, t=0.0, **kwargs):
+    """Sum method evaluated for all non-dissipative potentials in Pot in internal units"""
+    if not isinstance(Pot, list):
+        Pot = [Pot]
+    out = 0.0
+    for pot in Pot:
+        if not pot.isDissipative:
+            out += getattr(pot, method)(
+                R, z, phi=phi, t=t, use_physical=False, **kwargs
+            )
+    return out
+
+
+def _evaluate_backend(Pot, quantity, R, z, phi, t, pyfunc, backend):
+    """Evaluate quantity for (a list of) potentials with the given backend; with backend='c', potentials that have the quantity implemented in C are evaluated in C for all points at once and pyfunc(list of potentials,R,z,phi,t) is used for the others; with backend='jax', all potentials are evaluated with their JAX implementation"""
+    if backend == "python":
+        return pyfunc(Pot, R, z, phi, t)
+    elif backend == "jax":
+        from ._jax import evaluate_jax
+
+        out = numpy.asarray(
+            evaluate_jax(Pot, quantity, R, z, phi=0.0 if phi is None else phi, t=t)
+        )
+        return out[()] if out.ndim == 0 else out
+    elif backend != "c":
+        raise ValueError(
+            f"backend={backend} not understood; should be 'python', 'c', or 'jax'"
+        )
+    elif quantity in ("R2deriv", "phi2deriv", "Rphideriv"):
+        raise ValueError(
+            f"backend='c' is not supported for {quantity}; should be 'python' or 'jax'"
+        )
+    from ..orbit.integrateFullOrbit import _ext_loaded, evaluatePotentialQuantity_c
+    from .NullPotential import NullPotential
+
+    Pot = flatten(Pot)
+    if not isinstance(Pot, list):
+        Pot = [Pot]
+    cpot = [
+        p
+        for p in Pot
+        if not p.isDissipative and not isinstance(p, NullPotential) and _check_c(p)
+    ]
+    if not _ext_loaded or len(cpot) == 0:
+        return pyfunc(Pot, R, z, phi, t)
+    pypot = [p for p in Pot if not numpy.any([p is c for c in cpot])]
+    if phi is None:
+        phi = 0.0
+    R, z, phi, t = numpy.broadcast_arrays(R, z, phi, t)
+    out_shape = R.shape
+    R, z, phi, t = (x.flatten() for x in (R, z, phi, t))
+    out, incl = evaluatePotentialQuantity_c(cpot, quantity, R, z, phi, t)
+    pypot.extend([p for p, i in zip(cpot, incl) if not i])
+    if len(pypot) > 0:
+        try:
+            out = out + pyfunc(pypot, R, z, phi, t)
+        except (TypeError, ValueError):  # Python implementation needs scalars
+            out = out + numpy.vectorize(
+                lambda R, z, phi, t: pyfunc(pypot, R, z, phi, t), otypes=[float]
+            )(R, z, phi, t)
+    out = numpy.reshape(out, out_shape)
+    return out[()] if out.ndim == 0 else out
+
+
 @potential_positional_arg
 @potential_physical_input
 @physical_conversion("energy", pop=True)
-def evaluatePotentials(Pot, R, z, phi=None, t=0.0, dR=0, dphi=0):
+def evaluatePotentials(Pot, R, z, phi=None, t=0.0, dR=0, dphi=0, backend="python"):
     """
     Evaluate a potential or sum of potentials.
 
@@ -1885,6 +2305,8 @@ def evaluatePotentials(Pot, R, z, phi=None, t=0.0, dR=0, dphi=0):
     dphi : int, optional
         If set to a non-zero integer, return the dphi derivative instead (default: 0).
 
+    backend : {'python', 'c', 'jax'}, optional
+        If 'c', evaluate the potentials that have this quantity implemented in C for all input points at once in C (parallelized with OpenMP) and fall back on the Python implementation for the others; if 'jax', evaluate all potentials using their JAX implementation (see galpy.potential.evaluate_jax; default: 'python').
     Returns
     -------
     float or Quantity
@@ -1900,7 +2322,20 @@ def evaluatePotentials(Pot, R, z, phi=None, t=0.0, dR=0, dphi=0):
         raise PotentialError(
             "The (list of) Potential instances is non-axisymmetric, but you did not provide phi"
         )
-    return _evaluatePotentials(Pot, R, z, phi=phi, t=t, dR=dR, dphi=dphi)
+    if dR != 0 or dphi != 0:
+        backend = "python"
+    return _evaluate_backend(
+        Pot,
+        "potential",
+        R,
+        z,
+        phi,
+        t,
+        lambda pot, R, z, phi, t: _evaluatePotentials(
+            pot, R, z, phi=phi, t=t, dR=dR, dphi=dphi
+        ),
+        backend,
+    )
 
 
 def _evaluatePotentials(Pot, R, z, phi=None, t=0.0, dR=0, dphi=0):
@@ -1919,7 +2354,7 @@ def _evaluatePotentials(Pot, R, z, phi=None, t=0.0, dR=0, dphi=0):
 @potential_positional_arg
 @potential_physical_input
 @physical_conversion("density", pop=True)
-def evaluateDensities(Pot, R, z, phi=None, t=0.0, forcepoisson=False):
+def evaluateDensities(Pot, R, z, phi=None, t=0.0, forcepoisson=False, backend="python"):
     """
     Evaluate the density corresponding to a potential or sum of potentials.
 
@@ -1938,6 +2373,8 @@ def evaluateDensities(Pot, R, z, phi=None, t=0.0, forcepoisson=False):
     forcepoisson : bool, optional
         If True, calculate the density through the Poisson equation, even if an explicit expression for the density exists.
 
+    backend : {'python', 'c', 'jax'}, optional
+        If 'c', evaluate the potentials that have this quantity implemented in C for all input points at once in C (parallelized with OpenMP) and fall back on the Python implementation for the others; if 'jax', evaluate all potentials using their JAX implementation (see galpy.potential.evaluate_jax; default: 'python').
     Returns
     -------
     float or Quantity
@@ -1949,24 +2386,25 @@ def evaluateDensities(Pot, R, z, phi=None, t=0.0, forcepoisson=False):
     - 2013-12-28 - Added forcepoisson - Bovy (IAS)
 
     """
-    isList = isinstance(Pot, list)
     nonAxi = _isNonAxi(Pot)
     if nonAxi and phi is None:
         raise PotentialError(
             "The (list of) Potential instances is non-axisymmetric, but you did not provide phi"
         )
-    if isList:
-        out = 0.0
-        for pot in Pot:
-            if not pot.isDissipative:
-                out += pot.dens(
-                    R, z, phi=phi, t=t, forcepoisson=forcepoisson, use_physical=False
-                )
-        return out
-    elif not Pot.isDissipative:
-        return Pot.dens(
-            R, z, phi=phi, t=t, forcepoisson=forcepoisson, use_physical=False
-        )
+    if forcepoisson:
+        backend = "python"
+    return _evaluate_backend(
+        Pot,
+        "dens",
+        R,
+        z,
+        phi,
+        t,
+        lambda pot, R, z, phi, t: _evaluate_nondissipative(
+            pot, "dens", R, z, phi=phi, t=t, forcepoisson=forcepoisson
+        ),
+        backend,
+    )
 
 
 @potential_positional_arg
@@ -2072,7 +2510,7 @@ def mass(Pot, R, z=None, t=0.0, forceint=False):
 @potential_positional_arg
 @potential_physical_input
 @physical_conversion("force", pop=True)
-def evaluateRforces(Pot, R, z, phi=None, t=0.0, v=None):
+def evaluateRforces(Pot, R, z, phi=None, t=0.0, v=None, backend="python"):
     """
     Evaluate the radial force F_R(R,z,phi,t) of a potential, force or a list of potentials/forces.
 
@@ -2091,6 +2529,8 @@ def evaluateRforces(Pot, R, z, phi=None, t=0.0, v=None):
     v : numpy.ndarray or Quantity, optional
         Current velocity in cylindrical coordinates. Required when including dissipative forces. Default is None.
 
+    backend : {'python', 'c', 'jax'}, optional
+        If 'c', evaluate the potentials that have this quantity implemented in C for all input points at once in C (parallelized with OpenMP) and fall back on the Python implementation for the others; if 'jax', evaluate all potentials using their JAX implementation (see galpy.potential.evaluate_jax; default: 'python').
     Returns
     -------
     F_R : float or Quantity
@@ -2112,7 +2552,16 @@ def evaluateRforces(Pot, R, z, phi=None, t=0.0, v=None):
         raise PotentialError(
             "The (list of) Potential instances includes dissipative components, but you did not provide the 3D velocity (required for dissipative forces)"
         )
-    return _evaluateRforces(Pot, R, z, phi=phi, t=t, v=v)
+    return _evaluate_backend(
+        Pot,
+        "Rforce",
+        R,
+        z,
+        phi,
+        t,
+        lambda pot, R, z, phi, t: _evaluateRforces(pot, R, z, phi=phi, t=t, v=v),
+        backend,
+    )
 
 
 def _evaluateRforces(Pot, R, z, phi=None, t=0.0, v=None):
@@ -2135,7 +2584,7 @@ def _evaluateRforces(Pot, R, z, phi=None, t=0.0, v=None):
 @potential_positional_arg
 @potential_physical_input
 @physical_conversion("energy", pop=True)
-def evaluatephitorques(Pot, R, z, phi=None, t=0.0, v=None):
+def evaluatephitorques(Pot, R, z, phi=None, t=0.0, v=None, backend="python"):
     """
     Evaluate the azimuthal torque due to a potential, force or a list of potentials/forces.
 
@@ -2154,6 +2603,8 @@ def evaluatephitorques(Pot, R, z, phi=None, t=0.0, v=None):
     v : numpy.ndarray, optional
         Current velocity in cylindrical coordinates. Required when including dissipative forces. Default is None.
 
+    backend : {'python', 'c', 'jax'}, optional
+        If 'c', evaluate the potentials that have this quantity implemented in C for all input points at once in C (parallelized with OpenMP) and fall back on the Python implementation for the others; if 'jax', evaluate all potentials using their JAX implementation (see galpy.potential.evaluate_jax; default: 'python').
     Returns
     -------
     float or Quantity
@@ -2175,7 +2626,16 @@ def evaluatephitorques(Pot, R, z, phi=None, t=0.0, v=None):
         raise PotentialError(
             "The (list of) Potential instances includes dissipative, but you did not provide the 3D velocity (required for dissipative forces"
         )
-    return _evaluatephitorques(Pot, R, z, phi=phi, t=t, v=v)
+    return _evaluate_backend(
+        Pot,
+        "phitorque",
+        R,
+        z,
+        phi,
+        t,
+        lambda pot, R, z, phi, t: _evaluatephitorques(pot, R, z, phi=phi, t=t, v=v),
+        backend,
+    )
 
 
 def _evaluatephitorques(Pot, R, z, phi=None, t=0.0, v=None):
@@ -2198,7 +2658,7 @@ def _evaluatephitorques(Pot, R, z, phi=None, t=0.0, v=None):
 @potential_positional_arg
 @potential_physical_input
 @physical_conversion("force", pop=True)
-def evaluatezforces(Pot, R, z, phi=None, t=0.0, v=None):
+def evaluatezforces(Pot, R, z, phi=None, t=0.0, v=None, backend="python"):
     """
     Evaluate the vertical force at a given position due to a potential, force or a list of potentials/forces.
 
@@ -2217,6 +2677,8 @@ def evaluatezforces(Pot, R, z, phi=None, t=0.0, v=None):
     v : numpy.ndarray or Quantity, optional
         Current velocity in cylindrical coordinates. Required when including dissipative forces. Default is None.
 
+    backend : {'python', 'c', 'jax'}, optional
+        If 'c', evaluate the potentials that have this quantity implemented in C for all input points at once in C (parallelized with OpenMP) and fall back on the Python implementation for the others; if 'jax', evaluate all potentials using their JAX implementation (see galpy.potential.evaluate_jax; default: 'python').
     Returns
     -------
     float or Quantity
@@ -2238,7 +2700,16 @@ def evaluatezforces(Pot, R, z, phi=None, t=0.0, v=None):
         raise PotentialError(
             "The (list of) Potential instances includes dissipative, but you did not provide the 3D velocity (required for dissipative forces"
         )
-    return _evaluatezforces(Pot, R, z, phi=phi, t=t, v=v)
+    return _evaluate_backend(
+        Pot,
+        "zforce",
+        R,
+        z,
+        phi,
+        t,
+        lambda pot, R, z, phi, t: _evaluatezforces(pot, R, z, phi=phi, t=t, v=v),
+        backend,
+    )
 
 
 def _evaluatezforces(Pot, R, z, phi=None, t=0.0, v=None):
@@ -2258,6 +2729,22 @@ def _evaluatezforces(Pot, R, z, phi=None, t=0.0, v=None):
         return Pot._zforce_nodecorator(R, z, phi=phi, t=t)
 
 
+def _evaluateforces(Pot, R, z, phi=None, t=0.0, v=None):
+    """Raw, undecorated function for internal use that returns the radial force, the vertical force, and the azimuthal torque at once"""
+    if not isinstance(Pot, list):
+        Pot = [Pot]
+    Rforce, zforce, phitorque = 0.0, 0.0, 0.0
+    for pot in Pot:
+        if pot.isDissipative:
+            forces = pot._forces_nodecorator(R, z, phi=phi, t=t, v=v)
+        else:
+            forces = pot._forces_nodecorator(R, z, phi=phi, t=t)
+        Rforce += forces[0]
+        zforce += forces[1]
+        phitorque += forces[2]
+    return Rforce, zforce, phitorque
+
+
 @potential_positional_arg
 @potential_physical_input
 @physical_conversion("force", pop=True)
@@ -2318,7 +2805,7 @@ def evaluaterforces(Pot, R, z, phi=None, t=0.0, v=None):
 @potential_positional_arg
 @potential_physical_input
 @physical_conversion("forcederivative", pop=True)
-def evaluateR2derivs(Pot, R, z, phi=None, t=0.0):
+def evaluateR2derivs(Pot, R, z, phi=None, t=0.0, backend="python"):
     """
     Evaluate the second (cylindrical) radial derivative of a potential or sum of potentials.
 
@@ -2335,6 +2822,8 @@ def evaluateR2derivs(Pot, R, z, phi=None, t=0.0):
     t : float or Quantity, optional
         Time (default: 0.0).
 
+    backend : {'python', 'jax'}, optional
+        If 'jax', evaluate all potentials using their JAX implementation (see galpy.potential.evaluate_jax; default: 'python').
     Returns
     -------
     float or Quantity
@@ -2345,20 +2834,23 @@ def evaluateR2derivs(Pot, R, z, phi=None, t=0.0):
     - 2012-07-25 - Written - Bovy (IAS)
 
     """
-    isList = isinstance(Pot, list)
     nonAxi = _isNonAxi(Pot)
     if nonAxi and phi is None:
         raise PotentialError(
             "The (list of) Potential instances is non-axisymmetric, but you did not provide phi"
         )
-    if isList:
-        out = 0.0
-        for pot in Pot:
-            if not pot.isDissipative:
-                out += pot.R2deriv(R, z, phi=phi, t=t, use_physical=False)
-        return out
-    elif not Pot.isDissipative:
-        return Pot.R2deriv(R, z, phi=phi, t=t, use_physical=False)
+    return _evaluate_backend(
+        Pot,
+        "R2deriv",
+        R,
+        z,
+        phi,
+        t,
+        lambda pot, R, z, phi, t: _evaluate_nondissipative(
+            pot, "R2deriv", R, z, phi=phi, t=t
+        ),
+        backend,
+    )
 
 
 @potential_positional_arg
@@ -2456,7 +2948,7 @@ def evaluateRzderivs(Pot, R, z, phi=None, t=0.0):
 @potential_positional_arg
 @potential_physical_input
 @physical_conversion("energy", pop=True)
-def evaluatephi2derivs(Pot, R, z, phi=None, t=0.0):
+def evaluatephi2derivs(Pot, R, z, phi=None, t=0.0, backend="python"):
     """
     Evaluate the second azimuthal derivative of a potential or sum of potentials.
 
@@ -2473,6 +2965,8 @@ def evaluatephi2derivs(Pot, R, z, phi=None, t=0.0):
     t : float or Quantity, optional
         Time (default: 0.0).
 
+    backend : {'python', 'jax'}, optional
+        If 'jax', evaluate all potentials using their JAX implementation (see galpy.potential.evaluate_jax; default: 'python').
     Returns
     -------
     float or Quantity
@@ -2483,26 +2977,29 @@ def evaluatephi2derivs(Pot, R, z, phi=None, t=0.0):
     - 2018-03-28 - Written - Bovy (UofT)
 
     """
-    isList = isinstance(Pot, list)
     nonAxi = _isNonAxi(Pot)
     if nonAxi and phi is None:
         raise PotentialError(
             "The (list of) Potential instances is non-axisymmetric, but you did not provide phi"
         )
-    if isList:
-        out = 0.0
-        for pot in Pot:
-            if not pot.isDissipative:
-                out += pot.phi2deriv(R, z, phi=phi, t=t, use_physical=False)
-        return out
-    elif not Pot.isDissipative:
-        return Pot.phi2deriv(R, z, phi=phi, t=t, use_physical=False)
+    return _evaluate_backend(
+        Pot,
+        "phi2deriv",
+        R,
+        z,
+        phi,
+        t,
+        lambda pot, R, z, phi, t: _evaluate_nondissipative(
+            pot, "phi2deriv", R, z, phi=phi, t=t
+        ),
+        backend,
+    )
 
 
 @potential_positional_arg
 @potential_physical_input
 @physical_conversion("force", pop=True)
-def evaluateRphiderivs(Pot, R, z, phi=None, t=0.0):
+def evaluateRphiderivs(Pot, R, z, phi=None, t=0.0, backend="python"):
     """
     Evaluate the second derivative of the sum of potentials with respect to cylindrical Galactocentric distance and azimuth.
 
@@ -2519,6 +3016,8 @@ def evaluateRphiderivs(Pot, R, z, phi=None, t=0.0):
     t : float or Quantity, optional
         Time (default: 0.0).
 
+    backend : {'python', 'jax'}, optional
+        If 'jax', evaluate all potentials using their JAX implementation (see galpy.potential.evaluate_jax; default: 'python').
     Returns
     -------
     float or Quantity
@@ -2529,20 +3028,23 @@ def evaluateRphiderivs(Pot, R, z, phi=None, t=0.0):
     - 2014-06-30 - Written - Bovy (IAS)
 
     """
-    isList = isinstance(Pot, list)
     nonAxi = _isNonAxi(Pot)
     if nonAxi and phi is None:
         raise PotentialError(
             "The (list of) Potential instances is non-axisymmetric, but you did not provide phi"
         )
-    if isList:
-        out = 0.0
-        for pot in Pot:
-            if not pot.isDissipative:
-                out += pot.Rphideriv(R, z, phi=phi, t=t, use_physical=False)
-        return out
-    elif not Pot.isDissipative:
-        return Pot.Rphideriv(R, z, phi=phi, t=t, use_physical=False)
+    return _evaluate_backend(
+        Pot,
+        "Rphideriv",
+        R,
+        z,
+        phi,
+        t,
+        lambda pot, R, z, phi, t: _evaluate_nondissipative(
+            pot, "Rphideriv", R, z, phi=phi, t=t
+        ),
+        backend,
+    )
 
 
 @potential_positional_arg
@@ -3263,6 +3765,123 @@ def vterm(Pot, l, t=0.0, deg=True):
     )
 
 
+def _vectorized_brentq(
+    func, a, b, args=(), xtol=2e-12, rtol=4.0 * numpy.finfo(float).eps, maxiter=200
+):
+    """Vectorized version of scipy.optimize.brentq using Chandrupatla's (1997) algorithm: find the roots of func(x,*args) in the brackets [a,b], with func vectorized in both x and args (arrays of the same length as a and b); only the roots that have not yet converged are updated in each iteration"""
+    a = numpy.array(a, dtype="float")
+    b = numpy.array(b, dtype="float")
+    args = tuple(numpy.broadcast_to(arg, a.shape) for arg in args)
+    fa = func(a, *args)
+    fb = func(b, *args)
+    if numpy.any(fa * fb > 0.0):
+        raise ValueError("f(a) and f(b) must have different signs")
+    out = numpy.where(numpy.fabs(fa) < numpy.fabs(fb), a, b)
+    idx = numpy.arange(len(a))
+    keep = (fa != 0.0) * (fb != 0.0)
+    idx, a, b, fa, fb = idx[keep], a[keep], b[keep], fa[keep], fb[keep]
+    c, fc = a.copy(), fa.copy()
+    tt = numpy.full(len(a), 0.5)
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        for ii in range(maxiter):
+            if len(idx) == 0:
+                break
+            # Evaluate at the new point and update the bracket [a,b], c is
+            # the previous point
+            xt = a + tt * (b - a)
+            ft = func(xt, *[arg[idx] for arg in args])
+            samesign = numpy.sign(ft) == numpy.sign(fa)
+            c, fc = numpy.where(samesign, a, b), numpy.where(samesign, fa, fb)
+            b, fb = numpy.where(samesign, b, a), numpy.where(samesign, fb, fa)
+            a, fa = xt, ft
+            asmaller = numpy.fabs(fa) < numpy.fabs(fb)
+            xm = numpy.where(asmaller, a, b)
+            out[idx] = xm
+            tlim = (xtol + rtol * numpy.fabs(xm)) / numpy.fabs(b - a)
+            keep = (numpy.where(asmaller, fa, fb) != 0.0) * (tlim <= 0.5)
+            # Inverse quadratic interpolation when it is safe, else bisection
+            xi = (a - b) / (c - b)
+            ph = (fa - fb) / (fc - fb)
+            iqi = (ph**2.0 < xi) * ((1.0 - ph) ** 2.0 < 1.0 - xi)
+            tt = numpy.where(
+                iqi,
+                fa / (fb - fa) * fc / (fb - fc)
+                + (c - a) / (b - a) * fa / (fc - fa) * fb / (fc - fb),
+                0.5,
+            )
+            tt = numpy.minimum(1.0 - tlim, numpy.maximum(tlim, tt))
+            idx, a, b, c, fa, fb, fc, tt = (
+                idx[keep],
+                a[keep],
+                b[keep],
+                c[keep],
+                fa[keep],
+                fb[keep],
+                fc[keep],
+                tt[keep],
+            )
+    return out
+
+
+def _find_start_array(func, xtry, args, lower=False, xlim=None):
+    """Vectorized search for the start of a bracketing interval: multiply (divide when lower) xtry by two until (2*lower-1)*func(xtry,*args) <= 0 (or until xtry passes xlim)"""
+    xtry = numpy.array(xtry, dtype="float")
+    args = tuple(numpy.broadcast_to(arg, xtry.shape) for arg in args)
+    fac = 0.5 if lower else 2.0
+    idx = numpy.arange(len(xtry))
+    while len(idx) > 0:
+        indx = (2.0 * lower - 1.0) * func(xtry[idx], *[arg[idx] for arg in args]) > 0.0
+        if xlim is not None:
+            indx *= xtry[idx] > xlim if lower else xtry[idx] < xlim
+        idx = idx[indx]
+        xtry[idx] *= fac
+    return xtry
+
+
+def _array_or_loop(arrayfunc, scalarfunc, Pot, *args, **kwargs):
+    """Evaluate arrayfunc(Pot,*args,**kwargs) on flattened array inputs, falling back to a loop over scalarfunc for potentials that cannot be evaluated on arrays"""
+    args = numpy.broadcast_arrays(*args)
+    shape = args[0].shape
+    args = [arg.flatten() for arg in args]
+    try:
+        out = arrayfunc(Pot, *args, **kwargs)
+    except (TypeError, ValueError):
+        out = numpy.moveaxis(
+            numpy.array([scalarfunc(*targs) for targs in zip(*args)], dtype="float"),
+            0,
+            -1,
+        )
+    return numpy.reshape(out, out.shape[:-1] + shape)
+
+
+def _rl_array(Pot, lz, t=0.0):
+    """rl for an array of (positive) angular momenta"""
+    rstart = _rlFindStart(lz, lz, Pot, t=t)
+    rlower = numpy.full_like(lz, 10.0**-5.0)
+    indx = (
+        _rlfunc(rlower, lz, Pot, t=t) * _rlfunc(rstart, lz, Pot, t=t) > 0.0
+    )  # Probably lz small and starting lz to great
+    if numpy.any(indx):
+        rlower[indx] = _rlFindStart(rlower[indx], lz[indx], Pot, t=t, lower=True)
+    return _vectorized_brentq(
+        lambda r, l: _rlfunc(r, l, Pot, t=t), rlower, rstart, args=(lz,)
+    )
+
+
+def _rE_array(Pot, E, t=0.0):
+    """rE for an array of energies"""
+    rstart = _rEFindStart(numpy.ones_like(E), E, Pot, t=t)
+    rlower = numpy.full_like(E, 10.0**-5.0)
+    indx = (
+        _rEfunc(rlower, E, Pot, t=t) * _rEfunc(rstart, E, Pot, t=t) > 0.0
+    )  # Probably E small and starting rE to great
+    if numpy.any(indx):
+        rlower[indx] = _rEFindStart(rlower[indx], E[indx], Pot, t=t, lower=True)
+    return _vectorized_brentq(
+        lambda r, e: _rEfunc(r, e, Pot, t=t), rlower, rstart, args=(E,)
+    )
+
+
 @potential_positional_arg
 @physical_conversion("position", pop=True)
 def rl(Pot, lz, t=0.0):
@@ -3273,19 +3892,20 @@ def rl(Pot, lz, t=0.0):
     ----------
     Pot : Potential instance or list thereof
         Potential instance or list thereof.
-    lz : float or Quantity
+    lz : float, numpy.ndarray, or Quantity
         Angular momentum (can be Quantity).
     t : float or Quantity, optional
         Time (default: 0).
 
     Returns
     -------
-    float or Quantity
+    float, numpy.ndarray, or Quantity
         Radius.
 
     Notes
     -----
     - 2012-07-30 - Written - Bovy (IAS@MPIA)
+    - 2026-10-19 - Added vectorized root finding for array input - Agent (local)
 
     - An efficient way to call this function on many objects is provided as the Orbit method rguiding.
 
@@ -3296,6 +3916,14 @@ def rl(Pot, lz, t=0.0):
     """
     Pot = flatten(Pot)
     lz = conversion.parse_angmom(lz, **conversion.get_physical(Pot))
+    if numpy.ndim(lz) > 0:
+        return _array_or_loop(
+            _rl_array,
+            lambda tlz: rl(Pot, tlz, t=t, use_physical=False),
+            Pot,
+            numpy.fabs(lz),
+            t=t,
+        )
     # Find interval
     rstart = _rlFindStart(numpy.fabs(lz), numpy.fabs(lz), Pot, t=t)  # assumes vo=1.
     try:
@@ -3321,6 +3949,10 @@ def _rlfunc(rl, lz, pot, t=0.0):
 def _rlFindStart(rl, lz, pot, t=0.0, lower=False):
     """find a starting interval for rl"""
     rtry = 2.0 * rl
+    if numpy.ndim(rtry) > 0:
+        return _find_start_array(
+            lambda r, l: _rlfunc(r, l, pot, t=t), rtry, (lz,), lower=lower
+        )
     while (2.0 * lower - 1.0) * _rlfunc(rtry, lz, pot, t=t) > 0.0:
         if lower:
             rtry /= 2.0
@@ -3339,19 +3971,20 @@ def rE(Pot, E, t=0.0):
     ----------
     Pot : Potential instance or list thereof
         Potential instance or list thereof.
-    E : float or Quantity
+    E : float, numpy.ndarray, or Quantity
         Energy.
     t : float, optional
         Time (default is 0.0).
 
     Returns
     -------
-    radius : float
+    radius : float or numpy.ndarray
         Radius.
 
     Notes
     -----
     - 2022-04-06 - Written - Bovy (UofT)
+    - 2026-10-19 - Added vectorized root finding for array input - Agent (local)
 
     - An efficient way to call this function on many objects is provided as the Orbit method rE.
 
@@ -3362,6 +3995,10 @@ def rE(Pot, E, t=0.0):
     """
     Pot = flatten(Pot)
     E = conversion.parse_energy(E, **conversion.get_physical(Pot))
+    if numpy.ndim(E) > 0:
+        return _array_or_loop(
+            _rE_array, lambda tE: rE(Pot, tE, t=t, use_physical=False), Pot, E, t=t
+        )
     # Find interval
     rstart = _rEFindStart(1.0, E, Pot, t=t)
     try:
@@ -3382,6 +4019,10 @@ def _rEfunc(rE, E, pot, t=0.0):
 def _rEFindStart(rE, E, pot, t=0.0, lower=False):
     """find a starting interval for rE"""
     rtry = 2.0 * rE
+    if numpy.ndim(rtry) > 0:
+        return _find_start_array(
+            lambda r, e: _rEfunc(r, e, pot, t=t), rtry, (E,), lower=lower
+        )
     while (2.0 * lower - 1.0) * _rEfunc(rtry, E, pot, t=t) > 0.0:
         if lower:
             rtry /= 2.0
@@ -3400,14 +4041,14 @@ def LcE(Pot, E, t=0.0):
     ----------
     Pot : Potential instance or list thereof
         Potential instance or list thereof.
-    E : float or Quantity
+    E : float, numpy.ndarray, or Quantity
         Energy.
     t : float or Quantity, optional
         Time (default: 0.0).
 
     Returns
     -------
-    float or Quantity
+    float, numpy.ndarray, or Quantity
         Angular momentum of circular orbit with energy E
 
     Notes
@@ -3429,7 +4070,7 @@ def lindbladR(Pot, OmegaP, m=2, t=0.0, **kwargs):
     ----------
     Pot : Potential instance or list of such instances
         Potential instance or list of such instances.
-    OmegaP : float or Quantity
+    OmegaP : float, numpy.ndarray, or Quantity
         Pattern speed.
     m : int or str, optional
         Order of the resonance (as in m(O-Op)=kappa (negative m for outer)).
@@ -3437,16 +4078,17 @@ def lindbladR(Pot, OmegaP, m=2, t=0.0, **kwargs):
     t : float or Quantity, optional
         Time (default: 0.0).
     **kwargs
-        Additional arguments to be passed to scipy.optimize.brentq.
+        Additional arguments to be passed to scipy.optimize.brentq (only xtol, rtol, and maxiter for array input).
 
     Returns
     -------
     float or Quantity or None
-        Radius of Lindblad resonance, None if there is no resonance.
+        Radius of Lindblad resonance, None if there is no resonance (NaN for array input).
 
     Notes
     -----
     - 2011-10-09 - Written - Bovy (IAS)
+    - 2026-10-19 - Added vectorized root finding for array input - Agent (local)
 
     """
     Pot = flatten(Pot)
@@ -3460,6 +4102,19 @@ def lindbladR(Pot, OmegaP, m=2, t=0.0, **kwargs):
             )
     else:
         corotation = False
+    if numpy.ndim(OmegaP) > 0:
+        return _array_or_loop(
+            _lindbladR_array,
+            lambda tOmegaP: (lambda out: numpy.nan if out is None else out)(
+                lindbladR(Pot, tOmegaP, m=m, t=t, use_physical=False, **kwargs)
+            ),
+            Pot,
+            OmegaP,
+            m=m,
+            t=t,
+            corotation=corotation,
+            **kwargs,
+        )
     if corotation:
         try:
             out = optimize.brentq(
@@ -3488,6 +4143,31 @@ def lindbladR(Pot, OmegaP, m=2, t=0.0, **kwargs):
         return out
 
 
+def _lindbladR_array(Pot, OmegaP, m=2, t=0.0, corotation=False, **kwargs):
+    """lindbladR for an array of pattern speeds, nan where there is no resonance"""
+    if corotation:
+        eq = lambda R, tOmegaP: _corotationR_eq(R, Pot, tOmegaP, t=t)
+    else:
+        eq = lambda R, tOmegaP: _lindbladR_eq(R, Pot, tOmegaP, m, t=t)
+    Rlower = numpy.full_like(OmegaP, 0.0000001)
+    Rupper = numpy.full_like(OmegaP, 1000.0)
+    fupper = eq(Rupper, OmegaP)
+    indx = eq(Rlower, OmegaP) * fupper > 0.0
+    if corotation and numpy.any(indx):
+        # Sometimes 0.0000001 is numerically too small to start...
+        Rlower[indx] = 0.01
+        indx[indx] = eq(Rlower[indx], OmegaP[indx]) * fupper[indx] > 0.0
+    out = numpy.full_like(OmegaP, numpy.nan)
+    out[~indx] = _vectorized_brentq(
+        eq,
+        Rlower[~indx],
+        Rupper[~indx],
+        args=(OmegaP[~indx],),
+        **{key: kwargs[key] for key in ("xtol", "rtol", "maxiter") if key in kwargs},
+    )
+    return out
+
+
 def _corotationR_eq(R, Pot, OmegaP, t=0.0):
     return omegac(Pot, R, t=t, use_physical=False) - OmegaP
 
@@ -4010,11 +4690,11 @@ def zvc(Pot, R, E, Lz, phi=0.0, t=0.0):
     ----------
     Pot : Potential instance or list of such instances
         Potential instance or list of such instances.
-    R : float or Quantity
+    R : float, numpy.ndarray, or Quantity
         Galactocentric radius.
-    E : float or Quantity
+    E : float, numpy.ndarray, or Quantity
         Energy.
-    Lz : float or Quantity
+    Lz : float, numpy.ndarray, or Quantity
         Angular momentum.
     phi : float or Quantity, optional
         Azimuth (default: 0.0).
@@ -4023,18 +4703,32 @@ def zvc(Pot, R, E, Lz, phi=0.0, t=0.0):
 
     Returns
     -------
-    float
+    float or numpy.ndarray
         z such that Phi(R,z) + Lz/[2R^2] = E.
 
     Notes
     -----
     - 2020-08-20 - Written - Bovy (UofT)
+    - 2026-10-19 - Added vectorized root finding for array input - Agent (local)
 
     """
     Pot = flatten(Pot)
     R = conversion.parse_length(R, **get_physical(Pot))
     E = conversion.parse_energy(E, **get_physical(Pot))
     Lz = conversion.parse_angmom(Lz, **get_physical(Pot))
+    if numpy.ndim(R) > 0 or numpy.ndim(E) > 0 or numpy.ndim(Lz) > 0:
+        return _array_or_loop(
+            _zvc_array,
+            lambda tR, tE, tLz, tphi: zvc(
+                Pot, tR, tE, tLz, phi=tphi, t=t, use_physical=False
+            ),
+            Pot,
+            R,
+            E,
+            Lz,
+            phi,
+            t=t,
+        )
     Lz2over2R2 = Lz**2.0 / 2.0 / R**2.0
     # Check z=0 and whether a solution exists
     if (
@@ -4065,6 +4759,36 @@ def zvc(Pot, R, E, Lz, phi=0.0, t=0.0):
     return out
 
 
+def _zvc_array(Pot, R, E, Lz, phi, t=0.0):
+    """zvc for arrays of R, E, and Lz"""
+    Lz2over2R2 = Lz**2.0 / 2.0 / R**2.0
+    eq = lambda z, tR, tE, tL, tphi: (
+        _evaluatePotentials(Pot, tR, z, phi=tphi, t=t) + tL - tE
+    )
+    out = numpy.full_like(R, numpy.nan)  # s.t. no solution does not get plotted
+    # Check z=0 and whether a solution exists
+    f0 = eq(numpy.zeros_like(R), R, E, Lz2over2R2, phi)
+    out[numpy.fabs(f0) < 1e-8] = 0.0
+    indx = f0 <= -1e-8
+    if not numpy.any(indx):
+        return out
+    args = (R[indx], E[indx], Lz2over2R2[indx], phi[indx])
+    # Find starting value
+    zstart = _find_start_array(
+        eq,
+        numpy.ones(numpy.sum(indx)),
+        args,
+        xlim=1000.0,
+    )
+    try:
+        out[indx] = _vectorized_brentq(eq, numpy.zeros_like(zstart), zstart, args=args)
+    except ValueError:
+        raise ValueError(
+            "No solution for the zero-velocity curve found for this combination of parameters"
+        )
+    return out
+
+
 @potential_positional_arg
 @physical_conversion("position", pop=True)
 def zvc_range(Pot, E, Lz, phi=0.0, t=0.0):
@@ -4075,9 +4799,9 @@ def zvc_range(Pot, E, Lz, phi=0.0, t=0.0):
     ----------
     Pot : Potential instance or list of such instances
         Potential instance or list of such instances.
-    E : float or Quantity
+    E : float, numpy.ndarray, or Quantity
         Energy.
-    Lz : float or Quantity
+    Lz : float, numpy.ndarray, or Quantity
         Angular momentum.
     phi : float or Quantity, optional
         Azimuth (default: 0.0).
@@ -4087,15 +4811,28 @@ def zvc_range(Pot, E, Lz, phi=0.0, t=0.0):
     Returns
     -------
     numpy.ndarray
-        Solutions R such that Phi(R,0) + Lz/[2R^2] = E.
+        Solutions R such that Phi(R,0) + Lz/[2R^2] = E; shape (2,)+the shape of the (broadcast) E and Lz for array input.
 
     Notes
     -----
     - 2020-08-20 - Written - Bovy (UofT)
+    - 2026-10-19 - Added vectorized root finding for array input - Agent (local)
     """
     Pot = flatten(Pot)
     E = conversion.parse_energy(E, **get_physical(Pot))
     Lz = conversion.parse_angmom(Lz, **get_physical(Pot))
+    if numpy.ndim(E) > 0 or numpy.ndim(Lz) > 0:
+        return _array_or_loop(
+            _zvc_range_array,
+            lambda tE, tLz, tphi: zvc_range(
+                Pot, tE, tLz, phi=tphi, t=t, use_physical=False
+            ),
+            Pot,
+            E,
+            Lz,
+            phi,
+            t=t,
+        )
     Lz2over2 = Lz**2.0 / 2.0
     # Check whether a solution exists
     RLz = rl(Pot, Lz, t=t, use_physical=False)
@@ -4130,6 +4867,32 @@ def zvc_range(Pot, E, Lz, phi=0.0, t=0.0):
     return numpy.array([Rmin, Rmax])
 
 
+def _zvc_range_array(Pot, E, Lz, phi, t=0.0):
+    """zvc_range for arrays of E and Lz"""
+    Lz2over2 = Lz**2.0 / 2.0
+    eq = lambda R, tE, tL, tphi: (
+        _evaluatePotentials(Pot, R, numpy.zeros_like(R), phi=tphi, t=t)
+        + tL / R**2.0
+        - tE
+    )
+    out = numpy.full((2, len(E)), numpy.nan)
+    # Check whether a solution exists
+    RLz = rl(Pot, Lz, t=t, use_physical=False)
+    indx = ~(eq(RLz, E, Lz2over2, phi) > 0.0)
+    if not numpy.any(indx):
+        return out
+    RLz = RLz[indx]
+    args = (E[indx], Lz2over2[indx], phi[indx])
+    # Find starting values for Rmin and Rmax and solve
+    Rstart = _find_start_array(
+        lambda R, *targs: -eq(R, *targs), RLz, args, lower=True, xlim=1e-8
+    )
+    out[0, indx] = _vectorized_brentq(eq, Rstart, RLz, args=args)
+    Rstart = _find_start_array(eq, RLz, args, xlim=1000.0)
+    out[1, indx] = _vectorized_brentq(eq, RLz, Rstart, args=args)
+    return out
+
+
 @potential_positional_arg
 @physical_conversion("position", pop=True)
 def rhalf(Pot, t=0.0, INF=numpy.inf):
@@ -4157,6 +4920,10 @@ def rhalf(Pot, t=0.0, INF=numpy.inf):
     """
     Pot = flatten(Pot)
     tot_mass = mass(Pot, INF, t=t)
+    if getattr(Pot, "_mass_cache", None) is not None:
+        out = Pot._mass_cache.rmass(Pot, 0.5 * tot_mass, t)
+        if out is not None:
+            return out
     # Find interval
     rhi = _rhalfFindStart(1.0, Pot, tot_mass, t=t)
     rlo = _rhalfFindStart(1.0, Pot, tot_mass, t=t, lower=True)
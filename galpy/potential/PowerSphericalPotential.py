@@ -10,8 +10,12 @@ import numpy
 from scipy import special
 
 from ..util import conversion
+from ..util._optional_deps import _JAX_LOADED
 from .Potential import Potential
 
+if _JAX_LOADED:
+    import jax.numpy as jnp
+
 
 class PowerSphericalPotential(Potential):
     """Class that implements spherical potentials that are derived from power-law density models
@@ -167,6 +171,23 @@ class PowerSphericalPotential(Potential):
         # No need for actual JAX!
         return -self._amp / r ** (self.alpha - 1.0)
 
+    def _jax_params(self):
+        return {"amp": self._amp, "alpha": self.alpha}
+
+    def _evaluate_jax(self, params, R, z, phi=0.0, t=0.0):
+        if not _JAX_LOADED:  # pragma: no cover
+            raise ImportError(
+                "Making use of _evaluate_jax function requires the google/jax library"
+            )
+        r2 = R**2.0 + z**2.0
+        if self.alpha == 2.0:  # the instance's alpha sets the functional form
+            return params["amp"] * jnp.log(r2) / 2.0
+        return (
+            -params["amp"]
+            * r2 ** (1.0 - params["alpha"] / 2.0)
+            / (params["alpha"] - 2.0)
+        )
+
     def _R2deriv(self, R, z, phi=0.0, t=0.0):
         """
         Evaluate the second radial derivative for this potential.
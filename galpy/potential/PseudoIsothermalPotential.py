@@ -5,8 +5,12 @@
 import numpy
 
 from ..util import conversion
+from ..util._optional_deps import _JAX_LOADED
 from .Potential import Potential
 
+if _JAX_LOADED:
+    import jax.numpy as jnp
+
 
 class PseudoIsothermalPotential(Potential):
     """Class that implements the pseudo-isothermal potential
@@ -67,6 +71,23 @@ class PseudoIsothermalPotential(Potential):
             out[r == 0] = 1.0 / self._a
             return out
 
+    def _jax_params(self):
+        return {"amp": self._amp, "a": self._a}
+
+    def _evaluate_jax(self, params, R, z, phi=0.0, t=0.0):
+        if not _JAX_LOADED:  # pragma: no cover
+            raise ImportError(
+                "Making use of _evaluate_jax function requires the google/jax library"
+            )
+        a = params["a"]
+        r2 = R**2.0 + z**2.0
+        r = jnp.sqrt(r2)
+        return (
+            params["amp"]
+            * (0.5 * jnp.log(1 + r2 / a**2.0) + a / r * jnp.arctan(r / a))
+            / a
+        )
+
     def _Rforce(self, R, z, phi=0.0, t=0.0):
         r2 = R**2.0 + z**2.0
         r = numpy.sqrt(r2)
@@ -62,6 +62,8 @@ class RazorThinExponentialDiskPotential(Potential):
         self._scale = self._hr
         self._alpha = 1.0 / self._hr
         self._glx, self._glw = numpy.polynomial.legendre.leggauss(self._glorder)
+        self.hasC = self._new
+        self.hasC_dxdv = self._new
         if normalize or (
             isinstance(normalize, (int, float)) and not isinstance(normalize, bool)
         ):  # pragma: no cover
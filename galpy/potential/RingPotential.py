@@ -52,8 +52,8 @@ class RingPotential(Potential):
                     "RingPotential with normalize= for a > 1 is not supported (because the force is always positive at r=1)"
                 )
             self.normalize(normalize)
-        self.hasC = False
-        self.hasC_dxdv = False
+        self.hasC = True
+        self.hasC_dxdv = True
 
     def _evaluate(self, R, z, phi=0.0, t=0.0):
         # Stable as r -> infty
@@ -6,10 +6,8 @@ import numpy
 
 from ..util import _rotate_to_arbitrary_vector, conversion, coords
 from .Potential import (
-    _evaluatephitorques,
+    _evaluateforces,
     _evaluatePotentials,
-    _evaluateRforces,
-    _evaluatezforces,
     check_potential_inputs_not_arrays,
     evaluateDensities,
     evaluatephi2derivs,
@@ -168,18 +166,23 @@ class RotateAndTiltWrapperPotential(WrapperPotential):
         return _evaluatePotentials(self._pot, Rp, zp, phi=phip, t=t)
 
     @check_potential_inputs_not_arrays
-    def _Rforce(self, R, z, phi=0.0, t=0.0):
+    def _forces(self, R, z, phi=0.0, t=0.0):
         Fxyz = self._force_xyz(R, z, phi=phi, t=t)
-        return numpy.cos(phi) * Fxyz[0] + numpy.sin(phi) * Fxyz[1]
+        cp, sp = numpy.cos(phi), numpy.sin(phi)
+        return (
+            cp * Fxyz[0] + sp * Fxyz[1],
+            Fxyz[2],
+            R * (-sp * Fxyz[0] + cp * Fxyz[1]),
+        )
+
+    def _Rforce(self, R, z, phi=0.0, t=0.0):
+        return self._forces(R, z, phi=phi, t=t)[0]
 
-    @check_potential_inputs_not_arrays
     def _phitorque(self, R, z, phi=0.0, t=0.0):
-        Fxyz = self._force_xyz(R, z, phi=phi, t=t)
-        return R * (-numpy.sin(phi) * Fxyz[0] + numpy.cos(phi) * Fxyz[1])
+        return self._forces(R, z, phi=phi, t=t)[2]
 
-    @check_potential_inputs_not_arrays
     def _zforce(self, R, z, phi=0.0, t=0.0):
-        return self._force_xyz(R, z, phi=phi, t=t)[2]
+        return self._forces(R, z, phi=phi, t=t)[1]
 
     def _force_xyz(self, R, z, phi=0.0, t=0.0):
         """Get the rectangular forces in the transformed frame"""
@@ -191,9 +194,7 @@ class RotateAndTiltWrapperPotential(WrapperPotential):
         if self._offset is not None:
             xyzp += self._offset
         Rp, phip, zp = coords.rect_to_cyl(xyzp[0], xyzp[1], xyzp[2])
-        Rforcep = _evaluateRforces(self._pot, Rp, zp, phi=phip, t=t)
-        phitorquep = _evaluatephitorques(self._pot, Rp, zp, phi=phip, t=t)
-        zforcep = _evaluatezforces(self._pot, Rp, zp, phi=phip, t=t)
+        Rforcep, zforcep, phitorquep = _evaluateforces(self._pot, Rp, zp, phi=phip, t=t)
         xforcep = numpy.cos(phip) * Rforcep - numpy.sin(phip) * phitorquep / Rp
         yforcep = numpy.sin(phip) * Rforcep + numpy.cos(phip) * phitorquep / Rp
         return numpy.dot(self._inv_rot, numpy.array([xforcep, yforcep, zforcep]))
@@ -252,8 +253,7 @@ class RotateAndTiltWrapperPotential(WrapperPotential):
         if self._offset is not None:
             xyzp += self._offset
         Rp, phip, zp = coords.rect_to_cyl(xyzp[0], xyzp[1], xyzp[2])
-        Rforcep = _evaluateRforces(self._pot, Rp, zp, phi=phip, t=t)
-        phitorquep = _evaluatephitorques(self._pot, Rp, zp, phi=phip, t=t)
+        Rforcep, _, phitorquep = _evaluateforces(self._pot, Rp, zp, phi=phip, t=t)
         R2derivp = evaluateR2derivs(
             self._pot, Rp, zp, phi=phip, t=t, use_physical=False
         )
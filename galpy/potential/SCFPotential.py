@@ -1,5 +1,3 @@
-import hashlib
-
 import numpy
 import scipy
 from numpy.polynomial.legendre import leggauss
@@ -13,7 +11,8 @@ if _SCIPY_VERSION < parse_version("1.15"):  # pragma: no cover
 else:
     from scipy.special import assoc_legendre_p_all
 
-from ..util import conversion, coords
+from ..util import conversion, coords, multi
+from ..util._disk_cache import disk_cache
 from ..util._optional_deps import _APY_LOADED
 from .Potential import Potential
 
@@ -147,7 +146,6 @@ class SCFPotential(Potential, NumericalPotentialDerivativesMixin):
             self._Asin = Asin * NN[numpy.newaxis, :, :]
         else:
             self._Asin = numpy.zeros_like(Acos)
-        self._force_hash = None
         self.hasC = True
         self.hasC_dxdv = True
         self.hasC_dens = True
@@ -525,55 +523,36 @@ class SCFPotential(Potential, NumericalPotentialDerivativesMixin):
         Acos, Asin = self._Acos, self._Asin
         N, L, M = Acos.shape
         r, theta, phi = coords.cyl_to_spher(R, z, phi)
-        new_hash = hashlib.md5(numpy.array([R, z, phi])).hexdigest()
-
-        if new_hash == self._force_hash:
-            dPhi_dr = self._cached_dPhi_dr
-            dPhi_dtheta = self._cached_dPhi_dtheta
-            dPhi_dphi = self._cached_dPhi_dphi
-
+        ## Get the Legendre polynomials
+        if _SCIPY_VERSION < parse_version("1.15"):  # pragma: no cover
+            PP, dPP = lpmn(M - 1, L - 1, numpy.cos(theta))
         else:
-            ## Get the Legendre polynomials
-            if _SCIPY_VERSION < parse_version("1.15"):  # pragma: no cover
-                PP, dPP = lpmn(M - 1, L - 1, numpy.cos(theta))
-            else:
-                PP, dPP = assoc_legendre_p_all(
-                    L - 1, M - 1, numpy.cos(theta), branch_cut=2, diff_n=1
-                )
-                PP = numpy.swapaxes(PP[:, :M], 0, 1)
-                dPP = numpy.swapaxes(dPP[:, :M], 0, 1)
-            PP = PP.T[None, :, :]
-            dPP = dPP.T[None, :, :]
-            phi_tilde = self._phiTilde(r, N, L)[:, :, numpy.newaxis]
-            dphi_tilde = self._dphiTilde(r, N, L)[:, :, numpy.newaxis]
-
-            m = numpy.arange(0, M)[numpy.newaxis, numpy.newaxis, :]
-            mcos = numpy.cos(m * phi)
-            msin = numpy.sin(m * phi)
-            dPhi_dr = -numpy.sum((Acos * mcos + Asin * msin) * PP * dphi_tilde)
-            dPhi_dtheta = -numpy.sum(
-                (Acos * mcos + Asin * msin) * phi_tilde * dPP * (-numpy.sin(theta))
+            PP, dPP = assoc_legendre_p_all(
+                L - 1, M - 1, numpy.cos(theta), branch_cut=2, diff_n=1
             )
-            dPhi_dphi = -numpy.sum(m * (Asin * mcos - Acos * msin) * phi_tilde * PP)
+            PP = numpy.swapaxes(PP[:, :M], 0, 1)
+            dPP = numpy.swapaxes(dPP[:, :M], 0, 1)
+        PP = PP.T[None, :, :]
+        dPP = dPP.T[None, :, :]
+        phi_tilde = self._phiTilde(r, N, L)[:, :, numpy.newaxis]
+        dphi_tilde = self._dphiTilde(r, N, L)[:, :, numpy.newaxis]
 
-            self._force_hash = new_hash
-            self._cached_dPhi_dr = dPhi_dr
-            self._cached_dPhi_dtheta = dPhi_dtheta
-            self._cached_dPhi_dphi = dPhi_dphi
+        m = numpy.arange(0, M)[numpy.newaxis, numpy.newaxis, :]
+        mcos = numpy.cos(m * phi)
+        msin = numpy.sin(m * phi)
+        dPhi_dr = -numpy.sum((Acos * mcos + Asin * msin) * PP * dphi_tilde)
+        dPhi_dtheta = -numpy.sum(
+            (Acos * mcos + Asin * msin) * phi_tilde * dPP * (-numpy.sin(theta))
+        )
+        dPhi_dphi = -numpy.sum(m * (Asin * mcos - Acos * msin) * phi_tilde * PP)
         return dPhi_dr, dPhi_dtheta, dPhi_dphi
 
-    def _computeforceArray(self, dr_dx, dtheta_dx, dphi_dx, R, z, phi):
+    def _computeforceArray(self, R, z, phi):
         """
-        Evaluate the forces in the x direction for a given array of coordinates.
+        Evaluate dPhi/dr, dPhi/dtheta, and dPhi/dphi for a given array of coordinates.
 
         Parameters
         ----------
-        dr_dx : numpy.ndarray
-            The derivative of r with respect to the chosen variable x.
-        dtheta_dx : numpy.ndarray
-            The derivative of theta with respect to the chosen variable x.
-        dphi_dx : numpy.ndarray
-            The derivative of phi with respect to the chosen variable x.
         R : numpy.ndarray
             Cylindrical Galactocentric radius.
         z : numpy.ndarray
@@ -583,71 +562,52 @@ class SCFPotential(Potential, NumericalPotentialDerivativesMixin):
 
         Returns
         -------
-        numpy.ndarray
-            The forces in the x direction.
+        tuple of numpy.ndarray
+            dPhi/dr, dPhi/dtheta, and dPhi/dphi.
 
         Notes
         -----
         - 2016-06-02 - Written - Aladdin Seaifan (UofT)
+        - 2026-10-19 - Changed to return all spherical derivatives at once - Agent (local)
         """
         R = numpy.array(R, dtype=float)
         z = numpy.array(z, dtype=float)
         phi = numpy.array(phi, dtype=float)
         shape = (R * z * phi).shape
         if shape == ():
-            dPhi_dr, dPhi_dtheta, dPhi_dphi = self._computeforce(R, z, phi)
-            return dr_dx * dPhi_dr + dtheta_dx * dPhi_dtheta + dPhi_dphi * dphi_dx
+            return self._computeforce(R, z, phi)
 
         R = R * numpy.ones(shape)
         z = z * numpy.ones(shape)
         phi = phi * numpy.ones(shape)
-        force = numpy.zeros(shape, float)
-        dr_dx = dr_dx * numpy.ones(shape)
-        dtheta_dx = dtheta_dx * numpy.ones(shape)
-        dphi_dx = dphi_dx * numpy.ones(shape)
-        li = _cartesian(shape)
-
-        for i in range(li.shape[0]):
-            j = tuple(numpy.split(li[i], li.shape[1]))
-            dPhi_dr, dPhi_dtheta, dPhi_dphi = self._computeforce(
-                R[j][0], z[j][0], phi[j][0]
-            )
-            force[j] = (
-                dr_dx[j][0] * dPhi_dr
-                + dtheta_dx[j][0] * dPhi_dtheta
-                + dPhi_dphi * dphi_dx[j][0]
+        dPhi_dr = numpy.zeros(shape, float)
+        dPhi_dtheta = numpy.zeros(shape, float)
+        dPhi_dphi = numpy.zeros(shape, float)
+        for j in numpy.ndindex(shape):
+            dPhi_dr[j], dPhi_dtheta[j], dPhi_dphi[j] = self._computeforce(
+                R[j], z[j], phi[j]
             )
-        return force
+        return dPhi_dr, dPhi_dtheta, dPhi_dphi
 
-    def _Rforce(self, R, z, phi=0, t=0):
+    def _forces(self, R, z, phi=0.0, t=0.0):
         if not self.isNonAxi and phi is None:
             phi = 0.0
         r, theta, phi = coords.cyl_to_spher(R, z, phi)
-        # x = R
-        dr_dR = numpy.divide(R, r)
-        dtheta_dR = numpy.divide(z, r**2)
-        dphi_dR = 0
-        return self._computeforceArray(dr_dR, dtheta_dR, dphi_dR, R, z, phi)
+        dPhi_dr, dPhi_dtheta, dPhi_dphi = self._computeforceArray(R, z, phi)
+        return (
+            numpy.divide(R, r) * dPhi_dr + numpy.divide(z, r**2) * dPhi_dtheta,
+            numpy.divide(z, r) * dPhi_dr - numpy.divide(R, r**2) * dPhi_dtheta,
+            dPhi_dphi,
+        )
+
+    def _Rforce(self, R, z, phi=0, t=0):
+        return self._forces(R, z, phi=phi, t=t)[0]
 
     def _zforce(self, R, z, phi=0.0, t=0.0):
-        if not self.isNonAxi and phi is None:
-            phi = 0.0
-        r, theta, phi = coords.cyl_to_spher(R, z, phi)
-        # x = z
-        dr_dz = numpy.divide(z, r)
-        dtheta_dz = numpy.divide(-R, r**2)
-        dphi_dz = 0
-        return self._computeforceArray(dr_dz, dtheta_dz, dphi_dz, R, z, phi)
+        return self._forces(R, z, phi=phi, t=t)[1]
 
     def _phitorque(self, R, z, phi=0, t=0):
-        if not self.isNonAxi and phi is None:
-            phi = 0.0
-        r, theta, phi = coords.cyl_to_spher(R, z, phi)
-        # x = phi
-        dr_dphi = 0
-        dtheta_dphi = 0
-        dphi_dphi = 1
-        return self._computeforceArray(dr_dphi, dtheta_dphi, dphi_dphi, R, z, phi)
+        return self._forces(R, z, phi=phi, t=t)[2]
 
     def OmegaP(self):
         return 0
@@ -731,40 +691,99 @@ def _dC(xi, N, L):
     return CC
 
 
-def scf_compute_coeffs_spherical_nbody(pos, N, mass=1.0, a=1.0):
+def _scf_nbody_sums(block_sums, pos, mass, chunksize, numcores):
+    """Accumulate the per-particle sums (and sums of squares) returned by block_sums(pos,mass) over blocks of chunksize particles, splitting the blocks over numcores processes"""
+    npart = numpy.shape(pos)[1]
+    if numpy.size(mass) == 1:
+        mass = float(numpy.squeeze(mass))
+    starts = numpy.arange(0, npart, chunksize)
+    numcores = max(1, min(numcores, len(starts)))
+
+    def _sum_blocks(group):
+        out = None
+        for start in starts[group::numcores]:
+            # Only load this block into memory, such that pos can be a memmap
+            bpos = numpy.asarray(pos[:, start : start + chunksize], dtype=float)
+            bmass = (
+                mass
+                if isinstance(mass, float)
+                else numpy.asarray(mass[start : start + chunksize], dtype=float)
+            )
+            bsums = block_sums(bpos, bmass)
+            out = bsums if out is None else [o + b for o, b in zip(out, bsums)]
+        return out
+
+    if numcores > 1:
+        partial = list(
+            multi.parallel_map(_sum_blocks, list(range(numcores)), numcores=numcores)
+        )
+    else:
+        partial = [_sum_blocks(0)]
+    out = partial[0]
+    for p in partial[1:]:
+        out = [o + q for o, q in zip(out, p)]
+    return out, npart
+
+
+def _scf_nbody_variance(Sum, Sum2, npart, norm):
+    """Variance of a coefficient norm x Sum_i f_i estimated from the sum Sum and the sum of squares Sum2 of the contributions f_i of npart particles"""
+    return norm**2 * (Sum2 - Sum**2 / npart)
+
+
+def scf_compute_coeffs_spherical_nbody(
+    pos, N, mass=1.0, a=1.0, chunksize=100000, numcores=1, return_variance=False
+):
     """
     Numerically compute the expansion coefficients for a spherical expansion for a given $N$-body set of points
 
     Parameters
     ----------
     pos : numpy.ndarray
-        Positions of particles in rectangular coordinates with shape [3,n]
+        Positions of particles in rectangular coordinates with shape [3,n]; can be a numpy.memmap, in which case particles are read from disk one block at a time
     N : int
         Size of the Nth dimension of the expansion coefficients
     mass : float or numpy.ndarray, optional
         Mass of particles (scalar or array with size n), by default 1.0
     a : float, optional
         Parameter used to scale the radius, by default 1.0
+    chunksize : int, optional
+        Number of particles processed at a time, by default 100000
+    numcores : int, optional
+        Number of processes over which to split the blocks of particles, by default 1
+    return_variance : bool, optional
+        If True, also return the variance of the coefficients due to particle noise, by default False
 
     Returns
     -------
     tuple
-        Expansion coefficients for density dens that can be given to SCFPotential.__init__
+        Expansion coefficients for density dens that can be given to SCFPotential.__init__; if return_variance, followed by the variance of each coefficient (Acos_var,Asin_var)
 
     Notes
     -----
     - 2020-11-18 - Written - Morgan Bennett (UofT)
     - 2021-02-22 - Sped-up - Bovy (UofT)
+    - 2026-10-19 - Process particles in blocks, optionally in parallel, and return the variance of the coefficients - Agent (local)
 
     """
-    Acos = numpy.zeros((N, 1, 1), float)
-    Asin = None
-    r = numpy.sqrt(pos[0] ** 2 + pos[1] ** 2 + pos[2] ** 2)
-    RhoSum = numpy.einsum("j,ij", mass / (1.0 + r / a), _C(_RToxi(r, a=a), N, 1)[:, 0])
+
+    def block_sums(pos, mass):
+        r = numpy.sqrt(pos[0] ** 2 + pos[1] ** 2 + pos[2] ** 2)
+        phin = mass / (1.0 + r / a) * _C(_RToxi(r, a=a), N, 1)[:, 0]
+        return [numpy.sum(phin, axis=-1), numpy.sum(phin**2, axis=-1)]
+
+    (RhoSum, RhoSum2), npart = _scf_nbody_sums(
+        block_sums, pos, mass, chunksize, numcores
+    )
     n = numpy.arange(0, N)
     K = 4 * (n + 3.0 / 2) / ((n + 2) * (n + 1) * (1 + n * (n + 3.0) / 2.0))
+    Acos = numpy.zeros((N, 1, 1), float)
+    Asin = None
     Acos[n, 0, 0] = 2 * K * RhoSum
-    return Acos, Asin
+    if not return_variance:
+        return Acos, Asin
+    Acos_var = numpy.zeros((N, 1, 1), float)
+    Acos_var[n, 0, 0] = _scf_nbody_variance(RhoSum, RhoSum2, npart, 2 * K)
+    return Acos, Asin, Acos_var, None
 
 
 def _scf_compute_determine_dens_kwargs(dens, param):
@@ -778,6 +797,7 @@ def _scf_compute_determine_dens_kwargs(dens, param):
     return dens_kw
 
 
+@disk_cache()
 def scf_compute_coeffs_spherical(dens, N, a=1.0, radial_order=None):
     """
     Numerically compute the expansion coefficients for a given spherical density
@@ -801,6 +821,7 @@ def scf_compute_coeffs_spherical(dens, N, a=1.0, radial_order=None):
     Notes
     -----
     - 2016-05-18 - Written - Aladdin Seaifan (UofT)
+    - 2026-10-19 - Cached on disk when a cache directory is set in the configuration file - Agent (local)
     """
     numOfParam = 0
     try:
@@ -842,14 +863,16 @@ def scf_compute_coeffs_spherical(dens, N, a=1.0, radial_order=None):
     return Acos, Asin
 
 
-def scf_compute_coeffs_axi_nbody(pos, N, L, mass=1.0, a=1.0):
+def scf_compute_coeffs_axi_nbody(
+    pos, N, L, mass=1.0, a=1.0, chunksize=100000, numcores=1, return_variance=False
+):
     """
     Numerically compute the expansion coefficients for a given $N$-body set of points assuming that the density is axisymmetric
 
     Parameters
     ----------
     pos : numpy.ndarray
-        Positions of particles in rectangular coordinates with shape [3,n]
+        Positions of particles in rectangular coordinates with shape [3,n]; can be a numpy.memmap, in which case particles are read from disk one block at a time
     N : int
         Size of the Nth dimension of the expansion coefficients
     L : int
@@ -858,21 +881,23 @@ def scf_compute_coeffs_axi_nbody(pos, N, L, mass=1.0, a=1.0):
         Mass of particles (scalar or array with size n), by default 1.0
     a : float, optional
         Parameter used to scale the radius, by default 1.0
+    chunksize : int, optional
+        Number of particles processed at a time, by default 100000
+    numcores : int, optional
+        Number of processes over which to split the blocks of particles, by default 1
+    return_variance : bool, optional
+        If True, also return the variance of the coefficients due to particle noise, by default False
 
     Returns
     -------
     tuple
-        Expansion coefficients for density dens that can be given to SCFPotential.__init__
+        Expansion coefficients for density dens that can be given to SCFPotential.__init__; if return_variance, followed by the variance of each coefficient (Acos_var,Asin_var)
 
     Notes
     -----
     - 2021-02-22 - Written based on general code - Bovy (UofT)
+    - 2026-10-19 - Process particles in blocks, optionally in parallel, and return the variance of the coefficients - Agent (local)
     """
-    r = numpy.sqrt(pos[0] ** 2 + pos[1] ** 2 + pos[2] ** 2)
-    costheta = pos[2] / r
-    mass = numpy.atleast_1d(mass)
-    Acos, Asin = numpy.zeros([N, L, 1]), None
-    Pll = numpy.ones(len(r))  # Set up Assoc. Legendre recursion
     # (n,l) dependent constant
     n = numpy.arange(0, N)[:, numpy.newaxis]
     l = numpy.arange(0, L)[numpy.newaxis, :]
@@ -888,24 +913,39 @@ def scf_compute_coeffs_axi_nbody(pos, N, L, mass=1.0, a=1.0):
         / gamma(2.0 * l + 1.5) ** 2
         / numpy.sqrt(2.0 * l + 1)
     )
-    # Set up Assoc. Legendre recursion
-    Plm = Pll
-    Plmm1 = 0.0
-    for ll in range(L):
-        # Compute Gegenbauer polys for this l
-        Cn = _C(_RToxi(r, a=a), N, ll, singleL=True)
-        phinlm = -((r / a) ** ll) / (1.0 + r / a) ** (2.0 * ll + 1) * Cn[:, 0] * Plm
-        # Acos
-        Sum = numpy.sum(mass[numpy.newaxis, :] * phinlm, axis=-1)
-        Acos[:, ll, 0] = Sum / Inl[:, ll]
-        # Recurse Assoc. Legendre
-        if ll < L:
+
+    def block_sums(pos, mass):
+        r = numpy.sqrt(pos[0] ** 2 + pos[1] ** 2 + pos[2] ** 2)
+        costheta = pos[2] / r
+        xi = _RToxi(r, a=a)
+        Sum, Sum2 = numpy.zeros((2, N, L))
+        # Set up Assoc. Legendre recursion
+        Plm = numpy.ones(len(r))
+        Plmm1 = 0.0
+        for ll in range(L):
+            # Compute Gegenbauer polys for this l
+            Cn = _C(xi, N, ll, singleL=True)
+            phinl = -((r / a) ** ll) / (1.0 + r / a) ** (2.0 * ll + 1) * Cn[:, 0]
+            weight = mass * Plm
+            Sum[:, ll] = numpy.dot(phinl, weight)
+            Sum2[:, ll] = numpy.dot(phinl**2, weight**2)
+            # Recurse Assoc. Legendre
             tmp = Plm
             Plm = ((2 * ll + 1.0) * costheta * Plm - ll * Plmm1) / (ll + 1)
             Plmm1 = tmp
-    return Acos, Asin
+        return [Sum, Sum2]
+
+    (Sum, Sum2), npart = _scf_nbody_sums(block_sums, pos, mass, chunksize, numcores)
+    Acos, Asin = numpy.zeros([N, L, 1]), None
+    Acos[:, :, 0] = Sum / Inl
+    if not return_variance:
+        return Acos, Asin
+    Acos_var = numpy.zeros([N, L, 1])
+    Acos_var[:, :, 0] = _scf_nbody_variance(Sum, Sum2, npart, 1.0 / Inl)
+    return Acos, Asin, Acos_var, None
 
 
+@disk_cache()
 def scf_compute_coeffs_axi(dens, N, L, a=1.0, radial_order=None, costheta_order=None):
     """
     Numerically compute the expansion coefficients for a given axi-symmetric density
@@ -933,6 +973,7 @@ def scf_compute_coeffs_axi(dens, N, L, a=1.0, radial_order=None, costheta_order=
     Notes
     -----
     - 2016-05-20 - Written - Aladdin Seaifan (UofT)
+    - 2026-10-19 - Cached on disk when a cache directory is set in the configuration file - Agent (local)
     """
     numOfParam = 0
     try:
@@ -991,14 +1032,16 @@ def scf_compute_coeffs_axi(dens, N, L, a=1.0, radial_order=None, costheta_order=
     return Acos, Asin
 
 
-def scf_compute_coeffs_nbody(pos, N, L, mass=1.0, a=1.0):
+def scf_compute_coeffs_nbody(
+    pos, N, L, mass=1.0, a=1.0, chunksize=100000, numcores=1, return_variance=False
+):
     """
     Numerically compute the expansion coefficients for a given $N$-body set of points
 
     Parameters
     ----------
     pos : numpy.ndarray
-        Positions of particles in rectangular coordinates with shape [3,n]
+        Positions of particles in rectangular coordinates with shape [3,n]; can be a numpy.memmap, in which case particles are read from disk one block at a time
     N : int
         Size of the Nth dimension of the expansion coefficients
     L : int
@@ -1007,24 +1050,24 @@ def scf_compute_coeffs_nbody(pos, N, L, mass=1.0, a=1.0):
         Mass of particles (scalar or array with size n), by default 1.0
     a : float, optional
         Parameter used to scale the radius, by default 1.0
+    chunksize : int, optional
+        Number of particles processed at a time, by default 100000; memory use is dominated by N x L x chunksize radial basis functions
+    numcores : int, optional
+        Number of processes over which to split the blocks of particles, by default 1
+    return_variance : bool, optional
+        If True, also return the variance of the coefficients due to particle noise, by default False
 
     Returns
     -------
     tuple
-        Expansion coefficients for density dens that can be given to SCFPotential.__init__
+        Expansion coefficients for density dens that can be given to SCFPotential.__init__; if return_variance, followed by the variance of each coefficient (Acos_var,Asin_var)
 
     Notes
     -----
     - 2020-11-18 - Written - Morgan Bennett (UofT)
+    - 2026-10-19 - Process particles in blocks, optionally in parallel, and return the variance of the coefficients - Agent (local)
 
     """
-    r = numpy.sqrt(pos[0] ** 2 + pos[1] ** 2 + pos[2] ** 2)
-    phi = numpy.arctan2(pos[1], pos[0])
-    costheta = pos[2] / r
-    sintheta = numpy.sqrt(1.0 - costheta**2.0)
-    mass = numpy.atleast_1d(mass)
-    Acos, Asin = numpy.zeros([N, L, L]), numpy.zeros([N, L, L])
-    Pll = numpy.ones(len(r))  # Set up Assoc. Legendre recursion
     # (n,l) dependent constant
     n = numpy.arange(0, N)[:, numpy.newaxis]
     l = numpy.arange(0, L)[numpy.newaxis, :]
@@ -1039,38 +1082,65 @@ def scf_compute_coeffs_nbody(pos, N, L, mass=1.0, a=1.0):
         / (n + 2.0 * l + 1.5)
         / gamma(2.0 * l + 1.5) ** 2
     )
-    for mm in range(L):  # Loop over m
-        cosmphi = numpy.cos(phi * mm)
-        sinmphi = numpy.sin(phi * mm)
-        # Set up Assoc. Legendre recursion
-        Plm = Pll
-        Plmm1 = 0.0
-        for ll in range(mm, L):
-            # Compute Gegenbauer polys for this l
-            Cn = _C(_RToxi(r, a=a), N, ll, singleL=True)
-            phinlm = -((r / a) ** ll) / (1.0 + r / a) ** (2.0 * ll + 1) * Cn[:, 0] * Plm
-            # Acos
-            Sum = numpy.sqrt(
-                (2.0 * ll + 1) * gamma(ll - mm + 1) / gamma(ll + mm + 1)
-            ) * numpy.sum((mass * cosmphi)[numpy.newaxis, :] * phinlm, axis=-1)
-            Acos[:, ll, mm] = Sum / Inl[:, ll]
-            # Asin
-            Sum = numpy.sqrt(
-                (2.0 * ll + 1) * gamma(ll - mm + 1) / gamma(ll + mm + 1)
-            ) * numpy.sum((mass * sinmphi)[numpy.newaxis, :] * phinlm, axis=-1)
-            Asin[:, ll, mm] = Sum / Inl[:, ll]
-            # Recurse Assoc. Legendre
-            if ll < L:
+    # (l,m) dependent normalization, zero for m > l
+    ll, mm = numpy.meshgrid(numpy.arange(L), numpy.arange(L), indexing="ij")
+    Nlm = numpy.zeros((L, L))
+    Nlm[mm <= ll] = numpy.sqrt(
+        (2.0 * ll + 1) * gamma(ll - mm + 1) / gamma(ll + mm + 1)
+    )[mm <= ll]
+    norm = Nlm[numpy.newaxis] / Inl[:, :, numpy.newaxis]
+
+    def block_sums(pos, mass):
+        r = numpy.sqrt(pos[0] ** 2 + pos[1] ** 2 + pos[2] ** 2)
+        phi = numpy.arctan2(pos[1], pos[0])
+        costheta = pos[2] / r
+        sintheta = numpy.sqrt(1.0 - costheta**2.0)
+        xi = _RToxi(r, a=a)
+        # Radial basis functions, computed once for all m
+        phinl = numpy.empty((L, N, len(r)))
+        for ll in range(L):
+            Cn = _C(xi, N, ll, singleL=True)
+            phinl[ll] = -((r / a) ** ll) / (1.0 + r / a) ** (2.0 * ll + 1) * Cn[:, 0]
+        Sumc, Sums, Sumc2, Sums2 = numpy.zeros((4, N, L, L))
+        Pll = numpy.ones(len(r))  # Set up Assoc. Legendre recursion
+        for mm in range(L):  # Loop over m
+            cosmphi = numpy.cos(phi * mm)
+            sinmphi = numpy.sin(phi * mm)
+            # Set up Assoc. Legendre recursion
+            Plm = Pll
+            Plmm1 = 0.0
+            for ll in range(mm, L):
+                wcos = mass * cosmphi * Plm
+                wsin = mass * sinmphi * Plm
+                Sumc[:, ll, mm] = numpy.dot(phinl[ll], wcos)
+                Sums[:, ll, mm] = numpy.dot(phinl[ll], wsin)
+                Sumc2[:, ll, mm] = numpy.dot(phinl[ll] ** 2, wcos**2)
+                Sums2[:, ll, mm] = numpy.dot(phinl[ll] ** 2, wsin**2)
+                # Recurse Assoc. Legendre
                 tmp = Plm
                 Plm = ((2 * ll + 1.0) * costheta * Plm - (ll + mm) * Plmm1) / (
                     ll - mm + 1
                 )
                 Plmm1 = tmp
-        # Recurse Assoc. Legendre
-        Pll *= -(2 * mm + 1.0) * sintheta
-    return Acos, Asin
+            # Recurse Assoc. Legendre
+            Pll = -(2 * mm + 1.0) * sintheta * Pll
+        return [Sumc, Sums, Sumc2, Sums2]
+
+    (Sumc, Sums, Sumc2, Sums2), npart = _scf_nbody_sums(
+        block_sums, pos, mass, chunksize, numcores
+    )
+    Acos, Asin = Sumc * norm, Sums * norm
+    if not return_variance:
+        return Acos, Asin
+    return (
+        Acos,
+        Asin,
+        _scf_nbody_variance(Sumc, Sumc2, npart, norm),
+        _scf_nbody_variance(Sums, Sums2, npart, norm),
+    )
 
 
+@disk_cache()
 def scf_compute_coeffs(
     dens, N, L, a=1.0, radial_order=None, costheta_order=None, phi_order=None
 ):
@@ -1102,6 +1172,7 @@ def scf_compute_coeffs(
     Notes
     -----
     - 2016-05-27 - Written - Aladdin Seaifan (UofT)
+    - 2026-10-19 - Cached on disk when a cache directory is set in the configuration file - Agent (local)
 
     """
     dens_kw = _scf_compute_determine_dens_kwargs(dens, [0.1, 0.1, 0.1])
@@ -2,7 +2,6 @@
 #   SoftenedNeedleBarPotential.py: class that implements the softened needle
 #                                  bar potential from Long & Murali (1992)
 ###############################################################################
-import hashlib
 
 import numpy
 
@@ -79,7 +78,6 @@ class SoftenedNeedleBarPotential(Potential):
         self._c2 = c**2.0
         self._pa = pa
         self._omegab = omegab
-        self._force_hash = None
         self.hasC = True
         self.hasC_dxdv = False
         if normalize or (
@@ -94,19 +92,19 @@ class SoftenedNeedleBarPotential(Potential):
         Tp, Tm = self._compute_TpTm(x, y, z)
         return numpy.log((x - self._a + Tm) / (x + self._a + Tp)) / 2.0 / self._a
 
+    def _forces(self, R, z, phi=0.0, t=0.0):
+        Fx, Fy, Fz = self._compute_xyzforces(R, z, phi, t)
+        cp, sp = numpy.cos(phi), numpy.sin(phi)
+        return cp * Fx + sp * Fy, Fz, R * (-sp * Fx + cp * Fy)
+
     def _Rforce(self, R, z, phi=0.0, t=0.0):
-        self._compute_xyzforces(R, z, phi, t)
-        return numpy.cos(phi) * self._cached_Fx + numpy.sin(phi) * self._cached_Fy
+        return self._forces(R, z, phi=phi, t=t)[0]
 
     def _phitorque(self, R, z, phi=0.0, t=0.0):
-        self._compute_xyzforces(R, z, phi, t)
-        return R * (
-            -numpy.sin(phi) * self._cached_Fx + numpy.cos(phi) * self._cached_Fy
-        )
+        return self._forces(R, z, phi=phi, t=t)[2]
 
     def _zforce(self, R, z, phi=0.0, t=0.0):
-        self._compute_xyzforces(R, z, phi, t)
-        return self._cached_Fz
+        return self._forces(R, z, phi=phi, t=t)[1]
 
     def OmegaP(self):
         return self._omegab
@@ -122,20 +120,15 @@ class SoftenedNeedleBarPotential(Potential):
         )
 
     def _compute_xyzforces(self, R, z, phi, t):
-        # Compute all rectangular forces
-        new_hash = hashlib.md5(numpy.array([R, phi, z, t])).hexdigest()
-        if new_hash != self._force_hash:
-            x, y, z = self._compute_xyz(R, phi, z, t)
-            Tp, Tm = self._compute_TpTm(x, y, z)
-            Fx = self._xforce_xyz(x, y, z, Tp, Tm)
-            Fy = self._yforce_xyz(x, y, z, Tp, Tm)
-            Fz = self._zforce_xyz(x, y, z, Tp, Tm)
-            self._force_hash = new_hash
-            tp = self._pa + self._omegab * t
-            cp, sp = numpy.cos(tp), numpy.sin(tp)
-            self._cached_Fx = cp * Fx - sp * Fy
-            self._cached_Fy = sp * Fx + cp * Fy
-            self._cached_Fz = Fz
+        # Compute all rectangular forces, rotated back to the inertial frame
+        x, y, z = self._compute_xyz(R, phi, z, t)
+        Tp, Tm = self._compute_TpTm(x, y, z)
+        Fx = self._xforce_xyz(x, y, z, Tp, Tm)
+        Fy = self._yforce_xyz(x, y, z, Tp, Tm)
+        Fz = self._zforce_xyz(x, y, z, Tp, Tm)
+        tp = self._pa + self._omegab * t
+        cp, sp = numpy.cos(tp), numpy.sin(tp)
+        return cp * Fx - sp * Fy, sp * Fx + cp * Fy, Fz
 
     def _xforce_xyz(self, x, y, z, Tp, Tm):
         return -2.0 * x / Tp / Tm / (Tp + Tm)
@@ -53,8 +53,9 @@ class SphericalShellPotential(SphericalPotential):
                     "SphericalShellPotential with normalize= for a > 1 is not supported (because the force is always 0 at r=1)"
                 )
             self.normalize(normalize)
-        self.hasC = False
-        self.hasC_dxdv = False
+        self.hasC = True
+        self.hasC_dxdv = True
+        self.hasC_dens = True
 
     def _revaluate(self, r, t=0.0):
         """The potential as a function of r"""
@@ -103,11 +103,13 @@ class SpiralArmsPotential(Potential):
         self._phi_ref = phi_ref
         self._Rs = Rs
         self._H = H
-        self._Cs = self._Cs0 = numpy.array(Cs)
-        self._ns = self._ns0 = numpy.arange(1, len(Cs) + 1)
+        self._Cs = numpy.array(Cs)
+        self._ns = numpy.arange(1, len(Cs) + 1)
         self._omega = omega
         self._rho0 = 1 / (4 * numpy.pi)
-        self._HNn = self._HNn0 = self._H * self._N * self._ns0
+        self._HNn = self._H * self._N * self._ns
+        # Cache of the terms shared by the potential and its derivatives
+        self._harmonics_key = None
 
         self.isNonAxi = True  # Potential is not axisymmetric
         self.hasC = (
@@ -116,116 +118,28 @@ class SpiralArmsPotential(Potential):
         self.hasC_dxdv = True  # Potential has C implementation of second derivatives
 
     def _evaluate(self, R, z, phi=0, t=0):
-        if isinstance(R, numpy.ndarray) or isinstance(z, numpy.ndarray):
-            nR = len(R) if isinstance(R, numpy.ndarray) else len(z)
-            self._Cs = numpy.transpose(
-                numpy.array(
-                    [
-                        self._Cs0,
-                    ]
-                    * nR
-                )
-            )
-            self._ns = numpy.transpose(
-                numpy.array(
-                    [
-                        self._ns0,
-                    ]
-                    * nR
-                )
-            )
-            self._HNn = numpy.transpose(
-                numpy.array(
-                    [
-                        self._HNn0,
-                    ]
-                    * nR
-                )
-            )
-        else:
-            self._Cs = self._Cs0
-            self._ns = self._ns0
-            self._HNn = self._HNn0
-
-        Ks = self._K(R)
-        Bs = self._B(R)
-        Ds = self._D(R)
-
-        return (
-            -self._H
-            * numpy.exp(-(R - self._r_ref) / self._Rs)
-            * numpy.sum(
-                self._Cs
-                / Ks
-                / Ds
-                * numpy.cos(self._ns * self._gamma(R, phi - self._omega * t))
-                / numpy.cosh(Ks * z / Bs) ** Bs,
-                axis=0,
-            )
+        h = self._harmonics(R, z, phi, t)
+        return -h["He"] * numpy.sum(
+            h["Cs"] / h["Ks"] / h["Ds"] * h["cos_ng"] * h["sechzKB_Bs"], axis=0
         )
 
     def _Rforce(self, R, z, phi=0, t=0):
-        if isinstance(R, numpy.ndarray) or isinstance(z, numpy.ndarray):
-            nR = len(R) if isinstance(R, numpy.ndarray) else len(z)
-            self._Cs = numpy.transpose(
-                numpy.array(
-                    [
-                        self._Cs0,
-                    ]
-                    * nR
-                )
-            )
-            self._ns = numpy.transpose(
-                numpy.array(
-                    [
-                        self._ns0,
-                    ]
-                    * nR
-                )
-            )
-            self._HNn = numpy.transpose(
-                numpy.array(
-                    [
-                        self._HNn0,
-                    ]
-                    * nR
-                )
-            )
-        else:
-            self._Cs = self._Cs0
-            self._ns = self._ns0
-            self._HNn = self._HNn0
-
-        He = self._H * numpy.exp(-(R - self._r_ref) / self._Rs)
-
-        Ks = self._K(R)
-        Bs = self._B(R)
-        Ds = self._D(R)
-
-        dKs_dR = self._dK_dR(R)
-        dBs_dR = self._dB_dR(R)
-        dDs_dR = self._dD_dR(R)
-
-        g = self._gamma(R, phi - self._omega * t)
-        dg_dR = self._dgamma_dR(R)
-
-        cos_ng = numpy.cos(self._ns * g)
-        sin_ng = numpy.sin(self._ns * g)
-
-        zKB = z * Ks / Bs
-        sechzKB = 1 / numpy.cosh(zKB)
-
-        return -He * numpy.sum(
-            self._Cs
-            * sechzKB**Bs
+        h = self._harmonics(R, z, phi, t)
+        Ks, Bs, Ds = h["Ks"], h["Bs"], h["Ds"]
+        dKs_dR, dBs_dR, dDs_dR = h["dKs_dR"], h["dBs_dR"], h["dDs_dR"]
+        cos_ng, sin_ng = h["cos_ng"], h["sin_ng"]
+
+        return -h["He"] * numpy.sum(
+            h["Cs"]
+            * h["sechzKB_Bs"]
             / Ds
             * (
                 (
-                    self._ns * dg_dR / Ks * sin_ng
+                    h["ns"] * h["dg_dR"] / Ks * sin_ng
                     + cos_ng
                     * (
-                        z * numpy.tanh(zKB) * (dKs_dR / Ks - dBs_dR / Bs)
-                        - dBs_dR / Ks * numpy.log(sechzKB)
+                        h["ztanhzKB"] * (dKs_dR / Ks - dBs_dR / Bs)
+                        - dBs_dR / Ks * h["log_sechzKB"]
                         + dKs_dR / Ks**2
                         + dDs_dR / Ds / Ks
                     )
@@ -236,198 +150,77 @@ class SpiralArmsPotential(Potential):
         )
 
     def _zforce(self, R, z, phi=0, t=0):
-        if isinstance(R, numpy.ndarray) or isinstance(z, numpy.ndarray):
-            nR = len(R) if isinstance(R, numpy.ndarray) else len(z)
-            self._Cs = numpy.transpose(
-                numpy.array(
-                    [
-                        self._Cs0,
-                    ]
-                    * nR
-                )
-            )
-            self._ns = numpy.transpose(
-                numpy.array(
-                    [
-                        self._ns0,
-                    ]
-                    * nR
-                )
-            )
-            self._HNn = numpy.transpose(
-                numpy.array(
-                    [
-                        self._HNn0,
-                    ]
-                    * nR
-                )
-            )
-        else:
-            self._Cs = self._Cs0
-            self._ns = self._ns0
-            self._HNn = self._HNn0
-
-        Ks = self._K(R)
-        Bs = self._B(R)
-        Ds = self._D(R)
-        zK_B = z * Ks / Bs
-
-        return (
-            -self._H
-            * numpy.exp(-(R - self._r_ref) / self._Rs)
-            * numpy.sum(
-                self._Cs
-                / Ds
-                * numpy.cos(self._ns * self._gamma(R, phi - self._omega * t))
-                * numpy.tanh(zK_B)
-                / numpy.cosh(zK_B) ** Bs,
-                axis=0,
-            )
+        h = self._harmonics(R, z, phi, t)
+        return -h["He"] * numpy.sum(
+            h["Cs"] / h["Ds"] * h["cos_ng"] * h["tanhzKB"] * h["sechzKB_Bs"], axis=0
         )
 
     def _phitorque(self, R, z, phi=0, t=0):
-        if isinstance(R, numpy.ndarray) or isinstance(z, numpy.ndarray):
-            nR = len(R) if isinstance(R, numpy.ndarray) else len(z)
-            self._Cs = numpy.transpose(
-                numpy.array(
-                    [
-                        self._Cs0,
-                    ]
-                    * nR
-                )
-            )
-            self._ns = numpy.transpose(
-                numpy.array(
-                    [
-                        self._ns0,
-                    ]
-                    * nR
-                )
-            )
-            self._HNn = numpy.transpose(
-                numpy.array(
-                    [
-                        self._HNn0,
-                    ]
-                    * nR
-                )
-            )
-        else:
-            self._Cs = self._Cs0
-            self._ns = self._ns0
-            self._HNn = self._HNn0
-
-        g = self._gamma(R, phi - self._omega * t)
-        Ks = self._K(R)
-        Bs = self._B(R)
-        Ds = self._D(R)
-
-        return (
-            -self._H
-            * numpy.exp(-(R - self._r_ref) / self._Rs)
-            * numpy.sum(
-                self._N
-                * self._ns
-                * self._Cs
-                / Ds
-                / Ks
-                / numpy.cosh(z * Ks / Bs) ** Bs
-                * numpy.sin(self._ns * g),
-                axis=0,
-            )
+        h = self._harmonics(R, z, phi, t)
+        return -h["He"] * numpy.sum(
+            self._N
+            * h["ns"]
+            * h["Cs"]
+            / h["Ds"]
+            / h["Ks"]
+            * h["sechzKB_Bs"]
+            * h["sin_ng"],
+            axis=0,
         )
 
     def _R2deriv(self, R, z, phi=0, t=0):
-        if isinstance(R, numpy.ndarray) or isinstance(z, numpy.ndarray):
-            nR = len(R) if isinstance(R, numpy.ndarray) else len(z)
-            self._Cs = numpy.transpose(
-                numpy.array(
-                    [
-                        self._Cs0,
-                    ]
-                    * nR
-                )
-            )
-            self._ns = numpy.transpose(
-                numpy.array(
-                    [
-                        self._ns0,
-                    ]
-                    * nR
-                )
-            )
-            self._HNn = numpy.transpose(
-                numpy.array(
-                    [
-                        self._HNn0,
-                    ]
-                    * nR
-                )
-            )
-        else:
-            self._Cs = self._Cs0
-            self._ns = self._ns0
-            self._HNn = self._HNn0
-
+        h = self._harmonics(R, z, phi, t)
+        R, z = h["R"], h["z"]
+        ns, HNn = h["ns"], h["HNn"]
         Rs = self._Rs
-        He = self._H * numpy.exp(-(R - self._r_ref) / self._Rs)
-
-        Ks = self._K(R)
-        Bs = self._B(R)
-        Ds = self._D(R)
 
-        dKs_dR = self._dK_dR(R)
-        dBs_dR = self._dB_dR(R)
-        dDs_dR = self._dD_dR(R)
+        Ks, Bs, Ds = h["Ks"], h["Bs"], h["Ds"]
+        dKs_dR, dBs_dR, dDs_dR = h["dKs_dR"], h["dBs_dR"], h["dDs_dR"]
 
         R_sina = R * self._sin_alpha
-        HNn_R_sina = self._HNn / R_sina
+        HNn_R_sina = HNn / R_sina
         HNn_R_sina_2 = HNn_R_sina**2
         x = R * (0.3 * HNn_R_sina + 1) * self._sin_alpha
 
-        d2Ks_dR2 = 2 * self._N * self._ns / R**3 / self._sin_alpha
+        d2Ks_dR2 = 2 * self._N * ns / R**3 / self._sin_alpha
         d2Bs_dR2 = HNn_R_sina / R**2 * (2.4 * HNn_R_sina + 2)
         d2Ds_dR2 = (
             self._sin_alpha
             / R
             / x
             * (
-                self._HNn
+                HNn
                 * (
-                    0.18 * self._HNn * (HNn_R_sina + 0.3 * HNn_R_sina_2 + 1) / x**2
+                    0.18 * HNn * (HNn_R_sina + 0.3 * HNn_R_sina_2 + 1) / x**2
                     + 2 / R_sina
                     - 0.6 * HNn_R_sina * (1 + 0.6 * HNn_R_sina) / x
                     - 0.6 * (HNn_R_sina + 0.3 * HNn_R_sina_2 + 1) / x
-                    + 1.8 * self._HNn / R_sina**2
+                    + 1.8 * HNn / R_sina**2
                 )
             )
         )
 
-        g = self._gamma(R, phi - self._omega * t)
-        dg_dR = self._dgamma_dR(R)
+        dg_dR = h["dg_dR"]
         d2g_dR2 = self._N / R**2 / self._tan_alpha
 
-        sin_ng = numpy.sin(self._ns * g)
-        cos_ng = numpy.cos(self._ns * g)
+        sin_ng, cos_ng = h["sin_ng"], h["cos_ng"]
 
-        zKB = z * Ks / Bs
-        sechzKB = 1 / numpy.cosh(zKB)
-        sechzKB_Bs = sechzKB**Bs
-        log_sechzKB = numpy.log(sechzKB)
-        tanhzKB = numpy.tanh(zKB)
-        ztanhzKB = z * tanhzKB
+        sechzKB_Bs = h["sechzKB_Bs"]
+        log_sechzKB = h["log_sechzKB"]
+        tanhzKB = h["tanhzKB"]
+        ztanhzKB = h["ztanhzKB"]
 
         return (
-            -He
+            -h["He"]
             / Rs
             * (
                 numpy.sum(
-                    self._Cs
+                    h["Cs"]
                     * sechzKB_Bs
                     / Ds
                     * (
                         (
-                            self._ns * dg_dR / Ks * sin_ng
+                            ns * dg_dR / Ks * sin_ng
                             + cos_ng
                             * (
                                 ztanhzKB * (dKs_dR / Ks - dBs_dR / Bs)
@@ -449,7 +242,7 @@ class SpiralArmsPotential(Potential):
                                     - dDs_dR / Ds
                                 )
                                 * (
-                                    self._ns * dg_dR * sin_ng
+                                    ns * dg_dR * sin_ng
                                     + cos_ng
                                     * (
                                         ztanhzKB * Ks * (dKs_dR / Ks - dBs_dR / Bs)
@@ -459,15 +252,15 @@ class SpiralArmsPotential(Potential):
                                     )
                                 )
                                 + (
-                                    self._ns
+                                    ns
                                     * (
                                         sin_ng * (d2g_dR2 / Ks - dg_dR / Ks**2 * dKs_dR)
-                                        + dg_dR**2 / Ks * cos_ng * self._ns
+                                        + dg_dR**2 / Ks * cos_ng * ns
                                     )
                                     + z
                                     * (
                                         -sin_ng
-                                        * self._ns
+                                        * ns
                                         * dg_dR
                                         * tanhzKB
                                         * (dKs_dR / Ks - dBs_dR / Bs)
@@ -500,14 +293,14 @@ class SpiralArmsPotential(Potential):
                                         / Ks
                                         * log_sechzKB
                                         * sin_ng
-                                        * self._ns
+                                        * ns
                                         * dg_dR
                                     )
                                     + (
                                         (
                                             cos_ng
                                             * (d2Ks_dR2 / Ks**2 - 2 * dKs_dR**2 / Ks**3)
-                                            - dKs_dR / Ks**2 * sin_ng * self._ns * dg_dR
+                                            - dKs_dR / Ks**2 * sin_ng * ns * dg_dR
                                         )
                                         + (
                                             cos_ng
@@ -516,12 +309,7 @@ class SpiralArmsPotential(Potential):
                                                 - (dDs_dR / Ds) ** 2 / Ks
                                                 - dDs_dR / Ds / Ks**2 * dKs_dR
                                             )
-                                            - sin_ng
-                                            * self._ns
-                                            * dg_dR
-                                            * dDs_dR
-                                            / Ds
-                                            / Ks
+                                            - sin_ng * ns * dg_dR * dDs_dR / Ds / Ks
                                         )
                                     )
                                 )
@@ -539,7 +327,7 @@ class SpiralArmsPotential(Potential):
                                             + log_sechzKB * dBs_dR
                                         )
                                     )
-                                    + sin_ng * self._ns * dg_dR
+                                    + sin_ng * ns * dg_dR
                                 )
                             )
                         )
@@ -550,177 +338,52 @@ class SpiralArmsPotential(Potential):
         )
 
     def _z2deriv(self, R, z, phi=0, t=0):
-        if isinstance(R, numpy.ndarray) or isinstance(z, numpy.ndarray):
-            nR = len(R) if isinstance(R, numpy.ndarray) else len(z)
-            self._Cs = numpy.transpose(
-                numpy.array(
-                    [
-                        self._Cs0,
-                    ]
-                    * nR
-                )
-            )
-            self._ns = numpy.transpose(
-                numpy.array(
-                    [
-                        self._ns0,
-                    ]
-                    * nR
-                )
-            )
-            self._HNn = numpy.transpose(
-                numpy.array(
-                    [
-                        self._HNn0,
-                    ]
-                    * nR
-                )
-            )
-        else:
-            self._Cs = self._Cs0
-            self._ns = self._ns0
-            self._HNn = self._HNn0
-
-        g = self._gamma(R, phi - self._omega * t)
-        Ks = self._K(R)
-        Bs = self._B(R)
-        Ds = self._D(R)
-        zKB = z * Ks / Bs
-        tanh2_zKB = numpy.tanh(zKB) ** 2
-
-        return (
-            -self._H
-            * numpy.exp(-(R - self._r_ref) / self._Rs)
-            * numpy.sum(
-                self._Cs
-                * Ks
-                / Ds
-                * ((tanh2_zKB - 1) / Bs + tanh2_zKB)
-                * numpy.cos(self._ns * g)
-                / numpy.cosh(zKB) ** Bs,
-                axis=0,
-            )
+        h = self._harmonics(R, z, phi, t)
+        tanh2_zKB = h["tanhzKB"] ** 2
+        return -h["He"] * numpy.sum(
+            h["Cs"]
+            * h["Ks"]
+            / h["Ds"]
+            * ((tanh2_zKB - 1) / h["Bs"] + tanh2_zKB)
+            * h["cos_ng"]
+            * h["sechzKB_Bs"],
+            axis=0,
         )
 
     def _phi2deriv(self, R, z, phi=0, t=0):
-        if isinstance(R, numpy.ndarray) or isinstance(z, numpy.ndarray):
-            nR = len(R) if isinstance(R, numpy.ndarray) else len(z)
-            self._Cs = numpy.transpose(
-                numpy.array(
-                    [
-                        self._Cs0,
-                    ]
-                    * nR
-                )
-            )
-            self._ns = numpy.transpose(
-                numpy.array(
-                    [
-                        self._ns0,
-                    ]
-                    * nR
-                )
-            )
-            self._HNn = numpy.transpose(
-                numpy.array(
-                    [
-                        self._HNn0,
-                    ]
-                    * nR
-                )
-            )
-        else:
-            self._Cs = self._Cs0
-            self._ns = self._ns0
-            self._HNn = self._HNn0
-
-        g = self._gamma(R, phi - self._omega * t)
-        Ks = self._K(R)
-        Bs = self._B(R)
-        Ds = self._D(R)
-
-        return (
-            self._H
-            * numpy.exp(-(R - self._r_ref) / self._Rs)
-            * numpy.sum(
-                self._Cs
-                * self._N**2.0
-                * self._ns**2.0
-                / Ds
-                / Ks
-                / numpy.cosh(z * Ks / Bs) ** Bs
-                * numpy.cos(self._ns * g),
-                axis=0,
-            )
+        h = self._harmonics(R, z, phi, t)
+        return h["He"] * numpy.sum(
+            h["Cs"]
+            * self._N**2.0
+            * h["ns"] ** 2.0
+            / h["Ds"]
+            / h["Ks"]
+            * h["sechzKB_Bs"]
+            * h["cos_ng"],
+            axis=0,
         )
 
     def _Rzderiv(self, R, z, phi=0.0, t=0.0):
-        if isinstance(R, numpy.ndarray) or isinstance(z, numpy.ndarray):
-            nR = len(R) if isinstance(R, numpy.ndarray) else len(z)
-            self._Cs = numpy.transpose(
-                numpy.array(
-                    [
-                        self._Cs0,
-                    ]
-                    * nR
-                )
-            )
-            self._ns = numpy.transpose(
-                numpy.array(
-                    [
-                        self._ns0,
-                    ]
-                    * nR
-                )
-            )
-            self._HNn = numpy.transpose(
-                numpy.array(
-                    [
-                        self._HNn0,
-                    ]
-                    * nR
-                )
-            )
-        else:
-            self._Cs = self._Cs0
-            self._ns = self._ns0
-            self._HNn = self._HNn0
-
-        Rs = self._Rs
-        He = self._H * numpy.exp(-(R - self._r_ref) / self._Rs)
-
-        Ks = self._K(R)
-        Bs = self._B(R)
-        Ds = self._D(R)
-
-        dKs_dR = self._dK_dR(R)
-        dBs_dR = self._dB_dR(R)
-        dDs_dR = self._dD_dR(R)
-
-        g = self._gamma(R, phi - self._omega * t)
-        dg_dR = self._dgamma_dR(R)
-
-        cos_ng = numpy.cos(self._ns * g)
-        sin_ng = numpy.sin(self._ns * g)
-
-        zKB = z * Ks / Bs
-        sechzKB = 1 / numpy.cosh(zKB)
-        sechzKB_Bs = sechzKB**Bs
-        log_sechzKB = numpy.log(sechzKB)
-        tanhzKB = numpy.tanh(zKB)
-
-        return -He * numpy.sum(
-            sechzKB_Bs
-            * self._Cs
+        h = self._harmonics(R, z, phi, t)
+        Ks, Bs, Ds = h["Ks"], h["Bs"], h["Ds"]
+        dKs_dR, dBs_dR, dDs_dR = h["dKs_dR"], h["dBs_dR"], h["dDs_dR"]
+        cos_ng, sin_ng = h["cos_ng"], h["sin_ng"]
+        zKB = h["zKB"]
+        log_sechzKB = h["log_sechzKB"]
+        tanhzKB = h["tanhzKB"]
+
+        return -h["He"] * numpy.sum(
+            h["sechzKB_Bs"]
+            * h["Cs"]
             / Ds
             * (
                 Ks
                 * tanhzKB
                 * (
-                    self._ns * dg_dR / Ks * sin_ng
+                    h["ns"] * h["dg_dR"] / Ks * sin_ng
                     + cos_ng
                     * (
-                        z * tanhzKB * (dKs_dR / Ks - dBs_dR / Bs)
+                        h["ztanhzKB"] * (dKs_dR / Ks - dBs_dR / Bs)
                         - dBs_dR / Ks * log_sechzKB
                         + dKs_dR / Ks**2
                         + dDs_dR / Ds / Ks
@@ -733,78 +396,33 @@ class SpiralArmsPotential(Potential):
                         + tanhzKB * (dKs_dR / Ks - dBs_dR / Bs)
                         + dBs_dR / Bs * tanhzKB
                     )
-                    - tanhzKB / Rs
+                    - tanhzKB / self._Rs
                 )
             ),
             axis=0,
         )
 
     def _Rphideriv(self, R, z, phi=0, t=0):
-        if isinstance(R, numpy.ndarray) or isinstance(z, numpy.ndarray):
-            nR = len(R) if isinstance(R, numpy.ndarray) else len(z)
-            self._Cs = numpy.transpose(
-                numpy.array(
-                    [
-                        self._Cs0,
-                    ]
-                    * nR
-                )
-            )
-            self._ns = numpy.transpose(
-                numpy.array(
-                    [
-                        self._ns0,
-                    ]
-                    * nR
-                )
-            )
-            self._HNn = numpy.transpose(
-                numpy.array(
-                    [
-                        self._HNn0,
-                    ]
-                    * nR
-                )
-            )
-        else:
-            self._Cs = self._Cs0
-            self._ns = self._ns0
-            self._HNn = self._HNn0
-
-        He = self._H * numpy.exp(-(R - self._r_ref) / self._Rs)
-
-        Ks = self._K(R)
-        Bs = self._B(R)
-        Ds = self._D(R)
-
-        dKs_dR = self._dK_dR(R)
-        dBs_dR = self._dB_dR(R)
-        dDs_dR = self._dD_dR(R)
-
-        g = self._gamma(R, phi - self._omega * t)
-        dg_dR = self._dgamma_dR(R)
-
-        cos_ng = numpy.cos(self._ns * g)
-        sin_ng = numpy.sin(self._ns * g)
-        zKB = z * Ks / Bs
-        sechzKB = 1 / numpy.cosh(zKB)
-        sechzKB_Bs = sechzKB**Bs
-
-        return -He * numpy.sum(
-            self._Cs
-            * sechzKB_Bs
+        h = self._harmonics(R, z, phi, t)
+        Ks, Bs, Ds = h["Ks"], h["Bs"], h["Ds"]
+        dKs_dR, dBs_dR, dDs_dR = h["dKs_dR"], h["dBs_dR"], h["dDs_dR"]
+        ns = h["ns"]
+
+        return -h["He"] * numpy.sum(
+            h["Cs"]
+            * h["sechzKB_Bs"]
             / Ds
-            * self._ns
+            * ns
             * self._N
             * (
-                -self._ns * dg_dR / Ks * cos_ng
-                + sin_ng
+                -ns * h["dg_dR"] / Ks * h["cos_ng"]
+                + h["sin_ng"]
                 * (
-                    z * numpy.tanh(zKB) * (dKs_dR / Ks - dBs_dR / Bs)
+                    h["ztanhzKB"] * (dKs_dR / Ks - dBs_dR / Bs)
                     + 1
                     / Ks
                     * (
-                        -dBs_dR * numpy.log(sechzKB)
+                        -dBs_dR * h["log_sechzKB"]
                         + dKs_dR / Ks
                         + dDs_dR / Ds
                         + 1 / self._Rs
@@ -815,100 +433,26 @@ class SpiralArmsPotential(Potential):
         )
 
     def _phizderiv(self, R, z, phi=0, t=0):
-        if isinstance(R, numpy.ndarray) or isinstance(z, numpy.ndarray):
-            nR = len(R) if isinstance(R, numpy.ndarray) else len(z)
-            self._Cs = numpy.transpose(
-                numpy.array(
-                    [
-                        self._Cs0,
-                    ]
-                    * nR
-                )
-            )
-            self._ns = numpy.transpose(
-                numpy.array(
-                    [
-                        self._ns0,
-                    ]
-                    * nR
-                )
-            )
-            self._HNn = numpy.transpose(
-                numpy.array(
-                    [
-                        self._HNn0,
-                    ]
-                    * nR
-                )
-            )
-        else:
-            self._Cs = self._Cs0
-            self._ns = self._ns0
-            self._HNn = self._HNn0
-
-        Ks = self._K(R)
-        Bs = self._B(R)
-        Ds = self._D(R)
-        zK_B = z * Ks / Bs
-
-        return (
-            -self._H
-            * numpy.exp(-(R - self._r_ref) / self._Rs)
-            * numpy.sum(
-                self._Cs
-                / Ds
-                * self._ns
-                * self._N
-                * numpy.sin(self._ns * self._gamma(R, phi - self._omega * t))
-                * numpy.tanh(zK_B)
-                / numpy.cosh(zK_B) ** Bs,
-                axis=0,
-            )
+        h = self._harmonics(R, z, phi, t)
+        return -h["He"] * numpy.sum(
+            h["Cs"]
+            / h["Ds"]
+            * h["ns"]
+            * self._N
+            * h["sin_ng"]
+            * h["tanhzKB"]
+            * h["sechzKB_Bs"],
+            axis=0,
         )
 
     def _dens(self, R, z, phi=0, t=0):
-        if isinstance(R, numpy.ndarray) or isinstance(z, numpy.ndarray):
-            nR = len(R) if isinstance(R, numpy.ndarray) else len(z)
-            self._Cs = numpy.transpose(
-                numpy.array(
-                    [
-                        self._Cs0,
-                    ]
-                    * nR
-                )
-            )
-            self._ns = numpy.transpose(
-                numpy.array(
-                    [
-                        self._ns0,
-                    ]
-                    * nR
-                )
-            )
-            self._HNn = numpy.transpose(
-                numpy.array(
-                    [
-                        self._HNn0,
-                    ]
-                    * nR
-                )
-            )
-        else:
-            self._Cs = self._Cs0
-            self._ns = self._ns0
-            self._HNn = self._HNn0
-
-        g = self._gamma(R, phi - self._omega * t)
-
-        Ks = self._K(R)
-        Bs = self._B(R)
-        Ds = self._D(R)
-
-        ng = self._ns * g
-        zKB = z * Ks / Bs
-        sech_zKB = 1 / numpy.cosh(zKB)
-        tanh_zKB = numpy.tanh(zKB)
-        log_sech_zKB = numpy.log(sech_zKB)
+        h = self._harmonics(R, z, phi, t)
+        R = h["R"]
+        Ks, Bs, Ds = h["Ks"], h["Bs"], h["Ds"]
+        zKB = h["zKB"]
+        sech_zKB = h["sechzKB"]
+        tanh_zKB = h["tanhzKB"]
+        log_sech_zKB = h["log_sechzKB"]
 
         # numpy of E as defined in the appendix of the paper.
         E = (
@@ -933,15 +477,14 @@ class SpiralArmsPotential(Potential):
         )
 
         return numpy.sum(
-            self._Cs
+            h["Cs"]
             * self._rho0
-            * (self._H / (Ds * R))
-            * numpy.exp(-(R - self._r_ref) / self._Rs)
-            * sech_zKB**Bs
+            * (h["He"] / (Ds * R))
+            * h["sechzKB_Bs"]
             * (
-                numpy.cos(ng)
+                h["cos_ng"]
                 * (Ks * R * (Bs + 1) / Bs * sech_zKB**2 - 1 / Ks / R * (E**2 + rE))
-                - 2 * numpy.sin(ng) * E * numpy.cos(self._alpha)
+                - 2 * h["sin_ng"] * E * numpy.cos(self._alpha)
             ),
             axis=0,
         )
@@ -949,6 +492,67 @@ class SpiralArmsPotential(Potential):
     def OmegaP(self):
         return self._omega
 
+    def _harmonics(self, R, z, phi, t):
+        """Return the terms shared by the potential and its derivatives, for all harmonics at once along the first axis; cached for the last scalar (R,z,phi,t), such that the forces at the same point reuse them"""
+        scalar = not (
+            numpy.ndim(R) or numpy.ndim(z) or numpy.ndim(phi) or numpy.ndim(t)
+        )
+        if not scalar:
+            R, z, phi, t = numpy.broadcast_arrays(R, z, phi, t)
+        elif (R, z, phi, t) == self._harmonics_key:
+            return self._harmonics_cache
+        ns, Cs, HNn = (
+            self._harmonic_axis(x, R) for x in (self._ns, self._Cs, self._HNn)
+        )
+        # K, B, D, and their derivatives (eqns. 5-7) in terms of KH = HNn / R / sin_alpha
+        KnH = HNn / R / self._sin_alpha
+        Ks = KnH / self._H
+        Bs = KnH * (0.4 * KnH + 1)
+        Ds = (0.3 * KnH**2 + KnH + 1) / (0.3 * KnH + 1)
+        dKs_dR = -Ks / R
+        dBs_dR = -KnH / R * (0.8 * KnH + 1)
+        dDs_dR = KnH * (
+            0.3 * (KnH + 0.3 * KnH**2 + 1) / R / (0.3 * KnH + 1) ** 2
+            - (1 + 0.6 * KnH) / R / (0.3 * KnH + 1)
+        )
+        zKB = z * Ks / Bs
+        sechzKB = 1 / numpy.cosh(zKB)
+        log_sechzKB = numpy.log(sechzKB)
+        tanhzKB = numpy.tanh(zKB)
+        ng = ns * self._gamma(R, phi - self._omega * t)
+        out = {
+            "R": R,
+            "z": z,
+            "ns": ns,
+            "Cs": Cs,
+            "HNn": HNn,
+            "He": self._H * numpy.exp(-(R - self._r_ref) / self._Rs),
+            "Ks": Ks,
+            "Bs": Bs,
+            "Ds": Ds,
+            "dKs_dR": dKs_dR,
+            "dBs_dR": dBs_dR,
+            "dDs_dR": dDs_dR,
+            "dg_dR": self._dgamma_dR(R),
+            "cos_ng": numpy.cos(ng),
+            "sin_ng": numpy.sin(ng),
+            "zKB": zKB,
+            "sechzKB": sechzKB,
+            "sechzKB_Bs": sechzKB**Bs,
+            "log_sechzKB": log_sechzKB,
+            "tanhzKB": tanhzKB,
+            "ztanhzKB": z * tanhzKB,
+        }
+        if scalar:
+            self._harmonics_key = (R, z, phi, t)
+            self._harmonics_cache = out
+        return out
+
+    def _harmonic_axis(self, x, R):
+        """Return the per-harmonic array x with the harmonics along the first axis, such that it broadcasts against R."""
+        ndim = numpy.ndim(R)
+        return numpy.reshape(x, (-1,) + (1,) * ndim) if ndim else x
+
     def _gamma(self, R, phi):
         """Return gamma. (eqn 3 in the paper)"""
         return self._N * (
@@ -961,36 +565,33 @@ class SpiralArmsPotential(Potential):
 
     def _K(self, R):
         """Return numpy array from K1 up to and including Kn. (eqn. 5)"""
-        return self._ns * self._N / R / self._sin_alpha
+        return self._harmonic_axis(self._ns, R) * self._N / R / self._sin_alpha
 
     def _dK_dR(self, R):
         """Return numpy array of dK/dR from K1 up to and including Kn."""
-        return -self._ns * self._N / R**2 / self._sin_alpha
+        return -self._harmonic_axis(self._ns, R) * self._N / R**2 / self._sin_alpha
 
     def _B(self, R):
         """Return numpy array from B1 up to and including Bn. (eqn. 6)"""
-        HNn_R = self._HNn / R
+        HNn_R = self._harmonic_axis(self._HNn, R) / R
 
         return HNn_R / self._sin_alpha * (0.4 * HNn_R / self._sin_alpha + 1)
 
     def _dB_dR(self, R):
         """Return numpy array of dB/dR from B1 up to and including Bn."""
-        return (
-            -self._HNn
-            / R**3
-            / self._sin_alpha**2
-            * (0.8 * self._HNn + R * self._sin_alpha)
-        )
+        HNn = self._harmonic_axis(self._HNn, R)
+        return -HNn / R**3 / self._sin_alpha**2 * (0.8 * HNn + R * self._sin_alpha)
 
     def _D(self, R):
         """Return numpy array from D1 up to and including Dn. (eqn. 7)"""
-        return (
-            0.3 * self._HNn**2 / self._sin_alpha / R + self._HNn + R * self._sin_alpha
-        ) / (0.3 * self._HNn + R * self._sin_alpha)
+        HNn = self._harmonic_axis(self._HNn, R)
+        return (0.3 * HNn**2 / self._sin_alpha / R + HNn + R * self._sin_alpha) / (
+            0.3 * HNn + R * self._sin_alpha
+        )
 
     def _dD_dR(self, R):
         """Return numpy array of dD/dR from D1 up to and including Dn."""
-        HNn_R_sina = self._HNn / R / self._sin_alpha
+        HNn_R_sina = self._harmonic_axis(self._HNn, R) / R / self._sin_alpha
 
         return HNn_R_sina * (
             0.3
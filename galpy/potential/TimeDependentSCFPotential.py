@@ -0,0 +1,173 @@
+###############################################################################
+#   TimeDependentSCFPotential.py: SCF potential with expansion coefficients
+#                                 that are interpolated in time
+###############################################################################
+import numpy
+from scipy import interpolate
+
+from ..util import conversion
+from .SCFPotential import SCFPotential
+
+
+class TimeDependentSCFPotential(SCFPotential):
+    """Class that implements a time-dependent `Hernquist & Ostriker (1992) <http://adsabs.harvard.edu/abs/1992ApJ...386..375H>`_ Self-Consistent-Field-type potential, for which the expansion coefficients are given at a series of times :math:`t_i` (e.g., computed with ``scf_compute_coeffs_nbody`` for each snapshot of a simulation) and are interpolated in time in between. Outside of the range of :math:`t_i`, the coefficients are held fixed at their values at the first or last time. See :ref:`SCFPotential <scf_potential>` for the form of the potential at any given time."""
+
+    def __init__(
+        self,
+        amp=1.0,
+        Acos=None,
+        Asin=None,
+        t=None,
+        a=1.0,
+        kind="cubic",
+        normalize=False,
+        ro=None,
+        vo=None,
+    ):
+        """
+        Initialize a time-dependent SCF Potential from a series of expansion coefficients
+
+        Parameters
+        ----------
+        amp : float or Quantity, optional
+            Amplitude to be applied to the potential (default: 1); can be a Quantity with units of mass or Gxmass.
+        Acos : numpy.ndarray, optional
+            The real part of the expansion coefficients at each time (ntxNxLxL array, or optionally ntxNxLx1 if Asin=None); default is a static Hernquist potential.
+        Asin : numpy.ndarray, optional
+            The imaginary part of the expansion coefficients at each time (ntxNxLxL array or None).
+        t : numpy.ndarray or Quantity, optional
+            Increasing times (nt >= 2) at which the coefficients are given (default: 0, 1, ..., nt-1).
+        a : float or Quantity, optional
+            Scale length.
+        kind : {'cubic','linear'}, optional
+            Type of interpolation of the coefficients in time: natural cubic spline or linear interpolation.
+        normalize : bool or float, optional
+            If True, normalize such that vc(1.,0.)=1. at t=0., or, if given as a number, such that the force is this fraction of the force necessary to make vc(1.,0.)=1.
+        ro : float or Quantity, optional
+            Distance scale for translation into internal units (default from configuration file).
+        vo : float or Quantity, optional
+            Velocity scale for translation into internal units (default from configuration file).
+
+        Notes
+        -----
+        - 2026-10-19 - Written - Agent (local)
+        """
+        if Acos is None:
+            Acos = numpy.ones((2, 1, 1, 1))
+        Acos = numpy.asarray(Acos, dtype=float)
+        if Asin is not None:
+            Asin = numpy.asarray(Asin, dtype=float)
+        if len(Acos.shape) != 4:
+            raise RuntimeError("Acos must be a 4 dimensional numpy array")
+        if Asin is not None and Asin.shape != Acos.shape:
+            raise RuntimeError("The shape of Asin does not match the shape of Acos.")
+        # Checks the coefficients and sets up amp, a, ro, vo
+        SCFPotential.__init__(
+            self,
+            amp=amp,
+            Acos=Acos[0],
+            Asin=None if Asin is None else Asin[0],
+            a=a,
+            ro=ro,
+            vo=vo,
+        )
+        nt = Acos.shape[0]
+        if t is None:
+            t = numpy.arange(nt, dtype=float)
+        t = numpy.array(conversion.parse_time(t, ro=self._ro, vo=self._vo), dtype=float)
+        if len(t) != nt or nt < 2:
+            raise RuntimeError(
+                "t must have the same length as the first dimension of Acos, which has to be at least 2"
+            )
+        if numpy.any(numpy.diff(t) <= 0.0):
+            raise RuntimeError("t must be strictly increasing")
+        self.isNonAxi = bool(
+            Asin is not None
+            and Acos.shape[2] > 1
+            and (numpy.any(Acos[:, :, :, 1:] != 0) or numpy.any(Asin != 0))
+        )
+        NN = self._Nroot(Acos.shape[2], Acos.shape[3])
+        Acos = Acos * NN
+        Asin = numpy.zeros_like(Acos) if Asin is None else Asin * NN
+        if kind.lower() == "cubic":
+            self._Acos_interp = interpolate.CubicSpline(
+                t, Acos, axis=0, bc_type="natural"
+            )
+            self._Asin_interp = interpolate.CubicSpline(
+                t, Asin, axis=0, bc_type="natural"
+            )
+        elif kind.lower() == "linear":
+            self._Acos_interp = _linear_ppoly(t, Acos)
+            self._Asin_interp = _linear_ppoly(t, Asin)
+        else:
+            raise ValueError(f"kind={kind} not understood; use 'cubic' or 'linear'")
+        self._ts = t
+        self._coeffs_t = None
+        self._set_coeffs(0.0)
+        if normalize or (
+            isinstance(normalize, (int, float)) and not isinstance(normalize, bool)
+        ):
+            self.normalize(normalize)
+        return None
+
+    def _set_coeffs(self, t):
+        """Set the expansion coefficients to their interpolated values at time t"""
+        t = min(max(float(t), self._ts[0]), self._ts[-1])
+        if t == self._coeffs_t:
+            return None
+        self._Acos = self._Acos_interp(t)
+        self._Asin = self._Asin_interp(t)
+        self._coeffs_t = t
+        return None
+
+    def _at_time(self, method, R, z, phi, t):
+        """Evaluate the SCFPotential method at (R,z,phi,t), looping over times when t is an array"""
+        if numpy.ndim(t) == 0:
+            self._set_coeffs(t)
+            return method(self, R, z, phi=phi, t=t)
+        if phi is None:
+            phi = 0.0
+        R, z, phi, t = numpy.broadcast_arrays(R, z, phi, t)
+        out = numpy.empty(R.shape)
+        for ii in numpy.ndindex(R.shape):
+            self._set_coeffs(t[ii])
+            out[ii] = method(self, R[ii], z[ii], phi=phi[ii], t=t[ii])
+        return out
+
+    def _evaluate(self, R, z, phi=0.0, t=0.0):
+        return self._at_time(SCFPotential._evaluate, R, z, phi, t)
+
+    def _forces(self, R, z, phi=0.0, t=0.0):
+        if numpy.ndim(t) == 0:
+            self._set_coeffs(t)
+            return SCFPotential._forces(self, R, z, phi=phi, t=t)
+        return tuple(
+            self._at_time(method, R, z, phi, t)
+            for method in (
+                SCFPotential._Rforce,
+                SCFPotential._zforce,
+                SCFPotential._phitorque,
+            )
+        )
+
+    def _Rforce(self, R, z, phi=0.0, t=0.0):
+        return self._at_time(SCFPotential._Rforce, R, z, phi, t)
+
+    def _zforce(self, R, z, phi=0.0, t=0.0):
+        return self._at_time(SCFPotential._zforce, R, z, phi, t)
+
+    def _phitorque(self, R, z, phi=0.0, t=0.0):
+        return self._at_time(SCFPotential._phitorque, R, z, phi, t)
+
+    def _dens(self, R, z, phi=0.0, t=0.0):
+        return self._at_time(SCFPotential._dens, R, z, phi, t)
+
+    def _mass(self, R, z=None, t=0.0):
+        self._set_coeffs(t)
+        return SCFPotential._mass(self, R, z=z, t=t)
+
+
+def _linear_ppoly(t, y):
+    """Piecewise-linear interpolation of y(t) along the first axis as a scipy PPoly"""
+    slope = numpy.diff(y, axis=0) / numpy.diff(t).reshape((-1,) + (1,) * (y.ndim - 1))
+    return interpolate.PPoly(numpy.array([slope, y[:-1]]), t)
@@ -0,0 +1,215 @@
+###############################################################################
+#   TimeInterpolatedPotential.py: potential that interpolates in time between
+#                                 a sequence of snapshot potentials
+###############################################################################
+import os
+import pickle
+from collections import OrderedDict
+
+import numpy
+
+from ..util import conversion
+from .Potential import (
+    Potential,
+    _check_c,
+    _evaluateforces,
+    _evaluatePotentials,
+    _isNonAxi,
+    evaluateDensities,
+    evaluatephi2derivs,
+    evaluatephizderivs,
+    evaluateR2derivs,
+    evaluateRphiderivs,
+    evaluateRzderivs,
+    evaluatez2derivs,
+    flatten,
+)
+
+
+class TimeInterpolatedPotential(Potential):
+    """Class that implements a time-dependent potential that is known at a sequence of times :math:`t_i` (e.g., the outputs of a simulation), represented by a potential for each time (e.g., an ``interpRZPotential``, ``CylindricalSplinePotential``, ``MultipolePotential``, or ``SCFPotential`` fit to each snapshot). The potential and its derivatives are linearly interpolated in time between the snapshots and are held fixed at their values at the first or last snapshot outside of the range of :math:`t_i`. Snapshots can be given as files with pickled potentials, which are then only loaded when they are needed."""
+
+    def __init__(self, pots=None, t=None, amp=1.0, max_loaded=None, ro=None, vo=None):
+        """
+        Initialize a TimeInterpolatedPotential
+
+        Parameters
+        ----------
+        pots : list
+            The potential at each time: a Potential instance or list of such instances, or the name of a file that contains such a pickled potential (loaded when first needed); all snapshots should be the same kind of potential.
+        t : numpy.ndarray or Quantity, optional
+            Increasing times (nt >= 2) at which the potentials are given (default: 0, 1, ..., nt-1).
+        amp : float, optional
+            Amplitude to be applied to the potential (default: 1).
+        max_loaded : int, optional
+            Maximum number of snapshots given as files to keep in memory at once, discarding the least recently used one when loading another (default: None, keep all loaded snapshots).
+        ro : float or Quantity, optional
+            Distance scale for translation into internal units (default from configuration file).
+        vo : float or Quantity, optional
+            Velocity scale for translation into internal units (default from configuration file).
+
+        Notes
+        -----
+        - 2026-10-19 - Written - Agent (local)
+        """
+        Potential.__init__(self, amp=amp, ro=ro, vo=vo)
+        if pots is None or len(pots) < 2:
+            raise ValueError(
+                "TimeInterpolatedPotential requires a list of at least two snapshot potentials"
+            )
+        self._nsnap = len(pots)
+        if t is None:
+            t = numpy.arange(self._nsnap, dtype=float)
+        elif isinstance(t, list):
+            t = numpy.array(t)
+        t = numpy.array(conversion.parse_time(t, ro=self._ro, vo=self._vo), dtype=float)
+        if len(t) != self._nsnap:
+            raise ValueError("t must have the same length as pots")
+        if numpy.any(numpy.diff(t) <= 0.0):
+            raise ValueError("t must be strictly increasing")
+        self._ts = t
+        if max_loaded is not None and max_loaded < 2:
+            raise ValueError("max_loaded must be at least 2")
+        self._max_loaded = max_loaded
+        # Snapshots are either potentials or files to load them from
+        self._snapshots = [
+            p if isinstance(p, (str, os.PathLike)) else flatten(p) for p in pots
+        ]
+        self._loaded = OrderedDict()
+        # Properties are set from the first snapshot and checked for the
+        # others when they are loaded
+        first = self._snapshot(0)
+        self.isNonAxi = _isNonAxi(first)
+        self.hasC = _check_c(first)
+        self.hasC_dxdv = _check_c(first, dxdv=True)
+        for ii in range(1, self._nsnap):
+            if not isinstance(self._snapshots[ii], (str, os.PathLike)):
+                self._check_snapshot(self._snapshots[ii])
+        return None
+
+    def _check_snapshot(self, pot):
+        if (
+            _isNonAxi(pot) != self.isNonAxi
+            or _check_c(pot) != self.hasC
+            or _check_c(pot, dxdv=True) != self.hasC_dxdv
+        ):
+            raise ValueError(
+                "All snapshots of a TimeInterpolatedPotential should be the same kind of potential"
+            )
+        return None
+
+    def _snapshot(self, ii):
+        """Return the potential of snapshot ii, loading it from file if necessary"""
+        ii = int(ii)
+        pot = self._snapshots[ii]
+        if not isinstance(pot, (str, os.PathLike)):
+            return pot
+        if ii in self._loaded:
+            self._loaded.move_to_end(ii)
+            return self._loaded[ii]
+        with open(pot, "rb") as savefile:
+            pot = flatten(pickle.load(savefile))
+        if ii > 0:
+            self._check_snapshot(pot)
+        self._loaded[ii] = pot
+        if self._max_loaded is not None and len(self._loaded) > self._max_loaded:
+            self._loaded.popitem(last=False)
+        return pot
+
+    def _weights(self, t):
+        """Index k of the snapshot before t and the weight of snapshot k+1"""
+        t = numpy.clip(t, self._ts[0], self._ts[-1])
+        k = numpy.clip(
+            numpy.searchsorted(self._ts, t, side="right") - 1, 0, self._nsnap - 2
+        )
+        return (k, (t - self._ts[k]) / (self._ts[k + 1] - self._ts[k]))
+
+    def _interp(self, func, R, z, phi, t):
+        """Linearly interpolate func(pot,R,z,phi,t) between the snapshots bracketing t"""
+        if phi is None:
+            phi = 0.0
+        if numpy.ndim(t) == 0:
+            k, w = self._weights(t)
+            out = func(self._snapshot(k), R, z, phi, t)
+            if w == 0.0:
+                return out
+            return _lincomb(out, func(self._snapshot(k + 1), R, z, phi, t), w)
+        R, z, phi, t = numpy.broadcast_arrays(R, z, phi, t)
+        ks, ws = self._weights(t)
+        out = None
+        for k in numpy.unique(ks):
+            indx = ks == k
+            tout = _lincomb(
+                func(self._snapshot(k), R[indx], z[indx], phi[indx], t[indx]),
+                func(self._snapshot(k + 1), R[indx], z[indx], phi[indx], t[indx]),
+                ws[indx],
+            )
+            if out is None:
+                out = numpy.empty(
+                    (len(tout),) + R.shape if isinstance(tout, tuple) else R.shape
+                )
+            if isinstance(tout, tuple):
+                for jj, tt in enumerate(tout):
+                    out[jj][indx] = tt
+            else:
+                out[indx] = tout
+        return tuple(out) if out.ndim > R.ndim else out
+
+    def _evaluate(self, R, z, phi=0.0, t=0.0):
+        return self._interp(
+            lambda p, R, z, phi, t: _evaluatePotentials(p, R, z, phi=phi, t=t),
+            R,
+            z,
+            phi,
+            t,
+        )
+
+    def _forces(self, R, z, phi=0.0, t=0.0):
+        return self._interp(
+            lambda p, R, z, phi, t: _evaluateforces(p, R, z, phi=phi, t=t),
+            R,
+            z,
+            phi,
+            t,
+        )
+
+    def _Rforce(self, R, z, phi=0.0, t=0.0):
+        return self._forces(R, z, phi=phi, t=t)[0]
+
+    def _zforce(self, R, z, phi=0.0, t=0.0):
+        return self._forces(R, z, phi=phi, t=t)[1]
+
+    def _phitorque(self, R, z, phi=0.0, t=0.0):
+        return self._forces(R, z, phi=phi, t=t)[2]
+
+    def _dens(self, R, z, phi=0.0, t=0.0):
+        return self._interp(_physical_off(evaluateDensities), R, z, phi, t)
+
+    def _R2deriv(self, R, z, phi=0.0, t=0.0):
+        return self._interp(_physical_off(evaluateR2derivs), R, z, phi, t)
+
+    def _z2deriv(self, R, z, phi=0.0, t=0.0):
+        return self._interp(_physical_off(evaluatez2derivs), R, z, phi, t)
+
+    def _Rzderiv(self, R, z, phi=0.0, t=0.0):
+        return self._interp(_physical_off(evaluateRzderivs), R, z, phi, t)
+
+    def _phi2deriv(self, R, z, phi=0.0, t=0.0):
+        return self._interp(_physical_off(evaluatephi2derivs), R, z, phi, t)
+
+    def _Rphideriv(self, R, z, phi=0.0, t=0.0):
+        return self._interp(_physical_off(evaluateRphiderivs), R, z, phi, t)
+
+    def _phizderiv(self, R, z, phi=0.0, t=0.0):
+        return self._interp(_physical_off(evaluatephizderivs), R, z, phi, t)
+
+
+def _lincomb(a, b, w):
+    """(1-w) a + w b for scalars/arrays or tuples of them"""
+    if isinstance(a, tuple):
+        return tuple((1.0 - w) * aa + w * bb for aa, bb in zip(a, b))
+    return (1.0 - w) * a + w * b
+
+
+def _physical_off(evaluate):
+    return lambda p, R, z, phi, t: evaluate(p, R, z, phi=phi, t=t, use_physical=False)
@@ -470,6 +470,18 @@ class DehnenCoreSphericalPotential(DehnenSphericalPotential):
         r = numpy.sqrt(R**2.0 + z**2.0)
         return -(1.0 - 1.0 / (1.0 + self.a / r) ** 2.0) / (6.0 * self.a)
 
+    def _jax_params(self):
+        return {"amp": self._amp, "a": self.a}
+
+    def _evaluate_jax(self, params, R, z, phi=0.0, t=0.0):
+        # No need for actual JAX!
+        a = params["a"]
+        return (
+            -params["amp"]
+            * (1.0 - 1.0 / (1.0 + a / (R**2.0 + z**2.0) ** 0.5) ** 2.0)
+            / (6.0 * a)
+        )
+
     def _Rforce(self, R, z, phi=0.0, t=0.0):
         return -R / numpy.power(numpy.sqrt(R**2.0 + z**2.0) + self.a, 3.0) / 3.0
 
@@ -552,6 +564,13 @@ class HernquistPotential(DehnenSphericalPotential):
     def _evaluate(self, R, z, phi=0.0, t=0.0):
         return -1.0 / (1.0 + numpy.sqrt(R**2.0 + z**2.0) / self.a) / 2.0 / self.a
 
+    def _jax_params(self):
+        return {"amp": self._amp, "a": self.a}
+
+    def _evaluate_jax(self, params, R, z, phi=0.0, t=0.0):
+        # No need for actual JAX!
+        return -params["amp"] / (params["a"] + (R**2.0 + z**2.0) ** 0.5) / 2.0
+
     def _Rforce(self, R, z, phi=0.0, t=0.0):
         sqrtRz = numpy.sqrt(R**2.0 + z**2.0)
         return -R / self.a / sqrtRz / (1.0 + sqrtRz / self.a) ** 2.0 / 2.0 / self.a
@@ -701,6 +720,17 @@ class JaffePotential(DehnenSphericalPotential):
     def _evaluate(self, R, z, phi=0.0, t=0.0):
         return -numpy.log(1.0 + self.a / numpy.sqrt(R**2.0 + z**2.0)) / self.a
 
+    def _jax_params(self):
+        return {"amp": self._amp, "a": self.a}
+
+    def _evaluate_jax(self, params, R, z, phi=0.0, t=0.0):
+        if not _JAX_LOADED:  # pragma: no cover
+            raise ImportError(
+                "Making use of _evaluate_jax function requires the google/jax library"
+            )
+        a = params["a"]
+        return -params["amp"] * jnp.log(1.0 + a / jnp.sqrt(R**2.0 + z**2.0)) / a
+
     def _Rforce(self, R, z, phi=0.0, t=0.0):
         sqrtRz = numpy.sqrt(R**2.0 + z**2.0)
         return -R / sqrtRz**3.0 / (1.0 + self.a / sqrtRz)
@@ -884,6 +914,17 @@ class NFWPotential(TwoPowerSphericalPotential):
             out[r == 0] = -1.0 / self.a
             return out
 
+    def _jax_params(self):
+        return {"amp": self._amp, "a": self.a}
+
+    def _evaluate_jax(self, params, R, z, phi=0.0, t=0.0):
+        if not _JAX_LOADED:  # pragma: no cover
+            raise ImportError(
+                "Making use of _evaluate_jax function requires the google/jax library"
+            )
+        r = jnp.sqrt(R**2.0 + z**2.0)
+        return -params["amp"] * jnp.log1p(r / params["a"]) / r
+
     def _Rforce(self, R, z, phi=0.0, t=0.0):
         Rz = R**2.0 + z**2.0
         sqrtRz = numpy.sqrt(Rz)
@@ -4,8 +4,10 @@ from . import (
     AnySphericalPotential,
     BurkertPotential,
     ChandrasekharDynamicalFrictionForce,
+    CompositePotential,
     CorotatingRotationWrapperPotential,
     CosmphiDiskPotential,
+    CylindricalSplinePotential,
     DehnenBarPotential,
     DehnenSmoothWrapperPotential,
     DiskSCFPotential,
@@ -25,9 +27,11 @@ from . import (
     KuzminKutuzovStaeckelPotential,
     KuzminLikeWrapperPotential,
     LogarithmicHaloPotential,
+    ManyMovingObjectsPotential,
     MiyamotoNagaiPotential,
     MN3ExponentialDiskPotential,
     MovingObjectPotential,
+    MultipolePotential,
     NonInertialFrameForce,
     NullPotential,
     NumericalPotentialDerivativesMixin,
@@ -49,10 +53,13 @@ from . import (
     SpiralArmsPotential,
     SteadyLogSpiralPotential,
     TimeDependentAmplitudeWrapperPotential,
+    TimeDependentSCFPotential,
+    TimeInterpolatedPotential,
     TransientLogSpiralPotential,
     TriaxialGaussianPotential,
     TwoPowerSphericalPotential,
     TwoPowerTriaxialPotential,
+    _jax,
     interpRZPotential,
     interpSphericalPotential,
     linearPotential,
@@ -81,6 +88,8 @@ evaluatephi2derivs = Potential.evaluatephi2derivs
 evaluateRphiderivs = Potential.evaluateRphiderivs
 evaluatephizderivs = Potential.evaluatephizderivs
 evaluater2derivs = Potential.evaluater2derivs
+evaluate_jax = _jax.evaluate_jax
+jax_params = _jax.jax_params
 RZToplanarPotential = planarPotential.RZToplanarPotential
 toPlanarPotential = planarPotential.toPlanarPotential
 RZToverticalPotential = verticalPotential.RZToverticalPotential
@@ -166,6 +175,8 @@ DehnenBarPotential = DehnenBarPotential.DehnenBarPotential
 SteadyLogSpiralPotential = SteadyLogSpiralPotential.SteadyLogSpiralPotential
 TransientLogSpiralPotential = TransientLogSpiralPotential.TransientLogSpiralPotential
 MovingObjectPotential = MovingObjectPotential.MovingObjectPotential
+ManyMovingObjectsPotential = ManyMovingObjectsPotential.ManyMovingObjectsPotential
+CompositePotential = CompositePotential.CompositePotential
 EllipticalDiskPotential = EllipticalDiskPotential.EllipticalDiskPotential
 LopsidedDiskPotential = CosmphiDiskPotential.LopsidedDiskPotential
 CosmphiDiskPotential = CosmphiDiskPotential.CosmphiDiskPotential
@@ -189,6 +200,10 @@ TriaxialJaffePotential = TwoPowerTriaxialPotential.TriaxialJaffePotential
 TwoPowerTriaxialPotential = TwoPowerTriaxialPotential.TwoPowerTriaxialPotential
 FerrersPotential = FerrersPotential.FerrersPotential
 SCFPotential = SCFPotential.SCFPotential
+TimeDependentSCFPotential = TimeDependentSCFPotential.TimeDependentSCFPotential
+TimeInterpolatedPotential = TimeInterpolatedPotential.TimeInterpolatedPotential
+MultipolePotential = MultipolePotential.MultipolePotential
+CylindricalSplinePotential = CylindricalSplinePotential.CylindricalSplinePotential
 SoftenedNeedleBarPotential = SoftenedNeedleBarPotential.SoftenedNeedleBarPotential
 DiskSCFPotential = DiskSCFPotential.DiskSCFPotential
 SpiralArmsPotential = SpiralArmsPotential.SpiralArmsPotential
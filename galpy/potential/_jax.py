@@ -0,0 +1,147 @@
+###############################################################################
+#   _jax.py: evaluate potentials and their derivatives with JAX, such that
+#            they can be differentiated with respect to position and
+#            parameters and batched
+###############################################################################
+import numpy
+
+from ..util._optional_deps import _JAX_LOADED
+from .Potential import flatten
+
+if _JAX_LOADED:
+    import jax
+    import jax.numpy as jnp
+
+# Second derivatives as entries of the Hessian in (R,z,phi)
+_HESSIAN_INDX = {
+    "R2deriv": (0, 0),
+    "z2deriv": (1, 1),
+    "Rzderiv": (0, 1),
+    "phi2deriv": (2, 2),
+    "Rphideriv": (0, 2),
+    "phizderiv": (2, 1),
+}
+
+
+def jax_params(Pot):
+    """
+    Return the parameters of the JAX implementation of a potential or list of potentials.
+
+    Parameters
+    ----------
+    Pot : Potential or list of Potential
+        Potential or list of potentials (dissipative forces in such a list are ignored).
+
+    Returns
+    -------
+    list of dict
+        The parameters of each potential in internal units (including the amplitude 'amp'); this is a JAX pytree that can be modified, differentiated with respect to, or batched over and passed to evaluate_jax or to the integrator returned by galpy.orbit.jax_integrator.
+
+    Notes
+    -----
+    - 2026-10-19 - Written - Agent (local)
+    """
+    return [p._jax_params() for p in _jax_pots(Pot)]
+
+
+def evaluate_jax(Pot, quantity, R, z, phi=0.0, t=0.0, params=None):
+    """
+    Evaluate the potential, forces, density, or second derivatives of a potential or list of potentials using JAX.
+
+    Parameters
+    ----------
+    Pot : Potential or list of Potential
+        Potential or list of potentials (dissipative forces in such a list are ignored); all potentials need to have a JAX implementation.
+    quantity : str
+        Quantity to evaluate: 'potential', 'Rforce', 'zforce', 'phitorque', 'dens', 'R2deriv', 'z2deriv', 'Rzderiv', 'phi2deriv', 'Rphideriv', or 'phizderiv'.
+    R : float or numpy.ndarray
+        Cylindrical Galactocentric radius (in internal units).
+    z : float or numpy.ndarray
+        Vertical height (in internal units).
+    phi : float or numpy.ndarray, optional
+        Azimuth (default: 0.0).
+    t : float or numpy.ndarray, optional
+        Time (in internal units; default: 0.0).
+    params : list of dict, optional
+        Parameters of the potentials as returned by jax_params (default: the potentials' own parameters).
+
+    Returns
+    -------
+    jax.Array
+        The quantity in internal units, with the broadcast shape of the inputs.
+
+    Notes
+    -----
+    - Forces, the density, and second derivatives are computed by automatic differentiation of the potential, which can itself be differentiated with respect to the inputs and the parameters.
+    - Use jax.config.update("jax_enable_x64", True) to evaluate in double precision.
+    - 2026-10-19 - Written - Agent (local)
+    """
+    if not _JAX_LOADED:  # pragma: no cover
+        raise ImportError(
+            "galpy.potential.evaluate_jax requires the google/jax library"
+        )
+    pots = _jax_pots(Pot)
+    if params is None:
+        params = [p._jax_params() for p in pots]
+    func = _quantity_func(pots, quantity)
+    R, z, phi, t = jnp.broadcast_arrays(
+        *(jnp.asarray(x, dtype=jnp.result_type(float)) for x in (R, z, phi, t))
+    )
+    return jax.vmap(func, in_axes=(None, 0, 0, 0, 0))(
+        params, R.ravel(), z.ravel(), phi.ravel(), t.ravel()
+    ).reshape(R.shape)
+
+
+def _jax_pots(Pot):
+    """Flattened list of the non-dissipative potentials in Pot, which should all have a JAX implementation"""
+    Pot = flatten(Pot)
+    if not isinstance(Pot, list):
+        Pot = [Pot]
+    Pot = [p for p in Pot if not p.isDissipative]
+    for p in Pot:
+        if not hasattr(p, "_evaluate_jax"):
+            raise NotImplementedError(
+                f"{type(p).__name__} does not have a JAX implementation"
+            )
+    return Pot
+
+
+def _potential_jax(pots, params, R, z, phi, t):
+    """Sum of the JAX potentials of pots with parameters params"""
+    out = 0.0
+    for p, pparams in zip(pots, params):
+        out = out + p._evaluate_jax(pparams, R, z, phi=phi, t=t)
+    return out
+
+
+def _quantity_func(pots, quantity):
+    """Function (params,R,z,phi,t) that evaluates quantity for scalar inputs"""
+
+    def potential(params, R, z, phi, t):
+        return _potential_jax(pots, params, R, z, phi, t)
+
+    if quantity == "potential":
+        return potential
+    elif quantity in ("Rforce", "zforce", "phitorque"):
+        grad = jax.grad(
+            potential, argnums=("Rforce", "zforce", "phitorque").index(quantity) + 1
+        )
+        return lambda params, R, z, phi, t: -grad(params, R, z, phi, t)
+    hessian = jax.hessian(potential, argnums=(1, 2, 3))
+    if quantity == "dens":  # from Poisson's equation in cylindrical coordinates
+        dPhidR = jax.grad(potential, argnums=1)
+
+        def dens(params, R, z, phi, t):
+            hess = hessian(params, R, z, phi, t)
+            return (
+                hess[0][0]
+                + dPhidR(params, R, z, phi, t) / R
+                + hess[1][1]
+                + hess[2][2] / R**2.0
+            ) / (4.0 * numpy.pi)
+
+        return dens
+    elif quantity in _HESSIAN_INDX:
+        ii, jj = _HESSIAN_INDX[quantity]
+        return lambda params, R, z, phi, t: hessian(params, R, z, phi, t)[ii][jj]
+    raise ValueError(f"quantity={quantity} not understood")
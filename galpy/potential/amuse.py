@@ -6,6 +6,7 @@ from amuse.units.quantities import ScalarQuantity
 
 from .. import potential
 from ..util import conversion
+from .Potential import _evaluateforces
 
 
 class galpy_profile(LiteratureReferencesMixIn):
@@ -156,30 +157,10 @@ class galpy_profile(LiteratureReferencesMixIn):
         zed = z.value_in(units.kpc)
         phi = numpy.arctan2(y.value_in(units.kpc), x.value_in(units.kpc))
         # Cylindrical force
-        Rforce = potential.evaluateRforces(
-            self.pot,
-            R / self.ro,
-            zed / self.ro,
-            phi=phi,
-            t=self.tgalpy,
-            use_physical=False,
-        )
-        phitorque = potential.evaluatephitorques(
-            self.pot,
-            R / self.ro,
-            zed / self.ro,
-            phi=phi,
-            t=self.tgalpy,
-            use_physical=False,
-        ) / (R / self.ro)
-        zforce = potential.evaluatezforces(
-            self.pot,
-            R / self.ro,
-            zed / self.ro,
-            phi=phi,
-            t=self.tgalpy,
-            use_physical=False,
+        Rforce, zforce, phitorque = _evaluateforces(
+            self.pot, R / self.ro, zed / self.ro, phi=phi, t=self.tgalpy
         )
+        phitorque /= R / self.ro
         # Convert cylindrical force --> rectangular
         cp, sp = numpy.cos(phi), numpy.sin(phi)
         ax = (Rforce * cp - phitorque * sp) * conversion.force_in_kmsMyr(
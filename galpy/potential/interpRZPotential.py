@@ -1,13 +1,17 @@
 import copy
 import ctypes
 import ctypes.util
+import json
+import os
+import warnings
 from functools import wraps
 
 import numpy
 from numpy.ctypeslib import ndpointer
 from scipy import interpolate
 
-from ..util import _load_extension_libs, multi
+from ..util import _load_extension_libs, galpyWarning, multi
+from ..util._disk_cache import disk_cache
 from ..util.conversion import physical_conversion
 from .Potential import Potential
 
@@ -15,6 +19,20 @@ _DEBUG = False
 
 _lib, ext_loaded = _load_extension_libs.load_libgalpy()
 
+# Quantities that can be interpolated and the attributes that hold their grids
+_GRIDS_2D = ("potential", "rforce", "zforce", "dens")
+_GRIDS_1D = ("vcirc", "dvcircdR", "epifreq", "verticalfreq")
+_GRID_ATTRS = {
+    "potential": "_potGrid",
+    "rforce": "_rforceGrid",
+    "zforce": "_zforceGrid",
+    "dens": "_densGrid",
+    "vcirc": "_vcircGrid",
+    "dvcircdR": "_dvcircdrGrid",
+    "epifreq": "_epifreqGrid",
+    "verticalfreq": "_verticalfreqGrid",
+}
+
 
 def scalarVectorDecorator(func):
     """Decorator to return scalar outputs as a set"""
@@ -109,6 +127,9 @@ class interpRZPotential(Potential):
         enable_c=False,
         zsym=True,
         numcores=None,
+        rtol=None,
+        max_refine=3,
+        griddir=None,
     ):
         """
         Initialize an interpRZPotential instance.
@@ -150,12 +171,20 @@ class interpRZPotential(Potential):
         zsym : bool, optional
             If True (default), the potential is assumed to be symmetric around z=0 (so you can use, e.g.,  zgrid=(0.,1.,101)).
         numcores : int, optional
-            If set to an integer, use this many cores (only used for vcirc, dvcircdR, epifreq, and verticalfreq; NOT NECESSARILY FASTER, TIME TO MAKE SURE).
+            If set to an integer, use this many cores (for the 2D grids only when they are not calculated in C; NOT NECESSARILY FASTER, TIME TO MAKE SURE).
+        rtol : float, optional
+            If set, repeatedly double the resolution of the (R,z) grid until the interpolation reproduces the potential, forces, and density at the new grid points to within this tolerance (relative to the maximum absolute value of each quantity on the grid; for the density, the error in its logarithm); the R grid of vcirc etc. is that of the final (R,z) grid.
+        max_refine : int, optional
+            Maximum number of refinements when rtol is set (default: 3).
+        griddir : str, optional
+            Directory with grids saved with save_grids, which are memory-mapped instead of being calculated; the grids, logR, zsym, and the interpolated quantities are those of the saved grids, but RZPot is still required for evaluations outside of the grid.
 
         Notes
         -----
         - 2010-07-21 - Written - Bovy (NYU)
         - 2013-01-24 - Started with new implementation - Bovy (IAS)
+        - 2026-10-19 - Grids cached on disk when a cache directory is set in the configuration file - Agent (local)
+        - 2026-10-19 - Added grid refinement, single-pass parallel grid evaluation, and saving/memory-mapping of the grids - Agent (local)
 
         """
         if isinstance(RZPot, interpRZPotential):
@@ -188,12 +217,31 @@ class interpRZPotential(Potential):
         if not voSet:
             self._voSet = False
         self._origPot = RZPot
-        self._rgrid = numpy.linspace(*rgrid)
+        if not griddir is None:
+            # Grids saved with save_grids set the grids and what is interpolated
+            with open(os.path.join(griddir, "interpRZPotential.json")) as jsonfile:
+                settings = json.load(jsonfile)
+            logR = settings["logR"]
+            zsym = settings["zsym"]
+            interpPot, interpRforce, interpzforce, interpDens = (
+                q in settings["quantities"] for q in _GRIDS_2D
+            )
+            (
+                interpvcirc,
+                interpdvcircdr,
+                interpepifreq,
+                interpverticalfreq,
+            ) = (q in settings["quantities"] for q in _GRIDS_1D)
+            self._rgrid = numpy.load(os.path.join(griddir, "rgrid.npy"))
+            self._zgrid = numpy.load(os.path.join(griddir, "zgrid.npy"))
+        else:
+            self._rgrid = numpy.linspace(*rgrid)
+            if logR:
+                self._rgrid = numpy.exp(self._rgrid)
+            self._zgrid = numpy.linspace(*zgrid)
         self._logR = logR
         if self._logR:
-            self._rgrid = numpy.exp(self._rgrid)
             self._logrgrid = numpy.log(self._rgrid)
-        self._zgrid = numpy.linspace(*zgrid)
         self._interpPot = interpPot
         self._interpRforce = interpRforce
         self._interpzforce = interpzforce
@@ -205,206 +253,189 @@ class interpRZPotential(Potential):
         self._enable_c = enable_c * ext_loaded
         self.hasC = self._enable_c
         self._zsym = zsym
-        if interpPot:
-            if use_c * ext_loaded:
-                self._potGrid, err = calc_potential_c(
-                    self._origPot, self._rgrid, self._zgrid
+        quantities_2d = tuple(
+            q
+            for q, interp in zip(
+                _GRIDS_2D, (interpPot, interpRforce, interpzforce, interpDens)
+            )
+            if interp
+        )
+        quantities_1d = tuple(
+            q
+            for q, interp in zip(
+                _GRIDS_1D,
+                (interpvcirc, interpdvcircdr, interpepifreq, interpverticalfreq),
+            )
+            if interp
+        )
+        if not griddir is None:
+            for q in quantities_2d + quantities_1d:
+                setattr(
+                    self,
+                    _GRID_ATTRS[q],
+                    numpy.load(
+                        os.path.join(griddir, f"{_GRID_ATTRS[q][1:]}.npy"),
+                        mmap_mode="r",
+                    ),
                 )
-            else:
-                from ..potential import evaluatePotentials
-
-                potGrid = numpy.zeros((len(self._rgrid), len(self._zgrid)))
-                for ii in range(len(self._rgrid)):
-                    for jj in range(len(self._zgrid)):
-                        potGrid[ii, jj] = evaluatePotentials(
-                            self._origPot, self._rgrid[ii], self._zgrid[jj]
-                        )
-                self._potGrid = potGrid
-            if self._logR:
-                self._potInterp = interpolate.RectBivariateSpline(
-                    self._logrgrid, self._zgrid, self._potGrid, kx=3, ky=3, s=0.0
+        else:
+            if len(quantities_2d) > 0:
+                # All 2D grids are evaluated together, refining them until
+                # the interpolation error is below rtol if requested
+                grids = _calc_grids_2d(
+                    self._origPot,
+                    quantities_2d,
+                    self._rgrid,
+                    self._zgrid,
+                    use_c * ext_loaded,
+                    numcores=numcores,
                 )
-            else:
-                self._potInterp = interpolate.RectBivariateSpline(
-                    self._rgrid, self._zgrid, self._potGrid, kx=3, ky=3, s=0.0
+                if not rtol is None:
+                    grids = self._refine_grids(
+                        grids, use_c * ext_loaded, numcores, rtol, max_refine
+                    )
+                for q in quantities_2d:
+                    setattr(self, _GRID_ATTRS[q], grids[q])
+            for q in quantities_1d:
+                setattr(
+                    self,
+                    _GRID_ATTRS[q],
+                    _calc_grid_1d(self._origPot, q, self._rgrid, numcores=numcores),
                 )
+        if interpPot:
+            self._potInterp = self._spline_2d(self._potGrid)
             if enable_c * ext_loaded:
                 self._potGrid_splinecoeffs = calc_2dsplinecoeffs_c(self._potGrid)
         if interpRforce:
-            if use_c * ext_loaded:
-                self._rforceGrid, err = calc_potential_c(
-                    self._origPot, self._rgrid, self._zgrid, rforce=True
-                )
-            else:
-                from ..potential import evaluateRforces
-
-                rforceGrid = numpy.zeros((len(self._rgrid), len(self._zgrid)))
-                for ii in range(len(self._rgrid)):
-                    for jj in range(len(self._zgrid)):
-                        rforceGrid[ii, jj] = evaluateRforces(
-                            self._origPot, self._rgrid[ii], self._zgrid[jj]
-                        )
-                self._rforceGrid = rforceGrid
-            if self._logR:
-                self._rforceInterp = interpolate.RectBivariateSpline(
-                    self._logrgrid, self._zgrid, self._rforceGrid, kx=3, ky=3, s=0.0
-                )
-            else:
-                self._rforceInterp = interpolate.RectBivariateSpline(
-                    self._rgrid, self._zgrid, self._rforceGrid, kx=3, ky=3, s=0.0
-                )
+            self._rforceInterp = self._spline_2d(self._rforceGrid)
             if enable_c * ext_loaded:
                 self._rforceGrid_splinecoeffs = calc_2dsplinecoeffs_c(self._rforceGrid)
         if interpzforce:
-            if use_c * ext_loaded:
-                self._zforceGrid, err = calc_potential_c(
-                    self._origPot, self._rgrid, self._zgrid, zforce=True
-                )
-            else:
-                from ..potential import evaluatezforces
-
-                zforceGrid = numpy.zeros((len(self._rgrid), len(self._zgrid)))
-                for ii in range(len(self._rgrid)):
-                    for jj in range(len(self._zgrid)):
-                        zforceGrid[ii, jj] = evaluatezforces(
-                            self._origPot, self._rgrid[ii], self._zgrid[jj]
-                        )
-                self._zforceGrid = zforceGrid
-            if self._logR:
-                self._zforceInterp = interpolate.RectBivariateSpline(
-                    self._logrgrid, self._zgrid, self._zforceGrid, kx=3, ky=3, s=0.0
-                )
-            else:
-                self._zforceInterp = interpolate.RectBivariateSpline(
-                    self._rgrid, self._zgrid, self._zforceGrid, kx=3, ky=3, s=0.0
-                )
+            self._zforceInterp = self._spline_2d(self._zforceGrid)
             if enable_c * ext_loaded:
                 self._zforceGrid_splinecoeffs = calc_2dsplinecoeffs_c(self._zforceGrid)
         if interpDens:
-            from ..potential import evaluateDensities
-
-            densGrid = numpy.zeros((len(self._rgrid), len(self._zgrid)))
-            for ii in range(len(self._rgrid)):
-                for jj in range(len(self._zgrid)):
-                    densGrid[ii, jj] = evaluateDensities(
-                        self._origPot, self._rgrid[ii], self._zgrid[jj]
-                    )
-            self._densGrid = densGrid
-            if self._logR:
-                self._densInterp = interpolate.RectBivariateSpline(
-                    self._logrgrid,
-                    self._zgrid,
-                    numpy.log(self._densGrid + 10.0**-10.0),
-                    kx=3,
-                    ky=3,
-                    s=0.0,
-                )
-            else:
-                self._densInterp = interpolate.RectBivariateSpline(
-                    self._rgrid,
-                    self._zgrid,
-                    numpy.log(self._densGrid + 10.0**-10.0),
-                    kx=3,
-                    ky=3,
-                    s=0.0,
-                )
+            self._densInterp = self._spline_2d(numpy.log(self._densGrid + 10.0**-10.0))
         if interpvcirc:
-            from ..potential import vcirc
-
-            if not numcores is None:
-                self._vcircGrid = multi.parallel_map(
-                    (lambda x: vcirc(self._origPot, self._rgrid[x])),
-                    list(range(len(self._rgrid))),
-                    numcores=numcores,
-                )
-            else:
-                self._vcircGrid = numpy.array(
-                    [vcirc(self._origPot, r) for r in self._rgrid]
-                )
-            if self._logR:
-                self._vcircInterp = interpolate.InterpolatedUnivariateSpline(
-                    self._logrgrid, self._vcircGrid, k=3
-                )
-            else:
-                self._vcircInterp = interpolate.InterpolatedUnivariateSpline(
-                    self._rgrid, self._vcircGrid, k=3
-                )
+            self._vcircInterp = self._spline_1d(self._vcircGrid)
         if interpdvcircdr:
-            from ..potential import dvcircdR
-
-            if not numcores is None:
-                self._dvcircdrGrid = multi.parallel_map(
-                    (lambda x: dvcircdR(self._origPot, self._rgrid[x])),
-                    list(range(len(self._rgrid))),
-                    numcores=numcores,
-                )
-            else:
-                self._dvcircdrGrid = numpy.array(
-                    [dvcircdR(self._origPot, r) for r in self._rgrid]
-                )
-            if self._logR:
-                self._dvcircdrInterp = interpolate.InterpolatedUnivariateSpline(
-                    self._logrgrid, self._dvcircdrGrid, k=3
-                )
-            else:
-                self._dvcircdrInterp = interpolate.InterpolatedUnivariateSpline(
-                    self._rgrid, self._dvcircdrGrid, k=3
-                )
+            self._dvcircdrInterp = self._spline_1d(self._dvcircdrGrid)
         if interpepifreq:
-            from ..potential import epifreq
-
-            if not numcores is None:
-                self._epifreqGrid = numpy.array(
-                    multi.parallel_map(
-                        (lambda x: epifreq(self._origPot, self._rgrid[x])),
-                        list(range(len(self._rgrid))),
-                        numcores=numcores,
-                    )
-                )
-            else:
-                self._epifreqGrid = numpy.array(
-                    [epifreq(self._origPot, r) for r in self._rgrid]
-                )
             indx = True ^ numpy.isnan(self._epifreqGrid)
-            if numpy.sum(indx) < 4:
-                if self._logR:
-                    self._epifreqInterp = interpolate.InterpolatedUnivariateSpline(
-                        self._logrgrid[indx], self._epifreqGrid[indx], k=1
-                    )
-                else:
-                    self._epifreqInterp = interpolate.InterpolatedUnivariateSpline(
-                        self._rgrid[indx], self._epifreqGrid[indx], k=1
-                    )
-            else:
-                if self._logR:
-                    self._epifreqInterp = interpolate.InterpolatedUnivariateSpline(
-                        self._logrgrid[indx], self._epifreqGrid[indx], k=3
-                    )
-                else:
-                    self._epifreqInterp = interpolate.InterpolatedUnivariateSpline(
-                        self._rgrid[indx], self._epifreqGrid[indx], k=3
-                    )
+            self._epifreqInterp = self._spline_1d(
+                self._epifreqGrid, indx=indx, k=1 if numpy.sum(indx) < 4 else 3
+            )
         if interpverticalfreq:
-            from ..potential import verticalfreq
+            self._verticalfreqInterp = self._spline_1d(self._verticalfreqGrid)
+        return None
 
-            if not numcores is None:
-                self._verticalfreqGrid = multi.parallel_map(
-                    (lambda x: verticalfreq(self._origPot, self._rgrid[x])),
-                    list(range(len(self._rgrid))),
-                    numcores=numcores,
-                )
-            else:
-                self._verticalfreqGrid = numpy.array(
-                    [verticalfreq(self._origPot, r) for r in self._rgrid]
+    def _spline_2d(self, grid):
+        """Cubic spline of a grid of values on the (R,z) grid, in log R if logR"""
+        return interpolate.RectBivariateSpline(
+            self._logrgrid if self._logR else self._rgrid,
+            self._zgrid,
+            grid,
+            kx=3,
+            ky=3,
+            s=0.0,
+        )
+
+    def _spline_1d(self, grid, indx=Ellipsis, k=3):
+        """Spline of a grid of values on the R grid, in log R if logR"""
+        return interpolate.InterpolatedUnivariateSpline(
+            (self._logrgrid if self._logR else self._rgrid)[indx], grid[indx], k=k
+        )
+
+    def _refine_grids(self, grids, use_c, numcores, rtol, max_refine):
+        """Double the resolution of the (R,z) grids until interpolating the coarser grids reproduces the new grid points to within rtol (relative to the maximum of the absolute value of each quantity; the error in the log for the density)"""
+        for ii in range(max_refine):
+            xgrid = self._logrgrid if self._logR else self._rgrid
+            newx = numpy.linspace(xgrid[0], xgrid[-1], 2 * len(xgrid) - 1)
+            newr = numpy.exp(newx) if self._logR else newx
+            newz = numpy.linspace(
+                self._zgrid[0], self._zgrid[-1], 2 * len(self._zgrid) - 1
+            )
+            # Only evaluate the new points: odd R for all z, even R for odd z
+            oddr = _calc_grids_2d(
+                self._origPot, tuple(grids), newr[1::2], newz, use_c, numcores=numcores
+            )
+            evenr = _calc_grids_2d(
+                self._origPot,
+                tuple(grids),
+                newr[::2],
+                newz[1::2],
+                use_c,
+                numcores=numcores,
+            )
+            converged = True
+            newgrids = {}
+            for q, grid in grids.items():
+                newgrids[q] = numpy.empty((len(newr), len(newz)))
+                newgrids[q][::2, ::2] = grid
+                newgrids[q][1::2] = oddr[q]
+                newgrids[q][::2, 1::2] = evenr[q]
+                if q == "dens":
+                    grid, oddr[q], evenr[q] = (
+                        numpy.log(g + 10.0**-10.0) for g in (grid, oddr[q], evenr[q])
+                    )
+                    scale = 1.0
+                else:
+                    scale = numpy.amax(numpy.fabs(newgrids[q]))
+                spl = self._spline_2d(grid)
+                err = max(
+                    numpy.amax(numpy.fabs(spl(newx[1::2], newz) - oddr[q])),
+                    numpy.amax(numpy.fabs(spl(newx[::2], newz[1::2]) - evenr[q])),
                 )
+                if err > rtol * scale:
+                    converged = False
+            grids = newgrids
+            self._rgrid = newr
             if self._logR:
-                self._verticalfreqInterp = interpolate.InterpolatedUnivariateSpline(
-                    self._logrgrid, self._verticalfreqGrid, k=3
-                )
-            else:
-                self._verticalfreqInterp = interpolate.InterpolatedUnivariateSpline(
-                    self._rgrid, self._verticalfreqGrid, k=3
-                )
+                self._logrgrid = newx
+            self._zgrid = newz
+            if converged:
+                return grids
+        warnings.warn(
+            f"interpRZPotential grids did not reach rtol={rtol} after {max_refine} refinements; consider increasing max_refine",
+            galpyWarning,
+        )
+        return grids
+
+    def save_grids(self, directory):
+        """
+        Save the interpolation grids as numpy .npy files in a directory, such that they can be memory-mapped by many processes by initializing an interpRZPotential with griddir=directory.
+
+        Parameters
+        ----------
+        directory : str
+            Directory to save the grids in (created if it does not exist).
+
+        Returns
+        -------
+        None
+
+        Notes
+        -----
+        - 2026-10-19 - Written - Agent (local)
+        """
+        os.makedirs(directory, exist_ok=True)
+        numpy.save(os.path.join(directory, "rgrid.npy"), self._rgrid)
+        numpy.save(os.path.join(directory, "zgrid.npy"), self._zgrid)
+        quantities = [q for q in _GRID_ATTRS if hasattr(self, _GRID_ATTRS[q])]
+        for q in quantities:
+            numpy.save(
+                os.path.join(directory, f"{_GRID_ATTRS[q][1:]}.npy"),
+                getattr(self, _GRID_ATTRS[q]),
+            )
+        with open(os.path.join(directory, "interpRZPotential.json"), "w") as jsonfile:
+            json.dump(
+                {
+                    "logR": bool(self._logR),
+                    "zsym": bool(self._zsym),
+                    "quantities": quantities,
+                },
+                jsonfile,
+            )
         return None
 
     @scalarVectorDecorator
@@ -609,6 +640,82 @@ class interpRZPotential(Potential):
             return verticalfreq(self._origPot, R)
 
 
+@disk_cache(ignore=("numcores",))
+def _calc_grids_2d(pot, quantities, rgrid, zgrid, use_c, numcores=None):
+    """Evaluate all quantities (from 'potential', 'rforce', 'zforce', and 'dens') of pot on the (R,z) grid in a single pass, in C if use_c (the density is not available in C and is evaluated in a separate pass in Python) and otherwise in parallel over R if numcores is set; returns a dictionary of grids"""
+    out = {}
+    if use_c:
+        out.update(
+            calc_potential_grids_c(
+                pot, rgrid, zgrid, [q for q in quantities if q != "dens"]
+            )[0]
+        )
+        quantities = tuple(q for q in quantities if q == "dens")
+        if len(quantities) == 0:
+            return out
+    if not numcores is None:
+        rows = multi.parallel_map(
+            (lambda x: _calc_grid_row(pot, quantities, rgrid[x], zgrid)),
+            list(range(len(rgrid))),
+            numcores=numcores,
+        )
+    else:
+        rows = [_calc_grid_row(pot, quantities, r, zgrid) for r in rgrid]
+    for ii, quantity in enumerate(quantities):
+        out[quantity] = numpy.array([row[ii] for row in rows])
+    return out
+
+
+def _calc_grid_row(pot, quantities, R, zgrid):
+    """Evaluate all quantities of pot at R for all z in zgrid, evaluating the forces together"""
+    try:
+        return _calc_grid_points(pot, quantities, numpy.full_like(zgrid, R), zgrid)
+    except (TypeError, ValueError):  # for potentials that do not accept array input
+        return numpy.array([_calc_grid_points(pot, quantities, R, z) for z in zgrid]).T
+
+
+def _calc_grid_points(pot, quantities, R, z):
+    """Evaluate all quantities of pot at (R,z), evaluating the forces together"""
+    from ..potential import evaluateDensities
+    from .Potential import _evaluateforces, _evaluatePotentials
+
+    if "rforce" in quantities or "zforce" in quantities:
+        forces = _evaluateforces(pot, R, z)
+    out = []
+    for quantity in quantities:
+        if quantity == "potential":
+            out.append(_evaluatePotentials(pot, R, z))
+        elif quantity == "rforce":
+            out.append(forces[0])
+        elif quantity == "zforce":
+            out.append(forces[1])
+        else:
+            out.append(evaluateDensities(pot, R, z, use_physical=False))
+    return numpy.array(out)
+
+
+@disk_cache(ignore=("numcores",))
+def _calc_grid_1d(pot, quantity, rgrid, numcores=None):
+    """Evaluate quantity ('vcirc', 'dvcircdR', 'epifreq', or 'verticalfreq') of pot on the R grid, in parallel if numcores is set"""
+    from ..potential import dvcircdR, epifreq, vcirc, verticalfreq
+
+    func = {
+        "vcirc": vcirc,
+        "dvcircdR": dvcircdR,
+        "epifreq": epifreq,
+        "verticalfreq": verticalfreq,
+    }[quantity]
+    if not numcores is None:
+        return numpy.array(
+            multi.parallel_map(
+                (lambda x: func(pot, rgrid[x])),
+                list(range(len(rgrid))),
+                numcores=numcores,
+            )
+        )
+    return numpy.array([func(pot, r) for r in rgrid])
+
+
 def calc_potential_c(pot, R, z, rforce=False, zforce=False):
     """
     Calculate the potential on a grid.
@@ -700,6 +807,86 @@ def calc_potential_c(pot, R, z, rforce=False, zforce=False):
     return (out, err.value)
 
 
+def calc_potential_grids_c(pot, R, z, quantities):
+    """
+    Calculate the potential and/or forces on a grid in a single pass.
+
+    Parameters
+    ----------
+    pot : Potential or list of such instances
+        Potential object(s) to calculate the potential from.
+    R : numpy.ndarray
+        Grid in R.
+    z : numpy.ndarray
+        Grid in z.
+    quantities : list of str
+        Quantities to calculate, from 'potential', 'rforce', and 'zforce'.
+
+    Returns
+    -------
+    dict
+        Grid (2D array) of each quantity.
+    int
+        Error code.
+
+    Notes
+    -----
+    - 2026-10-19 - Written - Agent (local)
+    """
+    from ..orbit.integrateFullOrbit import (  # here bc otherwise there is an infinite loop
+        _parse_pot,
+    )
+    from ..orbit.integratePlanarOrbit import _prep_tfuncs
+
+    # Parse the potential
+    npot, pot_type, pot_args, pot_tfuncs = _parse_pot(pot)
+    pot_tfuncs = _prep_tfuncs(pot_tfuncs)
+
+    # Set up result arrays
+    names = ["potential", "rforce", "zforce"]
+    calc = numpy.array([name in quantities for name in names], dtype=numpy.int32)
+    out = numpy.empty((3, len(R), len(z)))
+    err = ctypes.c_int(0)
+
+    # Set up the C code
+    ndarrayFlags = ("C_CONTIGUOUS", "WRITEABLE")
+    interppotential_calc_potentialFunc = _lib.calc_potential_grids
+    interppotential_calc_potentialFunc.argtypes = [
+        ctypes.c_int,
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ctypes.c_int,
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ctypes.c_int,
+        ndpointer(dtype=numpy.int32, flags=ndarrayFlags),
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ctypes.c_void_p,
+        ndpointer(dtype=numpy.int32, flags=ndarrayFlags),
+        ndpointer(dtype=numpy.float64, flags=ndarrayFlags),
+        ctypes.POINTER(ctypes.c_int),
+    ]
+
+    # Array requirements
+    R = numpy.require(R, dtype=numpy.float64, requirements=["C", "W"])
+    z = numpy.require(z, dtype=numpy.float64, requirements=["C", "W"])
+
+    # Run the C code
+    interppotential_calc_potentialFunc(
+        len(R),
+        R,
+        len(z),
+        z,
+        ctypes.c_int(npot),
+        pot_type,
+        pot_args,
+        pot_tfuncs,
+        calc,
+        out,
+        ctypes.byref(err),
+    )
+
+    return ({name: out[ii] for ii, name in enumerate(names) if calc[ii]}, err.value)
+
+
 def calc_2dsplinecoeffs_c(array2d):
     """
     Calculate spline coefficients for a 2D array.
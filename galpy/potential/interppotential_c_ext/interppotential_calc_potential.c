@@ -147,6 +147,47 @@ EXPORT void calc_zforce(int nR,
   free(potentialArgs);
   free(row);
 }
+/*
+  calc_potential_grids: calculate the potential, radial force, and vertical
+  force on the grid in a single pass
+  Input:
+     calc - whether to calculate the potential, radial force, vertical force
+  Output:
+     out - (3,nR,nz) grids of the potential, radial force, vertical force
+           (only those requested are filled in)
+*/
+EXPORT void calc_potential_grids(int nR,
+				 double *R,
+				 int nz,
+				 double *z,
+				 int npot,
+				 int * pot_type,
+				 double * pot_args,
+         tfuncs_type_arr pot_tfuncs,
+				 int * calc,
+				 double *out,
+				 int * err){
+  int ii, jj;
+  //Set up the potentials
+  struct potentialArg * potentialArgs= (struct potentialArg *) malloc ( npot * sizeof (struct potentialArg) );
+  parse_leapFuncArgs_Full(npot,potentialArgs,&pot_type,&pot_args,&pot_tfuncs);
+  //Run through the grid and calculate
+  UNUSED int chunk= CHUNKSIZE;
+#pragma omp parallel for schedule(static,chunk) private(ii,jj)	\
+  shared(npot,potentialArgs,R,z,nR,nz,calc,out)
+  for (ii=0; ii < nR; ii++){
+    for (jj=0; jj < nz; jj++){
+      if ( *calc )
+	*(out+ii*nz+jj)= evaluatePotentials(*(R+ii),*(z+jj),npot,potentialArgs);
+      if ( *(calc+1) )
+	*(out+(nR+ii)*nz+jj)= calcRforce(*(R+ii),*(z+jj),0.,0.,npot,potentialArgs);
+      if ( *(calc+2) )
+	*(out+(2*nR+ii)*nz+jj)= calczforce(*(R+ii),*(z+jj),0.,0.,npot,potentialArgs);
+    }
+  }
+  free_potentialArgs(npot,potentialArgs);
+  free(potentialArgs);
+}
 EXPORT void eval_potential(int nR,
 			   double *R,
 			   double *z,
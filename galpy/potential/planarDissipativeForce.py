@@ -114,6 +114,29 @@ class planarDissipativeForce(planarForce):
                 )
             return 0.0
 
+    def _forces(self, R, phi=0.0, t=0.0, v=None):
+        """Evaluate the radial force and the azimuthal torque (without the amplitude) at once"""
+        return (
+            self._Rforce(R, phi=phi, t=t, v=v),
+            (
+                self._phitorque(R, phi=phi, t=t, v=v)
+                if self.isNonAxi or hasattr(self, "_phitorque")
+                else 0.0
+            ),
+        )
+
+    def _forces_nodecorator(self, R, phi=0.0, t=0.0, v=None):
+        # Separate, so it can be used during orbit integration
+        try:
+            Rforce, phitorque = self._forces(R, phi=phi, t=t, v=v)
+        except AttributeError:  # pragma: no cover
+            from .Potential import PotentialError
+
+            raise PotentialError(
+                "Forces not implemented for this planarDissipativeForce"
+            )
+        return self._amp * Rforce, self._amp * phitorque
+
 
 class planarDissipativeForceFromFullDissipativeForce(planarDissipativeForce):
     """Class that represents a planar dissipative force derived from a 3D dissipative force"""
@@ -203,3 +226,9 @@ class planarDissipativeForceFromFullDissipativeForce(planarDissipativeForce):
         return self._Pot.phitorque(
             R, 0.0, phi=phi, t=t, v=[v[0], v[1], 0.0], use_physical=False
         )
+
+    def _forces(self, R, phi=0.0, t=0.0, v=None):
+        Rforce, _, phitorque = self._Pot._forces_nodecorator(
+            R, 0.0, phi=phi, t=t, v=[v[0], v[1], 0.0]
+        )
+        return Rforce, phitorque
@@ -158,6 +158,18 @@ class planarPotential(planarForce):
                 "'_phitorque' function not implemented for this potential"
             )
 
+    def _forces(self, R, phi=0.0, t=0.0):
+        """Evaluate the radial force and the azimuthal torque (without the amplitude) at once"""
+        return self._Rforce(R, phi=phi, t=t), self._phitorque(R, phi=phi, t=t)
+
+    def _forces_nodecorator(self, R, phi=0.0, t=0.0):
+        # Separate, so it can be used during orbit integration
+        try:
+            Rforce, phitorque = self._forces(R, phi=phi, t=t)
+        except AttributeError:  # pragma: no cover
+            raise PotentialError("Forces not implemented for this potential")
+        return self._amp * Rforce, self._amp * phitorque
+
     @potential_physical_input
     @physical_conversion("forcederivative", pop=True)
     def R2deriv(self, R, phi=0.0, t=0.0):
@@ -794,6 +806,10 @@ class planarPotentialFromFullPotential(planarPotential):
         """
         return self._Pot.phitorque(R, 0.0, phi=phi, t=t, use_physical=False)
 
+    def _forces(self, R, phi=0.0, t=0.0):
+        Rforce, _, phitorque = self._Pot._forces_nodecorator(R, 0.0, phi=phi, t=t)
+        return Rforce, phitorque
+
     def _R2deriv(self, R, phi=0.0, t=0.0):
         """
         Evaluate the second radial derivative.
@@ -1142,6 +1158,23 @@ def _evaluateplanarphitorques(Pot, R, phi=None, t=0.0, v=None):
         )
 
 
+def _evaluateplanarforces(Pot, R, phi=None, t=0.0, v=None):
+    """Raw, undecorated function for internal use that returns the radial force and the azimuthal torque at once"""
+    if not isinstance(Pot, list):
+        Pot = [Pot]
+    Rforce, phitorque = 0.0, 0.0
+    for pot in Pot:
+        if pot.isDissipative:
+            forces = pot._forces_nodecorator(R, phi=phi, t=t, v=v)
+        elif pot.isNonAxi:
+            forces = pot._forces_nodecorator(R, phi=phi, t=t)
+        else:
+            forces = pot._forces_nodecorator(R, t=t)
+        Rforce += forces[0]
+        phitorque += forces[1]
+    return Rforce, phitorque
+
+
 @potential_positional_arg
 @potential_physical_input
 @physical_conversion("forcederivative", pop=True)
@@ -0,0 +1,137 @@
+#include <math.h>
+#include <gsl/gsl_spline.h>
+#include <galpy_potentials.h>
+//AnyAxisymmetricRazorThinDiskPotential
+//arguments: amp, pot_zero, amin, amax, nde, xde[nde], wde[nde],
+//           xdeinf[nde], wdeinf[nde], followed by the optional table of the
+//           potential (see disk_table_eval)
+// with the surface density as a spline in ln(a) on [amin,amax] in spline1d,
+// constant at a < amin and zero at a > amax, and the potential and forces
+// computed with double-exponential quadrature, with nodes (xde,wde) on [0,1]
+// and (xdeinf,wdeinf) on [0,infinity)
+static inline double AnyAxisymmetricRazorThinDiskPotentialsdens(double a,
+							      double amin,
+							      double amax,
+							      struct potentialArg * potentialArgs){
+  if ( a > amax )
+    return 0.;
+  return gsl_spline_eval(*potentialArgs->spline1d,log( a < amin ? amin : a ),
+			 *potentialArgs->acc1d);
+}
+// Integrand of the potential (type=0), Rforce (1), and zforce (2) at a = R+d,
+// with the elliptic integrals computed from 1-m, which is accurate near a=R
+static inline double AnyAxisymmetricRazorThinDiskPotentialintegrand(double a,
+								    double d,
+								    double R,
+								    double z,
+								    int type,
+								    double amin,
+								    double amax,
+								    struct potentialArg * potentialArgs){
+  double aRz= ( a + R ) * ( a + R ) + z * z;
+  double dz2= d * d + z * z;
+  double K, E;
+  double aS= a * AnyAxisymmetricRazorThinDiskPotentialsdens(a,amin,amax,
+							     potentialArgs);
+  if ( aS == 0. )
+    return 0.;
+  ellipKE(dz2 / aRz,&K,&E);
+  if ( type == 0 )
+    return aS * K / sqrt( aRz );
+  else if ( type == 1 )
+    return aS * ( ( ( a + R ) * d + z * z ) * E - dz2 * K ) / R / dz2
+      / sqrt( aRz );
+  else
+    return aS * E / dz2 / sqrt( aRz );
+}
+static double AnyAxisymmetricRazorThinDiskPotentialintegral(double R,double z,
+							    int type,
+							    struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  double amin= *(args+2);
+  double amax= *(args+3);
+  int nde= (int) *(args+4);
+  double * xde= args+5;
+  double * wde= args+5+nde;
+  double * xdeinf= args+5+2*nde;
+  double * wdeinf= args+5+3*nde;
+  int ii;
+  double u;
+  double out= 0.;
+  for (ii=0; ii < nde; ii++) {
+    // [0,2R], folded around the singularity at a=R, where the two sides cancel
+    if ( *(xde+ii) > 1e-14 ) {
+      u= R * *(xde+ii);
+      out+= R * *(wde+ii)
+	* ( AnyAxisymmetricRazorThinDiskPotentialintegrand(R-u,-u,R,z,type,
+							    amin,amax,
+							    potentialArgs)
+	    + AnyAxisymmetricRazorThinDiskPotentialintegrand(R+u,u,R,z,type,
+							      amin,amax,
+							      potentialArgs) );
+    }
+    // [2R,infinity)
+    out+= *(wdeinf+ii)
+      * AnyAxisymmetricRazorThinDiskPotentialintegrand(2. * R + *(xdeinf+ii),
+							R + *(xdeinf+ii),
+							R,z,type,amin,amax,
+							potentialArgs);
+  }
+  return out;
+}
+double AnyAxisymmetricRazorThinDiskPotentialEval(double R,double z,
+						 double phi,double t,
+						 struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args;
+  double pot_zero= *(args+1);
+  double Phi, dPhidR, dPhidz;
+  //Calculate potential
+  if ( disk_table_eval(R,z,args + 5 + 4 * (int) *(args+4),
+		       &Phi,&dPhidR,&dPhidz) )
+    return amp * Phi;
+  else if ( R == 0. && z == 0. )
+    return amp * pot_zero;
+  else if ( isinf( R * R + z * z ) )
+    return 0.;
+  return -4. * amp
+    * AnyAxisymmetricRazorThinDiskPotentialintegral(R,z,0,potentialArgs);
+}
+double AnyAxisymmetricRazorThinDiskPotentialRforce(double R,double z,
+						   double phi,double t,
+						   struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args;
+  double Phi, dPhidR, dPhidz;
+  //Calculate Rforce
+  if ( disk_table_eval(R,z,args + 5 + 4 * (int) *(args+4),
+		       &Phi,&dPhidR,&dPhidz) )
+    return - amp * dPhidR;
+  else if ( R == 0. )
+    return 0.;
+  return 2. * amp
+    * AnyAxisymmetricRazorThinDiskPotentialintegral(R,z,1,potentialArgs);
+}
+double AnyAxisymmetricRazorThinDiskPotentialPlanarRforce(double R,double phi,
+							 double t,
+							 struct potentialArg * potentialArgs){
+  return AnyAxisymmetricRazorThinDiskPotentialRforce(R,0.,phi,t,potentialArgs);
+}
+double AnyAxisymmetricRazorThinDiskPotentialzforce(double R,double z,
+						   double phi,double t,
+						   struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args;
+  double Phi, dPhidR, dPhidz;
+  //Calculate zforce
+  if ( disk_table_eval(R,z,args + 5 + 4 * (int) *(args+4),
+		       &Phi,&dPhidR,&dPhidz) )
+    return - amp * dPhidz;
+  else if ( z == 0. )
+    return 0.;
+  return -4. * amp * z
+    * AnyAxisymmetricRazorThinDiskPotentialintegral(R,z,2,potentialArgs);
+}
@@ -0,0 +1,275 @@
+#include <math.h>
+#include <stdlib.h>
+#include <galpy_potentials.h>
+#ifndef M_PI
+#define M_PI 3.14159265358979323846
+#endif
+//CylindricalSplinePotential: arguments: M, zsym, omegab, nR, nz, Rgrid[nR],
+//zgrid[nz], and the harmonics' values, R and z derivatives, and cross
+//derivatives on the grid, grid[4][nR][nz][2M+1] (x amp); the harmonics are
+//cos(m phi) for m=0,...,M followed by sin(m phi) for m=1,...,M
+static int bisect(double x,double * grid,int n){
+  int lo= 0, hi= n - 1, mid;
+  while ( hi - lo > 1 ) {
+    mid= ( lo + hi ) / 2;
+    if ( x < *(grid+mid) ) hi= mid;
+    else lo= mid;
+  }
+  return lo;
+}
+//Cubic Hermite basis functions and their first, second, and third derivatives
+static void hermite_basis(double u,double h,double * b,double * db,
+			  double * d2b,double * d3b){
+  *b= 2. * u * u * u - 3. * u * u + 1.;
+  *(b+1)= h * ( u * u * u - 2. * u * u + u );
+  *(b+2)= -2. * u * u * u + 3. * u * u;
+  *(b+3)= h * ( u * u * u - u * u );
+  *db= ( 6. * u * u - 6. * u ) / h;
+  *(db+1)= 3. * u * u - 4. * u + 1.;
+  *(db+2)= ( -6. * u * u + 6. * u ) / h;
+  *(db+3)= 3. * u * u - 2. * u;
+  *d2b= ( 12. * u - 6. ) / h / h;
+  *(d2b+1)= ( 6. * u - 4. ) / h;
+  *(d2b+2)= ( -12. * u + 6. ) / h / h;
+  *(d2b+3)= ( 6. * u - 2. ) / h;
+  *d3b= 12. / h / h / h;
+  *(d3b+1)= 6. / h / h;
+  *(d3b+2)= -12. / h / h / h;
+  *(d3b+3)= 6. / h / h;
+}
+//Bicubic Hermite interpolation of all harmonics at (R,z) inside of the grid;
+//F[10][nharm]: value, R, z, RR, Rz, zz, RRR, RRz, Rzz, and zzz derivatives
+static void bicubic_hermite(double R,double z,double * args,double * F){
+  int nharm= 2 * (int) *args + 1;
+  int nR= (int) *(args+3), nz= (int) *(args+4);
+  double * Rgrid= args + 5;
+  double * zgrid= Rgrid + nR;
+  double * grid= zgrid + nz;
+  int ii, jj, a, b, k, kk;
+  double hR, hz, bu[4], dbu[4], d2bu[4], d3bu[4], bv[4], dbv[4], d2bv[4];
+  double d3bv[4], c, wu[4], wv[4];
+  ii= bisect(R,Rgrid,nR);
+  jj= bisect(z,zgrid,nz);
+  hR= *(Rgrid+ii+1) - *(Rgrid+ii);
+  hz= *(zgrid+jj+1) - *(zgrid+jj);
+  hermite_basis(( R - *(Rgrid+ii) ) / hR,hR,bu,dbu,d2bu,d3bu);
+  hermite_basis(( z - *(zgrid+jj) ) / hz,hz,bv,dbv,d2bv,d3bv);
+  for (kk=0; kk < 10 * nharm; kk++) *(F+kk)= 0.;
+  for (a=0; a < 2; a++)
+    for (b=0; b < 2; b++)
+      // Node values: f, f_R, f_z, f_Rz
+      for (k=0; k < 4; k++) {
+	wu[0]= bu[2*a + k % 2];
+	wu[1]= dbu[2*a + k % 2];
+	wu[2]= d2bu[2*a + k % 2];
+	wu[3]= d3bu[2*a + k % 2];
+	wv[0]= bv[2*b + k / 2];
+	wv[1]= dbv[2*b + k / 2];
+	wv[2]= d2bv[2*b + k / 2];
+	wv[3]= d3bv[2*b + k / 2];
+	for (kk=0; kk < nharm; kk++) {
+	  c= *(grid + ( ( k * nR + ii + a ) * nz + jj + b ) * nharm + kk);
+	  *(F+kk)+= c * wu[0] * wv[0];
+	  *(F+nharm+kk)+= c * wu[1] * wv[0];
+	  *(F+2*nharm+kk)+= c * wu[0] * wv[1];
+	  *(F+3*nharm+kk)+= c * wu[2] * wv[0];
+	  *(F+4*nharm+kk)+= c * wu[1] * wv[1];
+	  *(F+5*nharm+kk)+= c * wu[0] * wv[2];
+	  *(F+6*nharm+kk)+= c * wu[3] * wv[0];
+	  *(F+7*nharm+kk)+= c * wu[2] * wv[1];
+	  *(F+8*nharm+kk)+= c * wu[1] * wv[2];
+	  *(F+9*nharm+kk)+= c * wu[0] * wv[3];
+	}
+      }
+}
+//Compute the potential and its derivatives; out= Phi,Phi_R,Phi_z,Phi_p and,
+//if second, Phi_RR,Phi_zz,Phi_Rz,Phi_pp,Phi_Rp,Phi_zp
+static void compute(double R,double z,double phi,double t,
+		    struct potentialArg * potentialArgs,
+		    int second,double * out){
+  double * args= potentialArgs->args;
+  int M= (int) *args;
+  int zsym= (int) *(args+1);
+  double omegab= *(args+2);
+  int nR= (int) *(args+3), nz= (int) *(args+4);
+  int nharm= 2 * M + 1;
+  double * Rgrid= args + 5;
+  double * zgrid= Rgrid + nR;
+  int kk, m, inner, outside, Rbound, nout;
+  double zsign= 1., sR, sz, s, Re, ze, b, w, am, sa, G, Gu, Gv, Guu, Guv, Gvv;
+  double Fn, Fv, Fvv, Fnvv, Fvvv, D, D1, D2, P, P1, P2, Q, Q1, Q2;
+  double H1, H1p, H2, H2p, trig, dtrig, FR, Fz, FRR, FRz, Fzz;
+  double * F;
+  nout= second ? 10 : 4;
+  for (kk=0; kk < nout; kk++) *(out+kk)= 0.;
+  if ( zsym && z < 0. ) {
+    zsign= -1.;
+    z= -z;
+  }
+  inner= R < *Rgrid;
+  if ( inner ) R= *Rgrid;
+  // Scale factor to the edge of the grid along the ray from the origin
+  sR= ( R > *(Rgrid+nR-1) ) ? *(Rgrid+nR-1) / R : INFINITY;
+  if ( z > *(zgrid+nz-1) ) sz= *(zgrid+nz-1) / z;
+  else if ( z < *zgrid ) sz= *zgrid / z;
+  else sz= INFINITY;
+  outside= isfinite(sR) || isfinite(sz);
+  Rbound= sR <= sz;
+  s= outside ? fmin(sR,sz) : 1.;
+  // Point at the edge of the grid along the ray, exactly on the edge
+  Re= ( outside && Rbound ) ? *(Rgrid+nR-1) : s * R;
+  if ( outside && !Rbound ) ze= ( z > 0. ) ? *(zgrid+nz-1) : *zgrid;
+  else ze= s * z;
+  F= (double *) malloc ( 10 * nharm * sizeof ( double ) );
+  bicubic_hermite(fmin(fmax(Re,*Rgrid),*(Rgrid+nR-1)),
+		  fmin(fmax(ze,*zgrid),*(zgrid+nz-1)),args,F);
+  phi-= omegab * t;
+  for (kk=0; kk < nharm; kk++) {
+    m= ( kk > M ) ? kk - M : kk;
+    G= *(F+kk);
+    FR= *(F+nharm+kk);
+    Fz= *(F+2*nharm+kk);
+    FRR= *(F+3*nharm+kk);
+    FRz= *(F+4*nharm+kk);
+    Fzz= *(F+5*nharm+kk);
+    if ( outside ) {
+      // Along the ray, G = P s^a + Q s^(a+1) with P and Q set by the value
+      // and the radial derivative at the edge; in coordinates (u,v) with the
+      // edge at u=b and w=s v along the edge
+      b= Rbound ? Re : ze;
+      w= Rbound ? ze : Re;
+      am= m + 1.;
+      Fn= Rbound ? FR : Fz;
+      Fv= Rbound ? Fz : FR;
+      Fvv= Rbound ? Fzz : FRR;
+      Fnvv= Rbound ? *(F+8*nharm+kk) : *(F+7*nharm+kk);
+      Fvvv= Rbound ? *(F+9*nharm+kk) : *(F+6*nharm+kk);
+      D= b * Fn + w * Fv;
+      D1= b * FRz + Fv + w * Fvv;
+      D2= b * Fnvv + 2. * Fvv + w * Fvvv;
+      P= ( am + 1. ) * G + D;
+      P1= ( am + 1. ) * Fv + D1;
+      P2= ( am + 1. ) * Fvv + D2;
+      Q= -D - am * G;
+      Q1= -D1 - am * Fv;
+      Q2= -D2 - am * Fvv;
+      H1= w * P1 + am * P;
+      H1p= w * P2 + ( am + 1. ) * P1;
+      H2= w * Q1 + ( am + 1. ) * Q;
+      H2p= w * Q2 + ( am + 2. ) * Q1;
+      sa= pow(s,am);
+      G= sa * ( P + Q * s );
+      Gv= sa * s * ( P1 + Q1 * s );
+      Gvv= sa * s * s * ( P2 + Q2 * s );
+      Gu= -sa * s * ( H1 + H2 * s ) / b;
+      Guv= -sa * s * s * ( H1p + H2p * s ) / b;
+      Guu= sa * s * s * ( w * H1p + ( am + 1. ) * H1
+			  + ( w * H2p + ( am + 2. ) * H2 ) * s ) / b / b;
+      FR= Rbound ? Gu : Gv;
+      Fz= Rbound ? Gv : Gu;
+      FRR= Rbound ? Guu : Gvv;
+      Fzz= Rbound ? Gvv : Guu;
+      FRz= Guv;
+    }
+    // Constant in R inside of the smallest grid radius
+    if ( inner ) {
+      FR= 0.;
+      FRR= 0.;
+      FRz= 0.;
+    }
+    if ( kk > M ) {
+      trig= sin ( m * phi );
+      dtrig= m * cos ( m * phi );
+    }
+    else {
+      trig= cos ( m * phi );
+      dtrig= -m * sin ( m * phi );
+    }
+    *out+= G * trig;
+    *(out+1)+= FR * trig;
+    *(out+2)+= zsign * Fz * trig;
+    *(out+3)+= G * dtrig;
+    if ( second ) {
+      *(out+4)+= FRR * trig;
+      *(out+5)+= Fzz * trig;
+      *(out+6)+= zsign * FRz * trig;
+      *(out+7)-= m * m * G * trig;
+      *(out+8)+= FR * dtrig;
+      *(out+9)+= zsign * Fz * dtrig;
+    }
+  }
+  free(F);
+}
+double CylindricalSplinePotentialEval(double R,double Z, double phi,
+				      double t,
+				      struct potentialArg * potentialArgs){
+  double out[4];
+  compute(R,Z,phi,t,potentialArgs,0,out);
+  return *out;
+}
+double CylindricalSplinePotentialRforce(double R,double Z, double phi,
+					double t,
+					struct potentialArg * potentialArgs){
+  double out[4];
+  compute(R,Z,phi,t,potentialArgs,0,out);
+  return -*(out+1);
+}
+double CylindricalSplinePotentialzforce(double R,double Z, double phi,
+					double t,
+					struct potentialArg * potentialArgs){
+  double out[4];
+  compute(R,Z,phi,t,potentialArgs,0,out);
+  return -*(out+2);
+}
+double CylindricalSplinePotentialphitorque(double R,double Z, double phi,
+					   double t,
+					   struct potentialArg * potentialArgs){
+  double out[4];
+  compute(R,Z,phi,t,potentialArgs,0,out);
+  return -*(out+3);
+}
+double CylindricalSplinePotentialDens(double R,double Z, double phi,
+				      double t,
+				      struct potentialArg * potentialArgs){
+  double out[10];
+  compute(R,Z,phi,t,potentialArgs,1,out);
+  if ( R > 0. )
+    return ( *(out+4) + *(out+5) + *(out+1) / R + *(out+7) / R / R ) / 4. / M_PI;
+  else
+    return ( 2. * *(out+4) + *(out+5) ) / 4. / M_PI;
+}
+double CylindricalSplinePotentialPlanarRforce(double R,double phi,
+					      double t,
+					      struct potentialArg * potentialArgs){
+  double out[4];
+  compute(R,0.,phi,t,potentialArgs,0,out);
+  return -*(out+1);
+}
+double CylindricalSplinePotentialPlanarphitorque(double R,double phi,
+						 double t,
+						 struct potentialArg * potentialArgs){
+  double out[4];
+  compute(R,0.,phi,t,potentialArgs,0,out);
+  return -*(out+3);
+}
+double CylindricalSplinePotentialPlanarR2deriv(double R,double phi,
+					       double t,
+					       struct potentialArg * potentialArgs){
+  double out[10];
+  compute(R,0.,phi,t,potentialArgs,1,out);
+  return *(out+4);
+}
+double CylindricalSplinePotentialPlanarphi2deriv(double R,double phi,
+						 double t,
+						 struct potentialArg * potentialArgs){
+  double out[10];
+  compute(R,0.,phi,t,potentialArgs,1,out);
+  return *(out+7);
+}
+double CylindricalSplinePotentialPlanarRphideriv(double R,double phi,
+						 double t,
+						 struct potentialArg * potentialArgs){
+  double out[10];
+  compute(R,0.,phi,t,potentialArgs,1,out);
+  return *(out+8);
+}
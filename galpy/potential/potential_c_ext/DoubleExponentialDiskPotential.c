@@ -1,6 +1,9 @@
 #include <math.h>
 #include <galpy_potentials.h>
 //Double exponential disk potential
+//arguments: amp, -4 pi alpha amp, alpha, beta, de_n, de_j0_xs[de_n],
+//           de_j1_xs[de_n], de_j0_ws[de_n], de_j1_ws[de_n], followed by the
+//           optional table of the potential (see disk_table_eval)
 double DoubleExponentialDiskPotentialEval(double R,double z, double phi,
 					  double t,
 					  struct potentialArg * potentialArgs){
@@ -20,6 +23,9 @@ double DoubleExponentialDiskPotentialEval(double R,double z, double phi,
   double out= 0;
   double prev_term= 1;
   int ii= 0;
+  double dPhidR, dPhidz;
+  if ( disk_table_eval(R,z,args + 5 + 4 * de_n,&out,&dPhidR,&dPhidz) )
+    return *args * out;
   while ( fabs(prev_term) > 1e-15 && ii < de_n ) {
     x= *(de_j0_xs+ii) / R;
     prev_term= *(de_j0_ws+ii) * pow( alpha2 + x * x , -1.5 )	\
@@ -50,6 +56,9 @@ double DoubleExponentialDiskPotentialRforce(double R,double z, double phi,
   double out= 0;
   double prev_term= 1;
   int ii= 0;
+  double Phi, dPhidz;
+  if ( disk_table_eval(R,z,args + 5 + 4 * de_n,&Phi,&out,&dPhidz) )
+    return - *args * out;
   while ( fabs(prev_term) > 1e-15 && ii < de_n ) {
     x= *(de_j1_xs+ii) / R;
     prev_term= *(de_j1_ws+ii) * x * pow( alpha2 + x * x , -1.5) \
@@ -77,6 +86,9 @@ double DoubleExponentialDiskPotentialPlanarRforce(double R,double phi,
   double out= 0;
   double prev_term= 1;
   int ii= 0;
+  double Phi, dPhidz;
+  if ( disk_table_eval(R,0.,args + 5 + 4 * de_n,&Phi,&out,&dPhidz) )
+    return - *args * out;
   while ( fabs(prev_term) > 1e-15 && ii < de_n ) {
     x= *(de_j1_xs+ii) / R;
     prev_term= *(de_j1_ws+ii) * x * pow( alpha2 + x * x , -1.5) / ( beta + x );
@@ -105,6 +117,9 @@ double DoubleExponentialDiskPotentialzforce(double R,double z,double phi,
   double out= 0;
   double prev_term= 1;
   int ii= 0;
+  double Phi, dPhidR;
+  if ( disk_table_eval(R,z,args + 5 + 4 * de_n,&Phi,&dPhidR,&out) )
+    return - *args * out;
   while ( fabs(prev_term) > 1e-15 && ii < de_n ) {
     x= *(de_j0_xs+ii) / R;
     prev_term= *(de_j0_ws+ii) * pow( alpha2 + x * x , -1.5) \
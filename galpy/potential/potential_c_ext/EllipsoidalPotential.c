@@ -2,7 +2,82 @@
 #include <math.h>
 #include <bovy_coords.h>
 #include <galpy_potentials.h>
+#ifndef M_PI
+#define M_PI 3.14159265358979323846
+#endif
 //General routines for EllipsoidalPotentials
+//Number of arguments, including the optional table of the potential
+int EllipsoidalPotentialnargs(double * args){
+  int npsi= (int) *(args+7);
+  int glorder= (int) *(args+20+npsi);
+  double * tab= args + 21 + npsi + 2 * glorder;
+  if ( (int) *tab )
+    return 27 + npsi + 2 * glorder
+      + ( (int) *(tab+1) + 2 ) * ( (int) *(tab+2) + 2 ) * ( (int) *(tab+3) + 2 );
+  else
+    return 22 + npsi + 2 * glorder;
+}
+//Tricubic B-spline interpolation of the table of the potential in
+//(ln r,theta,phi) in the aligned frame: tab= [tabulated,nu,ntheta,nphi,
+//umin,umax,coeffs[nu+2][ntheta+2][nphi+2]]; returns 0 if not tabulated or
+//outside of the table, otherwise the potential and its gradient
+static int table_eval(double x,double y,double z,double * tab,
+		      double * Phi,double * gx,double * gy,double * gz){
+  int d, a, b, c, n[3], idx[3];
+  double ax= fabs(x), ay= fabs(y), az= fabs(z), Rc, r2, h[3], lo[3], crd[3];
+  double bs[3][4], dbs[3][4], coeff, wtp, Phiu= 0., Phit= 0., Phip= 0.;
+  double gR, gp;
+  double * coeffs= tab + 6;
+  if ( ! (int) *tab )
+    return 0;
+  Rc= sqrt ( ax * ax + ay * ay );
+  r2= Rc * Rc + az * az;
+  crd[0]= 0.5 * log ( r2 );
+  if ( crd[0] < *(tab+4) || crd[0] > *(tab+5) )
+    return 0;
+  crd[1]= atan2 ( Rc , az );
+  crd[2]= atan2 ( ay , ax );
+  lo[0]= *(tab+4);
+  lo[1]= 0.;
+  lo[2]= 0.;
+  for (d=0; d < 3; d++)
+    n[d]= (int) *(tab+1+d);
+  h[0]= ( *(tab+5) - *(tab+4) ) / ( n[0] - 1 );
+  h[1]= 0.5 * M_PI / ( n[1] - 1 );
+  h[2]= 0.5 * M_PI / ( n[2] - 1 );
+  for (d=0; d < 3; d++) {
+    idx[d]= (int) ( ( crd[d] - lo[d] ) / h[d] );
+    if ( idx[d] < 0 ) idx[d]= 0;
+    if ( idx[d] > n[d] - 2 ) idx[d]= n[d] - 2;
+    bspline_basis(( crd[d] - lo[d] ) / h[d] - idx[d],h[d],bs[d],dbs[d]);
+  }
+  *Phi= 0.;
+  for (b=0; b < 4; b++)
+    for (c=0; c < 4; c++) {
+      wtp= bs[1][b] * bs[2][c];
+      for (a=0; a < 4; a++) {
+	coeff= *(coeffs + ( ( idx[0] + a ) * ( n[1] + 2 ) + idx[1] + b )
+		 * ( n[2] + 2 ) + idx[2] + c);
+	*Phi+= coeff * bs[0][a] * wtp;
+	Phiu+= coeff * dbs[0][a] * wtp;
+	Phit+= coeff * bs[0][a] * dbs[1][b] * bs[2][c];
+	Phip+= coeff * bs[0][a] * bs[1][b] * dbs[2][c];
+      }
+    }
+  // Gradient in rectangular coordinates, zero on the z axis by symmetry
+  if ( Rc > 0. ) {
+    gR= ( Phiu * Rc + Phit * az ) / r2 / Rc;
+    gp= Phip / Rc / Rc;
+  }
+  else {
+    gR= 0.;
+    gp= 0.;
+  }
+  *gx= ( x < 0. ? -1. : 1. ) * ( gR * ax - gp * ay );
+  *gy= ( y < 0. ? -1. : 1. ) * ( gR * ay + gp * ax );
+  *gz= ( z < 0. ? -1. : 1. ) * ( Phiu * az - Phit * Rc ) / r2;
+  return 1;
+}
 double EllipsoidalPotentialEval(double R,double z, double phi,
 				double t,
 				struct potentialArg * potentialArgs){
@@ -21,11 +96,13 @@ double EllipsoidalPotentialEval(double R,double z, double phi,
   double * glx= ellipargs;
   double * glw= ellipargs + glorder;
   //Calculate potential
-  double x, y;
+  double x, y, gx, gy, gz;
   double out= 0.;
   cyl_to_rect(R,phi,&x,&y);
   if ( !aligned )
     rotate(&x,&y,&z,rot);
+  if ( table_eval(x,y,z,glw+glorder,&out,&gx,&gy,&gz) )
+    return amp * out;
   for (ii=0; ii < glorder; ii++) {
     s= 1. / *(glx+ii) / *(glx+ii) - 1.;
     out+= *(glw+ii) * potentialArgs->psi ( sqrt (  x * x / ( 1. + s )
@@ -43,6 +120,7 @@ void EllipsoidalPotentialxyzforces_xyz(double (*dens)(double m,
   int ii;
   double t;
   double td;
+  double Phi;
   //Get args
   double * ellipargs= args + 8 + (int) *(args+7); // *(args+7) = num. arguments dens
   double b2= *ellipargs++;
@@ -62,13 +140,20 @@ void EllipsoidalPotentialxyzforces_xyz(double (*dens)(double m,
   *Fx= 0.;
   *Fy= 0.;
   *Fz= 0.;
-  for (ii=0; ii < glorder; ii++) {
-    t= 1. / *(glx+ii) / *(glx+ii) - 1.;
-    td= *(glw+ii) * dens( sqrt ( x * x / ( 1. + t )	+ y * y / ( b2 + t ) \
-				 + z * z / ( c2 + t ) ),args+8);
-    *Fx+= td * x / ( 1. + t );
-    *Fy+= td * y / ( b2 + t );
-    *Fz+= td * z / ( c2 + t );
+  if ( table_eval(x,y,z,glw+glorder,&Phi,Fx,Fy,Fz) ) {
+    *Fx*= -1.;
+    *Fy*= -1.;
+    *Fz*= -1.;
+  }
+  else {
+    for (ii=0; ii < glorder; ii++) {
+      t= 1. / *(glx+ii) / *(glx+ii) - 1.;
+      td= *(glw+ii) * dens( sqrt ( x * x / ( 1. + t ) + y * y / ( b2 + t ) \
+				   + z * z / ( c2 + t ) ),args+8);
+      *Fx+= td * x / ( 1. + t );
+      *Fy+= td * y / ( b2 + t );
+      *Fz+= td * z / ( c2 + t );
+    }
   }
   if ( !aligned )
     rotate_force(Fx,Fy,Fz,rot);
@@ -0,0 +1,225 @@
+#include <math.h>
+#include <gsl/gsl_poly.h>
+#include <bovy_coords.h>
+#include <galpy_potentials.h>
+//FerrersPotential
+//arguments: amp, a2, b2, c2, n, pa, omegab, 7 cached values,
+//           glorder, glx[glorder], glw[glorder]
+// where amp includes pi rho_c a^3 b c and (a2,b2,c2) are the squared axes
+static double FerrersPotential_lowerlim(double x2,double y2,double z2,
+					double a,double b,double c){
+  // Real positive root of x2/(a+t) + y2/(b+t) + z2/(c+t) = 1 outside of
+  // the ellipsoid, zero inside; this is the largest root of the cubic
+  double r0, r1, r2, f, df;
+  int ii, nroots;
+  if ( x2 / a + y2 / b + z2 / c <= 1. )
+    return 0.;
+  nroots= gsl_poly_solve_cubic(a + b + c - x2 - y2 - z2,
+			       a * b + a * c + b * c - a * y2 - a * z2
+			       - b * x2 - b * z2 - c * x2 - c * y2,
+			       a * b * c - a * b * z2 - a * c * y2 - b * c * x2,
+			       &r0,&r1,&r2);
+  if ( nroots == 3 )
+    r0= r2;
+  // Polish the root with Newton's method
+  for (ii=0; ii < 2; ii++) {
+    f= x2 / ( a + r0 ) + y2 / ( b + r0 ) + z2 / ( c + r0 ) - 1.;
+    df= -x2 / ( a + r0 ) / ( a + r0 ) - y2 / ( b + r0 ) / ( b + r0 )
+      - z2 / ( c + r0 ) / ( c + r0 );
+    r0-= f / df;
+  }
+  return r0;
+}
+// The integrals from lambda to infinity over tau of
+//   pot: B^(n+1) / A
+//   force: B^n x_i / (tau + a_i) / A
+//   d2: derivatives of -B^(n+1) / A / (n+1) wrt (x,x), (x,y), (y,y)
+// with A= sqrt((tau+a)(tau+b)(tau+c)) and B= 1-x^2/(tau+a)-y^2/(tau+b)-z^2/(tau+c)
+// using Gauss-Legendre quadrature in s with tau= lambda + q (1/s^2-1)
+static void FerrersPotential_integrals(double x,double y,double z,
+				       double a2,double b2,double c2,double n,
+				       int glorder,double * glx,double * glw,
+				       double * pot,double * force,double * d2){
+  int ii;
+  double lambda= FerrersPotential_lowerlim(x*x,y*y,z*z,a2,b2,c2);
+  double q= a2 + lambda;
+  double s, w, tau, ta, tb, tc, A, B, Bn;
+  if ( pot ) *pot= 0.;
+  if ( force ) {
+    *force= 0.;
+    *(force+1)= 0.;
+    *(force+2)= 0.;
+  }
+  if ( d2 ) {
+    *d2= 0.;
+    *(d2+1)= 0.;
+    *(d2+2)= 0.;
+  }
+  for (ii=0; ii < glorder; ii++) {
+    s= 0.5 * ( *(glx+ii) + 1. );
+    tau= lambda + q * ( 1. / s / s - 1. );
+    ta= tau + a2;
+    tb= tau + b2;
+    tc= tau + c2;
+    A= sqrt( ta * tb * tc );
+    B= 1. - x * x / ta - y * y / tb - z * z / tc;
+    if ( B < 0. ) B= 0.;
+    w= *(glw+ii) * q / s / s / s / A;
+    Bn= pow( B , n );
+    if ( pot )
+      *pot+= w * Bn * B;
+    if ( force ) {
+      *force+= w * Bn * x / ta;
+      *(force+1)+= w * Bn * y / tb;
+      *(force+2)+= w * Bn * z / tc;
+    }
+    if ( d2 ) {
+      *d2+= w * ( n * pow( B , n - 1. ) * 4. * x * x / ta / ta - 2. * Bn / ta );
+      *(d2+1)+= w * n * pow( B , n - 1. ) * 4. * x * y / ta / tb;
+      *(d2+2)+= w * ( n * pow( B , n - 1. ) * 4. * y * y / tb / tb - 2. * Bn / tb );
+    }
+  }
+}
+double FerrersPotentialEval(double R,double z, double phi,
+			    double t,
+			    struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args;
+  double a2= *(args+1);
+  double b2= *(args+2);
+  double c2= *(args+3);
+  double n= *(args+4);
+  double pa= *(args+5);
+  double omegab= *(args+6);
+  int glorder= (int) *(args+14);
+  double * glx= args+15;
+  double * glw= args+15+glorder;
+  double x, y, pot;
+  //Calculate potential
+  cyl_to_rect(R,phi-pa-omegab*t,&x,&y);
+  FerrersPotential_integrals(x,y,z,a2,b2,c2,n,glorder,glx,glw,&pot,NULL,NULL);
+  return -amp * pot / ( n + 1. );
+}
+static void FerrersPotentialxyzforces_xyz(double R,double z, double phi,
+					  double t,double * args){
+  double a2= *(args+1);
+  double b2= *(args+2);
+  double c2= *(args+3);
+  double n= *(args+4);
+  double pa= *(args+5);
+  double omegab= *(args+6);
+  double * cache= args+7;
+  int glorder= (int) *(args+14);
+  double * glx= args+15;
+  double * glw= args+15+glorder;
+  double x, y, cp, sp;
+  double force[3];
+  if ( R != *cache || z != *(cache+1) || phi != *(cache+2) || t != *(cache+3) ){
+    // Set up cache
+    *cache= R;
+    *(cache+1)= z;
+    *(cache+2)= phi;
+    *(cache+3)= t;
+    // Compute forces in rectangular, aligned frame
+    cyl_to_rect(R,phi-pa-omegab*t,&x,&y);
+    FerrersPotential_integrals(x,y,z,a2,b2,c2,n,glorder,glx,glw,
+			       NULL,force,NULL);
+    // Rotate to rectangular, correct frame
+    cp= cos ( pa + omegab * t );
+    sp= sin ( pa + omegab * t );
+    *(cache+4)= -2. * ( cp * force[0] - sp * force[1] );
+    *(cache+5)= -2. * ( sp * force[0] + cp * force[1] );
+    *(cache+6)= -2. * force[2];
+  }
+}
+double FerrersPotentialRforce(double R,double z, double phi,
+			      double t,
+			      struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  double amp= *args;
+  //Calculate Rforce
+  FerrersPotentialxyzforces_xyz(R,z,phi,t,args);
+  return amp * ( cos ( phi ) * *(args + 11) + sin( phi ) * *(args + 12) );
+}
+double FerrersPotentialPlanarRforce(double R,double phi,double t,
+				    struct potentialArg * potentialArgs){
+  return FerrersPotentialRforce(R,0.,phi,t,potentialArgs);
+}
+double FerrersPotentialphitorque(double R,double z, double phi,
+				 double t,
+				 struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  double amp= *args;
+  //Calculate phitorque
+  FerrersPotentialxyzforces_xyz(R,z,phi,t,args);
+  return amp * R * ( -sin ( phi ) * *(args + 11) + cos( phi ) * *(args + 12) );
+}
+double FerrersPotentialPlanarphitorque(double R, double phi,double t,
+				       struct potentialArg * potentialArgs){
+  return FerrersPotentialphitorque(R,0.,phi,t,potentialArgs);
+}
+double FerrersPotentialzforce(double R,double z, double phi,
+			      double t,
+			      struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  double amp= *args;
+  //Calculate zforce
+  FerrersPotentialxyzforces_xyz(R,z,phi,t,args);
+  return amp * *(args + 13);
+}
+// Second derivatives in the plane in the rectangular, correct frame
+static void FerrersPotentialPlanar2ndderivs(double R,double phi,double t,
+					    double * args,double * phixx,
+					    double * phixy,double * phiyy){
+  double amp= *args;
+  double a2= *(args+1);
+  double b2= *(args+2);
+  double c2= *(args+3);
+  double n= *(args+4);
+  double pa= *(args+5);
+  double omegab= *(args+6);
+  int glorder= (int) *(args+14);
+  double * glx= args+15;
+  double * glw= args+15+glorder;
+  double x, y, c, s;
+  double d2[3];
+  cyl_to_rect(R,phi-pa-omegab*t,&x,&y);
+  FerrersPotential_integrals(x,y,0.,a2,b2,c2,n,glorder,glx,glw,NULL,NULL,d2);
+  c= cos ( pa + omegab * t );
+  s= sin ( pa + omegab * t );
+  *phixx= -amp * ( c * c * d2[0] + 2. * c * s * d2[1] + s * s * d2[2] );
+  *phixy= -amp * ( ( c * c - s * s ) * d2[1] + c * s * ( d2[2] - d2[0] ) );
+  *phiyy= -amp * ( s * s * d2[0] - 2. * c * s * d2[1] + c * c * d2[2] );
+}
+double FerrersPotentialPlanarR2deriv(double R,double phi,double t,
+				     struct potentialArg * potentialArgs){
+  double phixx, phixy, phiyy;
+  FerrersPotentialPlanar2ndderivs(R,phi,t,potentialArgs->args,
+				  &phixx,&phixy,&phiyy);
+  return cos ( phi ) * cos ( phi ) * phixx + sin ( phi ) * sin ( phi ) * phiyy
+    + 2. * cos ( phi ) * sin ( phi ) * phixy;
+}
+double FerrersPotentialPlanarphi2deriv(double R,double phi,double t,
+				       struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  double amp= *args;
+  double phixx, phixy, phiyy;
+  FerrersPotentialPlanar2ndderivs(R,phi,t,args,&phixx,&phixy,&phiyy);
+  FerrersPotentialxyzforces_xyz(R,0.,phi,t,args);
+  return R * R * ( sin ( phi ) * sin ( phi ) * phixx
+		   + cos ( phi ) * cos ( phi ) * phiyy
+		   - 2. * cos ( phi ) * sin ( phi ) * phixy )
+    + amp * R * ( cos ( phi ) * *(args + 11) + sin ( phi ) * *(args + 12) );
+}
+double FerrersPotentialPlanarRphideriv(double R,double phi,double t,
+				       struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  double amp= *args;
+  double phixx, phixy, phiyy;
+  FerrersPotentialPlanar2ndderivs(R,phi,t,args,&phixx,&phixy,&phiyy);
+  FerrersPotentialxyzforces_xyz(R,0.,phi,t,args);
+  return R * cos ( phi ) * sin ( phi ) * ( phiyy - phixx )
+    + R * cos ( 2. * phi ) * phixy
+    + amp * ( sin ( phi ) * *(args + 11) - cos ( phi ) * *(args + 12) );
+}
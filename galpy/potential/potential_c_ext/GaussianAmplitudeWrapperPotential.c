@@ -9,9 +9,9 @@ double GaussianAmplitudeWrapperPotentialEval(double R,double z,double phi,
 					double t,
 					struct potentialArg * potentialArgs){
   double * args= potentialArgs->args;
-  //Calculate potential, only used in actionAngle, so phi=0, t=0
+  //Calculate potential
   return *args * gaussSmooth(t,*(args+1),*(args+2))	\
-    * evaluatePotentials(R,z,
+    * calcPotential(R,z,phi,t,
 			 potentialArgs->nwrapped,
 			 potentialArgs->wrappedPotentialArg);
 }
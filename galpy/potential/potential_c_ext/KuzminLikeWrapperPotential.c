@@ -28,12 +28,14 @@ double KuzminLikeWrapperPotentialEval(double R,double z,double phi,
   double amp= *args;
   double a= *(args+1);
   double b2= *(args+2);
-  //Calculate potential, only used in actionAngle, so phi=0, t=0
-  return amp * evaluatePotentials(
+  //Calculate potential
+  return amp * calcPotential(
     KuzminLikeWrapperPotential_xi(R,z,a,b2),
     0.0,
+    0.0,
+    t,
     potentialArgs->nwrapped,
-		potentialArgs->wrappedPotentialArg
+    potentialArgs->wrappedPotentialArg
   );
 }
 double KuzminLikeWrapperPotentialRforce(double R,double z,double phi,
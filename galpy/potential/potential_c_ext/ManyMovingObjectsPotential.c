@@ -0,0 +1,124 @@
+#include <math.h>
+#include <galpy_potentials.h>
+// ManyMovingObjectsPotential: summed force of many objects moving along
+// cubic-spline trajectories on a shared time grid
+// 5+ngroups+nt+6*nt*nobj+8 arguments: amp, nobj, nt, rcut2 (<0: no cut),
+// ngroups, npot for each group, t[nt], xyz[nt,nobj,3], and the spline's second
+// derivatives xyz2[nt,nobj,3], followed by the cached
+// (t,k,R,z,phi,FR,Fz,Fphi) of the previous evaluation
+static void ManyMovingObjectsPotentialforces(double R,double z,double phi,double t,
+					     struct potentialArg * potentialArgs,
+					     bool planar){
+  int ii,jj,k,grp,offset;
+  double tc,h,a,b,ca,cb,x,y,cosphi,sinphi,xd,yd,zd,Rdist,RF;
+  double * p0, * p1, * q0, * q1;
+  double * args= potentialArgs->args;
+  //Get args
+  int nobj= (int) *(args+1);
+  int nt= (int) *(args+2);
+  double rcut2= *(args+3);
+  int ngroups= (int) *(args+4);
+  double * npots= args+5;
+  double * ts= npots+ngroups;
+  double * xyz= ts+nt;
+  double * xyz2= xyz+3*nt*nobj;
+  double * cache= xyz2+3*nt*nobj;
+  // Find the time interval, starting from that of the previous call
+  tc= t < *ts ? *ts : ( t > *(ts+nt-1) ? *(ts+nt-1) : t );
+  k= (int) *(cache+1);
+  while ( k < nt-2 && *(ts+k+1) <= tc ) k++;
+  while ( k > 0 && *(ts+k) > tc ) k--;
+  *cache= t;
+  *(cache+1)= k;
+  *(cache+2)= R;
+  *(cache+3)= z;
+  *(cache+4)= phi;
+  // Spline weights
+  h= *(ts+k+1) - *(ts+k);
+  a= ( *(ts+k+1) - tc ) / h;
+  b= 1. - a;
+  ca= ( a * a * a - a ) * h * h / 6.;
+  cb= ( b * b * b - b ) * h * h / 6.;
+  cosphi= cos(phi);
+  sinphi= sin(phi);
+  x= R * cosphi;
+  y= R * sinphi;
+  p0= xyz + 3 * k * nobj;
+  p1= p0 + 3 * nobj;
+  q0= xyz2 + 3 * k * nobj;
+  q1= q0 + 3 * nobj;
+  *(cache+5)= 0.;
+  *(cache+6)= 0.;
+  *(cache+7)= 0.;
+  offset= 0;
+  for (ii=0; ii < nobj; ii++){
+    grp= ngroups == 1 ? 0 : ii;
+    jj= 3 * ii;
+    xd= a * *(p0+jj) + b * *(p1+jj) + ca * *(q0+jj) + cb * *(q1+jj) - x;
+    yd= a * *(p0+jj+1) + b * *(p1+jj+1) + ca * *(q0+jj+1) + cb * *(q1+jj+1) - y;
+    zd= planar ? 0. : a * *(p0+jj+2) + b * *(p1+jj+2) + ca * *(q0+jj+2)
+      + cb * *(q1+jj+2) - z;
+    if ( rcut2 < 0. || xd * xd + yd * yd + zd * zd < rcut2 ) {
+      Rdist= sqrt( xd * xd + yd * yd );
+      if ( planar )
+	RF= calcPlanarRforce(Rdist,0.,t,(int) *(npots+grp),
+			     potentialArgs->wrappedPotentialArg+offset) / Rdist;
+      else {
+	RF= calcRforce(Rdist,zd,0.,t,(int) *(npots+grp),
+		       potentialArgs->wrappedPotentialArg+offset) / Rdist;
+	*(cache+6)-= calczforce(Rdist,zd,0.,t,(int) *(npots+grp),
+				potentialArgs->wrappedPotentialArg+offset);
+      }
+      *(cache+5)-= RF * ( cosphi * xd + sinphi * yd );
+      *(cache+7)-= RF * R * ( cosphi * yd - sinphi * xd );
+    }
+    if ( ngroups > 1 ) offset+= (int) *(npots+grp);
+  }
+}
+static inline bool cached(double R,double z,double phi,double t,double * args){
+  double * cache= args + 5 + (int) *(args+4) + (int) *(args+2)
+    + 6 * (int) *(args+2) * (int) *(args+1);
+  return t == *cache && R == *(cache+2) && z == *(cache+3) && phi == *(cache+4);
+}
+static inline double * cachedForces(double * args){
+  return args + 5 + (int) *(args+4) + (int) *(args+2)
+    + 6 * (int) *(args+2) * (int) *(args+1) + 5;
+}
+double ManyMovingObjectsPotentialRforce(double R,double z,double phi,
+					double t,
+					struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  if ( ! cached(R,z,phi,t,args) )
+    ManyMovingObjectsPotentialforces(R,z,phi,t,potentialArgs,false);
+  return *args * *cachedForces(args);
+}
+double ManyMovingObjectsPotentialzforce(double R,double z,double phi,
+					double t,
+					struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  if ( ! cached(R,z,phi,t,args) )
+    ManyMovingObjectsPotentialforces(R,z,phi,t,potentialArgs,false);
+  return *args * *(cachedForces(args)+1);
+}
+double ManyMovingObjectsPotentialphitorque(double R,double z,double phi,
+					   double t,
+					   struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  if ( ! cached(R,z,phi,t,args) )
+    ManyMovingObjectsPotentialforces(R,z,phi,t,potentialArgs,false);
+  return *args * *(cachedForces(args)+2);
+}
+double ManyMovingObjectsPotentialPlanarRforce(double R,double phi,double t,
+					      struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  if ( ! cached(R,0.,phi,t,args) )
+    ManyMovingObjectsPotentialforces(R,0.,phi,t,potentialArgs,true);
+  return *args * *cachedForces(args);
+}
+double ManyMovingObjectsPotentialPlanarphitorque(double R,double phi,double t,
+						 struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  if ( ! cached(R,0.,phi,t,args) )
+    ManyMovingObjectsPotentialforces(R,0.,phi,t,potentialArgs,true);
+  return *args * *(cachedForces(args)+2);
+}
@@ -0,0 +1,286 @@
+#include <math.h>
+#include <stdlib.h>
+#include <galpy_potentials.h>
+#ifndef M_PI
+#define M_PI 3.14159265358979323846
+#endif
+//MultipolePotential: arguments: isNonAxi, L, nharm, nr, x=ln(r) grid[nr],
+//l[nharm], m[nharm], sin[nharm] (whether the harmonic is sin(m phi)),
+//norm[nharm] (normalization of the Legendre functions),
+//quintic spline coefficients c[6][nr-1][nharm] (x amp),
+//Phi(rmin)[nharm], dPhi/dr(rmin)[nharm], Phi(rmax)[nharm] (x amp),
+//inner power-law slopes[nharm], and 7 for caching (R,Z,phi,Phi_r,Phi_t,Phi_p,
+//Phi)
+struct multipoleArgs {
+  int isNonAxi;
+  int L;
+  int nharm;
+  int nr;
+  double * x;
+  double * ls;
+  double * ms;
+  double * sins;
+  double * norm;
+  double * c;
+  double * Phi0;
+  double * dPhi0;
+  double * PhiN;
+  double * slope;
+  double * cache;
+};
+static void unpackArgs(double * args,struct multipoleArgs * ma){
+  ma->isNonAxi= (int) *args;
+  ma->L= (int) *(args+1);
+  ma->nharm= (int) *(args+2);
+  ma->nr= (int) *(args+3);
+  ma->x= args + 4;
+  ma->ls= ma->x + ma->nr;
+  ma->ms= ma->ls + ma->nharm;
+  ma->sins= ma->ms + ma->nharm;
+  ma->norm= ma->sins + ma->nharm;
+  ma->c= ma->norm + ma->nharm;
+  ma->Phi0= ma->c + 6 * ( ma->nr - 1 ) * ma->nharm;
+  ma->dPhi0= ma->Phi0 + ma->nharm;
+  ma->PhiN= ma->dPhi0 + ma->nharm;
+  ma->slope= ma->PhiN + ma->nharm;
+  ma->cache= ma->slope + ma->nharm;
+}
+//Radial function jj and its first two derivatives wrt r at r
+static void radial(double r,int jj,int indx,struct multipoleArgs * ma,
+		   double * f,double * df,double * d2f){
+  int nr= ma->nr, nharm= ma->nharm;
+  double l= *(ma->ls+jj);
+  double rmin= exp(*ma->x), rmax= exp(*(ma->x+nr-1));
+  double rin, s, dx, p, px, pxx;
+  double * cc;
+  if ( r < rmin ) {
+    rin= r / rmin;
+    s= *(ma->slope+jj);
+    if ( l == 0 ) {
+      // Power-law density, dPhi/dr propto r^s
+      *f= *(ma->Phi0+jj) + *(ma->dPhi0+jj) * rmin / ( s + 1. )	\
+	* ( pow(rin,s+1.) - 1. );
+      *df= *(ma->dPhi0+jj) * pow(rin,s);
+      *d2f= s * *(ma->dPhi0+jj) * pow(rin,s-1.) / rmin;
+    }
+    else {
+      *f= *(ma->Phi0+jj) * pow(rin,s);
+      *df= s * *(ma->Phi0+jj) * pow(rin,s-1.) / rmin;
+      *d2f= s * ( s - 1. ) * *(ma->Phi0+jj) * pow(rin,s-2.) / rmin / rmin;
+    }
+  }
+  else if ( r > rmax ) {
+    *f= *(ma->PhiN+jj) * pow(rmax/r,l+1.);
+    *df= -( l + 1. ) * *f / r;
+    *d2f= ( l + 1. ) * ( l + 2. ) * *f / r / r;
+  }
+  else {
+    dx= log(r) - *(ma->x+indx);
+    cc= ma->c + indx * nharm + jj;
+    p= ((((*cc * dx + *(cc+(nr-1)*nharm) ) * dx
+	  + *(cc+2*(nr-1)*nharm) ) * dx
+	 + *(cc+3*(nr-1)*nharm) ) * dx
+	+ *(cc+4*(nr-1)*nharm) ) * dx + *(cc+5*(nr-1)*nharm);
+    px= (((5. * *cc * dx + 4. * *(cc+(nr-1)*nharm) ) * dx
+	  + 3. * *(cc+2*(nr-1)*nharm) ) * dx
+	 + 2. * *(cc+3*(nr-1)*nharm) ) * dx + *(cc+4*(nr-1)*nharm);
+    pxx= ((20. * *cc * dx + 12. * *(cc+(nr-1)*nharm) ) * dx
+	  + 6. * *(cc+2*(nr-1)*nharm) ) * dx + 2. * *(cc+3*(nr-1)*nharm);
+    *f= p;
+    *df= px / r;
+    *d2f= ( pxx - px ) / r / r;
+  }
+}
+//Associated Legendre functions P_lm(cos theta) (with Condon-Shortley phase)
+//and their first and second derivatives wrt theta, arrays [L+1][L+3]
+static void legendre(double costheta,double sintheta,int L,
+		     double * P,double * dP,double * d2P){
+  int l, m, nm= L + 3;
+  for (l=0; l < ( L + 1 ) * nm; l++) {
+    *(P+l)= 0.;
+    *(dP+l)= 0.;
+    *(d2P+l)= 0.;
+  }
+  *P= 1.;
+  for (m=0; m <= L; m++) {
+    if ( m > 0 )
+      *(P+m*nm+m)= -( 2. * m - 1. ) * sintheta * *(P+(m-1)*nm+m-1);
+    if ( m + 1 <= L )
+      *(P+(m+1)*nm+m)= ( 2. * m + 1. ) * costheta * *(P+m*nm+m);
+    for (l=m+2; l <= L; l++)
+      *(P+l*nm+m)= ( ( 2. * l - 1. ) * costheta * *(P+(l-1)*nm+m)
+		     - ( l + m - 1. ) * *(P+(l-2)*nm+m) ) / ( l - m );
+  }
+  // dP_l^m/dtheta = [P_l^(m+1) - (l+m)(l-m+1) P_l^(m-1)]/2
+  for (l=0; l <= L; l++) {
+    *(dP+l*nm)= *(P+l*nm+1);
+    for (m=1; m <= l + 1 && m <= L + 1; m++)
+      *(dP+l*nm+m)= 0.5 * ( *(P+l*nm+m+1)
+			    - ( l + m ) * ( l - m + 1. ) * *(P+l*nm+m-1) );
+    *(d2P+l*nm)= *(dP+l*nm+1);
+    for (m=1; m <= l; m++)
+      *(d2P+l*nm+m)= 0.5 * ( *(dP+l*nm+m+1)
+			     - ( l + m ) * ( l - m + 1. ) * *(dP+l*nm+m-1) );
+  }
+}
+//Compute the potential and its derivatives wrt spherical r, theta, and phi;
+//out= Phi,Phi_r,Phi_t,Phi_p and, if second, Phi_rr,Phi_rt,Phi_tt,Phi_rp,
+//Phi_tp,Phi_pp, and the Laplacian
+static void compute(double R,double Z,double phi,
+		    struct potentialArg * potentialArgs,
+		    int second,double * out){
+  struct multipoleArgs ma;
+  int ii, jj, indx, lo, hi, mid, l, m, nm, nout;
+  double r, theta, st, ct, xr, f, df, d2f, trig, dtrig, Y, dY, d2Y;
+  double * P, * dP, * d2P;
+  unpackArgs(potentialArgs->args,&ma);
+  nm= ma.L + 3;
+  nout= second ? 11 : 4;
+  for (ii=0; ii < nout; ii++) *(out+ii)= 0.;
+  r= sqrt( R * R + Z * Z );
+  theta= atan2(R,Z);
+  // Avoid dividing by zero at the center
+  if ( r == 0. ) r= 1e-10 * exp(*ma.x);
+  st= sin(theta);
+  ct= cos(theta);
+  // Find the radial interval by bisection
+  xr= log(r);
+  lo= 0;
+  hi= ma.nr - 1;
+  while ( hi - lo > 1 ) {
+    mid= ( lo + hi ) / 2;
+    if ( xr < *(ma.x+mid) ) hi= mid;
+    else lo= mid;
+  }
+  indx= lo;
+  P= (double *) malloc ( 3 * ( ma.L + 1 ) * nm * sizeof ( double ) );
+  dP= P + ( ma.L + 1 ) * nm;
+  d2P= dP + ( ma.L + 1 ) * nm;
+  legendre(ct,st,ma.L,P,dP,d2P);
+  for (jj=0; jj < ma.nharm; jj++) {
+    l= (int) *(ma.ls+jj);
+    m= (int) *(ma.ms+jj);
+    radial(r,jj,indx,&ma,&f,&df,&d2f);
+    if ( (int) *(ma.sins+jj) ) {
+      trig= sin ( m * phi );
+      dtrig= m * cos ( m * phi );
+    }
+    else {
+      trig= cos ( m * phi );
+      dtrig= -m * sin ( m * phi );
+    }
+    Y= *(ma.norm+jj) * *(P+l*nm+m);
+    dY= *(ma.norm+jj) * *(dP+l*nm+m);
+    *out+= f * Y * trig;
+    *(out+1)+= df * Y * trig;
+    *(out+2)+= f * dY * trig;
+    *(out+3)+= f * Y * dtrig;
+    if ( second ) {
+      d2Y= *(ma.norm+jj) * *(d2P+l*nm+m);
+      *(out+4)+= d2f * Y * trig;
+      *(out+5)+= df * dY * trig;
+      *(out+6)+= f * d2Y * trig;
+      *(out+7)+= df * Y * dtrig;
+      *(out+8)+= f * dY * dtrig;
+      *(out+9)-= m * m * f * Y * trig;
+      *(out+10)+= ( d2f + 2. * df / r - l * ( l + 1. ) * f / r / r ) * Y * trig;
+    }
+  }
+  free(P);
+}
+//Cached first derivatives
+static void compute_forces(double R,double Z,double phi,
+			   struct potentialArg * potentialArgs,
+			   double * out){
+  struct multipoleArgs ma;
+  unpackArgs(potentialArgs->args,&ma);
+  if ( R == *ma.cache && Z == *(ma.cache+1) && phi == *(ma.cache+2) ) {
+    *out= *(ma.cache+6);
+    *(out+1)= *(ma.cache+3);
+    *(out+2)= *(ma.cache+4);
+    *(out+3)= *(ma.cache+5);
+    return;
+  }
+  compute(R,Z,phi,potentialArgs,0,out);
+  *ma.cache= R;
+  *(ma.cache+1)= Z;
+  *(ma.cache+2)= phi;
+  *(ma.cache+3)= *(out+1);
+  *(ma.cache+4)= *(out+2);
+  *(ma.cache+5)= *(out+3);
+  *(ma.cache+6)= *out;
+}
+double MultipolePotentialEval(double R,double Z, double phi,
+			      double t,
+			      struct potentialArg * potentialArgs){
+  double out[4];
+  compute_forces(R,Z,phi,potentialArgs,out);
+  return *out;
+}
+double MultipolePotentialRforce(double R,double Z, double phi,
+				double t,
+				struct potentialArg * potentialArgs){
+  double out[4];
+  double r= sqrt( R * R + Z * Z );
+  compute_forces(R,Z,phi,potentialArgs,out);
+  if ( r == 0. ) return 0.;
+  return -*(out+1) * R / r - *(out+2) * Z / r / r;
+}
+double MultipolePotentialzforce(double R,double Z, double phi,
+				double t,
+				struct potentialArg * potentialArgs){
+  double out[4];
+  double r= sqrt( R * R + Z * Z );
+  compute_forces(R,Z,phi,potentialArgs,out);
+  if ( r == 0. ) return 0.;
+  return -*(out+1) * Z / r + *(out+2) * R / r / r;
+}
+double MultipolePotentialphitorque(double R,double Z, double phi,
+				   double t,
+				   struct potentialArg * potentialArgs){
+  double out[4];
+  compute_forces(R,Z,phi,potentialArgs,out);
+  return -*(out+3);
+}
+double MultipolePotentialDens(double R,double Z, double phi,
+			      double t,
+			      struct potentialArg * potentialArgs){
+  double out[11];
+  compute(R,Z,phi,potentialArgs,1,out);
+  return *(out+10) / 4. / M_PI;
+}
+double MultipolePotentialPlanarRforce(double R,double phi,
+				      double t,
+				      struct potentialArg * potentialArgs){
+  double out[4];
+  compute_forces(R,0.,phi,potentialArgs,out);
+  return -*(out+1);
+}
+double MultipolePotentialPlanarphitorque(double R,double phi,
+					 double t,
+					 struct potentialArg * potentialArgs){
+  double out[4];
+  compute_forces(R,0.,phi,potentialArgs,out);
+  return -*(out+3);
+}
+double MultipolePotentialPlanarR2deriv(double R,double phi,
+				       double t,
+				       struct potentialArg * potentialArgs){
+  double out[11];
+  compute(R,0.,phi,potentialArgs,1,out);
+  return *(out+4);
+}
+double MultipolePotentialPlanarphi2deriv(double R,double phi,
+					 double t,
+					 struct potentialArg * potentialArgs){
+  double out[11];
+  compute(R,0.,phi,potentialArgs,1,out);
+  return *(out+9);
+}
+double MultipolePotentialPlanarRphideriv(double R,double phi,
+					 double t,
+					 struct potentialArg * potentialArgs){
+  double out[11];
+  compute(R,0.,phi,potentialArgs,1,out);
+  return *(out+7);
+}
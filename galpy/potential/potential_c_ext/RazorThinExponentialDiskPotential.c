@@ -0,0 +1,132 @@
+#include <math.h>
+#include <gsl/gsl_sf_bessel.h>
+#include <galpy_potentials.h>
+//RazorThinExponentialDiskPotential
+//arguments: amp, alpha, glorder, glx[glorder], glw[glorder], 4 cached values
+// Products I_i(y) K_j(y) are computed with the exponentially-scaled Bessel
+// functions, which do not overflow at large y
+double RazorThinExponentialDiskPotentialEval(double R,double z, double phi,
+					     double t,
+					     struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args;
+  double alpha= *(args+1);
+  int glorder= (int) *(args+2);
+  double * glx= args+3;
+  double * glw= args+3+glorder;
+  int ii;
+  double y, ks, sqrtp, sqrtm;
+  double out= 0.;
+  //Calculate potential
+  if ( fabs( z ) < 1e-6 ) {
+    if ( R == 0. ) // limit of the expression below
+      return -2. * amp * M_PI / alpha;
+    y= 0.5 * alpha * R;
+    return -amp * M_PI * R
+      * ( gsl_sf_bessel_I0_scaled( y ) * gsl_sf_bessel_K1_scaled( y )
+	  - gsl_sf_bessel_I1_scaled( y ) * gsl_sf_bessel_K0_scaled( y ) );
+  }
+  for (ii=0; ii < glorder; ii++) {
+    ks= 5. * ( *(glx+ii) + 1. );
+    sqrtp= sqrt( z * z + ( ks + R ) * ( ks + R ) );
+    sqrtm= sqrt( z * z + ( ks - R ) * ( ks - R ) );
+    out+= 10. * *(glw+ii) * asin( 2. * ks / ( sqrtp + sqrtm ) ) * ks
+      * gsl_sf_bessel_K0_scaled( alpha * ks ) * exp( -alpha * ks );
+  }
+  return -2. * amp * alpha * out;
+}
+// Integrals in the R and z forces, computed together and cached, because
+// they share the expensive Bessel functions
+static void RazorThinExponentialDiskPotentialforceInts(double R,double z,
+						       double * args){
+  double alpha= *(args+1);
+  int glorder= (int) *(args+2);
+  double * glx= args+3;
+  double * glw= args+3+glorder;
+  double * cache= args+3+2*glorder;
+  int ii, jj;
+  double kalphamin, kalphamax, ks, sqrtp, sqrtm, common;
+  double Rint= 0., zint= 0.;
+  if ( R == *cache && z == *(cache+1) )
+    return;
+  for (jj=0; jj < 2; jj++) {
+    kalphamin= jj == 0 ? 0. : R;
+    kalphamax= jj == 0 ? R : 10.;
+    if ( jj == 1 && R >= 10. )
+      break;
+    for (ii=0; ii < glorder; ii++) {
+      ks= ( kalphamax - kalphamin ) * 0.5 * ( *(glx+ii) + 1. ) + kalphamin;
+      sqrtp= sqrt( z * z + ( ks + R ) * ( ks + R ) );
+      sqrtm= sqrt( z * z + ( ks - R ) * ( ks - R ) );
+      common= ( kalphamax - kalphamin ) * *(glw+ii) * ks * ks
+	* gsl_sf_bessel_K0_scaled( alpha * ks ) * exp( -alpha * ks )
+	/ sqrt( R * R + z * z - ks * ks + sqrtp * sqrtm ) / ( sqrtp + sqrtm );
+      Rint+= common * ( ( ks + R ) / sqrtp - ( ks - R ) / sqrtm );
+      zint+= common * ( 1. / sqrtp + 1. / sqrtm );
+    }
+  }
+  *cache= R;
+  *(cache+1)= z;
+  *(cache+2)= -2. * M_SQRT2 * alpha * Rint;
+  *(cache+3)= -2. * M_SQRT2 * alpha * z * zint;
+}
+double RazorThinExponentialDiskPotentialRforce(double R,double z, double phi,
+					       double t,
+					       struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args;
+  double alpha= *(args+1);
+  int glorder= (int) *(args+2);
+  double y;
+  //Calculate Rforce
+  if ( fabs( z ) < 1e-6 ) {
+    if ( R == 0. )
+      return 0.;
+    y= 0.5 * alpha * R;
+    return -2. * amp * M_PI * y
+      * ( gsl_sf_bessel_I0_scaled( y ) * gsl_sf_bessel_K0_scaled( y )
+	  - gsl_sf_bessel_I1_scaled( y ) * gsl_sf_bessel_K1_scaled( y ) );
+  }
+  RazorThinExponentialDiskPotentialforceInts(R,z,args);
+  return amp * *(args+5+2*glorder);
+}
+double RazorThinExponentialDiskPotentialPlanarRforce(double R,double phi,
+						     double t,
+						     struct potentialArg * potentialArgs){
+  return RazorThinExponentialDiskPotentialRforce(R,0.,phi,t,potentialArgs);
+}
+double RazorThinExponentialDiskPotentialzforce(double R,double z,double phi,
+					       double t,
+					       struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args;
+  int glorder= (int) *(args+2);
+  //Calculate zforce
+  if ( fabs( z ) < 1e-6 )
+    return 0.;
+  RazorThinExponentialDiskPotentialforceInts(R,z,args);
+  return amp * *(args+6+2*glorder);
+}
+double RazorThinExponentialDiskPotentialPlanarR2deriv(double R,double phi,
+						      double t,
+						      struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args;
+  double alpha= *(args+1);
+  //Calculate R2deriv in the plane
+  if ( R == 0. )
+    return INFINITY;
+  double y= 0.5 * alpha * R;
+  double I0= gsl_sf_bessel_I0_scaled( y );
+  double I1= gsl_sf_bessel_I1_scaled( y );
+  double K0= gsl_sf_bessel_K0_scaled( y );
+  double K1= gsl_sf_bessel_K1_scaled( y );
+  return amp * ( M_PI * alpha * ( I0 * K0 - I1 * K1 )
+		 + M_PI / 4. * alpha * alpha * R
+		 * ( I1 * ( 3. * K0 + gsl_sf_bessel_Kn_scaled( 2 , y ) )
+		     - K1 * ( 3. * I0 + gsl_sf_bessel_In_scaled( 2 , y ) ) ) );
+}
@@ -0,0 +1,82 @@
+#include <math.h>
+#include <galpy_potentials.h>
+//RingPotential
+//2 arguments: amp, a
+// The elliptic integrals are computed from 1-m, which is accurate near the ring
+static inline double RingPotentialRforce_noamp(double R,double z,double a){
+  double Raz2= ( R + a ) * ( R + a ) + z * z;
+  double m= 4. * R * a / Raz2;
+  double mc= ( ( R - a ) * ( R - a ) + z * z ) / Raz2;
+  double K, E;
+  ellipKE(mc,&K,&E);
+  return -2. * a / R / sqrt( Raz2 )
+    * ( m * ( R * R - a * a - z * z ) / 4. / mc / a / R * E + K );
+}
+double RingPotentialEval(double R,double z, double phi,
+			 double t,
+			 struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args;
+  double a= *(args+1);
+  //Calculate potential
+  double Raz2= ( R + a ) * ( R + a ) + z * z;
+  double K, E;
+  ellipKE(( ( R - a ) * ( R - a ) + z * z ) / Raz2,&K,&E);
+  return -4. * amp * a / sqrt( Raz2 ) * K;
+}
+double RingPotentialRforce(double R,double z, double phi,
+			   double t,
+			   struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args;
+  double a= *(args+1);
+  //Calculate Rforce
+  if ( R == 0. )
+    return 0.;
+  return amp * RingPotentialRforce_noamp(R,z,a);
+}
+double RingPotentialPlanarRforce(double R,double phi,
+				 double t,
+				 struct potentialArg * potentialArgs){
+  return RingPotentialRforce(R,0.,phi,t,potentialArgs);
+}
+double RingPotentialzforce(double R,double z,double phi,
+			   double t,
+			   struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args;
+  double a= *(args+1);
+  //Calculate zforce
+  double Raz2= ( R + a ) * ( R + a ) + z * z;
+  double mc= ( ( R - a ) * ( R - a ) + z * z ) / Raz2;
+  double K, E;
+  ellipKE(mc,&K,&E);
+  return -4. * amp * z * a / mc * pow( Raz2 , -1.5 ) * E;
+}
+double RingPotentialPlanarR2deriv(double R,double phi,
+				  double t,
+				  struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double amp= *args;
+  double a= *(args+1);
+  //Calculate R2deriv in the plane
+  double Raz2= ( R + a ) * ( R + a );
+  double Raz= R + a;
+  double m= 4. * R * a / Raz2;
+  double mc= ( R - a ) * ( R - a ) / Raz2;
+  double R2ma2o4aR1m= ( R * R - a * a ) / 4. / a / R / mc;
+  double K, E;
+  ellipKE(mc,&K,&E);
+  return amp * ( ( 2. * R * R + a * a + 3. * R * a ) / R / Raz2
+		 * RingPotentialRforce_noamp(R,0.,a)
+		 + 2. * a / R / Raz
+		 * ( m * ( R * R + a * a ) / 4. / mc / a / R / R * E
+		     + ( R2ma2o4aR1m / mc * E
+			 + 0.5 * R2ma2o4aR1m * ( E - K )
+			 + 0.5 * ( E / mc - K ) / m )
+		     * 4. * a * ( a * a - R * R ) / Raz2 / Raz2 ) );
+}
@@ -0,0 +1,43 @@
+#include <math.h>
+#include <galpy_potentials.h>
+//SphericalShellPotential: 2 arguments: amp (not used here), a
+double SphericalShellPotentialrevaluate(double r,double t,
+					struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double a= *(args+1);
+  if ( r <= a )
+    return -1. / a;
+  else
+    return -1. / r;
+}
+double SphericalShellPotentialrforce(double r,double t,
+				     struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double a= *(args+1);
+  if ( r <= a )
+    return 0.;
+  else
+    return -1. / r / r;
+}
+double SphericalShellPotentialr2deriv(double r,double t,
+				      struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double a= *(args+1);
+  if ( r <= a )
+    return 0.;
+  else
+    return -2. / r / r / r;
+}
+double SphericalShellPotentialrdens(double r,double t,
+				    struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  //Get args
+  double a= *(args+1);
+  if ( r != a )
+    return 0.;
+  else
+    return INFINITY;
+}
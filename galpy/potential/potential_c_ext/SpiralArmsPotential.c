@@ -1,5 +1,8 @@
 #include <math.h>
 #include <galpy_potentials.h>
+#ifndef M_LN2
+#define M_LN2 0.69314718055994530942
+#endif
 
 double gam(double R, double phi, double N, double phi_ref, double r_ref, double tan_alpha);
 
@@ -17,6 +20,10 @@ double dB_dR(double R, double H, double n, double N, double sin_alpha);
 
 double dD_dR(double R, double H, double n, double N, double sin_alpha);
 
+void SpiralArmsPotentialforces(double R, double z, double phi, double t,
+                               double *args, double *FR, double *Fz,
+                               double *Fphi);
+
 // LCOV_EXCL_START
 double SpiralArmsPotentialEval(double R, double z, double phi, double t,
                                struct potentialArg *potentialArgs) {
@@ -58,13 +65,23 @@ double SpiralArmsPotentialEval(double R, double z, double phi, double t,
 }
 // LCOV_EXCL_STOP
 
-double SpiralArmsPotentialRforce(double R, double z, double phi, double t,
-                                 struct potentialArg *potentialArgs) {
-
-    // Get args
-    double *args = potentialArgs->args;
-
-    int nCs = (int) *args++;
+// Compute the Rforce, zforce, and phitorque for all harmonics in a single pass
+// that shares the terms common to the forces, caching them such that the
+// forces at the same (R,z,phi,t) are only computed once
+// args after the Cs: cached R, z, phi, t, Rforce, zforce, phitorque
+void SpiralArmsPotentialforces(double R, double z, double phi, double t,
+                               double *args, double *FR, double *Fz,
+                               double *Fphi) {
+    int nCs = (int) *args;
+    double *cache = args + 10 + nCs;
+    if (R == *cache && z == *(cache + 1) && phi == *(cache + 2)
+        && t == *(cache + 3)) {
+        *FR = *(cache + 4);
+        *Fz = *(cache + 5);
+        *Fphi = *(cache + 6);
+        return;
+    }
+    args++;
     double amp = *args++;
     double N = *args++;
     double sin_alpha = *args++;
@@ -77,9 +94,12 @@ double SpiralArmsPotentialRforce(double R, double z, double phi, double t,
 
     double g = gam(R, phi-omega*t, N, phi_ref, r_ref, tan_alpha);
     double dg_dR = dgam_dR(R, N, tan_alpha);
+    double cos_g = cos(g);
+    double sin_g = sin(g);
 
-    // Return the Rforce (-dPhi / dR)
-    double sum = 0;
+    double sumR = 0;
+    double sumz = 0;
+    double sumphi = 0;
     int n;
 
     double Cn;
@@ -91,11 +111,14 @@ double SpiralArmsPotentialRforce(double R, double z, double phi, double t,
     double dBn_dR;
     double dDn_dR;
 
-    double cos_ng;
-    double sin_ng;
+    double cos_ng = 1;
+    double sin_ng = 0;
+    double tmp;
 
     double zKB;
-    double sechzKB;
+    double tanhzKB;
+    double log_sechzKB;
+    double Cn_sechzKB_B_Dn;
 
     for (n = 1; n <= nCs; n++) {
         Cn = *args++;
@@ -107,106 +130,59 @@ double SpiralArmsPotentialRforce(double R, double z, double phi, double t,
         dBn_dR = dB_dR(R, H, n, N, sin_alpha);
         dDn_dR = dD_dR(R, H, n, N, sin_alpha);
 
-        cos_ng = cos(n * g);
-        sin_ng = sin(n * g);
+        // cos(n * g) and sin(n * g) from those of (n-1) * g
+        tmp = cos_ng * cos_g - sin_ng * sin_g;
+        sin_ng = sin_ng * cos_g + cos_ng * sin_g;
+        cos_ng = tmp;
 
         zKB = z * Kn / Bn;
-        sechzKB = 1 / cosh(zKB);
-
-        sum += Cn * pow(sechzKB, Bn) / Dn * ((n * dg_dR / Kn * sin_ng
-                                              + cos_ng * (z * tanh(zKB) * (dKn_dR / Kn - dBn_dR / Bn)
-                                                          - dBn_dR / Kn * log(sechzKB)
-                                                          + dKn_dR / Kn / Kn
-                                                          + dDn_dR / Dn / Kn))
-                                             + cos_ng / Kn / Rs);
+        tanhzKB = tanh(zKB);
+        // log(sech(zKB)), without overflow at large |zKB|
+        log_sechzKB = M_LN2 - fabs(zKB) - log1p(exp(-2 * fabs(zKB)));
+        Cn_sechzKB_B_Dn = Cn * exp(Bn * log_sechzKB) / Dn;
+
+        sumR += Cn_sechzKB_B_Dn * ((n * dg_dR / Kn * sin_ng
+                                    + cos_ng * (z * tanhzKB * (dKn_dR / Kn - dBn_dR / Bn)
+                                                - dBn_dR / Kn * log_sechzKB
+                                                + dKn_dR / Kn / Kn
+                                                + dDn_dR / Dn / Kn))
+                                   + cos_ng / Kn / Rs);
+        sumz += Cn_sechzKB_B_Dn * cos_ng * tanhzKB;
+        sumphi += Cn_sechzKB_B_Dn * N * n / Kn * sin_ng;
     }
 
-    return -amp * H * exp(-(R - r_ref) / Rs) * sum;
+    double prefactor = -amp * H * exp(-(R - r_ref) / Rs);
+    *FR = prefactor * sumR;
+    *Fz = prefactor * sumz;
+    *Fphi = prefactor * sumphi;
+    *cache = R;
+    *(cache + 1) = z;
+    *(cache + 2) = phi;
+    *(cache + 3) = t;
+    *(cache + 4) = *FR;
+    *(cache + 5) = *Fz;
+    *(cache + 6) = *Fphi;
 }
 
+double SpiralArmsPotentialRforce(double R, double z, double phi, double t,
+                                 struct potentialArg *potentialArgs) {
+    double FR, Fz, Fphi;
+    SpiralArmsPotentialforces(R, z, phi, t, potentialArgs->args, &FR, &Fz, &Fphi);
+    return FR;
+}
 
 double SpiralArmsPotentialzforce(double R, double z, double phi, double t,
                                  struct potentialArg *potentialArgs) {
-
-    // Get args
-    double *args = potentialArgs->args;
-
-    int nCs = (int) *args++;
-    double amp = *args++;
-    double N = *args++;
-    double sin_alpha = *args++;
-    double tan_alpha = *args++;
-    double r_ref = *args++;
-    double phi_ref = *args++;
-    double Rs = *args++;
-    double H = *args++;
-    double omega = *args++;
-
-    double g = gam(R, phi-omega*t, N, phi_ref, r_ref, tan_alpha);
-
-    // Return the zforce (-dPhi / dz)
-    double sum = 0;
-    int n;
-
-    double Cn;
-    double Kn;
-    double Bn;
-    double Dn;
-
-    double zKn_Bn;
-
-    for (n = 1; n <= nCs; n++) {
-        Cn = *args++;
-        Kn = K(R, n, N, sin_alpha);
-        Bn = B(R, H, n, N, sin_alpha);
-        Dn = D(R, H, n, N, sin_alpha);
-
-        zKn_Bn = z * Kn / Bn;
-
-        sum += Cn / Dn * cos(n * g) * tanh(zKn_Bn) / pow(cosh(zKn_Bn), Bn);
-    }
-
-    return -amp * H * exp(-(R - r_ref) / Rs) * sum;
+    double FR, Fz, Fphi;
+    SpiralArmsPotentialforces(R, z, phi, t, potentialArgs->args, &FR, &Fz, &Fphi);
+    return Fz;
 }
 
 double SpiralArmsPotentialphitorque(double R, double z, double phi, double t,
-                                   struct potentialArg *potentialArgs) {
-
-    // Get args
-    double *args = potentialArgs->args;
-
-    int nCs = (int) *args++;
-    double amp = *args++;
-    double N = *args++;
-    double sin_alpha = *args++;
-    double tan_alpha = *args++;
-    double r_ref = *args++;
-    double phi_ref = *args++;
-    double Rs = *args++;
-    double H = *args++;
-    double omega = *args++;
-
-    double g = gam(R, phi-omega*t, N, phi_ref, r_ref, tan_alpha);
-
-    // Return the phitorque (-dPhi / dphi)
-    double sum = 0;
-    int n;
-
-    double Cn;
-    double Kn;
-    double Bn;
-    double Dn;
-
-    for (n = 1; n <= nCs; n++) {
-        Cn = *args++;
-        Kn = K(R, n, N, sin_alpha);
-        Bn = B(R, H, n, N, sin_alpha);
-        Dn = D(R, H, n, N, sin_alpha);
-
-        sum += N * n * Cn / Dn / Kn / pow(cosh(z * Kn / Bn), Bn) * sin(n * g);
-    }
-
-    return -amp * H * exp(-(R - r_ref) / Rs) * sum;
+                                    struct potentialArg *potentialArgs) {
+    double FR, Fz, Fphi;
+    SpiralArmsPotentialforces(R, z, phi, t, potentialArgs->args, &FR, &Fz, &Fphi);
+    return Fphi;
 }
 
 // LCOV_EXCL_START
@@ -590,95 +566,16 @@ double SpiralArmsPotentialRphideriv(double R, double z, double phi, double t,
 
 double SpiralArmsPotentialPlanarRforce(double R, double phi, double t,
                                        struct potentialArg *potentialArgs) {
-
-    // Get args
-    double *args = potentialArgs->args;
-
-    int nCs = (int) *args++;
-    double amp = *args++;
-    double N = *args++;
-    double sin_alpha = *args++;
-    double tan_alpha = *args++;
-    double r_ref = *args++;
-    double phi_ref = *args++;
-    double Rs = *args++;
-    double H = *args++;
-    double omega = *args++;
-
-    double g = gam(R, phi-omega*t, N, phi_ref, r_ref, tan_alpha);
-    double dg_dR = dgam_dR(R, N, tan_alpha);
-
-    // Return the planar Rforce (-dPhi / dR)
-    double sum = 0;
-    int n;
-
-    double Cn;
-
-    double Kn;
-    double Dn;
-
-    double dKn_dR;
-    double dDn_dR;
-
-    double cos_ng;
-    double sin_ng;
-
-    for (n = 1; n <= nCs; n++) {
-        Cn = *args++;
-
-        Kn = K(R, n, N, sin_alpha);
-        Dn = D(R, H, n, N, sin_alpha);
-
-        dKn_dR = dK_dR(R, n, N, sin_alpha);
-        dDn_dR = dD_dR(R, H, n, N, sin_alpha);
-
-        cos_ng = cos(n * g);
-        sin_ng = sin(n * g);
-
-        sum += Cn / Dn * ((n * dg_dR / Kn * sin_ng
-                           + cos_ng * (dKn_dR / Kn / Kn + dDn_dR / Dn / Kn))
-                          + cos_ng / Kn / Rs);
-    }
-
-    return -amp * H * exp(-(R - r_ref) / Rs) * sum;
+    double FR, Fz, Fphi;
+    SpiralArmsPotentialforces(R, 0, phi, t, potentialArgs->args, &FR, &Fz, &Fphi);
+    return FR;
 }
 
 double SpiralArmsPotentialPlanarphitorque(double R, double phi, double t,
                                          struct potentialArg *potentialArgs) {
-
-    // Get args
-    double *args = potentialArgs->args;
-
-    int nCs = (int) *args++;
-    double amp = *args++;
-    double N = *args++;
-    double sin_alpha = *args++;
-    double tan_alpha = *args++;
-    double r_ref = *args++;
-    double phi_ref = *args++;
-    double Rs = *args++;
-    double H = *args++;
-    double omega = *args++;
-
-    double g = gam(R, phi-omega*t, N, phi_ref, r_ref, tan_alpha);
-
-    // Return the planar phitorque (-dPhi / dphi)
-    double sum = 0;
-    int n;
-
-    double Cn;
-    double Kn;
-    double Dn;
-
-    for (n = 1; n <= nCs; n++) {
-        Cn = *args++;
-        Kn = K(R, n, N, sin_alpha);
-        Dn = D(R, H, n, N, sin_alpha);
-
-        sum += N * n * Cn / Dn / Kn * sin(n * g);
-    }
-
-    return -amp * H * exp(-(R - r_ref) / Rs) * sum;
+    double FR, Fz, Fphi;
+    SpiralArmsPotentialforces(R, 0, phi, t, potentialArgs->args, &FR, &Fz, &Fphi);
+    return Fphi;
 }
 
 double SpiralArmsPotentialPlanarR2deriv(double R, double phi, double t,
@@ -4,9 +4,9 @@ double TimeDependentAmplitudeWrapperPotentialEval(double R,double z,double phi,
 					double t,
 					struct potentialArg * potentialArgs){
   double * args= potentialArgs->args;
-  //Calculate potential, only used in actionAngle, so phi=0, t=0
+  //Calculate potential
   return *args * (*(*(potentialArgs->tfuncs)))(t)	\
-              * evaluatePotentials(R,z,potentialArgs->nwrapped,
+              * calcPotential(R,z,phi,t,potentialArgs->nwrapped,
 			                             potentialArgs->wrappedPotentialArg);
 }
 double TimeDependentAmplitudeWrapperPotentialRforce(double R,double z,double phi,
@@ -0,0 +1,103 @@
+#include <math.h>
+#include <galpy_potentials.h>
+//TimeDependentSCFPotential: SCFPotential arguments (a,isNonAxi,N,L,M,
+//Acos,[Asin],7 for caching) followed by nt, t_cached, t[nt], and the
+//piecewise-cubic coefficients c[4][nt-1][ncoeff] of the interpolation in time
+//of the ncoeff = (1+isNonAxi)*N*L*M expansion coefficients
+//The SCF arguments' Acos/Asin are overwritten with the interpolated
+//coefficients whenever the time changes
+static void setCoefficients(double t,struct potentialArg * potentialArgs){
+  double * args= potentialArgs->args;
+  int isNonAxi= (int) *(args+1);
+  int ncoeff= (1 + isNonAxi) * (int) *(args+2) * (int) *(args+3) \
+    * (int) *(args+4);
+  double * coeffs= args + 5;
+  double * caching_i= coeffs + ncoeff;
+  int nt= (int) *(caching_i + 7);
+  double * t_cached= caching_i + 8;
+  double * ts= caching_i + 9;
+  double * c= ts + nt;
+  int ii, lo, hi, mid;
+  double dt;
+  // Coefficients are held fixed outside of the range of times
+  if ( t < *ts ) t= *ts;
+  else if ( t > *(ts+nt-1) ) t= *(ts+nt-1);
+  if ( t == *t_cached ) return;
+  // Bisect to find the interval [t_lo,t_{lo+1}] that contains t
+  lo= 0;
+  hi= nt - 1;
+  while ( hi - lo > 1 ) {
+    mid= ( lo + hi ) / 2;
+    if ( t < *(ts+mid) ) hi= mid;
+    else lo= mid;
+  }
+  dt= t - *(ts+lo);
+  for (ii=0; ii < ncoeff; ii++)
+    *(coeffs+ii)= ( ( *(c + lo*ncoeff + ii) * dt
+		      + *(c + ( nt - 1 + lo ) * ncoeff + ii) ) * dt
+		    + *(c + ( 2 * ( nt - 1 ) + lo ) * ncoeff + ii) ) * dt
+      + *(c + ( 3 * ( nt - 1 ) + lo ) * ncoeff + ii);
+  // Invalidate the SCFPotential cache
+  *caching_i= -1.;
+  *t_cached= t;
+}
+double TimeDependentSCFPotentialEval(double R,double Z, double phi,
+				     double t,
+				     struct potentialArg * potentialArgs){
+  setCoefficients(t,potentialArgs);
+  return SCFPotentialEval(R,Z,phi,t,potentialArgs);
+}
+double TimeDependentSCFPotentialRforce(double R,double Z, double phi,
+				       double t,
+				       struct potentialArg * potentialArgs){
+  setCoefficients(t,potentialArgs);
+  return SCFPotentialRforce(R,Z,phi,t,potentialArgs);
+}
+double TimeDependentSCFPotentialzforce(double R,double Z, double phi,
+				       double t,
+				       struct potentialArg * potentialArgs){
+  setCoefficients(t,potentialArgs);
+  return SCFPotentialzforce(R,Z,phi,t,potentialArgs);
+}
+double TimeDependentSCFPotentialphitorque(double R,double Z, double phi,
+					  double t,
+					  struct potentialArg * potentialArgs){
+  setCoefficients(t,potentialArgs);
+  return SCFPotentialphitorque(R,Z,phi,t,potentialArgs);
+}
+double TimeDependentSCFPotentialDens(double R,double Z, double phi,
+				     double t,
+				     struct potentialArg * potentialArgs){
+  setCoefficients(t,potentialArgs);
+  return SCFPotentialDens(R,Z,phi,t,potentialArgs);
+}
+double TimeDependentSCFPotentialPlanarRforce(double R,double phi,
+					     double t,
+					     struct potentialArg * potentialArgs){
+  setCoefficients(t,potentialArgs);
+  return SCFPotentialPlanarRforce(R,phi,t,potentialArgs);
+}
+double TimeDependentSCFPotentialPlanarphitorque(double R,double phi,
+						double t,
+						struct potentialArg * potentialArgs){
+  setCoefficients(t,potentialArgs);
+  return SCFPotentialPlanarphitorque(R,phi,t,potentialArgs);
+}
+double TimeDependentSCFPotentialPlanarR2deriv(double R,double phi,
+					      double t,
+					      struct potentialArg * potentialArgs){
+  setCoefficients(t,potentialArgs);
+  return SCFPotentialPlanarR2deriv(R,phi,t,potentialArgs);
+}
+double TimeDependentSCFPotentialPlanarphi2deriv(double R,double phi,
+						double t,
+						struct potentialArg * potentialArgs){
+  setCoefficients(t,potentialArgs);
+  return SCFPotentialPlanarphi2deriv(R,phi,t,potentialArgs);
+}
+double TimeDependentSCFPotentialPlanarRphideriv(double R,double phi,
+						double t,
+						struct potentialArg * potentialArgs){
+  setCoefficients(t,potentialArgs);
+  return SCFPotentialPlanarRphideriv(R,phi,t,potentialArgs);
+}
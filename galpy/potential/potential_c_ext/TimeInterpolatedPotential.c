@@ -0,0 +1,156 @@
+#include <galpy_potentials.h>
+// TimeInterpolatedPotential: linear interpolation in time between snapshot
+// potentials, which are the wrapped potentials
+// 3+3*nsnap arguments: amp, nsnap, npot for each snapshot, offset of each
+// snapshot in the wrapped potentials, t[nsnap], followed by the cached index
+// of the last snapshot interval
+static void TimeInterpolatedPotentialWeight(double t,double * args,
+					    int * k,double * w){
+  int nsnap= (int) *(args+1);
+  double * ts= args+2+2*nsnap;
+  if ( t <= *ts ) {
+    *k= 0;
+    *w= 0.;
+    return;
+  }
+  if ( t >= *(ts+nsnap-1) ) {
+    *k= nsnap-2;
+    *w= 1.;
+    return;
+  }
+  // Start from the interval of the previous call
+  *k= (int) *(ts+nsnap);
+  while ( *k < nsnap-2 && *(ts+*k+1) <= t ) (*k)++;
+  while ( *k > 0 && *(ts+*k) > t ) (*k)--;
+  *(ts+nsnap)= *k;
+  *w= ( t - *(ts+*k) ) / ( *(ts+*k+1) - *(ts+*k) );
+}
+static inline int TimeInterpolatedPotentialNpot(double * args,int k){
+  return (int) *(args+2+k);
+}
+static inline struct potentialArg * TimeInterpolatedPotentialSnapshot(
+		       struct potentialArg * potentialArgs,int k){
+  return potentialArgs->wrappedPotentialArg
+    + (int) *(potentialArgs->args+2+(int) *(potentialArgs->args+1)+k);
+}
+double TimeInterpolatedPotentialEval(double R,double z,double phi,
+				     double t,
+				     struct potentialArg * potentialArgs){
+  int k;
+  double w;
+  double * args= potentialArgs->args;
+  TimeInterpolatedPotentialWeight(t,args,&k,&w);
+  return *args * ( ( 1. - w ) * \
+    calcPotential(R,z,phi,t,TimeInterpolatedPotentialNpot(args,k),
+		  TimeInterpolatedPotentialSnapshot(potentialArgs,k))
+    + ( w == 0. ? 0. : w * \
+    calcPotential(R,z,phi,t,TimeInterpolatedPotentialNpot(args,k+1),
+		  TimeInterpolatedPotentialSnapshot(potentialArgs,k+1)) ) );
+}
+double TimeInterpolatedPotentialRforce(double R,double z,double phi,
+				       double t,
+				       struct potentialArg * potentialArgs){
+  int k;
+  double w;
+  double * args= potentialArgs->args;
+  TimeInterpolatedPotentialWeight(t,args,&k,&w);
+  return *args * ( ( 1. - w ) * \
+    calcRforce(R,z,phi,t,TimeInterpolatedPotentialNpot(args,k),
+	       TimeInterpolatedPotentialSnapshot(potentialArgs,k))
+    + ( w == 0. ? 0. : w * \
+    calcRforce(R,z,phi,t,TimeInterpolatedPotentialNpot(args,k+1),
+	       TimeInterpolatedPotentialSnapshot(potentialArgs,k+1)) ) );
+}
+double TimeInterpolatedPotentialzforce(double R,double z,double phi,
+				       double t,
+				       struct potentialArg * potentialArgs){
+  int k;
+  double w;
+  double * args= potentialArgs->args;
+  TimeInterpolatedPotentialWeight(t,args,&k,&w);
+  return *args * ( ( 1. - w ) * \
+    calczforce(R,z,phi,t,TimeInterpolatedPotentialNpot(args,k),
+	       TimeInterpolatedPotentialSnapshot(potentialArgs,k))
+    + ( w == 0. ? 0. : w * \
+    calczforce(R,z,phi,t,TimeInterpolatedPotentialNpot(args,k+1),
+	       TimeInterpolatedPotentialSnapshot(potentialArgs,k+1)) ) );
+}
+double TimeInterpolatedPotentialphitorque(double R,double z,double phi,
+					  double t,
+					  struct potentialArg * potentialArgs){
+  int k;
+  double w;
+  double * args= potentialArgs->args;
+  TimeInterpolatedPotentialWeight(t,args,&k,&w);
+  return *args * ( ( 1. - w ) * \
+    calcphitorque(R,z,phi,t,TimeInterpolatedPotentialNpot(args,k),
+		  TimeInterpolatedPotentialSnapshot(potentialArgs,k))
+    + ( w == 0. ? 0. : w * \
+    calcphitorque(R,z,phi,t,TimeInterpolatedPotentialNpot(args,k+1),
+		  TimeInterpolatedPotentialSnapshot(potentialArgs,k+1)) ) );
+}
+double TimeInterpolatedPotentialPlanarRforce(double R,double phi,double t,
+					     struct potentialArg * potentialArgs){
+  int k;
+  double w;
+  double * args= potentialArgs->args;
+  TimeInterpolatedPotentialWeight(t,args,&k,&w);
+  return *args * ( ( 1. - w ) * \
+    calcPlanarRforce(R,phi,t,TimeInterpolatedPotentialNpot(args,k),
+		     TimeInterpolatedPotentialSnapshot(potentialArgs,k))
+    + ( w == 0. ? 0. : w * \
+    calcPlanarRforce(R,phi,t,TimeInterpolatedPotentialNpot(args,k+1),
+		     TimeInterpolatedPotentialSnapshot(potentialArgs,k+1)) ) );
+}
+double TimeInterpolatedPotentialPlanarphitorque(double R,double phi,double t,
+						struct potentialArg * potentialArgs){
+  int k;
+  double w;
+  double * args= potentialArgs->args;
+  TimeInterpolatedPotentialWeight(t,args,&k,&w);
+  return *args * ( ( 1. - w ) * \
+    calcPlanarphitorque(R,phi,t,TimeInterpolatedPotentialNpot(args,k),
+			TimeInterpolatedPotentialSnapshot(potentialArgs,k))
+    + ( w == 0. ? 0. : w * \
+    calcPlanarphitorque(R,phi,t,TimeInterpolatedPotentialNpot(args,k+1),
+			TimeInterpolatedPotentialSnapshot(potentialArgs,k+1)) ) );
+}
+double TimeInterpolatedPotentialPlanarR2deriv(double R,double phi,double t,
+					      struct potentialArg * potentialArgs){
+  int k;
+  double w;
+  double * args= potentialArgs->args;
+  TimeInterpolatedPotentialWeight(t,args,&k,&w);
+  return *args * ( ( 1. - w ) * \
+    calcPlanarR2deriv(R,phi,t,TimeInterpolatedPotentialNpot(args,k),
+		      TimeInterpolatedPotentialSnapshot(potentialArgs,k))
+    + ( w == 0. ? 0. : w * \
+    calcPlanarR2deriv(R,phi,t,TimeInterpolatedPotentialNpot(args,k+1),
+		      TimeInterpolatedPotentialSnapshot(potentialArgs,k+1)) ) );
+}
+double TimeInterpolatedPotentialPlanarphi2deriv(double R,double phi,double t,
+						struct potentialArg * potentialArgs){
+  int k;
+  double w;
+  double * args= potentialArgs->args;
+  TimeInterpolatedPotentialWeight(t,args,&k,&w);
+  return *args * ( ( 1. - w ) * \
+    calcPlanarphi2deriv(R,phi,t,TimeInterpolatedPotentialNpot(args,k),
+			TimeInterpolatedPotentialSnapshot(potentialArgs,k))
+    + ( w == 0. ? 0. : w * \
+    calcPlanarphi2deriv(R,phi,t,TimeInterpolatedPotentialNpot(args,k+1),
+			TimeInterpolatedPotentialSnapshot(potentialArgs,k+1)) ) );
+}
+double TimeInterpolatedPotentialPlanarRphideriv(double R,double phi,double t,
+						struct potentialArg * potentialArgs){
+  int k;
+  double w;
+  double * args= potentialArgs->args;
+  TimeInterpolatedPotentialWeight(t,args,&k,&w);
+  return *args * ( ( 1. - w ) * \
+    calcPlanarRphideriv(R,phi,t,TimeInterpolatedPotentialNpot(args,k),
+			TimeInterpolatedPotentialSnapshot(potentialArgs,k))
+    + ( w == 0. ? 0. : w * \
+    calcPlanarRphideriv(R,phi,t,TimeInterpolatedPotentialNpot(args,k+1),
+			TimeInterpolatedPotentialSnapshot(potentialArgs,k+1)) ) );
+}
@@ -2,6 +2,11 @@
 void init_potentialArgs(int npot, struct potentialArg * potentialArgs){
   int ii;
   for (ii=0; ii < npot; ii++) {
+    (potentialArgs+ii)->potentialEval= NULL;
+    (potentialArgs+ii)->R2deriv= NULL;
+    (potentialArgs+ii)->phi2deriv= NULL;
+    (potentialArgs+ii)->Rphideriv= NULL;
+    (potentialArgs+ii)->dens= NULL;
     (potentialArgs+ii)->i2d= NULL;
     (potentialArgs+ii)->accx= NULL;
     (potentialArgs+ii)->accy= NULL;
@@ -68,6 +73,31 @@ double evaluatePotentials(double R, double Z,
   potentialArgs-= nargs;
   return pot;
 }
+double calcPotential(double R, double Z, double phi, double t,
+		     int nargs, struct potentialArg * potentialArgs){
+  int ii;
+  double pot= 0.;
+  for (ii=0; ii < nargs; ii++){
+    pot+= potentialArgs->potentialEval(R,Z,phi,t,
+				       potentialArgs);
+    potentialArgs++;
+  }
+  potentialArgs-= nargs;
+  return pot;
+}
+bool hasPotentialEval(int nargs, struct potentialArg * potentialArgs){
+  // Check whether all (wrapped) potentials have their potential implemented
+  int ii;
+  for (ii=0; ii < nargs; ii++){
+    if ( ! (potentialArgs+ii)->potentialEval )
+      return false;
+    if ( (potentialArgs+ii)->wrappedPotentialArg
+	 && ! hasPotentialEval((potentialArgs+ii)->nwrapped,
+			       (potentialArgs+ii)->wrappedPotentialArg) )
+      return false;
+  }
+  return true;
+}
 // function name in parentheses, because actual function defined by macro
 // in galpy_potentials.h and parentheses are necessary to avoid macro expansion
 double (calcRforce)(double R, double Z, double phi, double t,
@@ -265,3 +295,122 @@ void rotate_force(double *Fx, double *Fy, double *Fz,
   *Fy= Fyp;
   *Fz= Fzp;
 }
+void ellipKE(double mc, double *K, double *E){
+  // Complete elliptic integrals of the first and second kind K(m) and E(m),
+  // for the complementary parameter mc= 1-m, using the arithmetic-geometric
+  // mean; mc is used directly, because it is accurate near the
+  // logarithmic singularity of K at m=1
+  double a= 1., b= sqrt( mc ), c, tmp;
+  double pow2= 0.5, sum= 0.5 * ( 1. - mc );
+  if ( mc <= 0. ) {
+    *K= INFINITY;
+    *E= 1.;
+    return;
+  }
+  while ( fabs( a - b ) > 1e-15 * a ) {
+    c= 0.5 * ( a - b );
+    pow2*= 2.;
+    sum+= pow2 * c * c;
+    tmp= 0.5 * ( a + b );
+    b= sqrt( a * b );
+    a= tmp;
+  }
+  *K= M_PI / ( a + b );
+  *E= *K * ( 1. - sum );
+}
+void bspline_basis(double t,double h,double * b,double * db){
+  // Uniform cubic B-spline basis functions and their derivatives for
+  // x= x_i + t h, for the coefficients i-1,...,i+2
+  *b= ( 1. - t ) * ( 1. - t ) * ( 1. - t ) / 6.;
+  *(b+1)= ( 3. * t * t * t - 6. * t * t + 4. ) / 6.;
+  *(b+2)= ( -3. * t * t * t + 3. * t * t + 3. * t + 1. ) / 6.;
+  *(b+3)= t * t * t / 6.;
+  *db= -0.5 * ( 1. - t ) * ( 1. - t ) / h;
+  *(db+1)= ( 1.5 * t * t - 2. * t ) / h;
+  *(db+2)= ( -1.5 * t * t + t + 0.5 ) / h;
+  *(db+3)= 0.5 * t * t / h;
+}
+//Optional table of the potential of an axisymmetric disk: a bicubic B-spline
+//in (u,v)= (asinh(R/Rs),asinh(|z|/zs)) for R <= Rmax and |z| <= zmax and a
+//multipole expansion -sum_l M_l P_l(cos theta) / r^(l+1) of even orders
+//beyond; tab= [tabulated,nu,nv,Rs,zs,Rmax,zmax,nmult,M[nmult],
+//coeffs[nu+2][nv+2]]
+int disk_table_nargs(double * tab){
+  if ( (int) *tab )
+    return 8 + (int) *(tab+7) + ( (int) *(tab+1) + 2 ) * ( (int) *(tab+2) + 2 );
+  else
+    return 1;
+}
+//Returns 0 if not tabulated or not covered, otherwise the potential and its
+//derivatives wrt R and z (without the amplitude)
+int disk_table_eval(double R,double z,double * tab,
+		    double * Phi,double * dPhidR,double * dPhidz){
+  int a, b, d, l, n[2], idx[2];
+  int nmult= (int) *(tab+7);
+  double az= fabs(z), Rs, zs, h[2], crd[2], bs[2][4], dbs[2][4], coeff;
+  double Phiu= 0., Phiv= 0.;
+  double r2, r, c, rl1, Pl, Plm1, Plp1, dPl, dPlm1, dPlp1;
+  double * coeffs;
+  if ( ! (int) *tab )
+    return 0;
+  if ( R > *(tab+5) || az > *(tab+6) ) {
+    if ( ! nmult )
+      return 0;
+    // Multipole expansion, with the Legendre polynomials and their
+    // derivatives from their recurrences
+    r2= R * R + az * az;
+    r= sqrt( r2 );
+    c= az / r;
+    *Phi= 0.;
+    *dPhidR= 0.;
+    *dPhidz= 0.;
+    Plm1= 0.;
+    Pl= 1.;
+    dPlm1= 0.;
+    dPl= 0.;
+    rl1= r;
+    for (l=0; l <= 2 * ( nmult - 1 ); l++) {
+      if ( l % 2 == 0 ) {
+	*Phi-= *(tab+8+l/2) * Pl / rl1;
+	*dPhidR-= *(tab+8+l/2) * ( -dPl * az * R / r2 / r
+				   - ( l + 1. ) * Pl * R / r2 ) / rl1;
+	*dPhidz-= *(tab+8+l/2) * ( dPl * R * R / r2 / r
+				   - ( l + 1. ) * Pl * az / r2 ) / rl1;
+      }
+      Plp1= ( ( 2. * l + 1. ) * c * Pl - l * Plm1 ) / ( l + 1. );
+      dPlp1= dPlm1 + ( 2. * l + 1. ) * Pl;
+      Plm1= Pl;
+      Pl= Plp1;
+      dPlm1= dPl;
+      dPl= dPlp1;
+      rl1*= r;
+    }
+    if ( z < 0. )
+      *dPhidz*= -1.;
+    return 1;
+  }
+  Rs= *(tab+3);
+  zs= *(tab+4);
+  coeffs= tab + 8 + nmult;
+  crd[0]= asinh( R / Rs );
+  crd[1]= asinh( az / zs );
+  for (d=0; d < 2; d++) {
+    n[d]= (int) *(tab+1+d);
+    h[d]= asinh( *(tab+5+d) / *(tab+3+d) ) / ( n[d] - 1 );
+    idx[d]= (int) ( crd[d] / h[d] );
+    if ( idx[d] > n[d] - 2 ) idx[d]= n[d] - 2;
+    bspline_basis(crd[d] / h[d] - idx[d],h[d],bs[d],dbs[d]);
+  }
+  *Phi= 0.;
+  for (a=0; a < 4; a++)
+    for (b=0; b < 4; b++) {
+      coeff= *(coeffs + ( idx[0] + a ) * ( n[1] + 2 ) + idx[1] + b);
+      *Phi+= coeff * bs[0][a] * bs[1][b];
+      Phiu+= coeff * dbs[0][a] * bs[1][b];
+      Phiv+= coeff * bs[0][a] * dbs[1][b];
+    }
+  *dPhidR= Phiu / sqrt( Rs * Rs + R * R );
+  *dPhidz= ( z > 0. ? 1. : ( z < 0. ? -1. : 0. ) ) * Phiv
+    / sqrt( zs * zs + az * az );
+  return 1;
+}
@@ -95,6 +95,8 @@ void init_potentialArgs(int,struct potentialArg *);
 void free_potentialArgs(int,struct potentialArg *);
 //Potential and force evaluation
 double evaluatePotentials(double,double,int, struct potentialArg *);
+double calcPotential(double,double,double,double,int,struct potentialArg *);
+bool hasPotentialEval(int,struct potentialArg *);
 // Hack to allow optional velocity for dissipative forces
 // https://stackoverflow.com/a/52610204/10195320
 // Reason to use ##__VA_ARGS__ is that when no optional velocity is supplied,
@@ -159,6 +161,10 @@ double calcLinearForce(double, double, int, struct potentialArg *);
 double calcDensity(double, double, double,double, int, struct potentialArg *);
 void rotate(double *, double *, double *, double *);
 void rotate_force(double *, double *, double *,double *);
+void ellipKE(double, double *, double *);
+void bspline_basis(double,double,double *,double *);
+int disk_table_nargs(double *);
+int disk_table_eval(double,double,double *,double *,double *,double *);
 //ZeroForce
 double ZeroPlanarForce(double,double,double,
 		       struct potentialArg *);
@@ -421,6 +427,7 @@ double BurkertPotentialPlanarR2deriv(double,double,double,
 double BurkertPotentialDens(double,double,double,double,
 			    struct potentialArg *);
 //EllipsoidalPotential
+int EllipsoidalPotentialnargs(double *);
 double EllipsoidalPotentialEval(double,double,double,double,
 				     struct potentialArg *);
 double EllipsoidalPotentialRforce(double,double,double,double,
@@ -469,6 +476,69 @@ double SCFPotentialPlanarRphideriv(double,double,double,
 				        struct potentialArg *);
 double SCFPotentialDens(double,double,double,double,
 			struct potentialArg *);
+//TimeDependentSCFPotential
+double TimeDependentSCFPotentialEval(double,double,double,double,
+				     struct potentialArg *);
+double TimeDependentSCFPotentialRforce(double,double,double,double,
+				       struct potentialArg *);
+double TimeDependentSCFPotentialzforce(double,double,double,double,
+				       struct potentialArg *);
+double TimeDependentSCFPotentialphitorque(double,double,double,double,
+					  struct potentialArg *);
+double TimeDependentSCFPotentialPlanarRforce(double,double,double,
+					     struct potentialArg *);
+double TimeDependentSCFPotentialPlanarphitorque(double,double,double,
+						struct potentialArg *);
+double TimeDependentSCFPotentialPlanarR2deriv(double,double,double,
+					      struct potentialArg *);
+double TimeDependentSCFPotentialPlanarphi2deriv(double,double,double,
+						struct potentialArg *);
+double TimeDependentSCFPotentialPlanarRphideriv(double,double,double,
+						struct potentialArg *);
+double TimeDependentSCFPotentialDens(double,double,double,double,
+				     struct potentialArg *);
+//MultipolePotential
+double MultipolePotentialEval(double,double,double,double,
+			      struct potentialArg *);
+double MultipolePotentialRforce(double,double,double,double,
+				struct potentialArg *);
+double MultipolePotentialzforce(double,double,double,double,
+				struct potentialArg *);
+double MultipolePotentialphitorque(double,double,double,double,
+				   struct potentialArg *);
+double MultipolePotentialPlanarRforce(double,double,double,
+				      struct potentialArg *);
+double MultipolePotentialPlanarphitorque(double,double,double,
+					 struct potentialArg *);
+double MultipolePotentialPlanarR2deriv(double,double,double,
+				       struct potentialArg *);
+double MultipolePotentialPlanarphi2deriv(double,double,double,
+					 struct potentialArg *);
+double MultipolePotentialPlanarRphideriv(double,double,double,
+					 struct potentialArg *);
+double MultipolePotentialDens(double,double,double,double,
+			      struct potentialArg *);
+//CylindricalSplinePotential
+double CylindricalSplinePotentialEval(double,double,double,double,
+				      struct potentialArg *);
+double CylindricalSplinePotentialRforce(double,double,double,double,
+					struct potentialArg *);
+double CylindricalSplinePotentialzforce(double,double,double,double,
+					struct potentialArg *);
+double CylindricalSplinePotentialphitorque(double,double,double,double,
+					   struct potentialArg *);
+double CylindricalSplinePotentialPlanarRforce(double,double,double,
+					      struct potentialArg *);
+double CylindricalSplinePotentialPlanarphitorque(double,double,double,
+						 struct potentialArg *);
+double CylindricalSplinePotentialPlanarR2deriv(double,double,double,
+					       struct potentialArg *);
+double CylindricalSplinePotentialPlanarphi2deriv(double,double,double,
+						 struct potentialArg *);
+double CylindricalSplinePotentialPlanarRphideriv(double,double,double,
+						 struct potentialArg *);
+double CylindricalSplinePotentialDens(double,double,double,double,
+				      struct potentialArg *);
 //SoftenedNeedleBarPotential
 double SoftenedNeedleBarPotentialEval(double,double,double,double,
 				      struct potentialArg *);
@@ -614,6 +684,64 @@ double interpSphericalPotentialrevaluate(double,double,struct potentialArg *);
 double interpSphericalPotentialrforce(double,double,struct potentialArg *);
 double interpSphericalPotentialr2deriv(double,double,struct potentialArg *);
 double interpSphericalPotentialrdens(double,double,struct potentialArg *);
+//SphericalShellPotential: uses SphericalPotential, only need revaluate, rforce, r2deriv
+double SphericalShellPotentialrevaluate(double,double,struct potentialArg *);
+double SphericalShellPotentialrforce(double,double,struct potentialArg *);
+double SphericalShellPotentialr2deriv(double,double,struct potentialArg *);
+double SphericalShellPotentialrdens(double,double,struct potentialArg *);
+//RingPotential
+double RingPotentialEval(double ,double , double, double,
+			 struct potentialArg *);
+double RingPotentialRforce(double ,double , double, double,
+			   struct potentialArg *);
+double RingPotentialPlanarRforce(double ,double, double,
+				 struct potentialArg *);
+double RingPotentialzforce(double,double,double,double,
+			   struct potentialArg *);
+double RingPotentialPlanarR2deriv(double ,double, double,
+				  struct potentialArg *);
+//RazorThinExponentialDiskPotential
+double RazorThinExponentialDiskPotentialEval(double ,double , double, double,
+					     struct potentialArg *);
+double RazorThinExponentialDiskPotentialRforce(double ,double , double, double,
+					       struct potentialArg *);
+double RazorThinExponentialDiskPotentialPlanarRforce(double ,double, double,
+						     struct potentialArg *);
+double RazorThinExponentialDiskPotentialzforce(double,double,double,double,
+					       struct potentialArg *);
+double RazorThinExponentialDiskPotentialPlanarR2deriv(double ,double, double,
+						      struct potentialArg *);
+//AnyAxisymmetricRazorThinDiskPotential
+double AnyAxisymmetricRazorThinDiskPotentialEval(double ,double , double,
+						 double,struct potentialArg *);
+double AnyAxisymmetricRazorThinDiskPotentialRforce(double ,double , double,
+						   double,
+						   struct potentialArg *);
+double AnyAxisymmetricRazorThinDiskPotentialPlanarRforce(double ,double,
+							 double,
+							 struct potentialArg *);
+double AnyAxisymmetricRazorThinDiskPotentialzforce(double,double,double,
+						   double,
+						   struct potentialArg *);
+//FerrersPotential
+double FerrersPotentialEval(double ,double , double, double,
+			    struct potentialArg *);
+double FerrersPotentialRforce(double ,double , double, double,
+			      struct potentialArg *);
+double FerrersPotentialPlanarRforce(double ,double, double,
+				    struct potentialArg *);
+double FerrersPotentialzforce(double,double,double,double,
+			      struct potentialArg *);
+double FerrersPotentialphitorque(double,double,double,double,
+				 struct potentialArg *);
+double FerrersPotentialPlanarphitorque(double ,double, double,
+				       struct potentialArg *);
+double FerrersPotentialPlanarR2deriv(double ,double, double,
+				     struct potentialArg *);
+double FerrersPotentialPlanarphi2deriv(double ,double, double,
+				       struct potentialArg *);
+double FerrersPotentialPlanarRphideriv(double ,double, double,
+				       struct potentialArg *);
 
 //TriaxialGaussian: uses EllipsoidalPotential, only need psi, dens, densDeriv
 double TriaxialGaussianPotentialpsi(double,double *);
@@ -724,6 +852,36 @@ double MovingObjectPotentialPlanarRforce(double,double,double,
 					struct potentialArg *);
 double MovingObjectPotentialPlanarphitorque(double,double,double,
 					    struct potentialArg *);
+//ManyMovingObjectsPotential
+double ManyMovingObjectsPotentialRforce(double,double,double,double,
+					struct potentialArg *);
+double ManyMovingObjectsPotentialphitorque(double,double,double,double,
+					   struct potentialArg *);
+double ManyMovingObjectsPotentialzforce(double,double,double,double,
+					struct potentialArg *);
+double ManyMovingObjectsPotentialPlanarRforce(double,double,double,
+					      struct potentialArg *);
+double ManyMovingObjectsPotentialPlanarphitorque(double,double,double,
+						 struct potentialArg *);
+//TimeInterpolatedPotential
+double TimeInterpolatedPotentialEval(double,double,double,double,
+				     struct potentialArg *);
+double TimeInterpolatedPotentialRforce(double,double,double,double,
+				       struct potentialArg *);
+double TimeInterpolatedPotentialphitorque(double,double,double,double,
+					  struct potentialArg *);
+double TimeInterpolatedPotentialzforce(double,double,double,double,
+				       struct potentialArg *);
+double TimeInterpolatedPotentialPlanarRforce(double,double,double,
+					     struct potentialArg *);
+double TimeInterpolatedPotentialPlanarphitorque(double,double,double,
+						struct potentialArg *);
+double TimeInterpolatedPotentialPlanarR2deriv(double,double,double,
+					      struct potentialArg *);
+double TimeInterpolatedPotentialPlanarphi2deriv(double,double,double,
+						struct potentialArg *);
+double TimeInterpolatedPotentialPlanarRphideriv(double,double,double,
+						struct potentialArg *);
 //RotateAndTiltWrapperPotential
 double RotateAndTiltWrapperPotentialRforce(double,double,double,double,
 					struct potentialArg *);
@@ -0,0 +1,195 @@
+###############################################################################
+#   _disk_cache.py: content-addressed on-disk cache of the output of
+#                   expensive functions (e.g., SCF coefficients)
+###############################################################################
+import functools
+import hashlib
+import inspect
+import os
+import os.path
+import pickle
+import tempfile
+import types
+import warnings
+
+import numpy
+
+from . import galpyWarning
+from .config import __config__
+
+
+class _Uncacheable(Exception):
+    """Raised when an argument cannot be turned into a cache key"""
+
+
+def cache_directory():
+    """Return the directory of the on-disk cache or None if the cache is turned off"""
+    directory = __config__.get("cache", "directory", fallback="").strip()
+    if not directory:
+        return None
+    return os.path.expandvars(os.path.expanduser(directory))
+
+
+def _code_update(h, code, seen):
+    h.update(code.co_code)
+    h.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _code_update(h, const, seen)
+        else:
+            _update(h, const, seen)
+
+
+def _code_names(code):
+    """All global names referenced by a code object and its nested code objects"""
+    out = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            out |= _code_names(const)
+    return out
+
+
+def _update(h, obj, seen):
+    """Update the hash h with the content of obj, raising _Uncacheable when this cannot be determined"""
+    if obj is None or isinstance(
+        obj, (bool, int, float, complex, str, bytes, numpy.generic)
+    ):
+        h.update(f"{type(obj).__name__}:{obj!r};".encode())
+        return None
+    elif isinstance(obj, (types.ModuleType, type)):
+        h.update(
+            f"{type(obj).__name__}:{getattr(obj, '__module__', '')}.{getattr(obj, '__qualname__', obj.__name__)};".encode()
+        )
+        return None
+    elif isinstance(obj, (types.BuiltinFunctionType, numpy.ufunc)):
+        h.update(f"builtin:{getattr(obj, '__module__', '')}.{obj.__name__};".encode())
+        return None
+    if id(obj) in seen:
+        h.update(f"ref:{seen[id(obj)]};".encode())
+        return None
+    seen[id(obj)] = len(seen)
+    if isinstance(obj, numpy.ndarray):
+        h.update(
+            f"ndarray:{obj.dtype.str}:{obj.shape}:{getattr(obj, 'unit', '')};".encode()
+        )
+        h.update(numpy.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, (list, tuple)):
+        h.update(f"{type(obj).__name__}[".encode())
+        for item in obj:
+            _update(h, item, seen)
+        h.update(b"]")
+    elif isinstance(obj, (set, frozenset)):
+        h.update(f"{type(obj).__name__}{{".encode())
+        for item in sorted(obj, key=repr):
+            _update(h, item, seen)
+        h.update(b"}")
+    elif isinstance(obj, dict):
+        h.update(b"dict{")
+        for key in sorted(obj, key=repr):
+            _update(h, key, seen)
+            _update(h, obj[key], seen)
+        h.update(b"}")
+    elif isinstance(obj, functools.partial):
+        h.update(b"partial:")
+        _update(h, (obj.func, obj.args, obj.keywords), seen)
+    elif isinstance(obj, types.MethodType):
+        h.update(b"method:")
+        _update(h, (obj.__func__, obj.__self__), seen)
+    elif isinstance(obj, types.FunctionType):
+        code = obj.__code__
+        h.update(f"function:{obj.__module__}.{obj.__qualname__};".encode())
+        _code_update(h, code, seen)
+        if (obj.__module__ or "").split(".")[0] != "galpy":
+            # galpy's own code is identified by the galpy version and its
+            # bytecode, other code also by the globals that it references
+            for name in sorted(_code_names(code)):
+                if name in obj.__globals__:
+                    _update(h, name, seen)
+                    _update(h, obj.__globals__[name], seen)
+        _update(h, (obj.__defaults__, obj.__kwdefaults__), seen)
+        for cell in obj.__closure__ or ():
+            try:
+                _update(h, cell.cell_contents, seen)
+            except ValueError:  # empty cell
+                h.update(b"emptycell;")
+    elif type(obj).__module__.split(".")[0] == "galpy" and hasattr(obj, "__dict__"):
+        # galpy objects, e.g., Potential instances, are determined by their
+        # class and attributes, except for caches of previous evaluations
+        _update(h, type(obj), seen)
+        _update(
+            h,
+            {
+                key: val
+                for key, val in vars(obj).items()
+                if not (
+                    key.startswith("_cached")
+                    or key.endswith("_cache")
+                    or key.endswith("_hash")
+                )
+            },
+            seen,
+        )
+    else:
+        raise _Uncacheable(f"Cannot determine cache key for object of {type(obj)}")
+    return None
+
+
+def cache_key(func, args, kwargs, ignore=()):
+    """Content-based key for calling func(*args,**kwargs), or None if this cannot be determined"""
+    from .. import __version__
+
+    bound = inspect.signature(func).bind(*args, **kwargs)
+    bound.apply_defaults()
+    h = hashlib.sha256()
+    h.update(f"{__version__}:{func.__module__}.{func.__qualname__};".encode())
+    # Include the bytecode, such that editing func invalidates the cache
+    _code_update(h, func.__code__, {})
+    try:
+        _update(
+            h,
+            {key: val for key, val in bound.arguments.items() if key not in ignore},
+            {},
+        )
+    except (_Uncacheable, RecursionError):
+        return None
+    return h.hexdigest()
+
+
+def disk_cache(ignore=()):
+    """Decorator that caches the output of a function on disk in the directory set in the configuration file, keyed on the galpy version, the function's bytecode, and the content of the function's arguments (except those in ignore); when the cache is turned off or an argument cannot be turned into a key, the function is simply called"""
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            directory = cache_directory()
+            if directory is None:
+                return func(*args, **kwargs)
+            key = cache_key(func, args, kwargs, ignore=ignore)
+            if key is None:
+                return func(*args, **kwargs)
+            filename = os.path.join(directory, f"{func.__name__}-{key}.pkl")
+            if os.path.exists(filename):
+                try:
+                    with open(filename, "rb") as cachefile:
+                        return pickle.load(cachefile)
+                except Exception:  # corrupted file, recompute
+                    pass
+            out = func(*args, **kwargs)
+            # Write atomically, because many processes may share the cache
+            try:
+                os.makedirs(directory, exist_ok=True)
+                with tempfile.NamedTemporaryFile(
+                    dir=directory, suffix=".tmp", delete=False
+                ) as tmpfile:
+                    pickle.dump(out, tmpfile)
+                os.replace(tmpfile.name, filename)
+            except Exception as e:
+                warnings.warn(
+                    f"Could not write to the galpy cache directory {directory}, because of '{type(e).__name__}: {e}'",
+                    galpyWarning,
+                )
+            return out
+
+        return wrapper
+
+    return decorator
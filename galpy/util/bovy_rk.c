@@ -62,6 +62,7 @@ Usage:
   Output:
        double *result: result (nt blocks of size 2dim)
        int *err: error: -10 if interrupted by CTRL-C (SIGINT)
+       struct odeintStats * stats: if not NULL, number of steps and function evaluations (see bovy_symplecticode.h)
 */
 void bovy_rk4(void (*func)(double t, double *q, double *a,
 			   int nargs, struct potentialArg * potentialArgs),
@@ -70,7 +71,8 @@ void bovy_rk4(void (*func)(double t, double *q, double *a,
 	      int nt, double dt, double *t,
 	      int nargs, struct potentialArg * potentialArgs,
 	      double rtol, double atol,
-	      double *result, int * err){
+	      double *result, int * err,
+	      struct odeintStats * stats){
   //Declare and initialize
   double *yn= (double *) malloc ( dim * sizeof(double) );
   double *yn1= (double *) malloc ( dim * sizeof(double) );
@@ -80,6 +82,7 @@ void bovy_rk4(void (*func)(double t, double *q, double *a,
   save_rk(dim,yo,result);
   result+= dim;
   *err= 0;
+  init_odeintStats(stats);
   for (ii=0; ii < dim; ii++) *(yn+ii)= *(yo+ii);
   for (ii=0; ii < dim; ii++) *(yn1+ii)= *(yo+ii);
   //Estimate necessary stepsize
@@ -120,6 +123,7 @@ void bovy_rk4(void (*func)(double t, double *q, double *a,
     }
     bovy_rk4_onestep(func,dim,yn,yn1,to,dt,nargs,potentialArgs,ynk,a);
     to+= dt;
+    update_odeintStats(stats,(double) ndt,0.,(double) (4*ndt),dt);
     //save
     save_rk(dim,yn1,result);
     result+= dim;
@@ -175,7 +179,8 @@ void bovy_rk6(void (*func)(double t, double *q, double *a,
 	      int nt, double dt, double *t,
 	      int nargs, struct potentialArg * potentialArgs,
 	      double rtol, double atol,
-	      double *result, int * err){
+	      double *result, int * err,
+	      struct odeintStats * stats){
   //Declare and initialize
   double *yn= (double *) malloc ( dim * sizeof(double) );
   double *yn1= (double *) malloc ( dim * sizeof(double) );
@@ -190,6 +195,7 @@ void bovy_rk6(void (*func)(double t, double *q, double *a,
   save_rk(dim,yo,result);
   result+= dim;
   *err= 0;
+  init_odeintStats(stats);
   for (ii=0; ii < dim; ii++) *(yn+ii)= *(yo+ii);
   for (ii=0; ii < dim; ii++) *(yn1+ii)= *(yo+ii);
   //Estimate necessary stepsize
@@ -232,6 +238,7 @@ void bovy_rk6(void (*func)(double t, double *q, double *a,
     bovy_rk6_onestep(func,dim,yn,yn1,to,dt,nargs,potentialArgs,ynk,a,
 		     k1,k2,k3,k4,k5);
     to+= dt;
+    update_odeintStats(stats,(double) ndt,0.,(double) (7*ndt),dt);
     //save
     save_rk(dim,yn1,result);
     result+= dim;
@@ -497,6 +504,7 @@ Usage:
   Output:
        double *result: result (nt blocks of size 2dim)
        int * err: if non-zero, something bad happened (1: maximum step reduction happened; -10: interrupted by CTRL-C (SIGINT)
+       struct odeintStats * stats: if not NULL, number of accepted and rejected steps, function evaluations, and minimum stepsize (see bovy_symplecticode.h)
 */
 void bovy_dopr54(void (*func)(double t, double *q, double *a,
 			      int nargs, struct potentialArg * potentialArgs),
@@ -505,7 +513,8 @@ void bovy_dopr54(void (*func)(double t, double *q, double *a,
 		 int nt, double dt_one, double *t,
 		 int nargs, struct potentialArg * potentialArgs,
 		 double rtol, double atol,
-		 double *result, int * err){
+		 double *result, int * err,
+		 struct odeintStats * stats){
   //Declare and initialize
   double *a= (double *) malloc ( dim * sizeof(double) );
   double *a1= (double *) malloc ( dim * sizeof(double) );
@@ -523,6 +532,7 @@ void bovy_dopr54(void (*func)(double t, double *q, double *a,
   save_rk(dim,yo,result);
   result+= dim;
   *err= 0;
+  init_odeintStats(stats);
   for (ii=0; ii < dim; ii++) *(yn+ii)= *(yo+ii);
   double dt= (*(t+1))-(*t);
   if ( dt_one == -9999.99 ) {
@@ -533,6 +543,7 @@ void bovy_dopr54(void (*func)(double t, double *q, double *a,
   double to= *t;
   //set up a1
   func(to,yn,a1,nargs,potentialArgs);
+  update_odeintStats(stats,0.,0.,1.,0.);
   // Handle KeyboardInterrupt gracefully
 #ifndef _WIN32
   struct sigaction action;
@@ -556,7 +567,7 @@ void bovy_dopr54(void (*func)(double t, double *q, double *a,
     }
     bovy_dopr54_onestep(func,dim,yn,dt,&to,&dt_one,
 			nargs,potentialArgs,rtol,atol,
-			a1,a,k1,k2,k3,k4,k5,k6,yn1,yerr,ynk,err);
+			a1,a,k1,k2,k3,k4,k5,k6,yn1,yerr,ynk,err,stats);
     //save
     save_rk(dim,yn,result);
     result+= dim;
@@ -590,10 +601,11 @@ void bovy_dopr54_onestep(void (*func)(double t, double *y, double *a,int nargs,
 			 double * k1, double * k2,
 			 double * k3, double * k4,
 			 double * k5, double * k6,
-			 double * yn1, double * yerr,double * ynk, int * err){
+			 double * yn1, double * yerr,double * ynk, int * err,
+			 struct odeintStats * stats){
   double init_dt_one= *dt_one;
   double init_to= *to;
-  unsigned char accept;
+  unsigned char accept, clipped;
   //printf("%f,%f\n",*to,init_to+dt);
   while ( ( dt >= 0. && *to < (init_to+dt))
 	  || ( dt < 0. && *to > (init_to+dt)) ) {
@@ -604,14 +616,19 @@ void bovy_dopr54_onestep(void (*func)(double t, double *y, double *a,int nargs,
       accept= 1;
       if ( *err % 2 ==  0) *err+= 1;
     }
-    if ( dt >= 0. && *dt_one > (init_to+dt - *to) )
+    clipped= 0;
+    if ( dt >= 0. && *dt_one > (init_to+dt - *to) ) {
       *dt_one= (init_to + dt - *to);
-    if ( dt < 0. && *dt_one < (init_to+dt - *to) )
+      clipped= 1;
+    }
+    if ( dt < 0. && *dt_one < (init_to+dt - *to) ) {
       *dt_one = (init_to + dt - *to);
+      clipped= 1;
+    }
     *dt_one= bovy_dopr54_actualstep(func,dim,yo,*dt_one,to,nargs,potentialArgs,
 				    rtol,atol,
 				    a1,a,k1,k2,k3,k4,k5,k6,yn1,yerr,ynk,
-				    accept);
+				    accept,clipped,stats);
   }
 }
 double bovy_dopr54_actualstep(void (*func)(double t, double *y, double *a,int nargs, struct potentialArg *),
@@ -624,7 +641,9 @@ double bovy_dopr54_actualstep(void (*func)(double t, double *y, double *a,int na
 			      double * k3, double * k4,
 			      double * k5, double * k6,
 			      double * yn1, double * yerr,double * ynk,
-			      unsigned char accept){
+			      unsigned char accept,
+			      unsigned char clipped,
+			      struct odeintStats * stats){
   //constant
   static const double c2= 0.2;
   static const double c3= 0.3;
@@ -755,7 +774,11 @@ double bovy_dopr54_actualstep(void (*func)(double t, double *y, double *a,int na
     }
     *to+= dt;
     //printf("%f,%f\n",*to,dt);
+    // steps truncated to end on an output time do not count for hmin
+    update_odeintStats(stats,1.,0.,6.,clipped ? 0. : dt);
   }
+  else
+    update_odeintStats(stats,0.,1.,6.,dt);
   dt_one= dt*pow(2.,powertwo);
   return dt_one;
 }
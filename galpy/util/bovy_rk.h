@@ -48,7 +48,7 @@ void bovy_rk4(void (*func)(double, double *, double *,
 	      int, double, double *,
 	      int, struct potentialArg *,
 	      double, double,
-	      double *,int *);
+	      double *,int *,struct odeintStats *);
 void bovy_rk4_onestep(void (*func)(double, double *, double *,
 				   int, struct potentialArg *),
 		      int,
@@ -63,7 +63,7 @@ void bovy_rk6(void (*func)(double, double *, double *,
 	      int, double, double *,
 	      int, struct potentialArg *,
 	      double, double,
-	      double *,int *);
+	      double *,int *,struct odeintStats *);
 void bovy_rk6_onestep(void (*func)(double, double *, double *,
 				   int, struct potentialArg *),
 		      int,
@@ -94,7 +94,7 @@ void bovy_dopr54(void (*func)(double, double *, double *,
 		 int, double, double *,
 		 int, struct potentialArg *,
 		 double, double,
-		 double *,int *);
+		 double *,int *,struct odeintStats *);
 void bovy_dopr54_onestep(void (*func)(double, double *, double *,int, struct potentialArg *),
 			 int, double *,
 			 double, double *,double *,
@@ -105,7 +105,7 @@ void bovy_dopr54_onestep(void (*func)(double, double *, double *,int, struct pot
 			 double *, double *,
 			 double *, double *,
 			 double *, double *,
-			 double *,int *);
+			 double *,int *,struct odeintStats *);
 double bovy_dopr54_actualstep(void (*func)(double, double *, double *,int, struct potentialArg *),
 			      int, double *,
 			      double, double *,
@@ -116,7 +116,8 @@ double bovy_dopr54_actualstep(void (*func)(double, double *, double *,int, struc
 			      double *, double *,
 			      double *, double *,
 			      double *, double *,
-			      double *,unsigned char);
+			      double *,unsigned char,unsigned char,
+			      struct odeintStats *);
 #ifdef __cplusplus
 }
 #endif
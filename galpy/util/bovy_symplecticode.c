@@ -99,6 +99,7 @@ Usage:
   Output:
        double *result: result (nt blocks of size 2dim)
        int *err: error: -10 if interrupted by CTRL-C (SIGINT)
+       struct odeintStats * stats: if not NULL, number of steps and function evaluations (see header file)
 */
 void leapfrog(void (*func)(double t, double *q, double *a,
 			   int nargs, struct potentialArg * potentialArgs),
@@ -107,7 +108,8 @@ void leapfrog(void (*func)(double t, double *q, double *a,
 	      int nt, double dt, double *t,
 	      int nargs, struct potentialArg * potentialArgs,
 	      double rtol, double atol,
-	      double *result,int * err){
+	      double *result,int * err,
+	      struct odeintStats * stats){
   //Initialize
   double *qo= (double *) malloc ( dim * sizeof(double) );
   double *po= (double *) malloc ( dim * sizeof(double) );
@@ -124,6 +126,7 @@ void leapfrog(void (*func)(double t, double *q, double *a,
   save_qp(dim,qo,po,result);
   result+= 2 * dim;
   *err= 0;
+  init_odeintStats(stats);
   //Estimate necessary stepsize
   double init_dt= (*(t+1))-(*t);
   if ( dt == -9999.99 ) {
@@ -177,6 +180,7 @@ void leapfrog(void (*func)(double t, double *q, double *a,
     //drift
     leapfrog_leapq(dim,q12,po,dt/2.,qo);
     to= to+dt;
+    update_odeintStats(stats,(double) ndt,0.,(double) ndt,dt);
     //save
     save_qp(dim,qo,po,result);
     result+= 2 * dim;
@@ -217,6 +221,7 @@ Usage:
   Output:
        double *result: result (nt blocks of size 2dim)
        int *err: error: -10 if interrupted by CTRL-C (SIGINT)
+       struct odeintStats * stats: if not NULL, number of steps and function evaluations (see header file)
 */
 void symplec4(void (*func)(double t, double *q, double *a,
 			   int nargs, struct potentialArg * potentialArgs),
@@ -225,7 +230,8 @@ void symplec4(void (*func)(double t, double *q, double *a,
 	      int nt, double dt, double *t,
 	      int nargs, struct potentialArg * potentialArgs,
 	      double rtol, double atol,
-	      double *result,int * err){
+	      double *result,int * err,
+	      struct odeintStats * stats){
   //coefficients
   double c1= 0.6756035959798289;
   double c4= c1;
@@ -250,6 +256,7 @@ void symplec4(void (*func)(double t, double *q, double *a,
   save_qp(dim,qo,po,result);
   result+= 2 * dim;
   *err= 0;
+  init_odeintStats(stats);
   //Estimate necessary stepsize
   double init_dt= (*(t+1))-(*t);
   if ( dt == -9999.99 ) {
@@ -330,6 +337,7 @@ void symplec4(void (*func)(double t, double *q, double *a,
     to+= c4*dt;
     //p4=p3
     for (kk=0; kk < dim; kk++) *(po+kk)= *(p12+kk);
+    update_odeintStats(stats,(double) ndt,0.,(double) (3*ndt),dt);
     //save
     save_qp(dim,qo,po,result);
     result+= 2 * dim;
@@ -370,6 +378,7 @@ Usage:
   Output:
        double *result: result (nt blocks of size 2dim)
        int *err: error: -10 if interrupted by CTRL-C (SIGINT)
+       struct odeintStats * stats: if not NULL, number of steps and function evaluations (see header file)
 */
 void symplec6(void (*func)(double t, double *q, double *a,
 			   int nargs, struct potentialArg * potentialArgs),
@@ -378,7 +387,8 @@ void symplec6(void (*func)(double t, double *q, double *a,
 	      int nt, double dt, double *t,
 	      int nargs, struct potentialArg * potentialArgs,
 	      double rtol, double atol,
-	      double *result,int * err){
+	      double *result,int * err,
+	      struct odeintStats * stats){
   //coefficients
   double c1= 0.392256805238780;
   double c8= c1;
@@ -411,6 +421,7 @@ void symplec6(void (*func)(double t, double *q, double *a,
   save_qp(dim,qo,po,result);
   result+= 2 * dim;
   *err= 0;
+  init_odeintStats(stats);
   //Estimate necessary stepsize
   double init_dt= (*(t+1))-(*t);
   if ( dt == -9999.99 ) {
@@ -539,6 +550,7 @@ void symplec6(void (*func)(double t, double *q, double *a,
     to+= c8*dt;
     //p8=p7
     for (kk=0; kk < dim; kk++) *(po+kk)= *(p12+kk);
+    update_odeintStats(stats,(double) ndt,0.,(double) (7*ndt),dt);
     //save
     save_qp(dim,qo,po,result);
     result+= 2 * dim;
@@ -556,6 +568,304 @@ void symplec6(void (*func)(double t, double *q, double *a,
   //We're done
 }
 
+// One step of the force-gradient integrator below
+static inline void symplec4fg_step(void (*func)(double t, double *q, double *a,
+						int nargs, struct potentialArg * potentialArgs),
+				   int dim,double *q,double *p,double *a,
+				   double to,double dt,
+				   int nargs,struct potentialArg * potentialArgs,
+				   double *qtmp){
+  // a is the acceleration at (to,q) on input, at (to+dt,q) on output
+  //kick for dt/6
+  leapfrog_leapp(dim,p,dt/6.,a,p);
+  //drift for dt/2
+  leapfrog_leapq(dim,q,p,dt/2.,q);
+  //kick for 2dt/3 with the force-gradient-corrected force
+  func(to+dt/2.,q,a,nargs,potentialArgs);
+  leapfrog_leapq(dim,q,a,dt*dt/24.,qtmp);
+  func(to+dt/2.,qtmp,a,nargs,potentialArgs);
+  leapfrog_leapp(dim,p,2.*dt/3.,a,p);
+  //drift for dt/2
+  leapfrog_leapq(dim,q,p,dt/2.,q);
+  //kick for dt/6
+  func(to+dt,q,a,nargs,potentialArgs);
+  leapfrog_leapp(dim,p,dt/6.,a,p);
+}
+/*
+Fourth order force-gradient symplectic integrator (Chin 1997, algorithm 4A;
+Chin & Chen 2005), which has a much smaller error than symplec4 for the same
+number of force evaluations. The force-gradient term in the middle kick,
+dt^2/24 (da/dq) a, is obtained by evaluating the force at the position
+displaced by dt^2/24 a, which is correct to the order of the method and
+does not require second derivatives of the potential
+Usage:
+   Provide the acceleration function func with calling sequence
+       func (t,q,a,nargs,args)
+   where
+       double t: time
+       double * q: current position (dimension: dim)
+       double * a: will be set to the derivative
+       int nargs: number of arguments the function takes
+       struct potentialArg * potentialArg structure pointer, see header file
+  Other arguments are:
+       int dim: dimension
+       double *yo: initial value [qo,po], dimension: 2*dim
+       int nt: number of times at which the output is wanted
+       double dt: (optional) stepsize to use, must be an integer divisor of time difference between output steps (NOT CHECKED EXPLICITLY)
+       double *t: times at which the output is wanted (EQUALLY SPACED)
+       int nargs: see above
+       double *args: see above
+       double rtol, double atol: relative and absolute tolerance levels desired
+  Output:
+       double *result: result (nt blocks of size 2dim)
+       int *err: error: -10 if interrupted by CTRL-C (SIGINT)
+       struct odeintStats * stats: if not NULL, number of steps and function evaluations (see header file)
+*/
+void symplec4fg(void (*func)(double t, double *q, double *a,
+			     int nargs, struct potentialArg * potentialArgs),
+		int dim,
+		double * yo,
+		int nt, double dt, double *t,
+		int nargs, struct potentialArg * potentialArgs,
+		double rtol, double atol,
+		double *result,int * err,
+		struct odeintStats * stats){
+  //Initialize
+  double *qo= (double *) malloc ( dim * sizeof(double) );
+  double *po= (double *) malloc ( dim * sizeof(double) );
+  double *qtmp= (double *) malloc ( dim * sizeof(double) );
+  double *a= (double *) malloc ( dim * sizeof(double) );
+  int ii, jj;
+  for (ii=0; ii < dim; ii++) {
+    *qo++= *(yo+ii);
+    *po++= *(yo+dim+ii);
+  }
+  qo-= dim;
+  po-= dim;
+  save_qp(dim,qo,po,result);
+  result+= 2 * dim;
+  *err= 0;
+  init_odeintStats(stats);
+  //Estimate necessary stepsize
+  double init_dt= (*(t+1))-(*t);
+  if ( dt == -9999.99 ) {
+    dt= symplec4fg_estimate_step(*func,dim,qo,po,init_dt,t,nargs,potentialArgs,
+				 rtol,atol);
+  }
+  long ndt= (long) (init_dt/dt);
+  //Integrate the system
+  double to= *t;
+  // The acceleration at the end of a step is that at the start of the next
+  func(to,qo,a,nargs,potentialArgs);
+  update_odeintStats(stats,0.,0.,1.,0.);
+  // Handle KeyboardInterrupt gracefully
+#ifndef _WIN32
+  struct sigaction action;
+  memset(&action, 0, sizeof(struct sigaction));
+  action.sa_handler= handle_sigint;
+  sigaction(SIGINT,&action,NULL);
+#else
+    if (SetConsoleCtrlHandler(CtrlHandler, TRUE)) {}
+#endif
+  for (ii=0; ii < (nt-1); ii++){
+    if ( interrupted ) {
+      *err= -10;
+      interrupted= 0; // need to reset, bc library and vars stay in memory
+#ifdef USING_COVERAGE
+      __gcov_dump();
+// LCOV_EXCL_START
+      __gcov_reset();
+#endif
+      break;
+// LCOV_EXCL_STOP
+    }
+    for (jj=0; jj < ndt; jj++) {
+      symplec4fg_step(func,dim,qo,po,a,to,dt,nargs,potentialArgs,qtmp);
+      to+= dt;
+    }
+    update_odeintStats(stats,(double) ndt,0.,(double) (3*ndt),dt);
+    //save
+    save_qp(dim,qo,po,result);
+    result+= 2 * dim;
+  }
+  // Back to default handler
+#ifndef _WIN32
+  action.sa_handler= SIG_DFL;
+  sigaction(SIGINT,&action,NULL);
+#endif
+  //Free allocated memory
+  free(qo);
+  free(po);
+  free(qtmp);
+  free(a);
+  //We're done
+}
+
+// Omega(q)= 1/sqrt(r^2+rsoft^2) and its gradient for the TTL integrator below
+static inline double ttleapfrog_omega(int dim,double *q,double rsoft2,
+				      double *gradomega){
+  int ii;
+  double r2= rsoft2;
+  for (ii=0; ii < dim; ii++) r2+= *(q+ii) * *(q+ii);
+  double omega= 1./sqrt(r2);
+  for (ii=0; ii < dim; ii++)
+    *(gradomega+ii)= - *(q+ii) * omega * omega * omega;
+  return omega;
+}
+/*
+Time-transformed leapfrog (TTL) of Mikkola & Aarseth (2002), which takes
+equal steps ds in a new time variable s with dt/ds = 1/Omega(q) and
+Omega(q)= 1/sqrt(r^2+rsoft^2), r the distance from the origin; for the Kepler
+problem, this behaves like the logarithmic-Hamiltonian leapfrog (Mikkola &
+Tanikawa 1999; Preto & Tremaine 1999), but it does not require evaluating
+the potential. The physical stepsize is therefore proportional to the distance
+from the center, which allows eccentric orbits to be integrated with far
+fewer steps than with a fixed stepsize. The step ds is set such that the
+physical stepsize is dt at the initial position; the softening is 10^-3
+times the initial distance. The integration lands on the output times with
+a regular leapfrog step for the remaining time.
+Usage:
+   Provide the acceleration function func with calling sequence
+       func (t,q,a,nargs,args)
+   where
+       double t: time
+       double * q: current position (dimension: dim)
+       double * a: will be set to the derivative
+       int nargs: number of arguments the function takes
+       struct potentialArg * potentialArg structure pointer, see header file
+  Other arguments are:
+       int dim: dimension
+       double *yo: initial value [qo,po], dimension: 2*dim
+       int nt: number of times at which the output is wanted
+       double dt: (optional) physical stepsize at the initial position
+       double *t: times at which the output is wanted (EQUALLY SPACED)
+       int nargs: see above
+       double *args: see above
+       double rtol, double atol: relative and absolute tolerance levels desired
+  Output:
+       double *result: result (nt blocks of size 2dim)
+       int *err: error: -10 if interrupted by CTRL-C (SIGINT)
+       struct odeintStats * stats: if not NULL, number of steps and function evaluations (see header file)
+*/
+void ttleapfrog(void (*func)(double t, double *q, double *a,
+			     int nargs, struct potentialArg * potentialArgs),
+		int dim,
+		double * yo,
+		int nt, double dt, double *t,
+		int nargs, struct potentialArg * potentialArgs,
+		double rtol, double atol,
+		double *result,int * err,
+		struct odeintStats * stats){
+  //Initialize
+  double *qo= (double *) malloc ( dim * sizeof(double) );
+  double *po= (double *) malloc ( dim * sizeof(double) );
+  double *p12= (double *) malloc ( dim * sizeof(double) );
+  double *a= (double *) malloc ( dim * sizeof(double) );
+  double *gradomega= (double *) malloc ( dim * sizeof(double) );
+  int ii, kk;
+  double r02, rsoft2, ds, W, omega, dtd1, dtd2, dtk, vgrad, tout, rem;
+  for (ii=0; ii < dim; ii++) {
+    *qo++= *(yo+ii);
+    *po++= *(yo+dim+ii);
+  }
+  qo-= dim;
+  po-= dim;
+  save_qp(dim,qo,po,result);
+  result+= 2 * dim;
+  *err= 0;
+  init_odeintStats(stats);
+  //Estimate necessary stepsize at the initial position
+  double init_dt= (*(t+1))-(*t);
+  if ( dt == -9999.99 ) {
+    dt= leapfrog_estimate_step(*func,dim,qo,po,init_dt,t,nargs,potentialArgs,
+			       rtol,atol);
+  }
+  // Set the softening and the step in s from the initial distance or, when
+  // starting at the origin, from the distance traveled
+  r02= 0.;
+  for (ii=0; ii < dim; ii++) r02+= *(qo+ii) * *(qo+ii);
+  if ( r02 == 0. ) {
+    for (ii=0; ii < dim; ii++) r02+= *(po+ii) * *(po+ii);
+    r02*= (*(t+nt-1)-*t) * (*(t+nt-1)-*t);
+  }
+  if ( r02 == 0. ) r02= 1.;
+  rsoft2= 1e-6 * r02;
+  ds= dt / sqrt(r02+rsoft2);
+  W= ttleapfrog_omega(dim,qo,rsoft2,gradomega);
+  //Integrate the system
+  double to= *t;
+  // Handle KeyboardInterrupt gracefully
+#ifndef _WIN32
+  struct sigaction action;
+  memset(&action, 0, sizeof(struct sigaction));
+  action.sa_handler= handle_sigint;
+  sigaction(SIGINT,&action,NULL);
+#else
+    if (SetConsoleCtrlHandler(CtrlHandler, TRUE)) {}
+#endif
+  for (ii=0; ii < (nt-1); ii++){
+    if ( interrupted ) {
+      *err= -10;
+      interrupted= 0; // need to reset, bc library and vars stay in memory
+#ifdef USING_COVERAGE
+      __gcov_dump();
+// LCOV_EXCL_START
+      __gcov_reset();
+#endif
+      break;
+// LCOV_EXCL_STOP
+    }
+    tout= *(t+ii+1);
+    // take steps in s as long as the predicted step does not pass tout
+    while ( (tout-to) * W / ds > 1. ) {
+      //drift for ds/2
+      dtd1= ds/2./W;
+      leapfrog_leapq(dim,qo,po,dtd1,qo);
+      to+= dtd1;
+      //kick for ds, also evolving W
+      omega= ttleapfrog_omega(dim,qo,rsoft2,gradomega);
+      dtk= ds/omega;
+      func(to,qo,a,nargs,potentialArgs);
+      leapfrog_leapp(dim,po,dtk,a,p12);
+      vgrad= 0.;
+      for (kk=0; kk < dim; kk++)
+	vgrad+= 0.5 * ( *(po+kk) + *(p12+kk) ) * *(gradomega+kk);
+      W+= dtk * vgrad;
+      for (kk=0; kk < dim; kk++) *(po+kk)= *(p12+kk);
+      //drift for ds/2
+      dtd2= ds/2./W;
+      leapfrog_leapq(dim,qo,po,dtd2,qo);
+      to+= dtd2;
+      update_odeintStats(stats,1.,0.,1.,dtd1+dtd2);
+    }
+    // regular leapfrog step to land on tout (remainder can be negative when
+    // the last step overshot)
+    rem= tout-to;
+    leapfrog_leapq(dim,qo,po,rem/2.,qo);
+    func(to+rem/2.,qo,a,nargs,potentialArgs);
+    leapfrog_leapp(dim,po,rem,a,po);
+    leapfrog_leapq(dim,qo,po,rem/2.,qo);
+    to= tout;
+    W= ttleapfrog_omega(dim,qo,rsoft2,gradomega);
+    update_odeintStats(stats,1.,0.,1.,0.);
+    //save
+    save_qp(dim,qo,po,result);
+    result+= 2 * dim;
+  }
+  // Back to default handler
+#ifndef _WIN32
+  action.sa_handler= SIG_DFL;
+  sigaction(SIGINT,&action,NULL);
+#endif
+  //Free allocated memory
+  free(qo);
+  free(po);
+  free(p12);
+  free(a);
+  free(gradomega);
+  //We're done
+}
+
 double leapfrog_estimate_step(void (*func)(double t, double *q, double *a,int nargs, struct potentialArg *),
 			      int dim, double *qo,double *po,
 			      double dt, double *t,
@@ -1002,3 +1312,77 @@ double symplec6_estimate_step(void (*func)(double t, double *q, double *a,int na
   //fflush(stdout);
   return dt;
 }
+double symplec4fg_estimate_step(void (*func)(double t, double *q, double *a,int nargs, struct potentialArg *),
+				int dim, double *qo,double *po,
+				double dt, double *t,
+				int nargs,struct potentialArg * potentialArgs,
+				double rtol,double atol){
+  //scalars
+  double err= 2.;
+  double max_val_q, max_val_p;
+  double to= *t;
+  double init_dt= dt;
+  //allocate and initialize
+  double *q11= (double *) malloc ( dim * sizeof(double) );
+  double *q12= (double *) malloc ( dim * sizeof(double) );
+  double *p11= (double *) malloc ( dim * sizeof(double) );
+  double *p12= (double *) malloc ( dim * sizeof(double) );
+  double *qtmp= (double *) malloc ( dim * sizeof(double) );
+  double *ao= (double *) malloc ( dim * sizeof(double) );
+  double *a= (double *) malloc ( dim * sizeof(double) );
+  double *scale= (double *) malloc ( 2 * dim * sizeof(double) );
+  int ii;
+  //find maximum values
+  max_val_q= fabs(*qo);
+  for (ii=1; ii < dim; ii++)
+    if ( fabs(*(qo+ii)) > max_val_q )
+      max_val_q= fabs(*(qo+ii));
+  max_val_p= fabs(*po);
+  for (ii=1; ii < dim; ii++)
+    if ( fabs(*(po+ii)) > max_val_p )
+      max_val_p= fabs(*(po+ii));
+  //set up scale
+  double c= fmax(atol, rtol * max_val_q);
+  double s= log(exp(atol-c)+exp(rtol*max_val_q-c))+c;
+  for (ii=0; ii < dim; ii++) *(scale+ii)= s;
+  c= fmax(atol, rtol * max_val_p);
+  s= log(exp(atol-c)+exp(rtol*max_val_p-c))+c;
+  for (ii=0; ii < dim; ii++) *(scale+ii+dim)= s;
+  func(to,qo,ao,nargs,potentialArgs);
+  //find good dt
+  dt*= 2.;
+  while ( err > 1. && init_dt / dt < _MAX_DT_REDUCE ){
+    dt/= 2.;
+    //do one step with step dt, and two with step dt/2.
+    for (ii=0; ii < dim; ii++) {
+      *(q11+ii)= *(qo+ii);
+      *(p11+ii)= *(po+ii);
+      *(q12+ii)= *(qo+ii);
+      *(p12+ii)= *(po+ii);
+      *(a+ii)= *(ao+ii);
+    }
+    symplec4fg_step(func,dim,q11,p11,a,to,dt,nargs,potentialArgs,qtmp);
+    for (ii=0; ii < dim; ii++) *(a+ii)= *(ao+ii);
+    symplec4fg_step(func,dim,q12,p12,a,to,dt/2.,nargs,potentialArgs,qtmp);
+    symplec4fg_step(func,dim,q12,p12,a,to+dt/2.,dt/2.,nargs,potentialArgs,
+		    qtmp);
+    //Norm
+    err= 0.;
+    for (ii=0; ii < dim; ii++) {
+      err+= exp(2.*log(fabs(*(q11+ii)-*(q12+ii)))-2.* *(scale+ii));
+      err+= exp(2.*log(fabs(*(p11+ii)-*(p12+ii)))-2.* *(scale+ii+dim));
+    }
+    err= sqrt(err/2./dim);
+  }
+  //free what we allocated
+  free(q11);
+  free(q12);
+  free(p11);
+  free(p12);
+  free(qtmp);
+  free(ao);
+  free(a);
+  free(scale);
+  //return
+  return dt;
+}
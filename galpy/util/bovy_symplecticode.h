@@ -34,12 +34,44 @@ POSSIBILITY OF SUCH DAMAGE.
 #ifdef __cplusplus
 extern "C" {
 #endif
+#include <math.h>
 #include "signal.h"
 #include <galpy_potentials.h>
 /*
   Global variables
 */
 extern volatile sig_atomic_t interrupted;
+/*
+  Structure to keep track of the integrator's work for a single orbit; all
+  entries are doubles, such that an (nobj,4) numpy array can be passed in
+*/
+struct odeintStats{
+  double naccept; // number of accepted steps
+  double nreject; // number of rejected steps
+  double nfev; // number of evaluations of the derivative/force function
+  double hmin; // smallest absolute stepsize of an accepted step
+};
+// h is the stepsize of the accepted step(s) or zero if it should not be
+// considered for hmin
+static inline void init_odeintStats(struct odeintStats * stats){
+  if ( stats ) {
+    stats->naccept= 0.;
+    stats->nreject= 0.;
+    stats->nfev= 0.;
+    stats->hmin= INFINITY;
+  }
+}
+static inline void update_odeintStats(struct odeintStats * stats,
+				      double naccept,double nreject,
+				      double nfev,double h){
+  if ( stats ) {
+    stats->naccept+= naccept;
+    stats->nreject+= nreject;
+    stats->nfev+= nfev;
+    if ( naccept > 0. && h != 0. && fabs(h) < stats->hmin )
+      stats->hmin= fabs(h);
+  }
+}
 /*
   Function declarations
 */
@@ -56,7 +88,7 @@ void leapfrog(void (*func)(double, double *, double *,
 	      int, double, double *,
 	      int, struct potentialArg *,
 	      double, double,
-	      double *,int *);
+	      double *,int *,struct odeintStats *);
 double leapfrog_estimate_step(void (*func)(double , double *, double *,int, struct potentialArg *),
 			      int, double *,double *,
 			      double, double *,
@@ -69,7 +101,7 @@ void symplec4(void (*func)(double, double *, double *,
 	      int, double, double *,
 	      int, struct potentialArg *,
 	      double, double,
-	      double *,int *);
+	      double *,int *,struct odeintStats *);
 double symplec4_estimate_step(void (*func)(double , double *, double *,int, struct potentialArg *),
 			      int, double *,double *,
 			      double, double *,
@@ -82,12 +114,33 @@ void symplec6(void (*func)(double, double *, double *,
 	      int, double, double *,
 	      int, struct potentialArg *,
 	      double, double,
-	      double *,int *);
+	      double *,int *,struct odeintStats *);
 double symplec6_estimate_step(void (*func)(double , double *, double *,int, struct potentialArg *),
 			      int, double *,double *,
 			      double, double *,
 			      int,struct potentialArg *,
 			      double,double);
+void symplec4fg(void (*func)(double, double *, double *,
+			     int, struct potentialArg *),
+		int,
+		double *,
+		int, double, double *,
+		int, struct potentialArg *,
+		double, double,
+		double *,int *,struct odeintStats *);
+double symplec4fg_estimate_step(void (*func)(double , double *, double *,int, struct potentialArg *),
+				int, double *,double *,
+				double, double *,
+				int,struct potentialArg *,
+				double,double);
+void ttleapfrog(void (*func)(double, double *, double *,
+			     int, struct potentialArg *),
+		int,
+		double *,
+		int, double, double *,
+		int, struct potentialArg *,
+		double, double,
+		double *,int *,struct odeintStats *);
 #ifdef __cplusplus
 }
 #endif
@@ -16,6 +16,7 @@ default_configuration = {
         "check-non-interactive-every": "1",
         "last-non-interactive-check": "2000-01-01",
     },
+    "cache": {"directory": ""},
 }
 default_filename = os.path.join(os.path.expanduser("~"), ".galpyrc")
 
@@ -131,3 +132,23 @@ def set_vo(vo):
     if _APY_LOADED and isinstance(vo, units.Quantity):
         vo = vo.to(units.km / units.s).value
     __config__.set("normalization", "vo", str(vo))
+
+
+def set_cache_directory(directory):
+    """
+    Set the global configuration value of the directory of the on-disk cache of expensive potential setups
+
+    Parameters
+    ----------
+    directory : str or None
+        Cache directory; None or an empty string turns off the on-disk cache
+
+    Returns
+    -------
+    None
+
+    Notes
+    -----
+    - 2026-10-19 - Written - Agent (local)
+    """
+    __config__.set("cache", "directory", "" if directory is None else str(directory))
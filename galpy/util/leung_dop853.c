@@ -227,6 +227,7 @@ Usage:
   Output:
 	   double *result: result (nt blocks of size 2dim)
 	   int * err: if non-zero, something bad happened (1: maximum step reduction happened; -10: interrupted by CTRL-C (SIGINT)
+	   struct odeintStats * stats: if not NULL, number of accepted and rejected steps, function evaluations, and minimum stepsize (see bovy_symplecticode.h)
 */
 void dop853(void(*func)(double t, double *q, double *a, int nargs, struct potentialArg * potentialArgs),
 	int dim,
@@ -239,7 +240,8 @@ void dop853(void(*func)(double t, double *q, double *a, int nargs, struct potent
 	double rtol,
 	double atol,
 	double *result,
-	int *err_)
+	int *err_,
+	struct odeintStats * stats)
 {
 	rtol = exp(rtol);
 	atol = exp(atol);
@@ -282,6 +284,7 @@ void dop853(void(*func)(double t, double *q, double *a, int nargs, struct potent
 	double sqr, err, err2, erri, deno;
 	double fac, fac11;
 	double s, s1;
+	init_odeintStats(stats);
 	save_dop853(dim, y0, result);  // save first result which is the initials
 	result += dim;  // shift to next memory
 
@@ -324,6 +327,7 @@ void dop853(void(*func)(double t, double *q, double *a, int nargs, struct potent
 	h1 = pow(0.01 / der12, 1.0 / 8.0);
 	h = custom_sign(min(100.0 * fabs(h), min(fabs(h1), fabs(hmax))), pos_neg);
 	// finished estimate initial time step
+	update_odeintStats(stats, 0.0, 0.0, 2.0, 0.0);
 
 	int reject = 0;
 	double t_current = (double) t[0];  // store current integration time internally(not the current time wanted by user!!)
@@ -423,6 +427,7 @@ void dop853(void(*func)(double t, double *q, double *a, int nargs, struct potent
 
 		if (err <= 1.0)  // step accepted
 		{
+			update_odeintStats(stats, 1.0, 0.0, 15.0, h);
 			facold = max(err, 1.0e-4);
 			func(t_current, k5, k4, nargs, potentialArgs);
 
@@ -481,6 +486,7 @@ void dop853(void(*func)(double t, double *q, double *a, int nargs, struct potent
 		else
 		{
 			// step rejected since error too big
+			update_odeintStats(stats, 0.0, 1.0, 11.0, h);
 			hnew = h / min(facc1, fac11 / safe);
 			reject = 1;
 
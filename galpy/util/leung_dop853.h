@@ -37,6 +37,7 @@ extern "C" {
 #endif
 #include "signal.h"
 #include <galpy_potentials.h>
+#include <bovy_symplecticode.h>
 /* Global variables */
 extern volatile sig_atomic_t interrupted;
 #ifndef _WIN32
@@ -84,7 +85,8 @@ void dop853 (
 	double,
 	double,
 	double *,
-	int *
+	int *,
+	struct odeintStats *
 );
 #ifdef __cplusplus
 }
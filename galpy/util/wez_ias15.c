@@ -204,6 +204,7 @@ Usage:
   Output:
        double *result: result (nt blocks of size 2dim)
        int *err: error: -10 if interrupted by CTRL-C (SIGINT)
+       struct odeintStats * stats: if not NULL, number of accepted and rejected steps, function evaluations, and minimum stepsize (see bovy_symplecticode.h)
 */
 void wez_ias15(void (*func)(double t, double *q, double *a, int nargs, struct potentialArg * potentialArgs),
     int dim,
@@ -216,7 +217,8 @@ void wez_ias15(void (*func)(double t, double *q, double *a, int nargs, struct po
     double rtol,
     double atol,
     double *result,
-    int * err){
+    int * err,
+    struct odeintStats * stats){
   //Declare and initialize
   double *x= (double *) malloc ( dim * sizeof(double) );
   double *v= (double *) malloc ( dim * sizeof(double) );
@@ -259,6 +261,7 @@ void wez_ias15(void (*func)(double t, double *q, double *a, int nargs, struct po
   result+= 2 * dim;
 
   *err= 0;
+  init_odeintStats(stats);
 
   //Estimate necessary stepsize, use the returned time interval if the user does not provide
   double init_dt= (*(t+1))-(*t);
@@ -303,6 +306,7 @@ void wez_ias15(void (*func)(double t, double *q, double *a, int nargs, struct po
     for (int i=0; i < dim; i++){
       Fs[i * (order + 1)] = a[i];
     }
+    update_odeintStats(stats,0.,0.,1.,0.);
     //update G from B
     update_Gs_from_Bs(dim, Gs, Bs);
 
@@ -351,6 +355,7 @@ void wez_ias15(void (*func)(double t, double *q, double *a, int nargs, struct po
 
       integrator_error = max_delta_B6/max_a;
       iterations += 1;
+      update_odeintStats(stats,0.,0.,(double) order,0.);
     }
 
     //global error strategy for timestep
@@ -374,8 +379,10 @@ void wez_ias15(void (*func)(double t, double *q, double *a, int nargs, struct po
     if(fabs(dt_temp) > fabs(dt_required)){
       //rejected, try again with dt required
       dt = dt_required;
+      update_odeintStats(stats,0.,1.,0.,dt_temp);
     } else {
       //accepted, update position/velocity and do next timestep with dt required
+      update_odeintStats(stats,1.,0.,0.,dt_temp);
       time_remaining -= fabs(dt); //will eventually get negative as we stepped forward the minimum of dt and time_remaining
 
       if (init_dt > 0){
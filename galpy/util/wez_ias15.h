@@ -54,7 +54,7 @@ void wez_ias15(void (*func)(double, double *, double *,
 	      int, double, double *,
 	      int, struct potentialArg *,
 	      double, double,
-	      double *,int *);
+	      double *,int *,struct odeintStats *);
 
 static inline void save_ias15(int dim, double *qo, double *po, double *result){
   int ii;
@@ -70,11 +70,15 @@ def pytest_generate_tests(metafunc):
         pots.append("mockRotatedAndTiltedMWP14WrapperPotential")
         pots.append("testNullPotential")
         pots.append("mockKuzminLikeWrapperPotential")
+        pots.append("mockCompositePotential")
         rmpots = [
             "Potential",
             "MWPotential",
             "MWPotential2014",
             "MovingObjectPotential",
+            "ManyMovingObjectsPotential",
+            "TimeInterpolatedPotential",
+            "CompositePotential",
             "interpRZPotential",
             "linearPotential",
             "planarAxiPotential",
@@ -166,11 +170,15 @@ def pytest_generate_tests(metafunc):
         pots.append("mockRotatedAndTiltedMWP14WrapperPotential")
         pots.append("testNullPotential")
         pots.append("mockKuzminLikeWrapperPotential")
+        pots.append("mockCompositePotential")
         rmpots = [
             "Potential",
             "MWPotential",
             "MWPotential2014",
             "MovingObjectPotential",
+            "ManyMovingObjectsPotential",
+            "TimeInterpolatedPotential",
+            "CompositePotential",
             "interpRZPotential",
             "linearPotential",
             "planarAxiPotential",
@@ -0,0 +1,30 @@
+import sys
+
+import numpy
+
+from galpy import potential
+from galpy.orbit import Orbit
+
+if __name__ == "__main__":
+    # OMP_NUM_THREADS=4 python orbitint4omp.py vxvv.npy out.npz
+    # Integrates the ensemble of orbits in vxvv.npy with the adaptive C
+    # integrators in 3D, 2D, and 1D, such that running it with multiple
+    # OpenMP threads exercises the re-ordering of the orbits by cost
+    vxvv = numpy.load(sys.argv[1])
+    times = numpy.linspace(0.0, 10.0, 101)
+    out = {}
+    for name, vxvv_dim, pot in zip(
+        ["full", "planar", "linear"],
+        [vxvv, vxvv[:, [0, 1, 2, 5]], vxvv[:, [3, 4]]],
+        [
+            potential.MWPotential2014,
+            potential.MWPotential2014,
+            potential.toVerticalPotential(potential.MWPotential2014, 1.0),
+        ],
+    ):
+        for method in ["dop853_c", "dopr54_c", "ias15_c"]:
+            orbits = Orbit(vxvv_dim)
+            orbits.integrate(times, pot, method=method)
+            out[f"{name}_{method}"] = orbits.getOrbit()
+    numpy.savez(sys.argv[2], **out)
+    sys.exit(0)
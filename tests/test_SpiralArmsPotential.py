@@ -2236,6 +2236,52 @@ class TestSpiralArmsPotential(unittest.TestCase):
             pot._dgamma_dR(0.01), deriv(lambda x: pot._gamma(x, 1), 0.01, dx=dx)
         )
 
+    def test_array_inputs(self):
+        """Tests that array inputs agree with scalar inputs and do not affect later evaluations in C."""
+        from galpy.potential import (
+            evaluatephitorques,
+            evaluateRforces,
+            evaluatezforces,
+        )
+
+        pot = spiral(N=3, alpha=0.3, Cs=[1, 0.5, 0.2], omega=0.4, H=0.2)
+        numpy.random.seed(1)
+        R = numpy.random.uniform(0.2, 3.0, size=10)
+        z = numpy.random.uniform(-1.0, 1.0, size=10)
+        phi = numpy.random.uniform(0.0, 2.0 * numpy.pi, size=10)
+        t = numpy.random.uniform(0.0, 3.0, size=10)
+        for func in [
+            pot._evaluate,
+            pot._Rforce,
+            pot._zforce,
+            pot._phitorque,
+            pot._R2deriv,
+            pot._z2deriv,
+            pot._phi2deriv,
+            pot._Rzderiv,
+            pot._Rphideriv,
+            pot._phizderiv,
+            pot._dens,
+        ]:
+            assert_allclose(
+                func(R, z, phi, t),
+                [func(a, b, c, d) for a, b, c, d in zip(R, z, phi, t)],
+                rtol=1e-12,
+            )
+            # Mixed scalar and array inputs
+            assert_allclose(
+                func(R[0], z, phi[0], t[0]),
+                [func(R[0], b, phi[0], t[0]) for b in z],
+                rtol=1e-12,
+            )
+        # The C forces, computed together and cached, agree with Python
+        for func in [evaluateRforces, evaluatezforces, evaluatephitorques]:
+            assert_allclose(
+                func(pot, R, z, phi=phi, t=t, backend="c"),
+                func(pot, R, z, phi=phi, t=t),
+                rtol=1e-10,
+            )
+
 
 if __name__ == "__main__":
     suite = unittest.TestLoader().loadTestsFromTestCase(TestSpiralArmsPotential)
@@ -218,6 +218,62 @@ def test_ChandrasekharDynamicalFrictionForce_pickling():
     return None
 
 
+def test_ChandrasekharDynamicalFrictionForce_sigmar_table():
+    # Test that the tabulated sigmar agrees with the Jeans equation and is
+    # shared between instances with the same density
+    from galpy.df import jeans
+    from galpy.potential.ChandrasekharDynamicalFrictionForce import _SIGMAR_TABLES
+
+    for dens in [
+        potential.MWPotential2014,
+        potential.NFWPotential(amp=2.0, a=3.0),
+        potential.HernquistPotential(amp=2.0, a=0.5),
+    ]:
+        cdf = potential.ChandrasekharDynamicalFrictionForce(
+            GMs=0.01, rhm=0.1, dens=dens, minr=0.01, maxr=10.0, nr=101
+        )
+        rs = cdf._sigmar_rs_4interp[::10]
+        assert numpy.all(
+            numpy.fabs(
+                cdf._sigmars_4interp[::10]
+                / numpy.array(
+                    [jeans.sigmar(dens, r, beta=0.0, use_physical=False) for r in rs]
+                )
+                - 1.0
+            )
+            < 1e-5
+        ), (
+            "Tabulated sigmar in ChandrasekharDynamicalFrictionForce does not agree with the Jeans equation"
+        )
+    # A second instance with a different mass and size re-uses the table
+    ntables = len(_SIGMAR_TABLES)
+    cdf2 = potential.ChandrasekharDynamicalFrictionForce(
+        GMs=0.02, rhm=0.3, dens=dens, minr=0.01, maxr=10.0, nr=101
+    )
+    assert len(_SIGMAR_TABLES) == ntables, (
+        "sigmar table is not shared between ChandrasekharDynamicalFrictionForce instances"
+    )
+    assert numpy.all(cdf2._sigmars_4interp == cdf._sigmars_4interp), (
+        "Shared sigmar table differs between ChandrasekharDynamicalFrictionForce instances"
+    )
+    # but a host with different parameters does not
+    cdf3 = potential.ChandrasekharDynamicalFrictionForce(
+        GMs=0.02,
+        rhm=0.3,
+        dens=potential.HernquistPotential(amp=2.0, a=0.6),
+        minr=0.01,
+        maxr=10.0,
+        nr=101,
+    )
+    assert len(_SIGMAR_TABLES) == ntables + 1, (
+        "sigmar table is shared between ChandrasekharDynamicalFrictionForce instances with different densities"
+    )
+    assert numpy.all(cdf3._sigmars_4interp != cdf._sigmars_4interp), (
+        "sigmar table is shared between ChandrasekharDynamicalFrictionForce instances with different densities"
+    )
+    return None
+
+
 # Test whether dynamical friction in C works (compare to Python, which is
 # tested below; put here because a test of many potentials)
 def test_dynamfric_c():
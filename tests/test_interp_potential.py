@@ -1,6 +1,8 @@
 import numpy
+import pytest
 
 from galpy import potential
+from galpy.util import galpyWarning
 
 
 def test_errors():
@@ -1949,3 +1951,200 @@ def test_interpolation_potential_verticalfreq_notinterpolated():
             f"RZPot interpolation w/ interpRZPotential fails when the potential was not interpolated at R = {r:g} by {vfdiff:g}"
         )
     return None
+
+
+# Test that calculating the potential and forces on a grid in a single pass
+# in C agrees with calculating them one at a time
+def test_calc_potential_grids_c():
+    from galpy.potential.interpRZPotential import (
+        calc_potential_c,
+        calc_potential_grids_c,
+    )
+
+    rgrid = numpy.linspace(0.1, 2.0, 11)
+    zgrid = numpy.linspace(0.0, 0.5, 7)
+    for quantities in [
+        ["potential", "rforce", "zforce"],
+        ["rforce", "zforce"],
+        ["potential"],
+    ]:
+        grids, err = calc_potential_grids_c(
+            potential.MWPotential2014, rgrid, zgrid, quantities
+        )
+        assert err == 0, "calc_potential_grids_c returned an error"
+        assert sorted(grids.keys()) == sorted(quantities), (
+            "calc_potential_grids_c does not return the requested quantities"
+        )
+        for quantity in quantities:
+            assert numpy.all(
+                numpy.fabs(
+                    grids[quantity]
+                    - calc_potential_c(
+                        potential.MWPotential2014,
+                        rgrid,
+                        zgrid,
+                        rforce=quantity == "rforce",
+                        zforce=quantity == "zforce",
+                    )[0]
+                )
+                < 10.0**-14.0
+            ), (
+                f"Calculating the {quantity} grid in a single pass does not agree with calculating it on its own"
+            )
+    return None
+
+
+# Test that refining the grid reaches the requested interpolation accuracy
+def test_interpolation_potential_refine():
+    rzpot = potential.interpRZPotential(
+        RZPot=potential.MWPotential,
+        rgrid=(0.1, 2.0, 11),
+        zgrid=(0.0, 0.5, 11),
+        logR=False,
+        interpPot=True,
+        interpRforce=True,
+        interpzforce=True,
+        interpDens=True,
+        interpvcirc=True,
+        rtol=1e-5,
+        max_refine=6,
+        zsym=True,
+    )
+    assert len(rzpot._rgrid) > 11 and len(rzpot._zgrid) > 11, (
+        "interpRZPotential with rtol did not refine the grid"
+    )
+    assert len(rzpot._vcircGrid) == len(rzpot._rgrid), (
+        "interpRZPotential with rtol does not use the refined R grid for vcirc"
+    )
+    rs = numpy.linspace(0.15, 1.95, 13)
+    zs = numpy.linspace(0.02, 0.48, 13)
+    for func, origfunc in [
+        (rzpot, potential.evaluatePotentials),
+        (rzpot.Rforce, potential.evaluateRforces),
+        (rzpot.zforce, potential.evaluatezforces),
+        (rzpot.dens, potential.evaluateDensities),
+    ]:
+        assert numpy.all(
+            numpy.fabs(func(rs, zs) / origfunc(potential.MWPotential, rs, zs) - 1.0)
+            < 10.0**-4.0
+        ), "interpRZPotential with rtol does not reach the requested accuracy"
+    # Not reaching rtol gives a warning
+    with pytest.warns(galpyWarning) as record:
+        potential.interpRZPotential(
+            RZPot=potential.MWPotential,
+            rgrid=(0.1, 2.0, 11),
+            zgrid=(0.0, 0.5, 11),
+            logR=False,
+            interpPot=True,
+            rtol=1e-14,
+            max_refine=1,
+        )
+    assert any("did not reach rtol" in str(rec.message) for rec in record), (
+        "interpRZPotential that does not reach rtol does not warn"
+    )
+    return None
+
+
+# Test that evaluating the grids in parallel gives the same grids
+def test_interpolation_potential_grids_numcores():
+    kwargs = dict(
+        RZPot=potential.MWPotential,
+        rgrid=(numpy.log(0.01), numpy.log(20.0), 31),
+        zgrid=(0.0, 1.0, 21),
+        logR=True,
+        interpPot=True,
+        interpRforce=True,
+        interpzforce=True,
+        interpDens=True,
+    )
+    rzpot = potential.interpRZPotential(**kwargs)
+    rzpot_par = potential.interpRZPotential(numcores=2, **kwargs)
+    for grid in ["_potGrid", "_rforceGrid", "_zforceGrid", "_densGrid"]:
+        assert numpy.all(
+            numpy.fabs(getattr(rzpot, grid) - getattr(rzpot_par, grid)) < 10.0**-14.0
+        ), "interpRZPotential grids evaluated in parallel differ from serial ones"
+    return None
+
+
+# Test saving the grids and loading them memory-mapped
+def test_interpolation_potential_save_grids(tmp_path):
+    rzpot = potential.interpRZPotential(
+        RZPot=potential.MWPotential,
+        rgrid=(numpy.log(0.01), numpy.log(20.0), 51),
+        zgrid=(-1.0, 1.0, 41),
+        logR=True,
+        interpPot=True,
+        interpRforce=True,
+        interpzforce=True,
+        interpDens=True,
+        interpvcirc=True,
+        interpepifreq=True,
+        enable_c=True,
+        zsym=False,
+    )
+    rzpot.save_grids(str(tmp_path / "grids"))
+    # Arguments that set the grids are ignored in favor of the saved ones
+    rzpot_load = potential.interpRZPotential(
+        RZPot=potential.MWPotential,
+        rgrid=(0.1, 1.0, 3),
+        enable_c=True,
+        griddir=str(tmp_path / "grids"),
+    )
+    assert isinstance(rzpot_load._potGrid, numpy.memmap), (
+        "interpRZPotential grids loaded with griddir are not memory-mapped"
+    )
+    assert (
+        rzpot_load._logR
+        and not rzpot_load._zsym
+        and rzpot_load._interpDens
+        and rzpot_load._interpepifreq
+        and not rzpot_load._interpverticalfreq
+    ), "interpRZPotential loaded with griddir does not have the saved settings"
+    rs = numpy.linspace(0.1, 15.0, 11)
+    zs = numpy.linspace(-0.9, 0.9, 11)
+    for func in ["__call__", "Rforce", "zforce", "dens"]:
+        assert numpy.all(
+            numpy.fabs(getattr(rzpot_load, func)(rs, zs) - getattr(rzpot, func)(rs, zs))
+            < 10.0**-12.0
+        ), "interpRZPotential loaded with griddir differs from the original"
+    for func in ["vcirc", "epifreq"]:
+        assert numpy.all(
+            numpy.fabs(getattr(rzpot_load, func)(rs) - getattr(rzpot, func)(rs))
+            < 10.0**-12.0
+        ), "interpRZPotential loaded with griddir differs from the original"
+    assert numpy.all(rzpot_load._potGrid_splinecoeffs == rzpot._potGrid_splinecoeffs), (
+        "interpRZPotential loaded with griddir has different C spline coefficients"
+    )
+    return None
+
+
+# Test that grids can be computed for potentials that do not accept array input
+def test_interpolation_potential_grids_scalaronly():
+    dp = potential.DoubleExponentialDiskPotential(normalize=1.0, hr=0.3, hz=0.03)
+    rzpot = potential.interpRZPotential(
+        RZPot=dp,
+        rgrid=(0.1, 2.0, 11),
+        zgrid=(0.0, 0.2, 6),
+        logR=False,
+        interpPot=True,
+        interpRforce=True,
+        interpzforce=True,
+        interpDens=True,
+    )
+    for grid, func in [
+        ("_potGrid", potential.evaluatePotentials),
+        ("_rforceGrid", potential.evaluateRforces),
+        ("_zforceGrid", potential.evaluatezforces),
+        ("_densGrid", potential.evaluateDensities),
+    ]:
+        for ii, jj in [(0, 0), (3, 2), (10, 5)]:
+            assert (
+                numpy.fabs(
+                    getattr(rzpot, grid)[ii, jj]
+                    - func(dp, rzpot._rgrid[ii], rzpot._zgrid[jj])
+                )
+                < 1e-10
+            ), (
+                "interpRZPotential grid for a potential that does not accept array input is incorrect"
+            )
+    return None
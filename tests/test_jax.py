@@ -0,0 +1,211 @@
+# Tests of the JAX implementation of potentials and orbit integration
+import jax
+import jax.numpy as jnp
+import numpy
+import pytest
+
+from galpy import potential
+from galpy.orbit import Orbit, jax_integrator
+
+
+# Run these tests in double precision, without changing the precision of
+# JAX for other test files
+@pytest.fixture(autouse=True, scope="module")
+def jax_enable_x64():
+    old = jax.config.read("jax_enable_x64")
+    jax.config.update("jax_enable_x64", True)
+    yield
+    jax.config.update("jax_enable_x64", old)
+
+
+def jax_pots():
+    return [
+        potential.PowerSphericalPotential(alpha=2.3, normalize=2.0),
+        potential.PowerSphericalPotential(alpha=2.0, normalize=1.0),  # special case
+        potential.KeplerPotential(normalize=1.0),
+        potential.PlummerPotential(normalize=0.6, b=3.0),
+        potential.IsochronePotential(normalize=2.0, b=1.3),
+        potential.MiyamotoNagaiPotential(normalize=0.6, a=3.0, b=0.3),
+        potential.HernquistPotential(normalize=1.0, a=3.5),
+        potential.DehnenCoreSphericalPotential(normalize=4.0, a=1.2),
+        potential.JaffePotential(normalize=1.0, a=2.0),
+        potential.NFWPotential(normalize=1.0, a=1.5),
+        potential.LogarithmicHaloPotential(normalize=1.0),
+        potential.LogarithmicHaloPotential(
+            normalize=1.3, q=0.9, b=0.7, core=0.2
+        ),  # nonaxi
+        potential.PseudoIsothermalPotential(normalize=0.1, a=3.0),
+        potential.FlattenedPowerPotential(normalize=3.0, alpha=0.5, q=0.8, core=0.3),
+        potential.FlattenedPowerPotential(normalize=3.0, alpha=0.0),  # special case
+        potential.KuzminDiskPotential(normalize=1.0, a=0.8),
+    ]
+
+
+# Test that all quantities evaluated with JAX agree with the Python implementation
+def test_evaluate_jax():
+    funcs = {
+        "potential": potential.evaluatePotentials,
+        "Rforce": potential.evaluateRforces,
+        "zforce": potential.evaluatezforces,
+        "phitorque": potential.evaluatephitorques,
+        "dens": potential.evaluateDensities,
+        "R2deriv": potential.evaluateR2derivs,
+        "z2deriv": potential.evaluatez2derivs,
+        "Rzderiv": potential.evaluateRzderivs,
+        "phi2deriv": potential.evaluatephi2derivs,
+        "Rphideriv": potential.evaluateRphiderivs,
+        "phizderiv": potential.evaluatephizderivs,
+    }
+    Rs = numpy.array([0.5, 1.3, 3.0])
+    zs = numpy.array([0.1, -0.4, 2.0])
+    phis = numpy.array([0.3, 1.0, 2.0])
+    for pot in jax_pots():
+        for quantity, func in funcs.items():
+            try:
+                pyout = func(pot, Rs, zs, phi=phis, use_physical=False)
+            except potential.PotentialError:  # not implemented in Python
+                continue
+            jaxout = numpy.asarray(
+                potential.evaluate_jax(pot, quantity, Rs, zs, phi=phis)
+            )
+            assert numpy.all(
+                numpy.fabs(jaxout - pyout)
+                < 10.0**-9.0 * (numpy.fabs(pyout) + 10.0**-5.0)
+            ), (
+                f"{quantity} evaluated with JAX does not agree with Python for {type(pot).__name__}"
+            )
+    return None
+
+
+# Test the backend='jax' option of the evaluate* functions
+def test_evaluate_backend_jax():
+    pot = [
+        potential.HernquistPotential(normalize=0.1, a=0.3),
+        potential.MiyamotoNagaiPotential(normalize=0.5, a=0.4, b=0.04),
+        potential.NFWPotential(normalize=0.4, a=2.0),
+    ]
+    Rs = numpy.linspace(0.1, 3.0, 12).reshape((3, 4))
+    zs = numpy.linspace(-1.0, 1.0, 12).reshape((3, 4))
+    for func in [
+        potential.evaluatePotentials,
+        potential.evaluateRforces,
+        potential.evaluatezforces,
+        potential.evaluateDensities,
+        potential.evaluateR2derivs,
+    ]:
+        jaxout = func(pot, Rs, zs, backend="jax")
+        assert jaxout.shape == Rs.shape, (
+            "Output of evaluating with backend='jax' does not have the shape of the input"
+        )
+        assert numpy.all(numpy.fabs(jaxout - func(pot, Rs, zs)) < 10.0**-10.0), (
+            f"Evaluating {func.__name__} with backend='jax' does not agree with Python"
+        )
+        assert (
+            numpy.fabs(func(pot, 1.0, 0.1, backend="jax") - func(pot, 1.0, 0.1))
+            < 10.0**-10.0
+        ), f"Evaluating {func.__name__} with backend='jax' does not agree with Python"
+    return None
+
+
+# Test that potentials without a JAX implementation raise an error
+def test_evaluate_jax_notimplemented():
+    dp = potential.DoubleExponentialDiskPotential(normalize=1.0)
+    with pytest.raises(NotImplementedError):
+        potential.evaluate_jax(dp, "Rforce", 1.0, 0.1)
+    with pytest.raises(NotImplementedError):
+        potential.evaluateRforces(
+            [potential.NFWPotential(normalize=0.5), dp], 1.0, 0.1, backend="jax"
+        )
+    with pytest.raises(NotImplementedError):
+        jax_integrator(dp)
+    with pytest.raises(ValueError):
+        potential.evaluate_jax(potential.NFWPotential(), "Rforcex", 1.0, 0.1)
+    with pytest.raises(ValueError):
+        jax_integrator(potential.NFWPotential(), method="dopr54_c")
+    return None
+
+
+# Test that the JAX integrators agree with galpy's orbit integration
+def test_jax_integrator():
+    pot = [
+        potential.HernquistPotential(normalize=0.1, a=0.3),
+        potential.MiyamotoNagaiPotential(normalize=0.5, a=0.4, b=0.04),
+        potential.NFWPotential(normalize=0.4, a=2.0),
+    ]
+    vxvv = [1.0, 0.1, 1.1, 0.05, 0.02, 0.3]
+    ts = numpy.linspace(0.0, 20.0, 201)
+    o = Orbit(vxvv)
+    o.integrate(ts, pot, method="dop853_c")
+    for method, ndt, tol in [("leapfrog", 100, -5.0), ("rk4", 10, -8.0)]:
+        out = numpy.asarray(jax_integrator(pot, method=method, ndt=ndt)(vxvv, ts))
+        diff = out - o.getOrbit()
+        diff[:, 5] = (diff[:, 5] + numpy.pi) % (2.0 * numpy.pi) - numpy.pi
+        assert numpy.all(numpy.fabs(diff) < 10.0**tol), (
+            f"Orbit integrated with JAX {method} does not agree with galpy's orbit integration"
+        )
+    return None
+
+
+# Test gradients of orbit integration with respect to the parameters and
+# initial conditions against finite differences
+def test_jax_integrator_grad():
+    pot = [
+        potential.MiyamotoNagaiPotential(normalize=0.5, a=0.4, b=0.04),
+        potential.NFWPotential(normalize=0.5, a=2.0),
+    ]
+    vxvv = jnp.array([1.0, 0.1, 1.1, 0.05, 0.02, 0.3])
+    ts = numpy.linspace(0.0, 10.0, 101)
+    integrate = jax_integrator(pot, method="rk4", ndt=10)
+    params = potential.jax_params(pot)
+
+    def final_R(params, vxvv):
+        return integrate(vxvv, ts, params)[-1, 0]
+
+    grad_params, grad_vxvv = jax.grad(final_R, argnums=(0, 1))(params, vxvv)
+    eps = 10.0**-6.0
+    for ii, key in [(0, "a"), (0, "amp"), (1, "a")]:
+        pup = jax.tree_util.tree_map(lambda x: x, params)
+        pdown = jax.tree_util.tree_map(lambda x: x, params)
+        pup[ii][key] = params[ii][key] + eps
+        pdown[ii][key] = params[ii][key] - eps
+        assert (
+            numpy.fabs(
+                grad_params[ii][key]
+                - (final_R(pup, vxvv) - final_R(pdown, vxvv)) / 2.0 / eps
+            )
+            < 10.0**-6.0
+        ), f"Gradient of the orbit with respect to parameter {key} is incorrect"
+    for jj in range(5):
+        dv = eps * jnp.eye(6)[jj]
+        assert (
+            numpy.fabs(
+                grad_vxvv[jj]
+                - (final_R(params, vxvv + dv) - final_R(params, vxvv - dv)) / 2.0 / eps
+            )
+            < 10.0**-6.0
+        ), "Gradient of the orbit with respect to the initial condition is incorrect"
+    return None
+
+
+# Test batching orbit integration over models with vmap
+def test_jax_integrator_vmap():
+    pot = [
+        potential.MiyamotoNagaiPotential(normalize=0.5, a=0.4, b=0.04),
+        potential.NFWPotential(normalize=0.5, a=2.0),
+    ]
+    vxvv = [1.0, 0.1, 1.1, 0.05, 0.02, 0.3]
+    ts = numpy.linspace(0.0, 10.0, 101)
+    integrate = jax_integrator(pot)
+    params = potential.jax_params(pot)
+    amps = jnp.linspace(0.5, 1.5, 5)
+    batched = jax.tree_util.tree_map(lambda x: x * jnp.ones_like(amps), params)
+    batched[1]["amp"] = params[1]["amp"] * amps
+    out = jax.vmap(lambda p: integrate(vxvv, ts, p))(batched)
+    assert out.shape == (5, len(ts), 6), "Batched orbits do not have the expected shape"
+    for ii in range(5):
+        tparams = jax.tree_util.tree_map(lambda x: x, params)
+        tparams[1]["amp"] = params[1]["amp"] * amps[ii]
+        assert numpy.all(
+            numpy.fabs(out[ii] - integrate(vxvv, ts, tparams)) < 10.0**-10.0
+        ), "Batched orbit integration does not agree with integrating each model"
+    return None
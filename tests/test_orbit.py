@@ -26,6 +26,7 @@ from test_potential import (
     fullyRotatedTriaxialNFWPotential,
     mockAdiabaticContractionMWP14WrapperPotential,
     mockCombLinearPotential,
+    mockCompositePotential,
     mockFlatCorotatingRotationSpiralArmsPotential,
     mockFlatCosmphiDiskPotential,
     mockFlatCosmphiDiskwBreakPotential,
@@ -111,6 +112,8 @@ def test_energy_jacobi_conservation(pot, ttol, tjactol, firstTest):
         "rk6_c",
         "symplec4_c",
         "symplec6_c",
+        "symplec4fg_c",
+        "ttleapfrog_c",
         "ias15_c",
     ]
     try:
@@ -131,11 +134,7 @@ def test_energy_jacobi_conservation(pot, ttol, tjactol, firstTest):
             "Spiral" in pot or "Lopsided" in pot or "Dehnen" in pot or "Cosmphi" in pot
         ):
             ttimes = growtimes
-        elif (
-            integrator == "dopr54_c"
-            and not "MovingObject" in pot
-            and not pot == "FerrersPotential"
-        ):
+        elif integrator == "dopr54_c" and not "MovingObject" in pot:
             ttimes = times
         else:
             ttimes = fasttimes
@@ -530,6 +529,8 @@ def test_energy_conservation_linear(pot, ttol, firstTest):
         "rk6_c",
         "symplec4_c",
         "symplec6_c",
+        "symplec4fg_c",
+        "ttleapfrog_c",
         "ias15_c",
     ]
     # Setup instance of potential
@@ -661,6 +662,60 @@ def test_energy_symplec_longterm():
     return None
 
 
+# Test that the force-gradient and time-transformed integrators are more
+# efficient than their fixed-step counterparts for eccentric orbits
+def test_forcegradient_timetransformed_eccentric():
+    from galpy.orbit import Orbit
+
+    ts = numpy.linspace(0.0, 20.0, 101)
+
+    def integrate(method, dt, pot, vxvv):
+        oref = Orbit(vxvv)
+        oref.integrate(ts, pot, method="dop853_c")
+        o = Orbit(vxvv)
+        o.integrate(ts, pot, method=method, dt=dt, diagnostics=True)
+        poserr = numpy.amax(
+            numpy.fabs(o.getOrbit()[:, [0, 3]] - oref.getOrbit()[:, [0, 3]])
+        )
+        Es = o.E(ts)
+        return (
+            poserr,
+            numpy.amax(numpy.fabs(Es / Es[0] - 1.0)),
+            o.integration_diagnostics()["nfev"],
+        )
+
+    # Force-gradient: fourth order and much more accurate than symplec4_c
+    vxvv = [1.0, 0.1, 0.2, 0.1, 0.0, 0.0]
+    fgerr, _, fgnfev = integrate(
+        "symplec4fg_c", 0.2 / 32, potential.MWPotential2014, vxvv
+    )
+    fgerr2, _, _ = integrate("symplec4fg_c", 0.2 / 64, potential.MWPotential2014, vxvv)
+    s4err, _, s4nfev = integrate(
+        "symplec4_c", 0.2 / 32, potential.MWPotential2014, vxvv
+    )
+    assert numpy.fabs(fgnfev - s4nfev) <= 1, (
+        "symplec4fg_c does not use the same number of force evaluations as symplec4_c"
+    )
+    assert fgerr < 0.1 * s4err, (
+        f"symplec4fg_c is not much more accurate than symplec4_c for an eccentric orbit (errors {fgerr:g} and {s4err:g})"
+    )
+    assert 8.0 < fgerr / fgerr2 < 32.0, (
+        f"symplec4fg_c does not converge as a fourth-order integrator (error ratio {fgerr / fgerr2:g})"
+    )
+    # Time-transformed leapfrog: better than leapfrog_c with fewer force evals
+    hp = potential.HernquistPotential(normalize=1.0, a=0.5)
+    vxvv = [1.0, 0.0, 0.05, 0.1, 0.0, 0.0]
+    tterr, ttdE, ttnfev = integrate("ttleapfrog_c", 0.2, hp, vxvv)
+    lferr, lfdE, lfnfev = integrate("leapfrog_c", 0.2 / 16, hp, vxvv)
+    assert ttnfev < lfnfev / 4.0, (
+        "ttleapfrog_c does not use far fewer force evaluations than leapfrog_c"
+    )
+    assert tterr < lferr and ttdE < lfdE, (
+        f"ttleapfrog_c is not more accurate than leapfrog_c for an eccentric orbit (errors {tterr:g} and {lferr:g}, energy errors {ttdE:g} and {lfdE:g})"
+    )
+    return None
+
+
 def test_liouville_planar():
     if _NOLONGINTEGRATIONS:
         return None
@@ -723,11 +778,15 @@ def test_liouville_planar():
     pots.append("mockAdiabaticContractionMWP14WrapperPotential")
     pots.append("testNullPotential")
     pots.append("mockKuzminLikeWrapperPotential")
+    pots.append("mockCompositePotential")
     rmpots = [
         "Potential",
         "MWPotential",
         "MWPotential2014",
         "MovingObjectPotential",
+        "ManyMovingObjectsPotential",
+        "TimeInterpolatedPotential",
+        "CompositePotential",
         "interpRZPotential",
         "linearPotential",
         "planarAxiPotential",
@@ -744,8 +803,6 @@ def test_liouville_planar():
     # rmpots.append('BurkertPotential')
     # Don't have C implementations of the relevant 2nd derivatives
     rmpots.append("DoubleExponentialDiskPotential")
-    rmpots.append("RazorThinExponentialDiskPotential")
-    # Doesn't have C at all
     rmpots.append("AnyAxisymmetricRazorThinDiskPotential")
     # rmpots.append('PowerSphericalPotentialwCutoff')
     # Doesn't have the R2deriv
@@ -755,8 +812,6 @@ def test_liouville_planar():
     rmpots.append("TriaxialJaffePotential")
     rmpots.append("SoftenedNeedleBarPotential")
     rmpots.append("DiskSCFPotential")
-    rmpots.append("SphericalShellPotential")
-    rmpots.append("RingPotential")
     rmpots.append("PerfectEllipsoidPotential")
     rmpots.append("TriaxialGaussianPotential")
     rmpots.append("PowerTriaxialPotential")
@@ -769,12 +824,13 @@ def test_liouville_planar():
     tol["NFWPotential"] = -6.0  # more difficult for rk4_c, only one that does this
     tol["TriaxialNFWPotential"] = -4.0  # more difficult
     tol["triaxialLogarithmicHaloPotential"] = -7.0  # more difficult
-    tol["FerrersPotential"] = -2.0
     tol["HomogeneousSpherePotential"] = -4.0
     tol["KingPotential"] = -6.0
     tol["mockInterpSphericalPotential"] = -4.0  # == HomogeneousSpherePotential
     tol["mockFlatCosmphiDiskwBreakPotential"] = -7.0  # more difficult
     tol["mockFlatTrulyCorotatingRotationSpiralArmsPotential"] = -5.0  # more difficult
+    tol["CylindricalSplinePotential"] = -6.0  # 2nd derivs jump at grid nodes
+    tol["SphericalShellPotential"] = -6.0  # force jumps at the shell
     firstTest = True
     for p in pots:
         # Setup instance of potential
@@ -798,7 +854,7 @@ def test_liouville_planar():
                 thasC = _check_c(tp._potlist)
             else:
                 thasC = _check_c(tp)
-            if (integrator == "odeint" or not thasC) and not p == "FerrersPotential":
+            if integrator == "odeint" or not thasC:
                 ttol = -4.0
             if True:
                 ttimes = times
@@ -1174,11 +1230,15 @@ def test_eccentricity():
     pots.append("testMWPotential")
     pots.append("testplanarMWPotential")
     pots.append("mockInterpSphericalPotential")
+    pots.append("mockCompositePotential")
     rmpots = [
         "Potential",
         "MWPotential",
         "MWPotential2014",
         "MovingObjectPotential",
+        "ManyMovingObjectsPotential",
+        "TimeInterpolatedPotential",
+        "CompositePotential",
         "interpRZPotential",
         "linearPotential",
         "planarAxiPotential",
@@ -1349,11 +1409,15 @@ def test_pericenter():
     pots.append("testMWPotential")
     pots.append("testplanarMWPotential")
     pots.append("mockInterpSphericalPotential")
+    pots.append("mockCompositePotential")
     rmpots = [
         "Potential",
         "MWPotential",
         "MWPotential2014",
         "MovingObjectPotential",
+        "ManyMovingObjectsPotential",
+        "TimeInterpolatedPotential",
+        "CompositePotential",
         "interpRZPotential",
         "linearPotential",
         "planarAxiPotential",
@@ -1523,11 +1587,15 @@ def test_apocenter():
     pots.append("testMWPotential")
     pots.append("testplanarMWPotential")
     pots.append("mockInterpSphericalPotential")
+    pots.append("mockCompositePotential")
     rmpots = [
         "Potential",
         "MWPotential",
         "MWPotential2014",
         "MovingObjectPotential",
+        "ManyMovingObjectsPotential",
+        "TimeInterpolatedPotential",
+        "CompositePotential",
         "interpRZPotential",
         "linearPotential",
         "planarAxiPotential",
@@ -1697,11 +1765,15 @@ def test_zmax():
     ]
     pots.append("testMWPotential")
     pots.append("mockInterpSphericalPotential")
+    pots.append("mockCompositePotential")
     rmpots = [
         "Potential",
         "MWPotential",
         "MWPotential2014",
         "MovingObjectPotential",
+        "ManyMovingObjectsPotential",
+        "TimeInterpolatedPotential",
+        "CompositePotential",
         "interpRZPotential",
         "linearPotential",
         "planarAxiPotential",
@@ -1856,11 +1928,15 @@ def test_analytic_ecc_rperi_rap():
     ]
     pots.append("testMWPotential")
     pots.append("testplanarMWPotential")
+    pots.append("mockCompositePotential")
     rmpots = [
         "Potential",
         "MWPotential",
         "MWPotential2014",
         "MovingObjectPotential",
+        "ManyMovingObjectsPotential",
+        "TimeInterpolatedPotential",
+        "CompositePotential",
         "interpRZPotential",
         "linearPotential",
         "planarAxiPotential",
@@ -1889,6 +1965,7 @@ def test_analytic_ecc_rperi_rap():
     # tolerances in log10
     tol = {}
     tol["default"] = -10.0
+    tol["mockCompositePotential"] = -8.0  # these are more difficult
     tol["NFWPotential"] = -9.0  # these are more difficult
     tol["PlummerPotential"] = -9.0  # these are more difficult
     tol["DoubleExponentialDiskPotential"] = -6.0  # these are more difficult
@@ -2503,11 +2580,15 @@ def test_analytic_zmax():
         )
     ]
     pots.append("testMWPotential")
+    pots.append("mockCompositePotential")
     rmpots = [
         "Potential",
         "MWPotential",
         "MWPotential2014",
         "MovingObjectPotential",
+        "ManyMovingObjectsPotential",
+        "TimeInterpolatedPotential",
+        "CompositePotential",
         "interpRZPotential",
         "linearPotential",
         "planarAxiPotential",
@@ -2536,6 +2617,7 @@ def test_analytic_zmax():
     # tolerances in log10
     tol = {}
     tol["default"] = -9.0
+    tol["mockCompositePotential"] = -7.0  # these are more difficult
     tol["IsochronePotential"] = -4.0  # these are more difficult
     tol["DoubleExponentialDiskPotential"] = -6.0  # these are more difficult
     tol["RazorThinExponentialDiskPotential"] = -4.0  # these are more difficult
@@ -2558,6 +2640,7 @@ def test_analytic_zmax():
     tol["testMWPotential"] = -6.0  # these are more difficult
     tol["KuzminDiskPotential"] = -4  # these are more difficult
     tol["SCFPotential"] = -8.0  # these are more difficult
+    tol["TimeDependentSCFPotential"] = -8.0  # these are more difficult
     tol["DiskSCFPotential"] = -6.0  # these are more difficult
     for p in pots:
         # Setup instance of potential
@@ -7258,6 +7341,8 @@ def test_orbit_c_sigint_full():
         "rk6_c",
         "symplec4_c",
         "symplec6_c",
+        "symplec4fg_c",
+        "ttleapfrog_c",
         "ias15_c",
     ]
     scriptpath = "orbitint4sigint.py"
@@ -7310,6 +7395,8 @@ def test_orbit_c_sigint_planar():
         "rk6_c",
         "symplec4_c",
         "symplec6_c",
+        "symplec4fg_c",
+        "ttleapfrog_c",
         "ias15_c",
     ]
     scriptpath = "orbitint4sigint.py"
@@ -9617,6 +9704,110 @@ def test_MovingObjectPotential_planar_orbit():
     return None
 
 
+def test_ManyMovingObjectsPotential_orbit():
+    # Test that orbits integrated in a ManyMovingObjectsPotential by C and
+    # Python are the same and that they agree with those integrated in the
+    # equivalent list of MovingObjectPotentials
+    from galpy.orbit import Orbit
+    from galpy.potential import (
+        HernquistPotential,
+        ManyMovingObjectsPotential,
+        MovingObjectPotential,
+        MWPotential2014,
+    )
+
+    tmax = 5.0
+    times = numpy.linspace(0, tmax, 101)
+    numpy.random.seed(1)
+    for vxvv in [[0.5, 0.1, 1.0, 0.05, 0.1, 0.0], [0.5, 0.1, 1.0, 0.05]]:
+        nobj = 4
+        os = Orbit(
+            numpy.array(vxvv) + 0.1 * numpy.random.normal(size=(nobj, len(vxvv)))
+        )
+        os.integrate(times, MWPotential2014)
+        objpots = [
+            HernquistPotential(amp=0.02 * (ii + 1), a=0.05) for ii in range(nobj)
+        ]
+        for pot, mopots in [
+            (
+                ManyMovingObjectsPotential(os, pot=objpots[0]),
+                [MovingObjectPotential(os[ii], pot=objpots[0]) for ii in range(nobj)],
+            ),
+            (
+                ManyMovingObjectsPotential(os, pot=objpots, rcut=0.5),
+                None,
+            ),
+        ]:
+            oc = Orbit(vxvv[:2] + [1.1] + vxvv[3:])
+            op = oc()
+            oc.integrate(times, MWPotential2014 + [pot], method="dop853_c")
+            op.integrate(times, MWPotential2014 + [pot], method="dop853")
+            for attr in ["x", "y", "vx", "vy"]:
+                assert numpy.all(
+                    numpy.fabs(getattr(oc, attr)(times) - getattr(op, attr)(times))
+                    < 10.0**-4.0
+                ), (
+                    "Orbits integrated in a ManyMovingObjectsPotential in C and Python do not agree"
+                )
+            if mopots is None:
+                continue
+            om = oc()
+            om.integrate(times, MWPotential2014 + mopots, method="dop853_c")
+            for attr in ["x", "y", "vx", "vy"]:
+                assert numpy.all(
+                    numpy.fabs(getattr(oc, attr)(times) - getattr(om, attr)(times))
+                    < 10.0**-8.0
+                ), (
+                    "Orbits integrated in a ManyMovingObjectsPotential and the equivalent MovingObjectPotentials do not agree"
+                )
+    return None
+
+
+def test_TimeInterpolatedPotential_orbit():
+    # Test that orbits integrated in a TimeInterpolatedPotential by C and
+    # Python are the same
+    from galpy.orbit import Orbit
+    from galpy.potential import (
+        LogarithmicHaloPotential,
+        MiyamotoNagaiPotential,
+        MultipolePotential,
+        TimeInterpolatedPotential,
+    )
+
+    times = numpy.linspace(0.0, 6.0, 201)
+    for snaps in [
+        [
+            [
+                MiyamotoNagaiPotential(normalize=0.5, a=0.5 + 0.1 * ii, b=0.3),
+                LogarithmicHaloPotential(normalize=0.5, b=0.9 - 0.05 * ii),
+            ]
+            for ii in range(4)
+        ],
+        [
+            MultipolePotential(
+                dens=MiyamotoNagaiPotential(normalize=1.0, a=0.5 + 0.2 * ii, b=0.3),
+                symmetry="axisymmetry",
+                rgrid=numpy.geomspace(0.01, 20.0, 101),
+            )
+            for ii in range(3)
+        ],
+    ]:
+        tp = TimeInterpolatedPotential(snaps, t=numpy.linspace(0.0, 5.0, len(snaps)))
+        for vxvv in [[1.0, 0.1, 1.1, 0.1, 0.1, 0.0], [1.0, 0.1, 1.1, 0.0]]:
+            oc = Orbit(vxvv)
+            op = oc()
+            oc.integrate(times, tp, method="dop853_c")
+            op.integrate(times, tp, method="dop853")
+            for attr in ["x", "y", "vx", "vy"]:
+                assert numpy.all(
+                    numpy.fabs(getattr(oc, attr)(times) - getattr(op, attr)(times))
+                    < 10.0**-6.0
+                ), (
+                    "Orbits integrated in a TimeInterpolatedPotential in C and Python do not agree"
+                )
+    return None
+
+
 # Test that all integrators can start from a negative time
 def test_integrate_negative_time():
     from galpy.orbit import Orbit
@@ -9631,6 +9822,8 @@ def test_integrate_negative_time():
         "rk6_c",
         "symplec4_c",
         "symplec6_c",
+        "symplec4fg_c",
+        "ttleapfrog_c",
         "dopr54_c",
         "dop853_c",
         "ias15_c",
@@ -9672,6 +9865,8 @@ def test_integrate_backwards():
         "rk6_c",
         "symplec4_c",
         "symplec6_c",
+        "symplec4fg_c",
+        "ttleapfrog_c",
         "dopr54_c",
         "dop853_c",
         "ias15_c",
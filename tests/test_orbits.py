@@ -3440,6 +3440,179 @@ def test_check_integrate_dt():
     return None
 
 
+# Test that the integration diagnostics are recorded
+def test_integration_diagnostics():
+    from galpy.orbit import Orbit
+    from galpy.potential import LogarithmicHaloPotential
+
+    lp = LogarithmicHaloPotential(normalize=1.0, q=0.9)
+    times = numpy.linspace(0.0, 10.0, 251)
+    for vxvv in [
+        [[1.0, 0.1, 1.2, 0.3, 0.2, 2.0], [0.2, 0.1, 0.1, 0.3, 0.0, 1.0]],
+        [[1.0, 0.1, 1.2, 2.0], [0.2, 0.1, 0.1, 1.0]],
+        [[1.0, 0.1], [0.2, 0.3]],
+    ]:
+        o = Orbit(vxvv)
+        tpot = lp if o.dim() > 1 else lp.toVertical(1.0)
+        for method in ["dop853_c", "dopr54_c", "ias15_c", "symplec4_c"]:
+            o.integrate(times, tpot, method=method, diagnostics=True)
+            diag = o.integration_diagnostics()
+            for key in ["naccept", "nreject", "nfev", "hmin", "dEE"]:
+                assert diag[key].shape == o.shape, (
+                    "Integration diagnostics do not have the shape of the Orbit"
+                )
+            assert numpy.all(diag["naccept"] > 0), (
+                "Integration diagnostics report no accepted steps"
+            )
+            assert numpy.all(diag["nfev"] >= diag["naccept"]), (
+                "Integration diagnostics report fewer force evaluations than steps"
+            )
+            assert numpy.all(diag["hmin"] <= times[1] - times[0] + 1e-10), (
+                "Integration diagnostics report a minimum stepsize larger than the output stepsize"
+            )
+            if "symplec" in method:
+                assert numpy.all(diag["nreject"] == 0), (
+                    "Integration diagnostics report rejected steps for a fixed-step integrator"
+                )
+            else:
+                assert numpy.all(numpy.fabs(diag["dEE"]) < 1e-4), (
+                    "Integration diagnostics report a large energy error for a well-integrated orbit"
+                )
+    # The orbit that gets close to the center should be more expensive
+    o = Orbit([[1.0, 0.1, 1.2, 0.3, 0.2, 2.0], [0.2, 0.1, 0.1, 0.3, 0.0, 1.0]])
+    o.integrate(times, lp, method="dop853_c", diagnostics=True)
+    diag = o.integration_diagnostics()
+    assert diag["nfev"][1] > diag["nfev"][0], (
+        "Integration diagnostics do not show that a centrophilic orbit is more expensive"
+    )
+    assert diag["hmin"][1] < diag["hmin"][0], (
+        "Integration diagnostics do not show that a centrophilic orbit requires smaller steps"
+    )
+    # Python integrators only record the energy error
+    from galpy.util import galpyWarning
+
+    with pytest.warns(galpyWarning):
+        o.integrate(times, lp, method="dop853", diagnostics=True)
+    diag = o.integration_diagnostics()
+    assert numpy.all(numpy.isnan(diag["nfev"])), (
+        "Integration diagnostics for Python integrators should not have step counts"
+    )
+    assert numpy.all(numpy.fabs(diag["dEE"]) < 1e-4), (
+        "Integration diagnostics report a large energy error for a well-integrated orbit"
+    )
+    # Diagnostics are removed when re-integrating without them
+    o.integrate(times, lp)
+    with pytest.raises(AttributeError):
+        o.integration_diagnostics()
+    return None
+
+
+def _heterogeneous_ensemble_vxvv(nobj=40):
+    # Mix of tightly-bound bulge orbits and halo orbits
+    numpy.random.seed(1)
+    R = numpy.where(numpy.arange(nobj) % 5 == 4, 0.02, numpy.linspace(0.5, 5.0, nobj))
+    return numpy.array(
+        [
+            R,
+            0.1 * numpy.random.normal(size=nobj),
+            0.7 + 0.1 * numpy.random.normal(size=nobj),
+            0.05 * R,
+            0.1 * numpy.random.normal(size=nobj),
+            numpy.random.uniform(size=nobj) * 2.0 * numpy.pi,
+        ]
+    ).T
+
+
+# Test that integrating a heterogeneous ensemble, which the C integrators
+# re-order by estimated cost, gives the same result as individual orbits
+def test_integration_heterogeneous_ensemble():
+    from galpy.orbit import Orbit
+
+    nobj = 40
+    vxvv = _heterogeneous_ensemble_vxvv(nobj)
+    times = numpy.linspace(0.0, 10.0, 101)
+    for vxvv_dim, pot in zip(
+        [vxvv, vxvv[:, [0, 1, 2, 5]], vxvv[:, [3, 4]]],
+        [
+            potential.MWPotential2014,
+            potential.MWPotential2014,
+            potential.toVerticalPotential(potential.MWPotential2014, 1.0),
+        ],
+    ):
+        for method in ["dop853_c", "dopr54_c", "ias15_c"]:
+            orbits = Orbit(vxvv_dim)
+            orbits.integrate(times, pot, method=method)
+            for ii in [0, 4, 13, nobj - 1]:
+                o = Orbit(vxvv_dim[ii])
+                o.integrate(times, pot, method=method)
+                assert (
+                    numpy.amax(numpy.fabs(o.getOrbit() - orbits.getOrbit()[ii])) < 1e-10
+                ), (
+                    f"Integration of a heterogeneous ensemble with method {method} does not agree with integrating its orbits individually"
+                )
+    return None
+
+
+# Test that the re-ordering of the orbits by cost, which is only done when
+# integrating with more than one OpenMP thread, returns the orbits in the
+# input order; run in a subprocess to be able to set the number of threads
+def test_integration_heterogeneous_ensemble_multithreaded(tmp_path):
+    import os
+    import subprocess
+    import sys
+
+    import galpy
+    from galpy.orbit import Orbit
+
+    nobj = 40
+    vxvv = _heterogeneous_ensemble_vxvv(nobj)
+    numpy.save(tmp_path / "vxvv.npy", vxvv)
+    scriptpath = "orbitint4omp.py"
+    if not "tests" in os.getcwd():
+        scriptpath = os.path.join("tests", scriptpath)
+    subprocess.run(
+        [
+            sys.executable,
+            scriptpath,
+            str(tmp_path / "vxvv.npy"),
+            str(tmp_path / "out.npz"),
+        ],
+        env=dict(
+            os.environ,
+            OMP_NUM_THREADS="4",
+            PYTHONPATH=os.pathsep.join(
+                [
+                    os.path.dirname(os.path.dirname(galpy.__file__)),
+                    os.environ.get("PYTHONPATH", ""),
+                ]
+            ),
+        ),
+        check=True,
+    )
+    out = numpy.load(tmp_path / "out.npz")
+    times = numpy.linspace(0.0, 10.0, 101)
+    for name, vxvv_dim, pot in zip(
+        ["full", "planar", "linear"],
+        [vxvv, vxvv[:, [0, 1, 2, 5]], vxvv[:, [3, 4]]],
+        [
+            potential.MWPotential2014,
+            potential.MWPotential2014,
+            potential.toVerticalPotential(potential.MWPotential2014, 1.0),
+        ],
+    ):
+        for method in ["dop853_c", "dopr54_c", "ias15_c"]:
+            for ii in range(nobj):
+                o = Orbit(vxvv_dim[ii])
+                o.integrate(times, pot, method=method)
+                assert (
+                    numpy.amax(numpy.fabs(o.getOrbit() - out[f"{name}_{method}"][ii]))
+                    < 1e-10
+                ), (
+                    f"Integration of a heterogeneous ensemble with method {method} and multiple threads does not return the orbits in the input order"
+                )
+    return None
+
+
 # Test that evaluating coordinate functions for integrated orbits works
 def test_coordinate_interpolation():
     from galpy.orbit import Orbit
@@ -6230,6 +6403,193 @@ def _check_energy_jacobi_angmom(os, list_os):
     return None
 
 
+# Test that the energy and Jacobi integral evaluated in C for all times and
+# orbits at once agree with evaluating the potential one point at a time
+def test_energy_jacobi_c():
+    from galpy.orbit import Orbit
+    from galpy.potential import (
+        DehnenSmoothWrapperPotential,
+        MWPotential2014,
+        PotentialError,
+        SoftenedNeedleBarPotential,
+        SolidBodyRotationWrapperPotential,
+        TriaxialNFWPotential,
+        evaluateplanarPotentials,
+        evaluatePotentials,
+        toPlanarPotential,
+    )
+
+    numpy.random.seed(1)
+    nrand = 5
+    Rs = 0.2 * (2.0 * numpy.random.uniform(size=nrand) - 1.0) + 1.0
+    vRs = 0.2 * (2.0 * numpy.random.uniform(size=nrand) - 1.0)
+    vTs = 0.2 * (2.0 * numpy.random.uniform(size=nrand) - 1.0) + 1.0
+    zs = 0.2 * (2.0 * numpy.random.uniform(size=nrand) - 1.0)
+    vzs = 0.2 * (2.0 * numpy.random.uniform(size=nrand) - 1.0)
+    phis = 2.0 * numpy.pi * (2.0 * numpy.random.uniform(size=nrand) - 1.0)
+    times = numpy.linspace(0.0, 3.0, 31)
+
+    def direct_pot(pot, R, z, phi):
+        return numpy.array(
+            [
+                [
+                    evaluatePotentials(pot, R[ii, jj], z[ii, jj], phi=phi[ii, jj], t=t)
+                    for jj, t in enumerate(times)
+                ]
+                for ii in range(nrand)
+            ]
+        )
+
+    # Potentials: broadcasting, non-broadcasting (TriaxialNFW), time-dependent
+    # and non-axisymmetric through a wrapper, and not implemented in C (SBR)
+    pots = [
+        MWPotential2014,
+        TriaxialNFWPotential(normalize=1.0, b=0.8, c=0.6),
+        MWPotential2014
+        + [
+            DehnenSmoothWrapperPotential(
+                pot=SoftenedNeedleBarPotential(omegab=1.3, amp=0.1),
+                tform=0.5,
+                tsteady=1.0,
+            )
+        ],
+        MWPotential2014
+        + [
+            SolidBodyRotationWrapperPotential(
+                pot=SoftenedNeedleBarPotential(amp=0.1), omega=1.3
+            )
+        ],
+    ]
+    for pot in pots:
+        # 6D and 5D (only for the axisymmetric potential)
+        for os in [
+            Orbit(numpy.array([Rs, vRs, vTs, zs, vzs, phis]).T),
+            Orbit(numpy.array([Rs, vRs, vTs, zs, vzs]).T),
+        ]:
+            if os.phasedim() == 5 and not pot is MWPotential2014:
+                # Non-axisymmetric potentials need phi
+                with pytest.raises(PotentialError):
+                    os.integrate(times, MWPotential2014, method="dop853_c")
+                    os.E(times, pot=pot)
+                continue
+            os.integrate(times, pot, method="dop853_c")
+            if os.phasedim() == 6:
+                phi = os.phi(times)
+            else:
+                phi = numpy.zeros((nrand, len(times)))
+            R, z = os.R(times), os.z(times)
+            Ekin_R = 0.5 * (os.vR(times) ** 2.0 + os.vT(times) ** 2.0)
+            E_direct = direct_pot(pot, R, z, phi) + Ekin_R + 0.5 * os.vz(times) ** 2.0
+            assert numpy.all(numpy.fabs(os.E(times) - E_direct) < 1e-10), (
+                "Energy of integrated orbits does not agree with evaluating the potential directly"
+            )
+            assert numpy.all(numpy.fabs(os.E(times[3]) - E_direct[:, 3]) < 1e-10), (
+                "Energy of integrated orbits does not agree with evaluating the potential directly"
+            )
+            assert numpy.all(
+                numpy.fabs(os.Jacobi(times, OmegaP=0.5) - E_direct + 0.5 * os.Lz(times))
+                < 1e-10
+            ), (
+                "Jacobi integral of integrated orbits does not agree with evaluating the potential directly"
+            )
+            ER_direct = direct_pot(pot, R, numpy.zeros_like(z), phi) + Ekin_R
+            assert numpy.all(numpy.fabs(os.ER(times) - ER_direct) < 1e-10), (
+                "Radial energy of integrated orbits does not agree with evaluating the potential directly"
+            )
+        # 4D
+        os = Orbit(numpy.array([Rs, vRs, vTs, phis]).T)
+        ppot = toPlanarPotential(pot)
+        os.integrate(times, ppot, method="dop853_c")
+        E_direct = numpy.array(
+            [
+                [
+                    evaluateplanarPotentials(ppot, os.R(t)[ii], phi=os.phi(t)[ii], t=t)
+                    for t in times
+                ]
+                for ii in range(nrand)
+            ]
+        ) + 0.5 * (os.vR(times) ** 2.0 + os.vT(times) ** 2.0)
+        assert numpy.all(numpy.fabs(os.E(times) - E_direct) < 1e-10), (
+            "Energy of integrated planar orbits does not agree with evaluating the potential directly"
+        )
+    return None
+
+
+# Test the coupled integration of satellites
+def test_integrate_satellites():
+    from galpy.orbit import Orbit
+    from galpy.potential import (
+        ChandrasekharDynamicalFrictionForce,
+        HernquistPotential,
+        KeplerPotential,
+        MWPotential2014,
+        NullPotential,
+    )
+
+    ts = numpy.linspace(0.0, 20.0, 1001)
+    # Without a host, the total momentum of the satellites is conserved
+    sat_pots = [
+        HernquistPotential(amp=0.2, a=0.1),
+        HernquistPotential(amp=0.02, a=0.05),
+    ]
+    masses = numpy.array([0.1, 0.01])[:, None]
+    os = Orbit([[6.0, -0.1, 0.6, 2.0, 0.2, 0.0], [2.0, 0.3, 0.9, -0.5, 0.1, 2.0]])
+    os.integrate_satellites(ts, NullPotential(), sat_pots)
+    for vel in [os.vx(ts), os.vy(ts), os.vz(ts)]:
+        P = numpy.sum(masses * vel, axis=0)
+        assert numpy.all(numpy.fabs(P - P[0]) < 1e-5), (
+            "Total momentum of satellites not conserved"
+        )
+    # A satellite of mass m on a circular orbit around a point-mass host of
+    # mass M with reflex motion included has v^2 = G(M+m)/r
+    o = Orbit([1.0, 0.0, numpy.sqrt(1.5), 0.0, 0.0, 0.0])
+    o.integrate_satellites(
+        ts, KeplerPotential(amp=1.0), [KeplerPotential(amp=0.5)], reflex=True
+    )
+    assert numpy.all(numpy.fabs(o.r(ts) - 1.0) < 1e-6), (
+        "Satellite orbit with reflex motion not circular at the expected velocity"
+    )
+    # A single satellite without reflex is the same as a regular integration
+    cdf = ChandrasekharDynamicalFrictionForce(GMs=0.05, rhm=0.05, dens=MWPotential2014)
+    o = Orbit([6.0, -0.1, 0.6, 2.0, 0.2, 0.0])
+    o.integrate_satellites(ts, MWPotential2014, [sat_pots[0]], dynfric=[cdf])
+    oc = o()
+    oc.integrate(ts, MWPotential2014 + [cdf], method="dop853_c")
+    for attr in ["x", "y", "z", "vx", "vy", "vz"]:
+        assert numpy.all(
+            numpy.fabs(getattr(o, attr)(ts) - getattr(oc, attr)(ts)) < 1e-8
+        ), "Single-satellite integration does not agree with regular integration"
+    # The satellites' potential, including the reflex motion, can be used to
+    # integrate test particles in C and Python
+    os.integrate_satellites(
+        ts, KeplerPotential(amp=1.0), sat_pots, dynfric=[None, None], reflex=True
+    )
+    spot = os.satellite_potential()
+    assert len(spot) == 3, (
+        "satellite_potential should return one potential per satellite plus the reflex force"
+    )
+    tp = Orbit([1.0, 0.1, 1.0, 0.0, 0.1, 0.0])
+    tts = ts[:101]
+    tp.integrate(tts, [KeplerPotential(amp=1.0)] + spot, method="dop853_c")
+    tpp = tp()
+    tpp.integrate(tts, [KeplerPotential(amp=1.0)] + spot, method="dop853")
+    assert numpy.all(numpy.fabs(tp.x(tts) - tpp.x(tts)) < 1e-4), (
+        "Test-particle integration in the satellite potential does not agree between C and Python"
+    )
+    # Errors
+    with pytest.raises(ValueError):
+        os.integrate_satellites(ts, MWPotential2014, sat_pots[:1])
+    with pytest.raises(ValueError):
+        os.integrate_satellites(ts, MWPotential2014, sat_pots, dynfric=[cdf])
+    with pytest.raises(NotImplementedError):
+        Orbit([1.0, 0.1, 1.0, 0.0, 0.1]).integrate_satellites(
+            ts, MWPotential2014, sat_pots[:1]
+        )
+    with pytest.raises(AttributeError):
+        Orbit([1.0, 0.1, 1.0, 0.0, 0.1, 0.0]).satellite_potential()
+    return None
+
+
 # Test that L cannot be computed for (a) linearOrbits and (b) 5D orbits
 def test_angmom_errors():
     from galpy.orbit import Orbit
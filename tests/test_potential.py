@@ -45,11 +45,15 @@ def test_normalize_potential():
     pots.append("specialFlattenedPowerPotential")
     pots.append("specialMN3ExponentialDiskPotentialPD")
     pots.append("specialMN3ExponentialDiskPotentialSECH")
+    pots.append("mockCompositePotential")
     rmpots = [
         "Potential",
         "MWPotential",
         "MWPotential2014",
         "MovingObjectPotential",
+        "ManyMovingObjectsPotential",
+        "TimeInterpolatedPotential",
+        "CompositePotential",
         "interpRZPotential",
         "linearPotential",
         "planarAxiPotential",
@@ -168,6 +172,8 @@ def test_forceAsDeriv_potential():
     pots.append("mockFlatEllipticalDiskPotential")  # for evaluate w/ nonaxi lists
     pots.append("mockMovingObjectPotential")
     pots.append("mockMovingObjectPotentialExplPlummer")
+    pots.append("mockManyMovingObjectsPotential")
+    pots.append("mockTimeInterpolatedPotential")
     pots.append("oblateHernquistPotential")
     pots.append("oblateNFWPotential")
     pots.append("oblatenoGLNFWPotential")
@@ -217,11 +223,15 @@ def test_forceAsDeriv_potential():
     pots.append("mockKuzminLikeWrapperPotential")
     pots.append("mockOffsetMWP14WrapperPotential")
     pots.append("mockTimeDependentAmplitudeWrapperPotential")
+    pots.append("mockCompositePotential")
     rmpots = [
         "Potential",
         "MWPotential",
         "MWPotential2014",
         "MovingObjectPotential",
+        "ManyMovingObjectsPotential",
+        "TimeInterpolatedPotential",
+        "CompositePotential",
         "interpRZPotential",
         "linearPotential",
         "planarAxiPotential",
@@ -416,6 +426,7 @@ def test_2ndDeriv_potential():
     pots.append("mockSteadyLogSpiralPotentialTm5")
     pots.append("mockTransientLogSpiralPotential")
     pots.append("mockFlatEllipticalDiskPotential")  # for evaluate w/ nonaxi lists
+    pots.append("mockTimeInterpolatedPotential")
     pots.append("oblateHernquistPotential")  # in case these are ever implemented
     pots.append("oblateNFWPotential")
     pots.append("oblatenoGLNFWPotential")
@@ -453,11 +464,15 @@ def test_2ndDeriv_potential():
     pots.append("mockOffsetMWP14WrapperPotential")
     pots.append("mockTimeDependentAmplitudeWrapperPotential")
     pots.append("mockKuzminLikeWrapperPotential")
+    pots.append("mockCompositePotential")
     rmpots = [
         "Potential",
         "MWPotential",
         "MWPotential2014",
         "MovingObjectPotential",
+        "ManyMovingObjectsPotential",
+        "TimeInterpolatedPotential",
+        "CompositePotential",
         "interpRZPotential",
         "linearPotential",
         "planarAxiPotential",
@@ -489,6 +504,7 @@ def test_2ndDeriv_potential():
     tol["AnyAxisymmetricRazorThinDiskPotential"] = -4.5
     tol["mockInterpRZPotential"] = -4.0
     tol["DehnenBarPotential"] = -7.0
+    tol["CylindricalSplinePotential"] = -4.0  # 2nd derivs jump at grid nodes
     for p in pots:
         # if not 'NFW' in p: continue #For testing the test
         # Setup instance of potential
@@ -822,11 +838,15 @@ def test_poisson_potential():
     pots.append("mockOffsetMWP14WrapperPotential")
     pots.append("mockTimeDependentAmplitudeWrapperPotential")
     pots.append("mockKuzminLikeWrapperPotential")
+    pots.append("mockCompositePotential")
     rmpots = [
         "Potential",
         "MWPotential",
         "MWPotential2014",
         "MovingObjectPotential",
+        "ManyMovingObjectsPotential",
+        "TimeInterpolatedPotential",
+        "CompositePotential",
         "interpRZPotential",
         "linearPotential",
         "planarAxiPotential",
@@ -970,11 +990,15 @@ def test_poisson_surfdens_potential():
     pots.append("mockRotatedTiltedOffsetMWP14WrapperPotential")
     pots.append("mockOffsetMWP14WrapperPotential")
     pots.append("mockKuzminLikeWrapperPotential")
+    pots.append("mockCompositePotential")
     rmpots = [
         "Potential",
         "MWPotential",
         "MWPotential2014",
         "MovingObjectPotential",
+        "ManyMovingObjectsPotential",
+        "TimeInterpolatedPotential",
+        "CompositePotential",
         "interpRZPotential",
         "linearPotential",
         "planarAxiPotential",
@@ -1150,11 +1174,15 @@ def test_evaluateAndDerivs_potential():
     pots.append("mockOffsetMWP14WrapperPotential")
     pots.append("mockTimeDependentAmplitudeWrapperPotential")
     pots.append("mockKuzminLikeWrapperPotential")
+    pots.append("mockCompositePotential")
     rmpots = [
         "Potential",
         "MWPotential",
         "MWPotential2014",
         "MovingObjectPotential",
+        "ManyMovingObjectsPotential",
+        "TimeInterpolatedPotential",
+        "CompositePotential",
         "interpRZPotential",
         "linearPotential",
         "planarAxiPotential",
@@ -1377,6 +1405,7 @@ def test_amp_mult_divide():
     pots.append("mockFlatEllipticalDiskPotential")  # for evaluate w/ nonaxi lists
     pots.append("mockMovingObjectPotential")
     pots.append("mockMovingObjectPotentialExplPlummer")
+    pots.append("mockManyMovingObjectsPotential")
     pots.append("oblateHernquistPotential")
     pots.append("oblateNFWPotential")
     pots.append("oblatenoGLNFWPotential")
@@ -1425,11 +1454,15 @@ def test_amp_mult_divide():
     pots.append("mockRotatedTiltedOffsetMWP14WrapperPotential")
     pots.append("mockOffsetMWP14WrapperPotential")
     pots.append("mockKuzminLikeWrapperPotential")
+    pots.append("mockCompositePotential")
     rmpots = [
         "Potential",
         "MWPotential",
         "MWPotential2014",
         "MovingObjectPotential",
+        "ManyMovingObjectsPotential",
+        "TimeInterpolatedPotential",
+        "CompositePotential",
         "interpRZPotential",
         "linearPotential",
         "planarAxiPotential",
@@ -1516,6 +1549,7 @@ def test_potential_array_input():
     pots.append("mockInterpSphericalPotentialwForce")
     pots.append("mockAdiabaticContractionMWP14WrapperPotential")
     pots.append("mockAdiabaticContractionMWP14ExplicitfbarWrapperPotential")
+    pots.append("mockCompositePotential")
     rmpots = [
         "Potential",
         "MWPotential",
@@ -1547,6 +1581,9 @@ def test_potential_array_input():
     rmpots.append("PowerTriaxialPotential")
     # These cannot be setup without arguments
     rmpots.append("MovingObjectPotential")
+    rmpots.append("ManyMovingObjectsPotential")
+    rmpots.append("TimeInterpolatedPotential")
+    rmpots.append("CompositePotential")
     rmpots.append("SnapshotRZPotential")
     rmpots.append("InterpSnapshotRZPotential")
     # 2D ones that cannot use this test
@@ -1702,6 +1739,7 @@ def test_toVertical_array():
     ]
     pots.append("mockInterpSphericalPotential")
     pots.append("mockInterpSphericalPotentialwForce")
+    pots.append("mockCompositePotential")
     rmpots = [
         "Potential",
         "MWPotential",
@@ -1733,6 +1771,9 @@ def test_toVertical_array():
     rmpots.append("PowerTriaxialPotential")
     # These cannot be setup without arguments
     rmpots.append("MovingObjectPotential")
+    rmpots.append("ManyMovingObjectsPotential")
+    rmpots.append("TimeInterpolatedPotential")
+    rmpots.append("CompositePotential")
     rmpots.append("SnapshotRZPotential")
     rmpots.append("InterpSnapshotRZPotential")
     for p in rmpots:
@@ -1854,11 +1895,15 @@ def test_potential_at_zero():
     pots.append("mockRotatedTiltedOffsetMWP14WrapperPotential")
     pots.append("mockOffsetMWP14WrapperPotential")
     pots.append("mockKuzminLikeWrapperPotential")
+    pots.append("mockCompositePotential")
     rmpots = [
         "Potential",
         "MWPotential",
         "MWPotential2014",
         "MovingObjectPotential",
+        "ManyMovingObjectsPotential",
+        "TimeInterpolatedPotential",
+        "CompositePotential",
         "interpRZPotential",
         "linearPotential",
         "planarAxiPotential",
@@ -2006,11 +2051,15 @@ def test_potential_at_infinity():
     pots.append("mockRotatedTiltedOffsetMWP14WrapperPotential")
     pots.append("mockOffsetMWP14WrapperPotential")
     pots.append("mockKuzminLikeWrapperPotential")
+    pots.append("mockCompositePotential")
     rmpots = [
         "Potential",
         "MWPotential",
         "MWPotential2014",
         "MovingObjectPotential",
+        "ManyMovingObjectsPotential",
+        "TimeInterpolatedPotential",
+        "CompositePotential",
         "interpRZPotential",
         "linearPotential",
         "planarAxiPotential",
@@ -2844,11 +2893,15 @@ def test_toVertical_toPlanar():
     ]
     pots.append("mockInterpSphericalPotential")
     pots.append("mockInterpSphericalPotentialwForce")
+    pots.append("mockCompositePotential")
     rmpots = [
         "Potential",
         "MWPotential",
         "MWPotential2014",
         "MovingObjectPotential",
+        "ManyMovingObjectsPotential",
+        "TimeInterpolatedPotential",
+        "CompositePotential",
         "interpRZPotential",
         "linearPotential",
         "planarAxiPotential",
@@ -3451,6 +3504,90 @@ def test_LcE_powervc():
     return None
 
 
+def test_rootfinders_array():
+    # Test that the vectorized root finders for array input agree with
+    # the scalar ones
+    from galpy.potential import MWPotential2014
+
+    lzs = numpy.linspace(0.01, 3.0, 21).reshape((3, 7))
+    rls = potential.rl(MWPotential2014, lzs)
+    assert rls.shape == lzs.shape, "rl for array input returns the wrong shape"
+    assert numpy.all(
+        numpy.fabs(
+            rls
+            - numpy.array(
+                [potential.rl(MWPotential2014, lz) for lz in lzs.flatten()]
+            ).reshape(lzs.shape)
+        )
+        < 1e-10
+    ), "rl for array input does not agree with scalar input"
+    Es = numpy.linspace(-1.8, -0.3, 21)
+    assert numpy.all(
+        numpy.fabs(
+            potential.rE(MWPotential2014, Es)
+            - numpy.array([potential.rE(MWPotential2014, E) for E in Es])
+        )
+        < 1e-10
+    ), "rE for array input does not agree with scalar input"
+    assert numpy.all(
+        numpy.fabs(
+            potential.LcE(MWPotential2014, Es)
+            - numpy.array([potential.LcE(MWPotential2014, E) for E in Es])
+        )
+        < 1e-10
+    ), "LcE for array input does not agree with scalar input"
+    # lindbladR, including non-existent resonances, which are NaN
+    mp = potential.MiyamotoNagaiPotential(normalize=1.0, a=0.3)
+    OmegaPs = numpy.linspace(0.3, 6.0, 11)
+    for m in [2, -2, "corotation"]:
+        lrs = mp.lindbladR(OmegaPs, m)
+        for OmegaP, lr in zip(OmegaPs, lrs):
+            slr = mp.lindbladR(OmegaP, m)
+            if slr is None:
+                assert numpy.isnan(lr), (
+                    "lindbladR for array input does not return NaN for non-existing resonance"
+                )
+            else:
+                assert numpy.fabs(lr - slr) < 1e-10, (
+                    "lindbladR for array input does not agree with scalar input"
+                )
+    # zvc and zvc_range, including undefined ones
+    Rs = numpy.linspace(0.3, 2.0, 21)
+    zvcs = potential.zvc(MWPotential2014, Rs, -1.0, 0.8)
+    szvcs = numpy.array([potential.zvc(MWPotential2014, R, -1.0, 0.8) for R in Rs])
+    assert numpy.all(numpy.isnan(zvcs) == numpy.isnan(szvcs)), (
+        "zvc for array input does not agree with scalar input"
+    )
+    assert numpy.nanmax(numpy.fabs(zvcs - szvcs)) < 1e-10, (
+        "zvc for array input does not agree with scalar input"
+    )
+    Lzs = numpy.linspace(0.1, 1.5, 15)
+    zvcrs = potential.zvc_range(MWPotential2014, -1.0, Lzs)
+    szvcrs = numpy.array(
+        [potential.zvc_range(MWPotential2014, -1.0, Lz) for Lz in Lzs]
+    ).T
+    assert zvcrs.shape == (2, len(Lzs)), (
+        "zvc_range for array input returns the wrong shape"
+    )
+    assert numpy.all(numpy.isnan(zvcrs) == numpy.isnan(szvcrs)), (
+        "zvc_range for array input does not agree with scalar input"
+    )
+    assert numpy.nanmax(numpy.fabs(zvcrs - szvcrs)) < 1e-10, (
+        "zvc_range for array input does not agree with scalar input"
+    )
+    # Potentials that do not support array input fall back on a loop
+    tnp = potential.TriaxialNFWPotential(normalize=1.0, b=1.0, c=0.9)
+    lzs = numpy.array([0.5, 1.0, 1.5])
+    assert numpy.all(
+        numpy.fabs(
+            potential.rl(tnp.toPlanar(), lzs)
+            - numpy.array([potential.rl(tnp.toPlanar(), lz) for lz in lzs])
+        )
+        < 1e-10
+    ), "rl for array input does not agree with scalar input"
+    return None
+
+
 def test_vterm():
     lp = potential.LogarithmicHaloPotential(normalize=1.0)
     assert (
@@ -3912,6 +4049,190 @@ def test_MovingObject_density():
     return None
 
 
+def test_ManyMovingObjectsPotential():
+    from galpy.orbit import Orbit
+
+    # The potential of many moving objects is the sum of the potentials of
+    # the individual moving objects
+    numpy.random.seed(1)
+    nobj = 4
+    os = Orbit(
+        numpy.array([1.0, 0.1, 1.0, 0.1, 0.1, 0.0])
+        + 0.2 * numpy.random.normal(size=(nobj, 6))
+    )
+    times = numpy.linspace(0.0, 2.0, 101)
+    os.integrate(times, potential.MWPotential2014)
+    objpots = [
+        potential.HernquistPotential(amp=0.05 * (ii + 1), a=0.1) for ii in range(nobj)
+    ]
+    Rs = numpy.array([0.5, 1.0, 1.2, 0.8])
+    zs = numpy.array([0.1, -0.2, 0.0, 0.3])
+    phis = numpy.array([0.3, 2.0, -1.0, 4.0])
+    ts = numpy.array([0.1, 0.75, 1.5, 2.5])  # last one beyond the orbits
+    for pot, mopots in [
+        (
+            potential.ManyMovingObjectsPotential(os, pot=objpots[0]),
+            [
+                potential.MovingObjectPotential(os[ii], pot=objpots[0])
+                for ii in range(nobj)
+            ],
+        ),
+        (
+            potential.ManyMovingObjectsPotential(os, pot=objpots),
+            [
+                potential.MovingObjectPotential(os[ii], pot=objpots[ii])
+                for ii in range(nobj)
+            ],
+        ),
+    ]:
+        # Clip the time as the orbits' interpolation would
+        tts = numpy.clip(ts, 0.0, 2.0)
+        for func in [
+            potential.evaluatePotentials,
+            potential.evaluateRforces,
+            potential.evaluatezforces,
+            potential.evaluatephitorques,
+            potential.evaluateDensities,
+        ]:
+            assert numpy.all(
+                numpy.fabs(
+                    func(pot, Rs, zs, phi=phis, t=ts)
+                    - func(mopots, Rs, zs, phi=phis, t=tts)
+                )
+                < 10.0**-8.0
+            ), (
+                f"ManyMovingObjectsPotential does not agree with the sum of MovingObjectPotentials for {func.__name__}"
+            )
+        # Scalar input
+        assert (
+            numpy.fabs(
+                pot.Rforce(1.0, 0.1, phi=0.2, t=0.5)
+                - potential.evaluateRforces(mopots, 1.0, 0.1, phi=0.2, t=0.5)
+            )
+            < 10.0**-8.0
+        ), (
+            "ManyMovingObjectsPotential does not agree with the sum of MovingObjectPotentials for scalar input"
+        )
+    # Objects beyond rcut are ignored
+    rcut = 0.3
+    pot = potential.ManyMovingObjectsPotential(os, pot=objpots, rcut=rcut)
+    R, z, phi, t = 1.0, 0.1, 0.2, 0.5
+    indx = (os.x(t) - R * numpy.cos(phi)) ** 2.0 + (
+        os.y(t) - R * numpy.sin(phi)
+    ) ** 2.0 + (os.z(t) - z) ** 2.0 < rcut**2.0
+    assert 0 < numpy.sum(indx) < nobj, (
+        "Test of rcut in ManyMovingObjectsPotential should have objects both within and beyond rcut"
+    )
+    for func in [potential.evaluateRforces, potential.evaluateDensities]:
+        assert (
+            numpy.fabs(
+                func(pot, R, z, phi=phi, t=t)
+                - func(
+                    [
+                        potential.MovingObjectPotential(os[ii], pot=objpots[ii])
+                        for ii in numpy.arange(nobj)[indx]
+                    ],
+                    R,
+                    z,
+                    phi=phi,
+                    t=t,
+                )
+            )
+            < 10.0**-8.0
+        ), (
+            f"ManyMovingObjectsPotential with rcut does not correctly cull objects for {func.__name__}"
+        )
+    # Errors
+    with pytest.raises(ValueError):
+        potential.ManyMovingObjectsPotential(os, pot=objpots[:2])
+    with pytest.raises(NotImplementedError):
+        potential.ManyMovingObjectsPotential(
+            os, pot=potential.TriaxialNFWPotential(amp=0.1, b=0.8)
+        )
+    with pytest.raises(AttributeError):
+        potential.ManyMovingObjectsPotential(Orbit([1.0, 0.1, 1.0, 0.0, 0.1, 0.0]))
+    return None
+
+
+def test_TimeInterpolatedPotential(tmp_path):
+    import pickle
+
+    # The potential and its derivatives are linearly interpolated in time
+    # between the snapshots and held fixed outside of their time range
+    snaps = [
+        potential.MiyamotoNagaiPotential(amp=1.0, a=0.5 + 0.1 * ii, b=0.3)
+        for ii in range(5)
+    ]
+    ts = numpy.array([0.0, 1.0, 2.5, 3.0, 5.0])
+    tp = potential.TimeInterpolatedPotential(snaps, t=ts)
+    R, z, phi = 0.9, 0.2, 0.3
+    times = numpy.array([-1.0, 0.0, 0.5, 2.7, 4.0, 6.0])
+    for t in times:
+        k = numpy.clip(numpy.searchsorted(ts, t, side="right") - 1, 0, len(ts) - 2)
+        w = numpy.clip((t - ts[k]) / (ts[k + 1] - ts[k]), 0.0, 1.0)
+        for func in [
+            potential.evaluatePotentials,
+            potential.evaluateRforces,
+            potential.evaluatezforces,
+            potential.evaluateDensities,
+            potential.evaluateR2derivs,
+            potential.evaluatez2derivs,
+            potential.evaluateRzderivs,
+        ]:
+            assert (
+                numpy.fabs(
+                    func(tp, R, z, phi=phi, t=t)
+                    - (1.0 - w) * func(snaps[k], R, z, phi=phi, t=t)
+                    - w * func(snaps[k + 1], R, z, phi=phi, t=t)
+                )
+                < 10.0**-10.0
+            ), (
+                f"TimeInterpolatedPotential does not linearly interpolate {func.__name__} in time"
+            )
+    # Array input, including arrays of times
+    Rs = R * numpy.ones_like(times)
+    for func in [potential.evaluateRforces, potential.evaluateDensities]:
+        assert numpy.all(
+            numpy.fabs(
+                func(tp, Rs, z, phi=phi, t=times)
+                - numpy.array([func(tp, R, z, phi=phi, t=t) for t in times])
+            )
+            < 10.0**-10.0
+        ), (
+            f"TimeInterpolatedPotential evaluated for an array of times does not agree with evaluating each time separately for {func.__name__}"
+        )
+    # Snapshots stored in files are loaded lazily
+    files = []
+    for ii, snap in enumerate(snaps):
+        files.append(str(tmp_path / f"snap{ii}.pkl"))
+        with open(files[-1], "wb") as savefile:
+            pickle.dump(snap, savefile)
+    tpl = potential.TimeInterpolatedPotential(files, t=ts, max_loaded=2)
+    assert list(tpl._loaded) == [0], (
+        "TimeInterpolatedPotential should only load the first snapshot upon initialization"
+    )
+    assert numpy.all(
+        numpy.fabs(tpl.Rforce(Rs, z, t=times) - tp.Rforce(Rs, z, t=times)) < 10.0**-10.0
+    ), "TimeInterpolatedPotential with snapshots loaded from files does not agree"
+    assert len(tpl._loaded) == 2, (
+        "TimeInterpolatedPotential keeps more snapshots in memory than max_loaded"
+    )
+    # Errors
+    with pytest.raises(ValueError):
+        potential.TimeInterpolatedPotential(snaps[:1])
+    with pytest.raises(ValueError):
+        potential.TimeInterpolatedPotential(snaps, t=ts[:-1])
+    with pytest.raises(ValueError):
+        potential.TimeInterpolatedPotential(snaps, t=ts[::-1])
+    with pytest.raises(ValueError):
+        potential.TimeInterpolatedPotential(snaps, t=ts, max_loaded=1)
+    with pytest.raises(ValueError):
+        potential.TimeInterpolatedPotential(
+            [snaps[0], potential.LogarithmicHaloPotential(b=0.8)]
+        )
+    return None
+
+
 # test specialSelf for TwoPowerSphericalPotential
 def test_TwoPowerSphericalPotentialSpecialSelf():
     # TODO replace manual additions with an automatic method
@@ -6252,6 +6573,100 @@ def test_AdiabaticContractionWrapper():
     return None
 
 
+def test_AdiabaticContractionWrapper_solver(tmp_path):
+    # Test the enclosed-mass tables, convergence diagnostics, and warm starting
+    from galpy.potential.AdiabaticContractionWrapperPotential import (
+        _MASS_TABLES,
+        _enclosed_mass,
+    )
+
+    # Enclosed masses agree with those from mass (which is only accurate to
+    # ~1e-8 for the disk), for spherical and disk potentials, and are cached
+    rs = numpy.geomspace(0.01, 50.0, 31)
+    for pot in [potential.MWPotential2014[2], potential.MWPotential2014[:2]]:
+        assert numpy.all(
+            numpy.fabs(
+                _enclosed_mass(pot, rs)
+                / numpy.array([potential.mass(pot, r, use_physical=False) for r in rs])
+                - 1.0
+            )
+            < 1e-7
+        ), "Vectorized enclosed mass does not agree with mass"
+        mass_table = _MASS_TABLES[list(_MASS_TABLES.keys())[-1]]
+        cached_mass = _enclosed_mass(pot, rs)
+        assert numpy.all(cached_mass == mass_table), "Enclosed-mass table is not cached"
+        # Modifying the output does not change the cached table
+        cached_mass[0] = -1.0
+        assert numpy.all(_enclosed_mass(pot, rs) == mass_table) and not numpy.any(
+            mass_table == -1.0
+        ), "Modifying the output of _enclosed_mass changes the cached table"
+    rs = numpy.geomspace(0.05, 40.0, 11)
+    for method in ["cautun", "blumenthal", "gnedin"]:
+        dm = AdiabaticContractionWrapperPotential(
+            pot=potential.NFWPotential(amp=4.0, a=2.0),
+            baryonpot=potential.MWPotential2014[:2],
+            method=method,
+        )
+        assert dm.contraction_info["converged"], (
+            "Adiabatic contraction does not report convergence"
+        )
+        assert dm.contraction_info["relerr"] < 1e-8, (
+            "Adiabatic contraction reports convergence to a too-large relative change"
+        )
+        # Warm start from a neighboring model gives the same solution in
+        # fewer iterations
+        dm2 = AdiabaticContractionWrapperPotential(
+            pot=potential.NFWPotential(amp=4.1, a=2.0),
+            baryonpot=potential.MWPotential2014[:2],
+            method=method,
+        )
+        dm2_warm = AdiabaticContractionWrapperPotential(
+            pot=potential.NFWPotential(amp=4.1, a=2.0),
+            baryonpot=potential.MWPotential2014[:2],
+            method=method,
+            warm_start=dm,
+        )
+        assert numpy.all(numpy.fabs(dm2_warm.mass(rs) / dm2.mass(rs) - 1.0) < 1e-8), (
+            "Warm-started adiabatic contraction gives a different solution"
+        )
+        assert dm2_warm.contraction_info["niter"] < dm2.contraction_info["niter"], (
+            "Warm-started adiabatic contraction does not require fewer iterations"
+        )
+    # Warm starting from a different method is not allowed
+    with pytest.raises(ValueError) as excinfo:
+        AdiabaticContractionWrapperPotential(
+            pot=potential.NFWPotential(amp=4.1, a=2.0),
+            baryonpot=potential.MWPotential2014[:2],
+            method="cautun",
+            warm_start=dm,
+        )
+    # With the on-disk cache, a warm-started solution reports its own
+    # diagnostics rather than those of a cached cold start
+    from galpy.util import config
+
+    config.set_cache_directory(str(tmp_path))
+    try:
+        kwargs = dict(
+            pot=potential.NFWPotential(amp=4.1, a=2.0),
+            baryonpot=potential.MWPotential2014[:2],
+            method=method,
+        )
+        dm2 = AdiabaticContractionWrapperPotential(**kwargs)
+        dm2_warm = AdiabaticContractionWrapperPotential(warm_start=dm, **kwargs)
+        assert dm2_warm.contraction_info["niter"] < dm2.contraction_info["niter"], (
+            "Warm-started adiabatic contraction loaded from the on-disk cache reports the diagnostics of the cold start"
+        )
+        assert (
+            AdiabaticContractionWrapperPotential(**kwargs).contraction_info
+            == dm2.contraction_info
+        ), (
+            "Adiabatic contraction loaded from the on-disk cache does not report the same diagnostics"
+        )
+    finally:
+        config.set_cache_directory(None)
+    return None
+
+
 def test_RotateAndTiltWrapper():
     # some tests of the rotate and tilt wrapper
     zvec = numpy.array([numpy.sqrt(1 / 3.0), numpy.sqrt(1 / 3.0), numpy.sqrt(1 / 3.0)])
@@ -6914,6 +7329,69 @@ def test_rhalf():
     return None
 
 
+def test_mass_cache():
+    # Test that the cached mass and surface-density tables agree with the
+    # direct calculation
+    import pickle
+
+    mp = potential.MiyamotoNagaiPotential(normalize=1.0, a=0.5, b=0.05)
+    Rs = numpy.array([0.05, 0.3, 1.0, 3.0, 20.0, 200.0])
+    direct_mass = numpy.array([mp.mass(R) for R in Rs])
+    direct_surfdens = numpy.array([mp.surfdens(R, 0.1) for R in Rs])
+    direct_tdyn = mp.tdyn(1.3)
+    mp.turn_mass_cache_on(rmin=0.01, rmax=100.0, rtol=1e-6)
+    # Array input, including values outside of the table
+    assert numpy.all(numpy.fabs(mp.mass(Rs) / direct_mass - 1.0) < 1e-5), (
+        "Cached mass does not agree with direct calculation"
+    )
+    assert numpy.fabs(mp.mass(Rs[2]) / direct_mass[2] - 1.0) < 1e-5, (
+        "Cached mass does not agree with direct calculation"
+    )
+    assert numpy.fabs(mp.tdyn(1.3) / direct_tdyn - 1.0) < 1e-5, (
+        "tdyn with cached mass does not agree with direct calculation"
+    )
+    assert numpy.all(
+        numpy.fabs(
+            numpy.array([mp.surfdens(R, 0.1) for R in Rs]) / direct_surfdens - 1.0
+        )
+        < 1e-5
+    ), "Cached surface density does not agree with direct calculation"
+    # Tables are rebuilt when the parameters change
+    mp._amp *= 2.0
+    assert numpy.fabs(mp.mass(Rs[2]) / direct_mass[2] - 2.0) < 1e-5, (
+        "Cached mass is not updated when the potential's parameters change"
+    )
+    mp._amp /= 2.0
+    # Also when array parameters are replaced
+    sp = potential.SCFPotential(Acos=numpy.array([[[1.0]]]), a=2.0)
+    direct_spsurfdens = sp.surfdens(1.3, 0.2)
+    sp.turn_mass_cache_on(rmin=0.1, rmax=10.0, rtol=1e-4)
+    assert numpy.fabs(sp.surfdens(1.3, 0.2) / direct_spsurfdens - 1.0) < 1e-4, (
+        "Cached surface density does not agree with direct calculation"
+    )
+    sp._Acos = 2.0 * sp._Acos
+    assert numpy.fabs(sp.surfdens(1.3, 0.2) / direct_spsurfdens - 2.0) < 1e-4, (
+        "Cached surface density is not updated when the potential's array parameters change"
+    )
+    # Pickling drops the tables
+    assert (
+        numpy.fabs(pickle.loads(pickle.dumps(mp)).mass(Rs[2]) / direct_mass[2] - 1.0)
+        < 1e-5
+    ), "Cached mass does not agree with direct calculation after pickling"
+    mp.turn_mass_cache_off()
+    assert mp.mass(Rs[2]) == direct_mass[2], (
+        "Mass after turning off the cache does not agree with the direct calculation"
+    )
+    # Half-mass radius from the inverse mass table, Hernquist, r12= (1+sqrt(2))a
+    a = numpy.pi
+    hp = potential.HernquistPotential(amp=1.0, a=a)
+    hp.turn_mass_cache_on()
+    assert numpy.fabs(hp.rhalf() / ((1.0 + numpy.sqrt(2.0)) * a) - 1.0) < 1e-5, (
+        "Half-mass radius of the Hernquist potential from the cached mass incorrect"
+    )
+    return None
+
+
 def test_tdyn():
     # Spherical: tdyn = 2piR/vc
     a = numpy.pi
@@ -7901,6 +8379,787 @@ def test_dehnen_bar_python_c_consistency():
     )
 
 
+# Test that evaluating potentials, forces, and densities with backend='c'
+# agrees with the Python implementation, including fallback for quantities
+# and potentials without a C implementation
+def test_evaluate_backend_c():
+    pots = [
+        potential.MWPotential2014,
+        potential.TriaxialNFWPotential(amp=1.0, a=2.0, b=0.8, c=0.6),
+        potential.DehnenSmoothWrapperPotential(
+            pot=potential.SoftenedNeedleBarPotential(amp=0.1, omegab=1.0),
+            tform=-1.0,
+            tsteady=2.0,
+        ),
+        potential.SpiralArmsPotential(),
+        [potential.DehnenBarPotential(), potential.HernquistPotential()],
+        # No C implementation
+        [
+            potential.HernquistPotential(),
+            potential.TwoPowerSphericalPotential(amp=0.1, a=1.5, alpha=1.5, beta=3.5),
+        ],
+    ]
+    funcs = [
+        potential.evaluatePotentials,
+        potential.evaluateRforces,
+        potential.evaluatezforces,
+        potential.evaluatephitorques,
+        potential.evaluateDensities,
+    ]
+    numpy.random.seed(2)
+    Rs = numpy.random.uniform(0.2, 2.0, size=(3, 4))
+    zs = numpy.random.uniform(-1.0, 1.0, size=(3, 4))
+    phis = numpy.random.uniform(0.0, 2.0 * numpy.pi, size=(3, 4))
+    ts = numpy.random.uniform(0.0, 3.0, size=(3, 4))
+    for pot in pots:
+        for func in funcs:
+            try:
+                func(pot, 1.0, 0.1, phi=0.1, t=0.1)
+            except potential.PotentialError:  # not implemented in Python either
+                continue
+            cout = func(pot, Rs, zs, phi=phis, t=ts, backend="c")
+            assert cout.shape == Rs.shape, (
+                "Output of evaluating with backend='c' does not have the shape of the input"
+            )
+            pyout = numpy.array(
+                [
+                    [
+                        func(
+                            pot, Rs[ii, jj], zs[ii, jj], phi=phis[ii, jj], t=ts[ii, jj]
+                        )
+                        for jj in range(Rs.shape[1])
+                    ]
+                    for ii in range(Rs.shape[0])
+                ]
+            )
+            # DehnenBar's density is computed numerically in Python
+            assert numpy.all(
+                numpy.fabs(cout - pyout) < 1e-6 * numpy.fabs(pyout) + 1e-10
+            ), f"Evaluating {func.__name__} with backend='c' does not agree with Python"
+    # Scalar input and broadcasting
+    assert (
+        numpy.fabs(
+            potential.evaluateRforces(potential.MWPotential2014, 1.0, 0.1, backend="c")
+            - potential.evaluateRforces(potential.MWPotential2014, 1.0, 0.1)
+        )
+        < 1e-10
+    ), "Evaluating a scalar with backend='c' does not agree with Python"
+    assert numpy.all(
+        numpy.fabs(
+            potential.evaluatezforces(
+                potential.MWPotential2014, Rs, 0.1, phi=0.0, backend="c"
+            )
+            - potential.evaluatezforces(potential.MWPotential2014, Rs, 0.1)
+        )
+        < 1e-10
+    ), "Broadcasting with backend='c' does not agree with Python"
+    # Unknown backend
+    with pytest.raises(ValueError):
+        potential.evaluatePotentials(
+            potential.MWPotential2014, 1.0, 0.1, backend="fortran"
+        )
+    # Second derivatives are not implemented in C
+    for func in [
+        potential.evaluateR2derivs,
+        potential.evaluatephi2derivs,
+        potential.evaluateRphiderivs,
+    ]:
+        with pytest.raises(ValueError):
+            func(potential.MWPotential2014, 1.0, 0.1, phi=0.0, backend="c")
+    return None
+
+
+# Test that the raw interface agrees with the regular methods
+def test_raw_potential():
+    pots = [
+        potential.HernquistPotential(normalize=1.0),
+        potential.TriaxialNFWPotential(normalize=1.0, b=0.8, c=0.6),
+        potential.DehnenSmoothWrapperPotential(
+            pot=potential.DehnenBarPotential(), tform=-1.0, tsteady=2.0
+        ),
+        potential.MiyamotoNagaiPotential(normalize=1.0, ro=8.0, vo=220.0),
+    ]
+    methods = [
+        "__call__",
+        "Rforce",
+        "zforce",
+        "phitorque",
+        "dens",
+        "R2deriv",
+        "z2deriv",
+        "Rzderiv",
+        "phi2deriv",
+        "Rphideriv",
+        "phizderiv",
+        "rforce",
+        "r2deriv",
+    ]
+    R, z, phi, t = 0.9, 0.2, 0.3, 0.5
+    for pot in pots:
+        for method in methods:
+            try:
+                expected = getattr(pot, method)(R, z, phi=phi, t=t, use_physical=False)
+            except potential.PotentialError:
+                continue
+            assert (
+                numpy.fabs(getattr(pot.raw, method)(R, z, phi=phi, t=t) - expected)
+                < 1e-10
+            ), f"Raw {method} does not agree with the regular method"
+    return None
+
+
+# Test that a CompositePotential acts like the list of its components
+def test_CompositePotential():
+    from galpy.orbit import Orbit
+
+    pots = [
+        potential.MWPotential2014,
+        potential.MWPotential2014
+        + [
+            potential.DehnenSmoothWrapperPotential(
+                pot=potential.DehnenBarPotential(), tform=-1.0, tsteady=2.0
+            )
+        ],
+    ]
+    funcs = [
+        potential.evaluatePotentials,
+        potential.evaluateRforces,
+        potential.evaluatezforces,
+        potential.evaluatephitorques,
+        potential.evaluateDensities,
+        potential.evaluateR2derivs,
+        potential.evaluatez2derivs,
+        potential.evaluateRzderivs,
+    ]
+    R, z, phi, t = 0.9, 0.2, 0.3, 0.5
+    for pot in pots:
+        cp = potential.CompositePotential(pot)
+        assert cp.isNonAxi == potential._isNonAxi(pot), (
+            "CompositePotential does not inherit non-axisymmetry"
+        )
+        for func in funcs:
+            assert (
+                numpy.fabs(func(cp, R, z, phi=phi, t=t) - func(pot, R, z, phi=phi, t=t))
+                < 1e-10
+            ), f"CompositePotential {func.__name__} does not agree with the list"
+        # Amplitude scaling
+        assert (
+            numpy.fabs(
+                (2.0 * cp).Rforce(R, z, phi=phi, t=t)
+                - 2.0 * potential.evaluateRforces(pot, R, z, phi=phi, t=t)
+            )
+            < 1e-10
+        ), "Multiplying a CompositePotential does not scale it"
+    # Orbit integration in C in 3D, 2D, and 1D, also for a scaled potential
+    ts = numpy.linspace(0.0, 10.0, 1001)
+    cp = potential.CompositePotential(potential.MWPotential2014)
+    for vxvv, tpot, tcp in [
+        ([1.0, 0.1, 1.1, 0.1, 0.2, 0.0], potential.MWPotential2014, cp),
+        (
+            [1.0, 0.1, 1.1, 0.1, 0.2, 0.0],
+            [2.0 * p for p in potential.MWPotential2014],
+            2.0 * cp,
+        ),
+        ([1.0, 0.1, 1.1, 0.0], potential.MWPotential2014, cp),
+        (
+            [0.1, 0.2],
+            potential.toVerticalPotential(potential.MWPotential2014, 1.0),
+            potential.toVerticalPotential(cp, 1.0),
+        ),
+    ]:
+        o = Orbit(vxvv)
+        o.integrate(ts, tcp)
+        oc = o()
+        oc.integrate(ts, tpot)
+        assert numpy.all(numpy.fabs(o.x(ts) - oc.x(ts)) < 1e-10), (
+            "Orbit integration in a CompositePotential does not agree with the list"
+        )
+    # Dissipative forces are not supported
+    with pytest.raises(NotImplementedError):
+        potential.CompositePotential(
+            potential.MWPotential2014
+            + [
+                potential.ChandrasekharDynamicalFrictionForce(
+                    GMs=0.01, dens=potential.MWPotential2014
+                )
+            ]
+        )
+    return None
+
+
+# Test that the MultipolePotential reproduces the potentials of triaxial and
+# spherical densities and of a set of particles, and agrees between Python and C
+def test_MultipolePotential():
+    from galpy.df import isotropicHernquistdf
+    from galpy.orbit import Orbit
+
+    rgrid = numpy.geomspace(1e-2, 1e2, 61)
+    tnp = potential.TriaxialNFWPotential(amp=1.0, a=2.0, b=0.8, c=0.6)
+    mp = potential.MultipolePotential(dens=tnp, L=6, rgrid=rgrid)
+    assert mp.isNonAxi, (
+        "MultipolePotential of a triaxial density is not non-axisymmetric"
+    )
+    Rs = numpy.array([0.1, 1.0, 3.0, 10.0])
+    zs = numpy.array([0.05, 0.3, -2.0, 1.0])
+    phis = numpy.array([0.3, 1.0, 2.0, -1.0])
+    for func, tol in [
+        (potential.evaluatePotentials, 1e-3),
+        (potential.evaluateRforces, 1e-3),
+        (potential.evaluatezforces, 1e-3),
+        (potential.evaluatephitorques, 1e-3),
+    ]:
+        mpout = func(mp, Rs, zs, phi=phis)
+        tnpout = numpy.array(
+            [func(tnp, R, z, phi=phi) for R, z, phi in zip(Rs, zs, phis)]
+        )
+        assert numpy.all(numpy.fabs(mpout - tnpout) < tol * numpy.fabs(tnpout).max()), (
+            f"MultipolePotential {func.__name__} does not agree with TriaxialNFW"
+        )
+    # Second derivatives are consistent with the forces and the density with
+    # Poisson's equation
+    dx = 1e-6
+    assert numpy.all(
+        numpy.fabs(
+            mp.R2deriv(Rs, zs, phi=phis)
+            + (mp.Rforce(Rs + dx, zs, phi=phis) - mp.Rforce(Rs - dx, zs, phi=phis))
+            / 2.0
+            / dx
+        )
+        < 1e-6
+    ), "MultipolePotential R2deriv is not consistent with Rforce"
+    assert numpy.all(
+        numpy.fabs(
+            mp.dens(Rs, zs, phi=phis) - mp.dens(Rs, zs, phi=phis, forcepoisson=True)
+        )
+        < 1e-8
+    ), "MultipolePotential density does not satisfy Poisson's equation"
+    # Spherical Hernquist, also inside and outside of the grid
+    hp = potential.HernquistPotential(amp=2.0, a=1.3)
+    mps = potential.MultipolePotential(dens=hp, symmetry="spherical", rgrid=rgrid)
+    assert not mps.isNonAxi, "Spherical MultipolePotential is non-axisymmetric"
+    Rs = numpy.array([0.005, 0.5, 2.0, 50.0])
+    assert numpy.all(
+        numpy.fabs(mps(Rs, zs) - hp(Rs, zs)) < 1e-3 * numpy.fabs(hp(Rs, zs))
+    ), "Spherical MultipolePotential does not agree with HernquistPotential"
+    assert numpy.all(
+        numpy.fabs(mps.mass(Rs[1:]) - hp.mass(Rs[1:])) < 1e-3 * hp.mass(Rs[1:])
+    ), "Spherical MultipolePotential mass does not agree with HernquistPotential"
+    # Evaluating in C agrees with Python
+    numpy.random.seed(1)
+    Rs = numpy.random.uniform(0.005, 200.0, size=20)
+    zs = numpy.random.uniform(-10.0, 10.0, size=20)
+    phis = numpy.random.uniform(0.0, 2.0 * numpy.pi, size=20)
+    for func in [
+        potential.evaluatePotentials,
+        potential.evaluateRforces,
+        potential.evaluatezforces,
+        potential.evaluatephitorques,
+        potential.evaluateDensities,
+    ]:
+        for pot in [mp, mps]:
+            pyout = func(pot, Rs, zs, phi=phis)
+            cout = func(pot, Rs, zs, phi=phis, backend="c")
+            assert numpy.all(
+                numpy.fabs(cout - pyout) < 1e-8 * numpy.fabs(pyout) + 1e-12
+            ), f"MultipolePotential {func.__name__} in C does not agree with Python"
+    # Orbit integration in C agrees with Python, in 3D and 2D
+    ts = numpy.linspace(0.0, 10.0, 1001)
+    for vxvv in [[1.0, 0.1, 1.1, 0.1, 0.2, 0.3], [1.0, 0.1, 1.1, 0.3]]:
+        o = Orbit(vxvv)
+        o.integrate(ts, mp, method="dop853_c")
+        oc = Orbit(vxvv)
+        oc.integrate(ts, mp, method="dop853")
+        assert numpy.all(numpy.fabs(o.x(ts) - oc.x(ts)) < 1e-8), (
+            "Orbit integration in MultipolePotential in C does not agree with Python"
+        )
+    # From particles
+    numpy.random.seed(1)
+    orbs = isotropicHernquistdf(hp).sample(n=100000)
+    mpp = potential.MultipolePotential(
+        pos=numpy.array([orbs.x(), orbs.y(), orbs.z()]),
+        mass=1.0 / 100000,  # HernquistPotential's amp is twice the mass
+        L=2,
+        rgrid=rgrid,
+    )
+    Rs = numpy.array([0.1, 1.0, 3.0, 10.0])
+    zs = numpy.array([0.05, 0.3, -2.0, 1.0])
+    assert numpy.all(
+        numpy.fabs(mpp.Rforce(Rs, zs) - hp.Rforce(Rs, zs))
+        < 0.1 * numpy.fabs(hp.Rforce(Rs, zs))
+    ), "MultipolePotential from particles does not agree with HernquistPotential"
+    # Bad radial grid
+    with pytest.raises(ValueError):
+        potential.MultipolePotential(rgrid=[1.0, 0.5, 2.0])
+    return None
+
+
+# Test that the CylindricalSplinePotential reproduces a rotating bar potential,
+# including outside of the grid, and agrees between Python and C
+def test_CylindricalSplinePotential():
+    from galpy.orbit import Orbit
+
+    dp = potential.DehnenBarPotential()
+    pot = potential.MWPotential2014 + [dp]
+    csp = potential.CylindricalSplinePotential(pot=pot, M=2, omegab=dp.OmegaP())
+    assert csp.isNonAxi, "CylindricalSplinePotential with M > 0 is not non-axisymmetric"
+    assert numpy.fabs(csp.OmegaP() - dp.OmegaP()) < 1e-10, (
+        "CylindricalSplinePotential does not return the correct pattern speed"
+    )
+    Rs = numpy.array([0.13, 0.57, 0.91, 1.77, 2.93])
+    zs = numpy.array([0.03, -0.21, 0.11, 0.62, -0.97])
+    phis = numpy.array([0.3, 1.0, 2.0, -1.0, 4.0])
+    ts = numpy.array([0.0, 1.0, 2.5, -3.0, 10.0])
+    for func in [
+        potential.evaluatePotentials,
+        potential.evaluateRforces,
+        potential.evaluatezforces,
+        potential.evaluatephitorques,
+    ]:
+        assert numpy.all(
+            numpy.fabs(
+                func(csp, Rs, zs, phi=phis, t=ts) - func(pot, Rs, zs, phi=phis, t=ts)
+            )
+            < 1e-2 * numpy.fabs(func(pot, Rs, zs, phi=phis, t=ts)).max()
+        ), (
+            f"CylindricalSplinePotential {func.__name__} does not agree with the interpolated potential"
+        )
+    # Outside of the grid, approximately Keplerian
+    Rs = numpy.array([4.0, 10.0, 0.5])
+    zs = numpy.array([0.5, 1.0, 3.0])
+    hp = potential.HernquistPotential(amp=2.0, a=0.5)
+    cspo = potential.CylindricalSplinePotential(pot=hp, M=0)
+    assert numpy.all(
+        numpy.fabs(cspo(Rs, zs) - hp(Rs, zs)) < 0.05 * numpy.fabs(hp(Rs, zs))
+    ), (
+        "CylindricalSplinePotential outside of the grid does not agree with the interpolated potential"
+    )
+    assert numpy.all(
+        numpy.fabs(cspo.Rforce(Rs, zs) - hp.Rforce(Rs, zs))
+        < 0.15 * numpy.fabs(hp.Rforce(Rs, zs))
+    ), (
+        "CylindricalSplinePotential outside of the grid does not agree with the interpolated potential"
+    )
+    # Forces are continuous across the edge of the grid
+    for R, z in [(3.0, 0.3), (1.7, 1.0), (3.0, 0.99)]:
+        for func in [csp.Rforce, csp.zforce]:
+            assert (
+                numpy.fabs(
+                    func(R * (1.0 - 1e-9), z * (1.0 - 1e-9), phi=0.3)
+                    - func(R * (1.0 + 1e-9), z * (1.0 + 1e-9), phi=0.3)
+                )
+                < 1e-7
+            ), (
+                "CylindricalSplinePotential forces are not continuous across the edge of the grid"
+            )
+    # Forces are the derivatives of the potential, also outside of the grid
+    # and for zsym=False
+    csps = [
+        csp,
+        potential.CylindricalSplinePotential(
+            pot=pot, M=2, zsym=False, zgrid=numpy.linspace(-1.0, 1.0, 41)
+        ),
+    ]
+    Rs = numpy.array([0.13, 0.57, 5.0, 1.77])
+    zs = numpy.array([0.03, -0.21, 0.7, -3.0])
+    phis = numpy.array([0.3, 1.0, 2.0, -1.0])
+    dx = 1e-6
+    for tcsp in csps:
+        for force, coord in [
+            (tcsp.Rforce, "R"),
+            (tcsp.zforce, "z"),
+            (tcsp.phitorque, "phi"),
+        ]:
+            kwp = {"R": Rs, "z": zs, "phi": phis}
+            kwm = {"R": Rs, "z": zs, "phi": phis}
+            kwp[coord] = kwp[coord] + dx
+            kwm[coord] = kwm[coord] - dx
+            assert numpy.all(
+                numpy.fabs(
+                    force(Rs, zs, phi=phis) + (tcsp(**kwp) - tcsp(**kwm)) / 2.0 / dx
+                )
+                < 1e-7
+            ), (
+                "CylindricalSplinePotential force is not minus the derivative of the potential"
+            )
+        assert numpy.all(
+            numpy.fabs(
+                tcsp.R2deriv(Rs, zs, phi=phis)
+                + (
+                    tcsp.Rforce(Rs + dx, zs, phi=phis)
+                    - tcsp.Rforce(Rs - dx, zs, phi=phis)
+                )
+                / 2.0
+                / dx
+            )
+            < 1e-6
+        ), "CylindricalSplinePotential R2deriv is not consistent with Rforce"
+    # Evaluating in C agrees with Python
+    numpy.random.seed(1)
+    Rs = numpy.random.uniform(0.0, 5.0, size=20)
+    zs = numpy.random.uniform(-3.0, 3.0, size=20)
+    phis = numpy.random.uniform(0.0, 2.0 * numpy.pi, size=20)
+    ts = numpy.random.uniform(0.0, 3.0, size=20)
+    for func in [
+        potential.evaluatePotentials,
+        potential.evaluateRforces,
+        potential.evaluatezforces,
+        potential.evaluatephitorques,
+        potential.evaluateDensities,
+    ]:
+        for tcsp in csps:
+            pyout = func(tcsp, Rs, zs, phi=phis, t=ts)
+            cout = func(tcsp, Rs, zs, phi=phis, t=ts, backend="c")
+            assert numpy.all(
+                numpy.fabs(cout - pyout) < 1e-8 * numpy.fabs(pyout) + 1e-12
+            ), (
+                f"CylindricalSplinePotential {func.__name__} in C does not agree with Python"
+            )
+    # Orbit integration in C agrees with Python, in 3D and 2D
+    tts = numpy.linspace(0.0, 10.0, 1001)
+    for vxvv in [[1.0, 0.1, 1.1, 0.1, 0.2, 0.3], [1.0, 0.1, 1.1, 0.3]]:
+        o = Orbit(vxvv)
+        o.integrate(tts, csp, method="dop853_c")
+        oc = Orbit(vxvv)
+        oc.integrate(tts, csp, method="dop853")
+        assert numpy.all(numpy.fabs(o.x(tts) - oc.x(tts)) < 1e-5), (
+            "Orbit integration in CylindricalSplinePotential in C does not agree with Python"
+        )
+    # From particles, through a MultipolePotential
+    numpy.random.seed(1)
+    xyz = numpy.random.normal(size=(3, 20000)) * numpy.array([[1.0], [0.6], [0.3]])
+    cspp = potential.CylindricalSplinePotential(
+        pos=xyz,
+        mass=1.0 / 20000,
+        L=4,
+        zgrid=numpy.linspace(-1.0, 1.0, 81),
+        zsym=False,
+    )
+    mp = potential.MultipolePotential(
+        pos=xyz,
+        mass=1.0 / 20000,
+        L=4,
+        rgrid=numpy.geomspace(3e-3, 3e3, 121),
+    )
+    Rs = numpy.array([0.13, 0.57, 0.91, 1.77])
+    zs = numpy.array([0.03, -0.21, 0.11, 0.62])
+    assert numpy.all(
+        numpy.fabs(cspp(Rs, zs, phi=phis[:4]) - mp(Rs, zs, phi=phis[:4]))
+        < 1e-3 * numpy.fabs(mp(Rs, zs, phi=phis[:4]))
+    ), (
+        "CylindricalSplinePotential from particles does not agree with their MultipolePotential"
+    )
+    # Bad grids
+    with pytest.raises(ValueError):
+        potential.CylindricalSplinePotential(Rgrid=[-1.0, 0.5, 2.0])
+    with pytest.raises(ValueError):
+        potential.CylindricalSplinePotential(zgrid=[-1.0, 0.5, 2.0])
+    with pytest.raises(ValueError):
+        potential.CylindricalSplinePotential(zgrid=[0.0, 0.5, 2.0], zsym=False)
+    return None
+
+
+def test_EllipsoidalPotential_quadrature_table(tmp_path):
+    from galpy.orbit import Orbit
+    from galpy.util import config, galpyWarning
+
+    kwargs = dict(normalize=1.0, b=0.8, c=0.6, zvec=[0.3, 0.2, 1.0], pa=0.4)
+    tp = potential.TriaxialNFWPotential(**kwargs)
+    qp = potential.TriaxialNFWPotential(**kwargs)
+    tp.turn_quadrature_table_on(rmin=0.1, rmax=10.0, rtol=1e-5)
+    # The table agrees with the quadrature inside the table and falls back
+    # on the quadrature outside of it; the C implementation agrees with Python
+    numpy.random.seed(1)
+    Rs = numpy.append(numpy.random.uniform(0.1, 3.0, size=20), [0.01, 20.0])
+    zs = numpy.append(numpy.random.uniform(-2.0, 2.0, size=20), [0.02, -5.0])
+    phis = numpy.random.uniform(0.0, 2.0 * numpy.pi, size=22)
+    for func in [
+        potential.evaluatePotentials,
+        potential.evaluateRforces,
+        potential.evaluatezforces,
+        potential.evaluatephitorques,
+    ]:
+        tout = numpy.array([func(tp, R, z, phi=phi) for R, z, phi in zip(Rs, zs, phis)])
+        qout = numpy.array([func(qp, R, z, phi=phi) for R, z, phi in zip(Rs, zs, phis)])
+        assert numpy.all(numpy.fabs(tout - qout) < 1e-4 * numpy.fabs(qout) + 1e-6), (
+            f"EllipsoidalPotential quadrature table does not agree with the quadrature for {func.__name__}"
+        )
+        assert numpy.all(tout[-2:] == qout[-2:]), (
+            f"EllipsoidalPotential quadrature table is used outside of its range for {func.__name__}"
+        )
+        cout = func(tp, Rs, zs, phi=phis, backend="c")
+        assert numpy.all(numpy.fabs(cout - tout) < 1e-10 * numpy.fabs(tout) + 1e-12), (
+            f"EllipsoidalPotential quadrature table in C does not agree with Python for {func.__name__}"
+        )
+    # Orbit integration with the table agrees with that using the quadrature
+    tts = numpy.linspace(0.0, 10.0, 1001)
+    for method in ["dop853_c", "rk4_c"]:
+        o = Orbit([1.0, 0.1, 1.1, 0.1, 0.2, 0.3])
+        o.integrate(tts, tp, method=method)
+        oq = Orbit([1.0, 0.1, 1.1, 0.1, 0.2, 0.3])
+        oq.integrate(tts, qp, method=method)
+        assert numpy.all(numpy.fabs(o.x(tts) - oq.x(tts)) < 1e-4), (
+            "Orbit integration with the EllipsoidalPotential quadrature table does not agree with that using the quadrature"
+        )
+    # Turning the table off goes back to the quadrature
+    tp.turn_quadrature_table_off()
+    assert tp(Rs[0], zs[0], phi=phis[0]) == qp(Rs[0], zs[0], phi=phis[0]), (
+        "Turning the EllipsoidalPotential quadrature table off does not go back to the quadrature"
+    )
+    assert numpy.all(
+        potential.evaluateRforces(tp, Rs, zs, phi=phis, backend="c")
+        == potential.evaluateRforces(qp, Rs, zs, phi=phis, backend="c")
+    ), (
+        "Turning the EllipsoidalPotential quadrature table off does not go back to the quadrature in C"
+    )
+    # Not reaching the tolerance raises a warning
+    with pytest.warns(galpyWarning):
+        tp.turn_quadrature_table_on(rmin=0.1, rmax=10.0, rtol=1e-10, maxiter=0)
+    # The table is stored in the on-disk cache, independent of previous
+    # evaluations of the potential
+    config.set_cache_directory(str(tmp_path))
+    try:
+        tp.turn_quadrature_table_on(rmin=0.1, rmax=10.0, rtol=1e-3)
+        table = tp._qtable["table"]
+        tp.turn_quadrature_table_off()
+        tp.Rforce(0.5, 0.1, phi=0.2)
+        tp.turn_quadrature_table_on(rmin=0.1, rmax=10.0, rtol=1e-3)
+        assert len(os.listdir(tmp_path)) == 1, (
+            "EllipsoidalPotential quadrature table not loaded from the on-disk cache"
+        )
+        assert numpy.all(tp._qtable["table"] == table), (
+            "EllipsoidalPotential quadrature table loaded from the on-disk cache is not the same"
+        )
+    finally:
+        config.set_cache_directory(None)
+    return None
+
+
+def test_disk_quadrature_table():
+    import warnings
+
+    from galpy.orbit import Orbit
+    from galpy.util import galpyWarning
+
+    for pot_func, rtol, tol in [
+        (
+            lambda: potential.DoubleExponentialDiskPotential(amp=2.0, hr=0.5, hz=0.1),
+            1e-4,
+            1e-3,
+        ),
+        (lambda: potential.AnyAxisymmetricRazorThinDiskPotential(amp=2.0), 1e-3, 1e-2),
+    ]:
+        tp = pot_func()
+        qp = pot_func()
+        name = type(tp).__name__
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", galpyWarning)
+            tp.turn_quadrature_table_on(Rmax=10.0, rtol=rtol)
+        assert tp._qtable["multipoles"] is not None, (
+            f"{name} quadrature table does not use the multipole expansion beyond the table"
+        )
+        # The table agrees with the quadrature used to build it inside and
+        # beyond the table (multipole expansion), including at R = 0 where
+        # the default quadrature of the DoubleExponentialDiskPotential fails;
+        # the C implementation agrees with Python
+        numpy.random.seed(1)
+        Rs = numpy.append(numpy.random.uniform(0.01, 3.0, size=10), [0.0, 15.0])
+        zs = numpy.append(numpy.random.uniform(-1.0, 1.0, size=10), [0.3, -20.0])
+        qouts = qp._amp * qp._qtable_quadrature(Rs, numpy.fabs(zs))
+        qouts[2] *= numpy.sign(zs)
+        for func, qout in zip(
+            [
+                potential.evaluatePotentials,
+                potential.evaluateRforces,
+                potential.evaluatezforces,
+            ],
+            qouts,
+        ):
+            tout = numpy.array([func(tp, R, z) for R, z in zip(Rs, zs)])
+            assert numpy.all(
+                numpy.fabs(tout - qout) < tol * numpy.amax(numpy.fabs(qout))
+            ), (
+                f"{name} quadrature table does not agree with the quadrature for {func.__name__}"
+            )
+            cout = func(tp, Rs, zs, backend="c")
+            assert numpy.all(
+                numpy.fabs(cout - tout) < 1e-10 * numpy.fabs(tout) + 1e-12
+            ), (
+                f"{name} quadrature table in C does not agree with Python for {func.__name__}"
+            )
+        # Orbit integration with the table agrees with that using the quadrature
+        tts = numpy.linspace(0.0, 10.0, 1001)
+        lp = potential.LogarithmicHaloPotential(normalize=0.5)
+        o = Orbit([1.0, 0.1, 1.1, 0.1, 0.2, 0.3])
+        o.integrate(tts, [lp, tp], method="dop853_c")
+        oq = Orbit([1.0, 0.1, 1.1, 0.1, 0.2, 0.3])
+        oq.integrate(tts, [lp, qp], method="dop853_c")
+        assert numpy.all(numpy.fabs(o.x(tts) - oq.x(tts)) < 10.0 * tol), (
+            f"Orbit integration with the {name} quadrature table does not agree with that using the quadrature"
+        )
+        # Turning the table off goes back to the quadrature
+        tp.turn_quadrature_table_off()
+        assert tp(Rs[0], zs[0]) == qp(Rs[0], zs[0]), (
+            f"Turning the {name} quadrature table off does not go back to the quadrature"
+        )
+        assert numpy.array_equal(
+            potential.evaluateRforces(tp, Rs, zs, backend="c"),
+            potential.evaluateRforces(qp, Rs, zs, backend="c"),
+            equal_nan=True,
+        ), (
+            f"Turning the {name} quadrature table off does not go back to the quadrature in C"
+        )
+    # Not reaching the tolerance raises a warning
+    with pytest.warns(galpyWarning):
+        tp.turn_quadrature_table_on(Rmax=10.0, rtol=1e-10, maxiter=0)
+    return None
+
+
+# Test that the C implementations of the potentials that are evaluated with
+# numerical integrals or special functions in Python agree with Python
+def test_C_implementations_agree_with_python():
+    pots = [
+        potential.RingPotential(amp=2.0, a=2.5),
+        potential.SphericalShellPotential(amp=2.0, a=2.5),
+        potential.RazorThinExponentialDiskPotential(amp=2.0, hr=0.4),
+        potential.FerrersPotential(
+            amp=2.0, a=1.5, b=0.5, c=0.3, n=2, pa=0.3, omegab=0.4
+        ),
+        potential.AnyAxisymmetricRazorThinDiskPotential(amp=2.0),
+        potential.AnySphericalPotential(amp=2.0),
+        potential.KingPotential(W0=3.0, M=2.0, rt=2.0),
+    ]
+    # AnySpherical and AnyAxisymmetricRazorThinDisk use tables in C
+    tols = [1e-10, 1e-10, 1e-10, 1e-10, 1e-8, 1e-7, 1e-10]
+    funcs = [
+        potential.evaluatePotentials,
+        potential.evaluateRforces,
+        potential.evaluatezforces,
+        potential.evaluatephitorques,
+    ]
+    numpy.random.seed(3)
+    Rs = numpy.append(numpy.random.uniform(0.1, 3.0, size=8), [1.3, 5.0])
+    zs = numpy.append(numpy.random.uniform(-2.0, 2.0, size=8), [0.0, 0.0])
+    phis = numpy.random.uniform(0.0, 2.0 * numpy.pi, size=10)
+    ts = numpy.random.uniform(0.0, 3.0, size=10)
+    for pot, tol in zip(pots, tols):
+        assert pot.hasC, f"{type(pot).__name__} does not have a C implementation"
+        for func in funcs:
+            cout = func(pot, Rs, zs, phi=phis, t=ts, backend="c")
+            pyout = numpy.array(
+                [
+                    func(pot, R, z, phi=phi, t=t)
+                    for R, z, phi, t in zip(Rs, zs, phis, ts)
+                ]
+            )
+            assert numpy.all(
+                numpy.fabs(cout - pyout) < tol * numpy.amax(numpy.fabs(pyout)) + 1e-12
+            ), (
+                f"{type(pot).__name__}'s C implementation does not agree with Python for {func.__name__}"
+            )
+        # Orbits in the plane, which also use the C second derivatives for dxdv
+        lp = potential.LogarithmicHaloPotential(normalize=1.0)
+        ppot = potential.toPlanarPotential([lp, pot])
+        times = numpy.linspace(0.0, 1.0, 11)
+        o = orbit.Orbit([0.5, 0.1, 1.1, 0.3])
+        oc = o()
+        oc.integrate(times, ppot, method="dop853_c")
+        o.integrate(times, ppot, method="odeint")
+        for attr in ["x", "y", "vx", "vy"]:
+            assert numpy.all(
+                numpy.fabs(getattr(oc, attr)(times) - getattr(o, attr)(times)) < 1e-5
+            ), (
+                f"Orbit integration in the plane with {type(pot).__name__} in C does not agree with Python"
+            )
+        if not pot.hasC_dxdv:
+            continue
+        oc.integrate_dxdv(
+            [1.0, 0.0, 0.0, 0.0], times, ppot, method="dopr54_c", rectIn=True
+        )
+        o.integrate_dxdv(
+            [1.0, 0.0, 0.0, 0.0], times, ppot, method="odeint", rectIn=True
+        )
+        assert numpy.all(numpy.fabs(oc.getOrbit_dxdv() - o.getOrbit_dxdv()) < 1e-5), (
+            f"Phase-space volume integration in the plane with {type(pot).__name__} in C does not agree with Python"
+        )
+    return None
+
+
+# Test that evaluating all forces at once agrees with evaluating them one by one
+def test_forces_single_call():
+    from galpy.potential.planarPotential import _evaluateplanarforces
+    from galpy.potential.Potential import _evaluateforces
+
+    Acos = numpy.zeros((4, 3, 3))
+    Acos[0, 0, 0] = 1.0
+    Acos += (
+        0.1
+        * numpy.random.RandomState(2).uniform(size=(4, 3, 3))
+        * numpy.tril(numpy.ones((3, 3)))[None]
+    )
+    Asin = 0.5 * Acos * numpy.tril(numpy.ones((3, 3)), -1)[None]
+    pots = [
+        potential.MWPotential2014,
+        mockCompositePotential(),
+        potential.SCFPotential(Acos=Acos, Asin=Asin, a=1.3),
+        potential.FerrersPotential(
+            amp=2.0, a=1.5, b=0.5, c=0.3, n=2, pa=0.3, omegab=0.4
+        ),
+        potential.SoftenedNeedleBarPotential(
+            amp=2.0, a=1.5, b=0.2, c=0.3, pa=0.3, omegab=0.4
+        ),
+        potential.TriaxialNFWPotential(amp=2.0, a=2.0, b=0.7, c=0.5),
+        potential.TriaxialNFWPotential(
+            amp=2.0, a=2.0, b=0.7, c=0.5, pa=0.3, zvec=[0.1, 0.2, 0.9]
+        ),
+        potential.RotateAndTiltWrapperPotential(
+            pot=potential.MiyamotoNagaiPotential(a=0.5, b=0.1),
+            zvec=[0.1, 0.2, 0.9],
+            galaxy_pa=0.3,
+        ),
+        [
+            potential.LogarithmicHaloPotential(normalize=1.0),
+            potential.ChandrasekharDynamicalFrictionForce(
+                GMs=0.01, rhm=0.1, dens=potential.MWPotential2014
+            ),
+            potential.NonInertialFrameForce(
+                Omega=numpy.array([0.1, 0.2, 0.3]),
+                Omegadot=numpy.array([0.01, 0.0, -0.01]),
+            ),
+        ],
+    ]
+    v = [0.1, 1.0, 0.2]
+    for pot in pots:
+        for R, z, phi, t in [
+            (0.9, 0.2, 0.4, 0.3),
+            (1.3, -0.3, 2.0, 1.1),
+            (0.5, 0.05, -1.0, 0.6),
+        ]:
+            forces = _evaluateforces(pot, R, z, phi=phi, t=t, v=v)
+            for force, func in zip(
+                forces,
+                [
+                    potential.evaluateRforces,
+                    potential.evaluatezforces,
+                    potential.evaluatephitorques,
+                ],
+            ):
+                assert numpy.fabs(force - func(pot, R, z, phi=phi, t=t, v=v)) < 1e-10, (
+                    f"Evaluating all forces at once does not agree with {func.__name__} for {pot}"
+                )
+            ppot = potential.toPlanarPotential(pot)
+            pforces = _evaluateplanarforces(ppot, R, phi=phi, t=t, v=v[:2])
+            for force, func in zip(
+                pforces,
+                [potential.evaluateplanarRforces, potential.evaluateplanarphitorques],
+            ):
+                assert (
+                    numpy.fabs(force - func(ppot, R, phi=phi, t=t, v=v[:2])) < 1e-10
+                ), (
+                    f"Evaluating all planar forces at once does not agree with {func.__name__} for {pot}"
+                )
+    return None
+
+
 # Test that trying to plot a potential with xy=True and effective=True raises a RuntimeError
 def test_plotting_xy_effective_error():
     # First a single potential
@@ -9365,6 +10624,63 @@ class mockMovingObjectLongIntPotential(mockMovingObjectPotential):
         return None
 
 
+from galpy.potential import TimeInterpolatedPotential
+
+
+class mockTimeInterpolatedPotential(TimeInterpolatedPotential):
+    def __init__(self):
+        TimeInterpolatedPotential.__init__(
+            self,
+            pots=[
+                potential.LogarithmicHaloPotential(
+                    normalize=1.0, q=0.9, b=0.8 + 0.1 * ii
+                )
+                for ii in range(3)
+            ],
+            t=[-10.0, 0.0, 10.0],
+        )
+        return None
+
+
+class mockCompositePotential(potential.CompositePotential):
+    def __init__(self):
+        potential.CompositePotential.__init__(
+            self,
+            pots=[
+                potential.HernquistPotential(a=0.075, normalize=0.05),
+                potential.MiyamotoNagaiPotential(a=0.375, b=0.035, normalize=0.6),
+                potential.NFWPotential(a=2.0, normalize=0.35),
+            ],
+        )
+        return None
+
+
+class mockManyMovingObjectsPotential(testMWPotential):
+    def __init__(self, rc=0.75, maxt=1.0, nt=50):
+        from galpy.orbit import Orbit
+
+        self._rc = rc
+        os = Orbit(
+            [
+                [self._rc, 0.0, 1.0, 0.0, 0.0, 0.0],
+                [self._rc, 0.0, 1.0, 0.0, 0.0, numpy.pi],
+            ]
+        )
+        lp = potential.LogarithmicHaloPotential(normalize=1.0)
+        times = numpy.linspace(0.0, maxt, nt)
+        os.integrate(times, lp, method="dopr54_c")
+        self._osp = potential.ManyMovingObjectsPotential(os)
+        testMWPotential.__init__(self, [self._osp])
+        self.isNonAxi = True
+        return None
+
+    def phi2deriv(self, R, z, phi=0.0, t=0.0):
+        raise AttributeError
+
+    def OmegaP(self):
+        return 1.0 / self._rc
+
+
 # Classes to test wrappers
 from galpy.potential import (
     AdiabaticContractionWrapperPotential,
@@ -1,6 +1,7 @@
 ############################TESTS ON POTENTIALS################################
 
 import numpy
+import pytest
 
 from galpy import df, potential
 from galpy.orbit import Orbit
@@ -184,6 +185,99 @@ def test_scf_compute_spherical_zeeuw():
     assert numpy.all(numpy.fabs(Acos[2:, 0, 0]) < EPS), "Acos(n>1,l=0,m=0) = 0 fails."
 
 
+## tests the on-disk cache of the SCF coefficients
+def test_scf_compute_coeffs_disk_cache(tmp_path):
+    import os
+
+    from galpy.util import config
+
+    def make_dens(amp):
+        return lambda R, z: amp * axi_density1(R, z)
+
+    class NotCacheable:
+        def __call__(self, R, z):
+            return axi_density1(R, z)
+
+    config.set_cache_directory(str(tmp_path))
+    try:
+        A = potential.scf_compute_coeffs_axi(make_dens(1.0), 10, 10)
+        assert len(os.listdir(tmp_path)) == 1, (
+            "SCF coefficients not written to the on-disk cache"
+        )
+        # Second call loads from the cache
+        Ac = potential.scf_compute_coeffs_axi(make_dens(1.0), 10, 10)
+        assert len(os.listdir(tmp_path)) == 1, (
+            "SCF coefficients written to the on-disk cache twice"
+        )
+        assert numpy.all(A[0] == Ac[0]) and numpy.all(A[1] == Ac[1]), (
+            "SCF coefficients loaded from the on-disk cache are not the same"
+        )
+        # Different parameters give a different entry
+        A2 = potential.scf_compute_coeffs_axi(make_dens(2.0), 10, 10)
+        assert len(os.listdir(tmp_path)) == 2, (
+            "SCF coefficients for a different density not written to the cache"
+        )
+        assert numpy.all(numpy.fabs(A2[0] - 2.0 * A[0]) < 1e-10), (
+            "SCF coefficients for a different density are wrong"
+        )
+        potential.scf_compute_coeffs_axi(make_dens(1.0), 10, 10, a=2.0)
+        assert len(os.listdir(tmp_path)) == 3, (
+            "SCF coefficients for a different scale not written to the cache"
+        )
+        # Arguments that cannot be turned into a key are not cached
+        An = potential.scf_compute_coeffs_axi(NotCacheable(), 10, 10)
+        assert len(os.listdir(tmp_path)) == 3, (
+            "SCF coefficients for a density that cannot be cached were cached"
+        )
+        assert numpy.all(An[0] == A[0]), (
+            "SCF coefficients for a density that cannot be cached are wrong"
+        )
+    finally:
+        config.set_cache_directory(None)
+    # Turned off
+    potential.scf_compute_coeffs_axi(make_dens(3.0), 10, 10)
+    assert len(os.listdir(tmp_path)) == 3, (
+        "SCF coefficients written to the cache after turning it off"
+    )
+    return None
+
+
+## tests that the on-disk cache key of galpy functions depends on their bytecode
+def test_disk_cache_key_bytecode():
+    from galpy.util._disk_cache import cache_key
+
+    def func(dens, N):
+        return dens(1.0, 0.0) * N
+
+    def edited_func(dens, N):
+        return dens(1.0, 0.0) * N + 1.0
+
+    def dens(R, z):
+        return R
+
+    def edited_dens(R, z):
+        return 2.0 * R
+
+    # Pretend that the edits are made in galpy, at the same line
+    for f, edited_f in [(func, edited_func), (dens, edited_dens)]:
+        f.__module__ = "galpy.potential.SCFPotential"
+        edited_f.__module__ = "galpy.potential.SCFPotential"
+        edited_f.__code__ = edited_f.__code__.replace(
+            co_name=f.__name__, co_firstlineno=f.__code__.co_firstlineno
+        )
+        edited_f.__qualname__ = f.__qualname__
+    assert cache_key(func, (dens, 10), {}) == cache_key(func, (dens, 10), {}), (
+        "On-disk cache key is not deterministic"
+    )
+    assert cache_key(func, (dens, 10), {}) != cache_key(edited_func, (dens, 10), {}), (
+        "On-disk cache key does not change when the cached galpy function is edited"
+    )
+    assert cache_key(func, (dens, 10), {}) != cache_key(func, (edited_dens, 10), {}), (
+        "On-disk cache key does not change when a galpy function argument is edited"
+    )
+    return None
+
+
 ##Tests that the numerically calculated results from axi_density1 matches with the analytic results
 def test_scf_compute_axi_density1():
     A = potential.scf_compute_coeffs_axi(axi_density1, 10, 10)
@@ -411,6 +505,58 @@ def test_scf_compute_nbody_twopowertriaxial():
     return None
 
 
+## Tests that computing the nbody coefficients in blocks, in parallel, and from a memmap gives the same result, and that the variance is sensible
+def test_scf_compute_nbody_chunked(tmp_path):
+    numpy.random.seed(3)
+    npart = 20001
+    pos = numpy.random.normal(size=(3, npart)) * numpy.array([[1.0], [1.5], [2.5]])
+    mass = numpy.random.uniform(size=npart) / npart
+    mpos = numpy.lib.format.open_memmap(
+        str(tmp_path / "pos.npy"), mode="w+", dtype=float, shape=pos.shape
+    )
+    mpos[:] = pos
+    mpos.flush()
+    for func, args in [
+        (potential.scf_compute_coeffs_spherical_nbody, (6,)),
+        (potential.scf_compute_coeffs_axi_nbody, (6, 4)),
+        (potential.scf_compute_coeffs_nbody, (6, 4)),
+    ]:
+        for m in [mass, 1.0 / npart]:
+            A = func(pos, *args, mass=m, a=2.0, chunksize=npart)
+            Ac = func(mpos, *args, mass=m, a=2.0, chunksize=3000, numcores=2)
+            for x, y in zip(A, Ac):
+                if x is None:
+                    assert y is None, "Chunked nbody coefficients are not None"
+                    continue
+                assert numpy.all(
+                    numpy.fabs(x - y) < 1e-10 * numpy.amax(numpy.fabs(x))
+                ), "Chunked nbody coefficients differ from unchunked ones"
+            Av = func(pos, *args, mass=m, a=2.0, chunksize=3000, return_variance=True)
+            assert len(Av) == 4, "return_variance=True does not return the variances"
+            assert numpy.all(numpy.fabs(Av[0] - A[0]) < 1e-10), (
+                "Coefficients with return_variance=True differ"
+            )
+            assert numpy.all(Av[2] >= -1e-14), "Coefficient variance is negative"
+            # The lowest-order coefficient is dominated by the mass, so it is well determined
+            assert Av[2][0, 0, 0] < 1e-2 * Av[0][0, 0, 0] ** 2, (
+                "Variance of the lowest-order coefficient is too large"
+            )
+    # Variance agrees with the scatter between samples
+    cs, vs = [], []
+    for ii in range(40):
+        pos = numpy.random.normal(size=(3, 5000)) * numpy.array([[1.0], [1.5], [2.5]])
+        c, _, cv, _ = potential.scf_compute_coeffs_nbody(
+            pos, 4, 3, mass=1.0 / 5000, a=2.0, return_variance=True
+        )
+        cs.append(c)
+        vs.append(cv)
+    ratio = numpy.var(cs, axis=0) / numpy.mean(vs, axis=0)
+    assert numpy.fabs(numpy.nanmedian(ratio) - 1.0) < 0.3, (
+        "Variance of the nbody coefficients does not agree with their scatter"
+    )
+    return None
+
+
 def test_scf_compute_nfw():
     Acos, Asin = potential.scf_compute_coeffs_spherical(rho_NFW, 10)
     spherical_coeffsTest(Acos, Asin)
@@ -899,3 +1045,96 @@ def density1(R, z=0, phi=0.0):
         * (1 + numpy.cos(theta) + numpy.cos(theta) ** 2.0)
         * (1 + numpy.cos(phi) + numpy.sin(phi))
     )
+
+
+# Test that the TimeDependentSCFPotential agrees with SCFPotential at the input times, interpolates in between, and has a correct C implementation
+def test_TimeDependentSCFPotential():
+    numpy.random.seed(4)
+    N, L = 5, 4
+    ts = numpy.array([0.0, 1.0, 2.5, 4.0])
+    Acos = numpy.tril(0.05 * numpy.random.normal(size=(len(ts), N, L, L)))
+    Acos[:, 0, 0, 0] = 1.0 + 0.2 * numpy.arange(len(ts))
+    Asin = numpy.tril(0.05 * numpy.random.normal(size=(len(ts), N, L, L)))
+    Asin[:, :, :, 0] = 0.0
+    for kind in ["cubic", "linear"]:
+        tp = potential.TimeDependentSCFPotential(
+            Acos=Acos, Asin=Asin, t=ts, a=1.3, kind=kind
+        )
+        assert tp.isNonAxi, "TimeDependentSCFPotential should be non-axisymmetric"
+        for ii, t in enumerate(ts):
+            sp = potential.SCFPotential(Acos=Acos[ii], Asin=Asin[ii], a=1.3)
+            for func in ["__call__", "Rforce", "zforce", "phitorque", "dens"]:
+                assert (
+                    numpy.fabs(
+                        getattr(tp, func)(0.7, 0.2, phi=0.3, t=t)
+                        - getattr(sp, func)(0.7, 0.2, phi=0.3)
+                    )
+                    < 1e-10
+                ), (
+                    f"TimeDependentSCFPotential {func} does not agree with SCFPotential at t_i"
+                )
+        # Linear in the coefficients, so linear interpolation gives the mean halfway
+        if kind == "linear":
+            sp1 = potential.SCFPotential(Acos=Acos[1], Asin=Asin[1], a=1.3)
+            sp2 = potential.SCFPotential(Acos=Acos[2], Asin=Asin[2], a=1.3)
+            assert (
+                numpy.fabs(
+                    tp.Rforce(0.7, 0.2, phi=0.3, t=1.75)
+                    - 0.5
+                    * (sp1.Rforce(0.7, 0.2, phi=0.3) + sp2.Rforce(0.7, 0.2, phi=0.3))
+                )
+                < 1e-10
+            ), "Linear TimeDependentSCFPotential does not interpolate linearly"
+        # Coefficients are held fixed outside of the range of times
+        assert (
+            numpy.fabs(
+                tp.Rforce(0.7, 0.2, phi=0.3, t=-2.0)
+                - tp.Rforce(0.7, 0.2, phi=0.3, t=0.0)
+            )
+            < 1e-10
+        ), "TimeDependentSCFPotential not constant before the first time"
+        assert (
+            numpy.fabs(
+                tp.zforce(0.7, 0.2, phi=0.3, t=6.0)
+                - tp.zforce(0.7, 0.2, phi=0.3, t=4.0)
+            )
+            < 1e-10
+        ), "TimeDependentSCFPotential not constant after the last time"
+        # Array times
+        tt = numpy.array([0.5, 1.7, 3.2])
+        assert numpy.all(
+            numpy.fabs(
+                tp.Rforce(0.7, 0.2, phi=0.3, t=tt)
+                - numpy.array([tp.Rforce(0.7, 0.2, phi=0.3, t=t) for t in tt])
+            )
+            < 1e-10
+        ), "TimeDependentSCFPotential does not work for array times"
+        # C orbit integration agrees with Python, for 3D and 2D orbits
+        times = numpy.linspace(0.0, 6.0, 101)
+        for vxvv in [[1.0, 0.1, 1.1, 0.1, 0.0, 0.5], [1.0, 0.1, 1.1, 0.5]]:
+            oc = Orbit(vxvv)
+            op = Orbit(vxvv)
+            oc.integrate(times, tp, method="dop853_c")
+            op.integrate(times, tp, method="odeint")
+            assert numpy.amax(numpy.fabs(oc.x(times) - op.x(times))) < 1e-5, (
+                "Orbit integration in TimeDependentSCFPotential in C does not agree with Python"
+            )
+    return None
+
+
+def test_TimeDependentSCFPotential_errors():
+    with pytest.raises(RuntimeError):
+        potential.TimeDependentSCFPotential(Acos=numpy.ones((2, 1, 1)))
+    with pytest.raises(RuntimeError):
+        potential.TimeDependentSCFPotential(
+            Acos=numpy.ones((2, 1, 1, 1)), t=[0.0, 1.0, 2.0]
+        )
+    with pytest.raises(RuntimeError):
+        potential.TimeDependentSCFPotential(Acos=numpy.ones((1, 1, 1, 1)), t=[0.0])
+    with pytest.raises(RuntimeError):
+        potential.TimeDependentSCFPotential(Acos=numpy.ones((2, 1, 1, 1)), t=[1.0, 0.0])
+    with pytest.raises(ValueError):
+        potential.TimeDependentSCFPotential(
+            Acos=numpy.ones((2, 1, 1, 1)), kind="quadratic"
+        )
+    return None